@@ -1,8 +1,24 @@
 """Egregora: Multi-platform chat analysis and blog generation."""
 
-from egregora.cli.write import process_whatsapp_export
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from egregora.cli.write import process_whatsapp_export
 
 __version__ = "3.0.1"
 __all__ = [
     "process_whatsapp_export",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    # Resolved lazily: importing the write pipeline pulls in ibis, duckdb and the
+    # LLM SDKs, which every `egregora.*` import would otherwise pay for.
+    if name == "process_whatsapp_export":
+        from egregora.cli.write import process_whatsapp_export
+
+        return process_whatsapp_export
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -28,6 +28,7 @@ from egregora.ops.media import (
 )
 from egregora.orchestration.cache import EnrichmentCache
 from egregora.security.dns import SSRFValidationError, safe_dns_validation
+from egregora.security.http import get_http_client
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -56,19 +57,6 @@ class AvatarProcessingError(EgregoraError):
     """Error during avatar processing."""
 
 
-def _create_secure_client(timeout: float = DEFAULT_DOWNLOAD_TIMEOUT) -> httpx.Client:
-    """Create a configured httpx.Client with security controls.
-
-    Note: SSRF validation is handled by safe_dns_validation context manager
-    in download_avatar_from_url, not via event hooks.
-    """
-    return httpx.Client(
-        timeout=timeout,
-        follow_redirects=True,
-        max_redirects=MAX_REDIRECT_HOPS,
-    )
-
-
 def _get_avatar_directory(media_dir: Path) -> Path:
     """Get or create the images directory for avatars.
 
@@ -343,10 +331,12 @@ def _save_avatar_file(content: bytes | bytearray, avatar_uuid: uuid.UUID, ext: s
     return avatar_path
 
 
-def _fetch_and_validate_image(client: httpx.Client, url: str) -> tuple[bytearray, str]:
+def _fetch_and_validate_image(
+    client: httpx.Client, url: str, timeout: float = DEFAULT_DOWNLOAD_TIMEOUT
+) -> tuple[bytearray, str]:
     """Fetch image from URL and validate it."""
     logger.info("Downloading avatar from URL: %s", url)
-    with client.stream("GET", url) as response:
+    with client.stream("GET", url, timeout=timeout) as response:
         response.raise_for_status()
         content, content_type = _download_image_content(response)
 
@@ -384,10 +374,11 @@ def _download_avatar_with_client(
     url: str,
     media_dir: Path,
     namespace: uuid.UUID,
+    timeout: float = DEFAULT_DOWNLOAD_TIMEOUT,
 ) -> tuple[uuid.UUID, Path]:
     """Internal function to download avatar using an existing client."""
     try:
-        content, ext = _fetch_and_validate_image(client, url)
+        content, ext = _fetch_and_validate_image(client, url, timeout)
         avatar_uuid = _generate_avatar_uuid(content, namespace)
         avatar_path = _save_avatar_file(content, avatar_uuid, ext, media_dir)
         return avatar_uuid, avatar_path
@@ -413,7 +404,7 @@ def download_avatar_from_url(
         media_dir: Root media directory (e.g., site_root/media)
         namespace: UUID namespace for avatar generation
         timeout: HTTP timeout in seconds
-        client: Optional httpx.Client to reuse
+        client: Optional httpx.Client to use instead of the shared SSRF-guarded client
 
     Returns:
         Tuple of (avatar_uuid, avatar_path)
@@ -424,11 +415,9 @@ def download_avatar_from_url(
     """
     try:
         with safe_dns_validation(url):
-            if client:
-                return _download_avatar_with_client(client, url, media_dir, namespace)
-
-            with _create_secure_client(timeout) as new_client:
-                return _download_avatar_with_client(new_client, url, media_dir, namespace)
+            return _download_avatar_with_client(
+                client or get_http_client(ssrf_guard=True), url, media_dir, namespace, timeout
+            )
     except SSRFValidationError as exc:
         raise AvatarProcessingError(str(exc)) from exc
 
@@ -488,31 +477,31 @@ def process_avatar_commands(
     logger.info("Found %s avatar command(s)", len(avatar_commands))
     results: dict[str, str] = {}
 
-    with _create_secure_client() as client:
-        for cmd_entry in avatar_commands:
-            author_uuid = cmd_entry["author"]
-            timestamp_raw = cmd_entry["timestamp"]
-            command = cmd_entry["command"]
-            cmd_type = command["command"]
-            target = command["target"]
-            if cmd_type in ("set", "unset") and target == "avatar":
-                if cmd_type == "set":
-                    timestamp_dt = ensure_datetime(timestamp_raw)
-                    result = _process_set_avatar_command(
-                        author_uuid=author_uuid,
-                        timestamp=timestamp_dt,
-                        context=context,
-                        value=command.get("value"),
-                        client=client,
-                    )
-                    results[author_uuid] = result
-                elif cmd_type == "unset":
-                    result = _process_unset_avatar_command(
-                        author_uuid=author_uuid,
-                        timestamp=str(timestamp_raw),
-                        profiles_dir=context.profiles_dir,
-                    )
-                    results[author_uuid] = result
+    client = get_http_client(ssrf_guard=True)
+    for cmd_entry in avatar_commands:
+        author_uuid = cmd_entry["author"]
+        timestamp_raw = cmd_entry["timestamp"]
+        command = cmd_entry["command"]
+        cmd_type = command["command"]
+        target = command["target"]
+        if cmd_type in ("set", "unset") and target == "avatar":
+            if cmd_type == "set":
+                timestamp_dt = ensure_datetime(timestamp_raw)
+                result = _process_set_avatar_command(
+                    author_uuid=author_uuid,
+                    timestamp=timestamp_dt,
+                    context=context,
+                    value=command.get("value"),
+                    client=client,
+                )
+                results[author_uuid] = result
+            elif cmd_type == "unset":
+                result = _process_unset_avatar_command(
+                    author_uuid=author_uuid,
+                    timestamp=str(timestamp_raw),
+                    profiles_dir=context.profiles_dir,
+                )
+                results[author_uuid] = result
     return results
 
 
@@ -23,6 +23,7 @@ from egregora.agents.banner.image_generation import ImageGenerationRequest
 from egregora.config import EgregoraConfig
 from egregora.data_primitives.document import Document, DocumentType
 from egregora.llm.api_keys import get_google_api_key, google_api_key_available
+from egregora.llm.providers.genai_clients import get_genai_client
 from egregora.llm.retry import RETRY_IF, RETRY_STOP, RETRY_WAIT
 from egregora.resources.prompts import render_prompt
 
@@ -139,7 +140,7 @@ def generate_banner(
     # Client reads GOOGLE_API_KEY from environment automatically
     config = EgregoraConfig()
     api_key = get_google_api_key()
-    client = genai.Client(api_key=api_key)
+    client = get_genai_client(api_key)
 
     # Load configuration
     image_model = config.models.banner
@@ -0,0 +1,143 @@
+"""Gemini Batch API jobs that survive the run that submitted them.
+
+A batch job can take hours, longer than a run is willing to wait. Every
+submitted job is recorded in the task store with the tags of the requests it
+answers, so a run that is interrupted (or stops waiting) picks the same job
+back up instead of submitting and paying for it again.
+:class:`ResumableBatch` keeps that record; callers subclass it with the task
+type their jobs are recorded under.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING, Any, ClassVar, cast
+
+from egregora.llm.exceptions import BatchJobFailedError, BatchJobTimeoutError
+
+if TYPE_CHECKING:
+    from egregora.database.task_store import TaskStore
+    from egregora.llm.providers.google_batch import GoogleBatchModel
+
+logger = logging.getLogger(__name__)
+
+
+class ResumableBatch:
+    """Submits, resumes and tracks the batch jobs of one run."""
+
+    # Task type the jobs are recorded under.
+    task_type: ClassVar[str]
+    # Shown in logs and as the job's display name.
+    label: ClassVar[str] = "batch"
+    # What one request stands for, for log messages.
+    item_name: ClassVar[str] = "requests"
+
+    def __init__(self, model: GoogleBatchModel, task_store: TaskStore | None = None) -> None:
+        self.model = model
+        self.task_store = task_store
+        self.responses: dict[str, dict[str, Any]] = {}
+        self._task_ids: list[str] = []
+
+    def run(self, requests: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        """Answer ``requests`` (keyed by tag) and return the responses.
+
+        Jobs recorded by an earlier run are collected first; only requests
+        none of them covers are submitted as a new job. Requests whose result
+        came back with an error are left out, so the caller can send them live.
+
+        Raises:
+            BatchJobTimeoutError: A job did not finish within the model's
+                timeout. It stays recorded and the next run resumes it.
+
+        """
+        remaining = dict(requests)
+        for task in self._pending_jobs():
+            payload = task["payload"]
+            if isinstance(payload, str):
+                payload = json.loads(payload)
+            tags = payload.get("tags", [])
+            if self._is_stale(tags, remaining):
+                if self.task_store is not None:
+                    self.task_store.mark_superseded(
+                        task["task_id"], f"No pending {self.item_name} left in this job"
+                    )
+                continue
+            logger.info(
+                "Resuming %s batch job %s (%d %s)", self.label, payload["job_name"], len(tags), self.item_name
+            )
+            self._collect(task["task_id"], payload["job_name"], tags, remaining)
+
+        if remaining:
+            tags = list(remaining)
+            job_name = self.model.submit_batch(
+                [{"tag": tag, **remaining[tag]} for tag in tags], display_name=f"egregora-{self.label}"
+            )
+            task_id = self._record_job(job_name, tags)
+            logger.info("Submitted %s batch job %s (%d %s)", self.label, job_name, len(tags), self.item_name)
+            self._collect(task_id, job_name, tags, remaining)
+        return self.responses
+
+    def complete(self) -> None:
+        """Mark the jobs of this run as done once their results have been used."""
+        if self.task_store is None:
+            return
+        for task_id in self._task_ids:
+            self.task_store.mark_completed(task_id)
+
+    def _is_stale(self, tags: list[str], remaining: dict[str, Any]) -> bool:
+        """Whether a recorded job answers nothing that is still wanted."""
+        return not remaining.keys() & set(tags)
+
+    def _record_job(self, job_name: str, tags: list[str]) -> str | None:
+        if self.task_store is None:
+            return None
+        payload = {"job_name": job_name, "model": self.model.model_name, "tags": tags}
+        return self.task_store.enqueue(self.task_type, payload)
+
+    def _pending_jobs(self) -> list[dict[str, Any]]:
+        if self.task_store is None:
+            return []
+        return self.task_store.fetch_pending(task_type=self.task_type)
+
+    def _collect(
+        self, task_id: str | None, job_name: str, tags: list[str], remaining: dict[str, Any]
+    ) -> None:
+        try:
+            results = self.model.collect_batch(job_name, [{"tag": tag} for tag in tags])
+        except BatchJobTimeoutError:
+            logger.warning(
+                "%s batch job %s is still running; run the same command again to resume it",
+                self.label.capitalize(),
+                job_name,
+            )
+            raise
+        except BatchJobFailedError as exc:
+            logger.warning(
+                "%s batch job %s failed; its %s will be sent live: %s",
+                self.label.capitalize(),
+                job_name,
+                self.item_name,
+                exc,
+            )
+            if task_id is not None:
+                cast("TaskStore", self.task_store).mark_failed(task_id, str(exc))
+            return
+
+        for result in results:
+            if result.tag not in remaining:
+                continue
+            if result.response and not result.error:
+                self.responses[result.tag] = result.response
+            else:
+                logger.warning(
+                    "%s batch request %s failed: %s", self.label.capitalize(), result.tag, result.error
+                )
+        # Requests the job did not answer are sent live, not resubmitted.
+        for tag in tags:
+            remaining.pop(tag, None)
+        if task_id is not None:
+            self._task_ids.append(task_id)
+
+
+__all__ = ["ResumableBatch"]
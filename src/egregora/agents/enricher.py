@@ -9,12 +9,13 @@ from __future__ import annotations
 
 import asyncio
 import base64
+import contextvars
 import json
 import logging
 import mimetypes
 import re
-import shutil
 import tempfile
+import threading
 import time
 import uuid
 import zipfile
@@ -36,6 +37,7 @@ from pydantic_ai import Agent, RunContext, WebFetchTool
 from pydantic_ai.exceptions import ModelHTTPError, UsageLimitExceeded
 from pydantic_ai.messages import BinaryContent
 
+from egregora.agents.batch_jobs import ResumableBatch
 from egregora.agents.exceptions import (
     EnrichmentExecutionError,
     EnrichmentFileError,
@@ -48,14 +50,34 @@ from egregora.config.settings import EnrichmentSettings
 from egregora.data_primitives.datetime_utils import ensure_datetime
 from egregora.data_primitives.document import Document, DocumentType
 from egregora.data_primitives.text import slugify
+from egregora.database.asset_cache import AssetCache
 from egregora.database.message_repository import MessageRepository
 from egregora.database.streaming import ensure_deterministic_order, stream_ibis
 from egregora.llm.api_keys import get_google_api_key
+from egregora.llm.exceptions import BatchJobTimeoutError
+from egregora.llm.providers.file_uploads import FileUploadRegistry, genai_uploader
+from egregora.llm.providers.genai_clients import get_genai_client
 from egregora.llm.providers.google_batch import GoogleBatchModel
-from egregora.orchestration.cache import EnrichmentCache, make_enrichment_cache_key
-from egregora.orchestration.exceptions import CacheKeyNotFoundError
+from egregora.llm.providers.rate_limited import RateLimitedModel
+from egregora.llm.rate_limit import get_adaptive_limiter, key_fingerprint
+from egregora.ops.image_preprocessing import (
+    PREPROCESSABLE_MIME_TYPES,
+    ImagePreprocessOptions,
+    ImagePreprocessor,
+)
+from egregora.ops.media_batching import (
+    BATCH_JOB_LIMITS,
+    SINGLE_CALL_LIMITS,
+    MediaBatchPlan,
+    estimate_request_size,
+    pack_media_requests,
+)
+from egregora.ops.media_staging import StagedMedia, build_media_index, stage_zip_member
+from egregora.ops.url_fetch import CachedUrlFetcher
+from egregora.orchestration.cache import CacheTier, EnrichmentCache, make_enrichment_cache_key
 from egregora.orchestration.worker_base import BaseWorker
 from egregora.resources.prompts import render_prompt
+from egregora.security.http import close_async_http_clients
 from egregora.security.zip import validate_zip_contents
 
 if TYPE_CHECKING:
@@ -79,6 +101,11 @@ logger = logging.getLogger(__name__)
 
 # TODO: [Taskmaster] Externalize hardcoded configuration values
 HEARTBEAT_INTERVAL = 10  # Seconds for heartbeat logging
+# Task type under which URL enrichment batch jobs are recorded.
+URL_BATCH_TASK = "enrich_url_batch"
+# Most URLs sent in one batch job; a job's inline requests are capped at 20 MB in total.
+URL_BATCH_MAX_REQUESTS = 5000
+MEDIA_PREPARE_WORKERS = 4  # Threads reading, downscaling and uploading staged media
 
 _MARKDOWN_LINK_PATTERN = re.compile(r"(?:!\[|\[)[^\]]*\]\([^)]*?([^/)]+\.\w+)\)")
 _UUID_PATTERN = re.compile(r"\b([a-f0-9]{8}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{4}-[a-f0-9]{12}\.\w+)")
@@ -161,15 +188,15 @@ async def fetch_url_with_jina(ctx: RunContext[Any], url: str) -> str:
     # Headers to enable image captioning and ensure JSON response if needed
     headers = {"X-With-Generated-Alt": "true", "X-Retain-Images": "none"}
 
-    async with httpx.AsyncClient() as client:
-        try:
-            # Jina returns Markdown by default
-            response = await client.get(jina_url, headers=headers, timeout=30.0)
-            response.raise_for_status()
-            return response.text
-        except (httpx.RequestError, httpx.HTTPStatusError) as exc:
-            msg = f"Jina fetch failed: {exc}"
-            raise JinaFetchError(msg) from exc
+    # Agents run by the enrichment worker share its cache, so retries do not fetch again.
+    fetcher = ctx.deps if isinstance(ctx.deps, CachedUrlFetcher) else CachedUrlFetcher()
+    try:
+        # Jina returns Markdown by default
+        fetched = await fetcher.get(jina_url, headers=headers)
+    except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+        msg = f"Jina fetch failed: {exc}"
+        raise JinaFetchError(msg) from exc
+    return fetched.text
 
 
 @dataclass(frozen=True, slots=True)
@@ -184,6 +211,7 @@ class EnrichmentRuntimeContext:
     usage_tracker: UsageTracker | None = None
     pii_prevention: dict[str, Any] | None = None  # LLM-native PII prevention settings
     task_store: Any | None = None  # Added for job queue scheduling
+    url_index: Any | None = None  # Corpus-wide URL candidate index (UrlCandidateIndex)
 
 
 # ---------------------------------------------------------------------------
@@ -197,6 +225,33 @@ def _uuid_to_str(value: uuid.UUID | str | None) -> str | None:
     return str(value)
 
 
+def _media_mime_type(payload: dict[str, Any]) -> str:
+    """MIME type of a media task's file.
+
+    ``media_type`` in the payload is a category ("image", "video") from
+    :data:`~egregora.ops.media.MEDIA_EXTENSIONS`, so the type is resolved
+    from the filename.
+    """
+    media_type = payload.get("media_type") or ""
+    if "/" in media_type:
+        return media_type
+    for name in (payload.get("filename"), payload.get("original_filename")):
+        if name:
+            guessed, _ = mimetypes.guess_type(name)
+            if guessed:
+                return guessed
+    return "application/octet-stream"
+
+
+def _inline_media_part(data: bytes, mime_type: str) -> dict[str, Any]:
+    return {
+        "inlineData": {
+            "mimeType": mime_type,
+            "data": base64.b64encode(data).decode("utf-8"),
+        }
+    }
+
+
 def _safe_timestamp_plus_one(timestamp: datetime | str | Any) -> datetime:
     dt_value = ensure_datetime(timestamp)
     return dt_value + timedelta(seconds=1)
@@ -260,6 +315,30 @@ def _frame_to_records(frame: Any) -> list[dict[str, Any]]:
     return [dict(row) for row in frame]
 
 
+def _url_summary_output(url: str, enrichment: dict[str, Any]) -> EnrichmentOutput:
+    """Build an enrichment document from a ``url_batch`` prompt's per-URL summary."""
+    slug = enrichment.get("slug", "")
+    title = enrichment.get("title") or slug.replace("-", " ").title()
+    tags = enrichment.get("tags", [])
+    summary = enrichment.get("summary", "")
+    takeaways = enrichment.get("key_takeaways", [])
+
+    # Build markdown from enrichment data
+    takeaways_md = "\n".join(f"- {t}" for t in takeaways) if takeaways else ""
+    markdown = f"""# {slug}
+
+## Summary
+{summary}
+
+## Key Takeaways
+{takeaways_md}
+
+---
+*Source: [{url}]({url})*
+"""
+    return EnrichmentOutput(slug=slug, markdown=markdown, title=title, tags=tags)
+
+
 def _iter_table_batches(table: Table, batch_size: int = 1000) -> Iterator[list[dict[str, Any]]]:
     """Stream table rows as batches of dictionaries without loading entire table into memory."""
     try:
@@ -292,19 +371,22 @@ def schedule_enrichment(
     enrichment_settings: EnrichmentSettings,
     context: EnrichmentRuntimeContext,
     run_id: uuid.UUID | None = None,
-) -> None:
-    """Schedule enrichment tasks for background processing."""
+) -> list[str]:
+    """Schedule enrichment tasks for background processing.
+
+    Returns the ids of the enqueued tasks.
+    """
     if not hasattr(context, "task_store") or not context.task_store:
         logger.warning("TaskStore not available in context; skipping enrichment scheduling.")
-        return
+        return []
 
     if messages_table.count().execute() == 0:
-        return
+        return []
 
     current_run_id = run_id or uuid.uuid4()
     max_enrichments = enrichment_settings.max_enrichments
 
-    url_count = _enqueue_url_enrichments(
+    url_task_ids = _enqueue_url_enrichments(
         messages_table,
         max_enrichments,
         context,
@@ -317,16 +399,16 @@ def schedule_enrichment(
         max_enrichments=max_enrichments,
         enable_media=enrichment_settings.enable_media,
     )
-    media_count = _enqueue_media_enrichments(
+    media_task_ids = _enqueue_media_enrichments(
         messages_table,
         context,
         current_run_id,
         media_config,
     )
-    logger.info("Scheduled %d URL tasks and %d Media tasks", url_count, media_count)
+    logger.info("Scheduled %d URL tasks and %d Media tasks", len(url_task_ids), len(media_task_ids))
+    return [*url_task_ids, *media_task_ids]
 
 
-# TODO: [Taskmaster] Refactor duplicated enrichment check logic
 def _enqueue_url_enrichments(
     messages_table: Table,
     max_enrichments: int,
@@ -334,49 +416,25 @@ def _enqueue_url_enrichments(
     run_id: uuid.UUID,
     *,
     enable_url: bool,
-) -> int:
+) -> list[str]:
     if not enable_url or max_enrichments <= 0:
-        return 0
+        return []
 
     backend = context.duckdb_connection or messages_table._find_backend(use_default=True)
     repo = MessageRepository(backend)
-    candidates = repo.get_url_enrichment_candidates(messages_table, max_enrichments)
+    candidates = repo.get_url_enrichment_candidates(
+        messages_table, max_enrichments, url_index=context.url_index
+    )
 
-    # Pre-check database for already enriched URLs to avoid redundant tasks
-    urls_to_check = [c[0] for c in candidates]
-    existing_urls: set[str] = set()
-    if urls_to_check:
-        try:
-            # Check for existing URL enrichments in the messages table
-            # We look for rows with media_type='URL' and matching media_url
-            db_existing = (
-                messages_table.filter(
-                    (messages_table.media_type == "URL") & (messages_table.media_url.isin(urls_to_check))
-                )
-                .select("media_url")
-                .execute()
-            )
-            existing_urls = set(db_existing["media_url"].tolist())
-        except (IbisError, ValueError) as exc:
-            logger.warning(
-                "Failed to check database for existing URL enrichments; falling back to cache only: %s",
-                exc,
-            )
+    new_urls = _unenriched_identifiers(
+        messages_table, context, kind="url", media_type="URL", identifiers=[c[0] for c in candidates]
+    )
 
-    scheduled = 0
     tasks_batch = []
     for url, metadata in candidates:
-        # Skip if already in database OR disk cache
-        if url in existing_urls:
+        if url not in new_urls:
             continue
 
-        cache_key = make_enrichment_cache_key(kind="url", identifier=url)
-        try:
-            context.cache.load(cache_key)
-            continue
-        except CacheKeyNotFoundError:
-            pass
-
         payload = {
             "type": "url",
             "url": url,
@@ -384,12 +442,65 @@ def _enqueue_url_enrichments(
         }
         if context.task_store:
             tasks_batch.append(("enrich_url", payload))
-            scheduled += 1
 
+    task_ids: list[str] = []
     if context.task_store and tasks_batch:
-        context.task_store.enqueue_batch(tasks_batch)
+        task_ids = list(context.task_store.enqueue_batch(tasks_batch))
+        if context.url_index is not None:
+            # Overlapping windows must not pick these up again.
+            context.url_index.mark([payload["url"] for _, payload in tasks_batch], "scheduled")
+    if context.url_index is not None:
+        context.url_index.mark([url for url, _ in candidates if url not in new_urls], "enriched")
+
+    return task_ids
+
+
+def _unenriched_identifiers(
+    messages_table: Table,
+    context: EnrichmentRuntimeContext,
+    *,
+    kind: str,
+    media_type: str,
+    identifiers: list[str],
+) -> set[str]:
+    """Return the identifiers that are neither enriched in the messages table nor cached.
+
+    One ``isin`` query finds rows already enriched (``media_url`` holds the URL
+    or media id) and one bulk cache probe covers the rest. Payloads are not
+    loaded: the cache only stores dicts, and readers drop corrupt entries.
+    """
+    candidates = set(identifiers)
+    if not candidates:
+        return candidates
+
+    try:
+        db_existing = (
+            messages_table.filter(
+                (messages_table.media_type == media_type) & (messages_table.media_url.isin(list(candidates)))
+            )
+            .select("media_url")
+            .execute()
+        )
+        candidates.difference_update(db_existing["media_url"].tolist())
+    except (IbisError, ValueError) as exc:
+        logger.warning(
+            "Failed to check database for existing %s enrichments; falling back to cache only: %s",
+            media_type,
+            exc,
+        )
+
+    keys = {
+        make_enrichment_cache_key(kind=kind, identifier=identifier): identifier for identifier in candidates
+    }
+    cached = {keys[key] for key in context.cache.contains_many(keys) if key in keys}
+    _record_cache_lookup(context, hit=True, count=len(cached))
+    _record_cache_lookup(context, hit=False, count=len(candidates) - len(cached))
+    return candidates - cached
 
-    return scheduled
+
+def _record_cache_lookup(context: EnrichmentRuntimeContext, *, hit: bool, count: int = 1) -> None:
+    if context.usage_tracker is not None and count:
+        context.usage_tracker.record_cache(CacheTier.ENRICHMENT.value, hit=hit, count=count)
 
 
 @dataclass
@@ -406,9 +517,9 @@ def _enqueue_media_enrichments(
     context: EnrichmentRuntimeContext,
     run_id: uuid.UUID,
     config: MediaEnrichmentConfig,
-) -> int:
+) -> list[str]:
     if not config.enable_media or config.max_enrichments <= 0:
-        return 0
+        return []
 
     backend = context.duckdb_connection or messages_table._find_backend(use_default=True)
     repo = MessageRepository(backend)
@@ -416,42 +527,20 @@ def _enqueue_media_enrichments(
         messages_table, config.media_mapping, config.max_enrichments
     )
 
-    # Pre-check database for already enriched media to avoid redundant tasks
-    media_ids_to_check = [c[1].document_id for c in candidates]
-    existing_media: set[str] = set()
-    if media_ids_to_check:
-        try:
-            # Check for existing Media enrichments in the messages table
-            # We look for rows with media_type='Media' and matching media_url (which stores the media_id)
-            db_existing = (
-                messages_table.filter(
-                    (messages_table.media_type == "Media")
-                    & (messages_table.media_url.isin(media_ids_to_check))
-                )
-                .select("media_url")
-                .execute()
-            )
-            existing_media = set(db_existing["media_url"].tolist())
-        except (IbisError, ValueError) as exc:
-            logger.warning(
-                "Failed to check database for existing Media enrichments; falling back to cache only: %s",
-                exc,
-            )
+    new_media = _unenriched_identifiers(
+        messages_table,
+        context,
+        kind="media",
+        media_type="Media",
+        identifiers=[c[1].document_id for c in candidates],
+    )
 
     scheduled = 0
     tasks_batch = []
     for ref, media_doc, metadata in candidates:
-        # Skip if already in database OR disk cache
-        if media_doc.document_id in existing_media:
+        if media_doc.document_id not in new_media:
             continue
 
-        cache_key = make_enrichment_cache_key(kind="media", identifier=media_doc.document_id)
-        try:
-            context.cache.load(cache_key)
-            continue
-        except CacheKeyNotFoundError:
-            pass
-
         payload = {
             "type": "media",
             "ref": ref,
@@ -469,9 +558,8 @@ def _enqueue_media_enrichments(
             break
 
     if context.task_store and tasks_batch:
-        context.task_store.enqueue_batch(tasks_batch)
-
-    return scheduled
+        return list(context.task_store.enqueue_batch(tasks_batch))
+    return []
 
 
 def _serialize_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
@@ -491,6 +579,20 @@ def _serialize_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
 
 
 # TODO: [Taskmaster] Decompose monolithic EnrichmentWorker class
+class UrlEnrichmentBatch(ResumableBatch):
+    """URL enrichment sent as one batch job, keyed by task id."""
+
+    task_type = URL_BATCH_TASK
+    label = "enrichment"
+    item_name = "URLs"
+
+    def _is_stale(self, tags: list[str], remaining: dict[str, Any]) -> bool:
+        # Only part of the backlog is fetched at once; a job is stale once none of its tasks is pending.
+        if self.task_store is None:
+            return super()._is_stale(tags, remaining)
+        return not self.task_store.pending_among(tags)
+
+
 class EnrichmentWorker(BaseWorker):
     """Worker for media enrichment (e.g. image description)."""
 
@@ -507,6 +609,16 @@ class EnrichmentWorker(BaseWorker):
         # Main Architecture: Ephemeral media staging
         self.staging_dir = tempfile.TemporaryDirectory(prefix="egregora_staging_")
         self.staged_files: set[str] = set()
+        self._image_preprocessor: ImagePreprocessor | None = None
+        self._file_uploads: dict[str | None, FileUploadRegistry] = {}
+        self._media_helpers_lock = threading.Lock()
+        # URL tasks whose batch job was still running when this worker stopped waiting.
+        self._url_tasks_in_running_jobs: set[str] = set()
+        self._url_fetcher: CachedUrlFetcher | None = None
+        self._url_fetcher_lock = threading.Lock()
+        # One event loop per URL thread, so its pooled HTTP connections serve every URL it runs.
+        self._url_loop_local = threading.local()
+        self._url_loops: list[tuple[threading.Thread, asyncio.AbstractEventLoop]] = []
 
         # Initialize ModelKeyRotator if enabled (reusing state across batches)
         rotation_enabled = getattr(self.enrichment_config, "model_rotation_enabled", True)
@@ -521,10 +633,7 @@ class EnrichmentWorker(BaseWorker):
             try:
                 self.zip_handle = zipfile.ZipFile(self.ctx.input_path, "r")
                 validate_zip_contents(self.zip_handle)
-                # Build index for O(1) lookup
-                for info in self.zip_handle.infolist():
-                    if not info.is_dir():
-                        self.media_index[Path(info.filename).name.lower()] = info.filename
+                self.media_index = build_media_index(self.zip_handle)
             except (OSError, zipfile.BadZipFile) as exc:
                 logger.warning("Failed to open source ZIP %s: %s", self.ctx.input_path, exc)
                 if self.zip_handle:
@@ -537,6 +646,7 @@ class EnrichmentWorker(BaseWorker):
         Should be called when done with the worker. Also called by __exit__
         for context manager support.
         """
+        self._close_url_loops()
         if self.zip_handle:
             try:
                 self.zip_handle.close()
@@ -583,7 +693,14 @@ class EnrichmentWorker(BaseWorker):
         # Scale fetch limit by concurrency to allow parallel processing of multiple batches
         fetch_limit = base_batch_size * concurrency
 
-        tasks = self.task_store.fetch_pending(task_type="enrich_url", limit=fetch_limit)
+        url_fetch_limit = fetch_limit
+        if self._url_batch_possible():
+            url_fetch_limit = max(fetch_limit, URL_BATCH_MAX_REQUESTS)
+        tasks = self.task_store.fetch_pending(task_type="enrich_url", limit=url_fetch_limit)
+        tasks = [task for task in tasks if str(task["task_id"]) not in self._url_tasks_in_running_jobs]
+        if not self._url_backlog_wants_batch_job(len(tasks)):
+            # Tasks of a job left by an earlier run come first (FIFO), so they are still in here.
+            tasks = tasks[:fetch_limit]
         media_tasks = self.task_store.fetch_pending(task_type="enrich_media", limit=fetch_limit)
 
         total_tasks = len(tasks) + len(media_tasks)
@@ -618,10 +735,138 @@ class EnrichmentWorker(BaseWorker):
         if not tasks_data:
             return 0
 
+        if self._use_url_batch_job(len(tasks_data)):
+            return self._process_url_batch_job(tasks_data)
+
         max_concurrent = self._determine_concurrency(len(tasks_data))
         results = self._execute_url_enrichments(tasks_data, max_concurrent)
         return self._persist_url_results(results)
 
+    def _url_batch_possible(self) -> bool:
+        config = self.enrichment_config
+        return getattr(config, "strategy", "individual") == "batch_api" or bool(
+            getattr(config, "url_batch_threshold", 0)
+        )
+
+    def _url_backlog_wants_batch_job(self, task_count: int) -> bool:
+        """``batch_api`` strategy, or a backlog of at least ``url_batch_threshold`` URLs."""
+        if not task_count:
+            return False
+        config = self.enrichment_config
+        if getattr(config, "strategy", "individual") == "batch_api":
+            return True
+        threshold = getattr(config, "url_batch_threshold", 0)
+        return bool(threshold) and task_count >= threshold
+
+    def _use_url_batch_job(self, task_count: int) -> bool:
+        """Whether URL tasks go through a Gemini Batch API job rather than live calls.
+
+        Besides large backlogs, a job an earlier run left to resume is always
+        collected through the batch path, so its URLs are not sent twice.
+        """
+        if self._url_backlog_wants_batch_job(task_count):
+            return True
+        return bool(
+            task_count
+            and self._url_batch_possible()
+            and self.task_store
+            and self.task_store.fetch_pending(task_type=URL_BATCH_TASK, limit=1)
+        )
+
+    def _process_url_batch_job(self, tasks_data: list[dict[str, Any]]) -> int:
+        """Enrich URLs through one resumable batch job; what it cannot answer goes live.
+
+        A job still running after ``url_batch_timeout`` stays recorded and its
+        tasks stay pending, so the next run resumes polling it instead of
+        submitting the URLs again.
+        """
+        requests = {str(td["task"]["task_id"]): self._url_batch_request(td["url"]) for td in tasks_data}
+        model = GoogleBatchModel(
+            api_key=get_google_api_key(),
+            model_name=self.ctx.config.models.enricher,
+            poll_interval=30.0,
+            timeout=float(getattr(self.enrichment_config, "url_batch_timeout", 3600)),
+        )
+        batch = UrlEnrichmentBatch(model, self.task_store)
+        still_running = False
+        try:
+            responses = batch.run(requests)
+        except BatchJobTimeoutError:
+            responses, still_running = batch.responses, True
+        except (UsageLimitExceeded, ModelHTTPError, google_exceptions.GoogleAPICallError) as exc:
+            logger.warning(
+                "[URLEnricher] Batch API failed (%s), falling back to live calls for %d URLs",
+                exc,
+                len(requests),
+            )
+            responses = {}
+
+        results: list[tuple[dict, EnrichmentOutput | None, str | None]] = []
+        live: list[dict[str, Any]] = []
+        for td in tasks_data:
+            task_id = str(td["task"]["task_id"])
+            response = responses.get(task_id)
+            if response is None:
+                if still_running:
+                    self._url_tasks_in_running_jobs.add(task_id)
+                else:
+                    live.append(td)
+                continue
+            try:
+                results.append((td["task"], self._parse_url_batch_response(td["url"], response), None))
+            except EnrichmentParsingError as exc:
+                logger.warning(
+                    "[URLEnricher] Unusable batch result for %s (%s); enriching live", td["url"], exc
+                )
+                live.append(td)
+
+        logger.info(
+            "[URLEnricher] Batch job answered %d/%d URLs (%d live, %d still running)",
+            len(results),
+            len(tasks_data),
+            len(live),
+            len(tasks_data) - len(results) - len(live),
+        )
+        if live:
+            results.extend(self._execute_url_individual(live, self._determine_concurrency(len(live))))
+        processed = self._persist_url_results(results)
+        batch.complete()
+        return processed
+
+    def _url_batch_request(self, url: str) -> dict[str, Any]:
+        """Render one URL as a batch request; the model reads the page with its URL context tool."""
+        prompts_dir = self.ctx.site_root / ".egregora" / "prompts" if self.ctx.site_root else None
+        prompt = render_prompt(
+            "enrichment.jinja",
+            mode="url_batch",
+            prompts_dir=prompts_dir,
+            url_count=1,
+            urls_json=json.dumps([url]),
+            pii_prevention=getattr(self.ctx.config.privacy, "pii_prevention", None),
+        ).strip()
+        return {
+            "contents": [{"role": "user", "parts": [{"text": prompt}]}],
+            # JSON mode cannot be combined with tools, so the JSON is parsed from the text.
+            "config": {"tools": [{"url_context": {}}]},
+        }
+
+    def _parse_url_batch_response(self, url: str, response: dict[str, Any]) -> EnrichmentOutput:
+        text = self._extract_text(response).strip()
+        text = text.removeprefix("```json").removeprefix("```").removesuffix("```")
+        try:
+            data = json.loads(text.strip())
+        except json.JSONDecodeError as exc:
+            msg = f"Failed to parse batch response: {exc}"
+            raise EnrichmentParsingError(msg) from exc
+        enrichment = data.get(url) if isinstance(data, dict) else None
+        if enrichment is None and isinstance(data, dict) and len(data) == 1:
+            # The model may normalize the URL it was given; there is only one entry either way.
+            enrichment = next(iter(data.values()))
+        if not isinstance(enrichment, dict) or not enrichment.get("slug"):
+            msg = f"No result for {url}"
+            raise EnrichmentParsingError(msg)
+        return _url_summary_output(url, enrichment)
+
     # TODO: [Taskmaster] Simplify complex async-in-sync wrapper
     def _enrich_single_url(self, task_data: dict) -> tuple[dict, EnrichmentOutput | None, str | None]:
         """Enrich a single URL with fallback support (sync wrapper)."""
@@ -635,10 +880,11 @@ class EnrichmentWorker(BaseWorker):
         try:
             # Create agent with fallback
             model_name = self.ctx.config.models.enricher
-            provider = GoogleProvider(api_key=get_google_api_key())
-            model = GoogleModel(
-                model_name.removeprefix("google-gla:"),
-                provider=provider,
+            api_key = get_google_api_key()
+            provider = GoogleProvider(api_key=api_key)
+            model = RateLimitedModel(
+                GoogleModel(model_name.removeprefix("google-gla:"), provider=provider),
+                api_key=api_key,
             )
 
             # REGISTER TOOLS:
@@ -651,19 +897,15 @@ class EnrichmentWorker(BaseWorker):
                 tools=[fetch_url_with_jina],  # Custom tools use regular tools param
             )
 
-            # Since this is running in a thread pool (via _execute_url_individual),
-            # we can create a new event loop for this thread.
+            fetcher = self.url_fetcher
 
             async def _run_async() -> Any:
-                return await agent.run(prompt)
+                return await agent.run(prompt, deps=fetcher)
 
-            # Create a new event loop for this thread to avoid "Event loop is closed" errors
-            loop = asyncio.new_event_loop()
+            # Runs in a thread pool (via _execute_url_individual); each thread keeps its loop.
+            loop = self._url_loop()
             asyncio.set_event_loop(loop)
-            try:
-                result = loop.run_until_complete(_run_async())
-            finally:
-                loop.close()
+            result = loop.run_until_complete(_run_async())
 
         except Exception as e:
             msg = f"Failed to enrich URL {url}: {e}"
@@ -671,6 +913,56 @@ class EnrichmentWorker(BaseWorker):
         else:
             return task, result.output, None
 
+    def _url_loop(self) -> asyncio.AbstractEventLoop:
+        """Event loop of the calling thread for URL agents.
+
+        The shared async HTTP client is kept per loop, so reusing the loop
+        lets the thread's later URLs reuse its open connections. Loops are
+        closed by :meth:`_close_url_loops`.
+        """
+        loop = getattr(self._url_loop_local, "loop", None)
+        if loop is None or loop.is_closed():
+            loop = self._url_loop_local.loop = asyncio.new_event_loop()
+            with self._url_fetcher_lock:
+                self._url_loops.append((threading.current_thread(), loop))
+        return loop
+
+    def _close_url_loops(self, *, finished_threads_only: bool = False) -> None:
+        """Close URL threads' HTTP clients and event loops.
+
+        With ``finished_threads_only``, loops of threads that are still alive
+        (another batch on this worker) are left open.
+        """
+        with self._url_fetcher_lock:
+            loops = [
+                loop for thread, loop in self._url_loops if not (finished_threads_only and thread.is_alive())
+            ]
+            self._url_loops = [entry for entry in self._url_loops if entry[1] not in loops]
+        for loop in loops:
+            if loop.is_closed():
+                continue
+            try:
+                loop.run_until_complete(close_async_http_clients())
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            except Exception:
+                logger.debug("Error closing URL enrichment HTTP clients", exc_info=True)
+            finally:
+                loop.close()
+
+    @property
+    def url_fetcher(self) -> CachedUrlFetcher:
+        """Fetcher the URL agents' tools share, backed by the ``asset_cache`` table."""
+        with self._url_fetcher_lock:
+            if self._url_fetcher is None:
+                ttl = timedelta(seconds=getattr(self.enrichment_config, "url_fetch_cache_ttl", 0))
+                try:
+                    cache: AssetCache | None = AssetCache(self.ctx.storage)
+                except (duckdb.Error, IbisError):
+                    logger.warning("Fetched content cache unavailable; URL tools fetch every time")
+                    cache = None
+                self._url_fetcher = CachedUrlFetcher(cache, ttl=ttl)
+            return self._url_fetcher
+
     def _prepare_url_tasks(self, tasks: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Parse payloads and render prompts for URL enrichment tasks."""
         tasks_data: list[dict[str, Any]] = []
@@ -792,12 +1084,27 @@ class EnrichmentWorker(BaseWorker):
         self, tasks_data: list[dict[str, Any]], max_concurrent: int
     ) -> list[tuple[dict, EnrichmentOutput | None, str | None]]:
         """Execute URL enrichments individually with model rotation."""
+        try:
+            results = self._run_url_individual(tasks_data, max_concurrent)
+        finally:
+            # The pool's threads are gone; release their loops and pooled connections.
+            self._close_url_loops(finished_threads_only=True)
+        logger.info("[Enrichment] URL tasks complete: %d/%d", len(results), len(tasks_data))
+        return results
+
+    def _run_url_individual(
+        self, tasks_data: list[dict[str, Any]], max_concurrent: int
+    ) -> list[tuple[dict, EnrichmentOutput | None, str | None]]:
         results: list[tuple[dict, EnrichmentOutput | None, str | None]] = []
         total = len(tasks_data)
         last_log_time = time.time()
 
         with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
-            future_to_task = {executor.submit(self._enrich_single_url, td): td for td in tasks_data}
+            # Each call runs in a copy of this context so its spans stay attached to the run.
+            future_to_task = {
+                executor.submit(contextvars.copy_context().run, self._enrich_single_url, td): td
+                for td in tasks_data
+            }
             for i, future in enumerate(as_completed(future_to_task), 1):
                 try:
                     results.append(future.result())
@@ -819,8 +1126,6 @@ class EnrichmentWorker(BaseWorker):
                     task = future_to_task[future]["task"]
                     logger.exception("Unexpected error during enrichment for %s", task["task_id"])
                     results.append((task, None, str(exc)))
-
-        logger.info("[Enrichment] URL tasks complete: %d/%d", len(results), total)
         return results
 
     # TODO: [Taskmaster] Decompose complex batch execution method
@@ -831,12 +1136,8 @@ class EnrichmentWorker(BaseWorker):
 
         Sends all URLs together with a combined prompt asking for JSON dict result.
         """
-        from google import genai
         from google.genai import types
 
-        api_key = get_google_api_key()
-        client = genai.Client(api_key=api_key)
-
         # Extract URLs from tasks
         urls = []
         for td in tasks_data:
@@ -860,7 +1161,7 @@ class EnrichmentWorker(BaseWorker):
         if self.rotator:
 
             def call_with_model_and_key(model: str, api_key: str) -> str:
-                client = genai.Client(api_key=api_key)
+                client = get_genai_client(api_key)
                 response = client.models.generate_content(
                     model=model,
                     contents=cast("Any", [{"parts": [{"text": combined_prompt}]}]),
@@ -873,12 +1174,13 @@ class EnrichmentWorker(BaseWorker):
             # No rotation - use configured model and API key
             model_name = self.ctx.config.models.enricher
             api_key = get_google_api_key()
-            client = genai.Client(api_key=api_key)
-            response = client.models.generate_content(
-                model=model_name,
-                contents=cast("Any", [{"parts": [{"text": combined_prompt}]}]),
-                config=types.GenerateContentConfig(response_mime_type="application/json"),
-            )
+            client = get_genai_client(api_key)
+            with get_adaptive_limiter("google", model_name, api_key).request_sync():
+                response = client.models.generate_content(
+                    model=model_name,
+                    contents=cast("Any", [{"parts": [{"text": combined_prompt}]}]),
+                    config=types.GenerateContentConfig(response_mime_type="application/json"),
+                )
             response_text = response.text or ""
 
         logger.debug(
@@ -903,28 +1205,7 @@ class EnrichmentWorker(BaseWorker):
 
             enrichment = results_dict.get(url, {})
             if enrichment:
-                # Build EnrichmentOutput from result
-                slug = enrichment.get("slug", "")
-                title = enrichment.get("title") or slug.replace("-", " ").title()
-                tags = enrichment.get("tags", [])
-                summary = enrichment.get("summary", "")
-                takeaways = enrichment.get("key_takeaways", [])
-
-                # Build markdown from enrichment data
-                takeaways_md = "\n".join(f"- {t}" for t in takeaways) if takeaways else ""
-                markdown = f"""# {slug}
-
-## Summary
-{summary}
-
-## Key Takeaways
-{takeaways_md}
-
----
-*Source: [{url}]({url})*
-"""
-                output = EnrichmentOutput(slug=slug, markdown=markdown, title=title, tags=tags)
-                results.append((task, output, None))
+                results.append((task, _url_summary_output(url, enrichment), None))
                 logger.info("[URLEnricher] Processed %s via single-call batch", url)
             else:
                 results.append((task, None, f"No result for {url}"))
@@ -993,9 +1274,42 @@ class EnrichmentWorker(BaseWorker):
         if not requests:
             return 0
 
-        results = self._execute_media_batch(requests, task_map)
+        plan = self._plan_media_batches(requests, task_map)
+        results: list[Any] = []
+        for batch in plan.batches:
+            results.extend(self._execute_media_batch(batch, task_map))
+        if plan.oversized:
+            logger.info(
+                "[MediaEnricher] Sending %d oversized media requests on their own", len(plan.oversized)
+            )
+            results.extend(
+                self._execute_media_individual(
+                    plan.oversized, task_map, self.ctx.config.models.enricher_vision, get_google_api_key()
+                )
+            )
         return self._persist_media_results(results, task_map)
 
+    def _plan_media_batches(
+        self, requests: list[dict[str, Any]], task_map: dict[str, dict[str, Any]]
+    ) -> MediaBatchPlan:
+        """Pack requests into batches that fit the strategy's request size and token limits."""
+        sizes = {}
+        for request in requests:
+            media = task_map[request["tag"]].get("_staged_media")
+            file_size = media.size if isinstance(media, StagedMedia) else 0
+            sizes[request["tag"]] = estimate_request_size(request, file_size=file_size)
+
+        strategy = getattr(self.enrichment_config, "strategy", "individual")
+        limits = SINGLE_CALL_LIMITS if strategy == "batch_all" else BATCH_JOB_LIMITS
+        plan = pack_media_requests(requests, sizes, limits)
+        if len(plan.batches) > 1:
+            logger.info(
+                "[MediaEnricher] Packed %d media requests into %d batches",
+                len(requests) - len(plan.oversized),
+                len(plan.batches),
+            )
+        return plan
+
     def _extract_text(self, response: dict[str, Any] | None) -> str:
         if not response:
             return ""
@@ -1014,6 +1328,7 @@ class EnrichmentWorker(BaseWorker):
         requests: list[dict[str, Any]] = []
         task_map: dict[str, dict[str, Any]] = {}
 
+        staged: list[tuple[dict[str, Any], dict[str, Any], StagedMedia]] = []
         for task in tasks:
             try:
                 payload = task["payload"]
@@ -1021,21 +1336,33 @@ class EnrichmentWorker(BaseWorker):
                     payload = json.loads(payload)
                 task["_parsed_payload"] = payload
 
-                # Stage the file to disk (ephemeral)
+                # Stage the file in memory (spooled to disk when large)
                 try:
-                    staged_path = self._stage_file(task, payload)
+                    media = self._stage_media(task, payload)
                 except MediaStagingError as exc:
                     logger.warning("Failed to stage media for task %s: %s", task["task_id"], exc)
                     self.task_store.mark_failed(task["task_id"], str(exc))
                     continue
 
-                # Store staged path in task for later persistence
-                task["_staged_path"] = str(staged_path)
+                # Keep the staged media with the task for later persistence
+                task["_staged_media"] = media
+                staged.append((task, payload, media))
 
-                filename = payload["filename"]
-                media_type = payload["media_type"]
+            except Exception as exc:
+                logger.exception("Failed to prepare media task %s", task.get("task_id"))
+                self.task_store.mark_failed(task.get("task_id"), str(exc))
+
+        media_parts = self._prepare_media_contents(
+            [(media, _media_mime_type(payload)) for _, payload, media in staged]
+        )
+
+        for (task, payload, _media), media_part in zip(staged, media_parts, strict=True):
+            try:
+                if isinstance(media_part, Exception):
+                    raise media_part
 
-                media_part = self._prepare_media_content(staged_path, media_type)
+                filename = payload["filename"]
+                media_type = _media_mime_type(payload)
 
                 prompt = render_prompt(
                     "enrichment.jinja",
@@ -1068,98 +1395,135 @@ class EnrichmentWorker(BaseWorker):
 
         return requests, task_map
 
-    # TODO: [Taskmaster] Simplify complex file staging logic
-    def _stage_file(self, task: dict[str, Any], payload: dict[str, Any]) -> Path:
-        """Extract media file from ZIP to ephemeral staging directory."""
+    def _prepare_media_contents(
+        self, items: list[tuple[StagedMedia, str]]
+    ) -> list[dict[str, Any] | Exception]:
+        """Encode, reduce or upload staged media in a thread pool; failures are returned, not raised."""
+
+        def prepare(item: tuple[StagedMedia, str]) -> dict[str, Any] | Exception:
+            try:
+                return self._prepare_media_content(*item)
+            except Exception as exc:  # reported per task by the caller
+                return exc
+
+        if not items:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(MEDIA_PREPARE_WORKERS, len(items)), thread_name_prefix="media-prepare"
+        ) as pool:
+            return list(pool.map(prepare, items))
+
+    def _source_archive(self, task: dict[str, Any]) -> tuple[zipfile.ZipFile, dict[str, str]]:
+        """Return the run's shared ZIP handle and media index, opening them on first use."""
+        with self._media_helpers_lock:
+            if self.zip_handle is None:
+                input_path = self.ctx.input_path
+                if not input_path or not input_path.exists():
+                    msg = f"Input path not available for media task {task['task_id']}"
+                    raise MediaStagingError(msg)
+                try:
+                    zf = zipfile.ZipFile(input_path, "r")
+                except (OSError, zipfile.BadZipFile) as exc:
+                    msg = f"Failed to open source ZIP: {exc}"
+                    raise MediaStagingError(msg) from exc
+                try:
+                    validate_zip_contents(zf)
+                    self.media_index = build_media_index(zf)
+                except Exception:
+                    zf.close()
+                    raise
+                self.zip_handle = zf
+            return self.zip_handle, self.media_index
+
+    def _stage_media(self, task: dict[str, Any], payload: dict[str, Any]) -> StagedMedia:
+        """Read a media file from the source ZIP into memory, spooling large files to disk."""
         original_filename = payload.get("original_filename") or payload.get("filename")
         if not original_filename:
             msg = "No filename in task payload"
             raise MediaStagingError(msg)
 
-        target_lower = original_filename.lower()
-
-        zf = self.zip_handle
-        media_index = self.media_index
-        should_close = False
-
-        # Ensure ZIP handle is available, opening it if necessary.
-        if zf is None:
-            input_path = self.ctx.input_path
-            if not input_path or not input_path.exists():
-                msg = f"Input path not available for media task {task['task_id']}"
-                raise MediaStagingError(msg)
-            try:
-                zf = zipfile.ZipFile(input_path, "r")
-                should_close = True
-                media_index = {
-                    Path(info.filename).name.lower(): info.filename
-                    for info in zf.infolist()
-                    if not info.is_dir()
-                }
-            except (OSError, zipfile.BadZipFile) as exc:
-                msg = f"Failed to open source ZIP: {exc}"
-                raise MediaStagingError(msg) from exc
+        zf, media_index = self._source_archive(task)
+        full_path = media_index.get(original_filename.lower())
+        if not full_path:
+            msg = f"Media file {original_filename} not found in ZIP"
+            raise MediaStagingError(msg)
 
         try:
-            full_path = media_index.get(target_lower)
-            if not full_path:
-                msg = f"Media file {original_filename} not found in ZIP"
-                raise MediaStagingError(msg)
-
-            safe_name = f"{task['task_id']}_{Path(full_path).name}"
-            target_path = Path(self.staging_dir.name) / safe_name
-
-            if target_path.exists():
-                return target_path
-
-            with zf.open(full_path) as source, target_path.open("wb") as dest:
-                shutil.copyfileobj(source, dest)
-
-            self.staged_files.add(str(target_path))
-            return target_path
+            return stage_zip_member(zf, full_path)
         except Exception as exc:
             msg = f"Failed to stage media file {original_filename}: {exc}"
             raise MediaStagingError(msg) from exc
+
+    def _stage_file(self, task: dict[str, Any], payload: dict[str, Any]) -> Path:
+        """Extract a media file from the source ZIP into the ephemeral staging directory."""
+        media = task.get("_staged_media")
+        if not isinstance(media, StagedMedia):
+            media = self._stage_media(task, payload)
+        target_path = Path(self.staging_dir.name) / f"{task['task_id']}_{media.name}"
+        try:
+            if not target_path.exists():
+                media.write_to(target_path)
+        except OSError as exc:
+            msg = f"Failed to stage media file {media.name}: {exc}"
+            raise MediaStagingError(msg) from exc
         finally:
-            if should_close and zf:
-                zf.close()
+            media.close()
+        self.staged_files.add(str(target_path))
+        return target_path
+
+    def _prepare_media_content(self, media: StagedMedia, mime_type: str) -> dict[str, Any]:
+        """Prepare media content for API request, using File API for large files.
 
-    def _prepare_media_content(self, file_path: Path, mime_type: str) -> dict[str, Any]:
-        """Prepare media content for API request, using File API for large files."""
+        Images are downscaled and re-encoded first (see
+        :mod:`egregora.ops.image_preprocessing`), so most of them are sent inline.
+        """
         # Threshold: 20 MB
         params = getattr(self.ctx.config.enrichment, "large_file_threshold_mb", 20)
         threshold_bytes = params * 1024 * 1024
 
-        file_size = file_path.stat().st_size
-
-        if file_size > threshold_bytes:
-            from google import genai
+        if mime_type in PREPROCESSABLE_MIME_TYPES:
+            file_bytes, prepared_mime_type = self.image_preprocessor.prepare(media.read_bytes(), mime_type)
+            if len(file_bytes) <= threshold_bytes:
+                return _inline_media_part(file_bytes, prepared_mime_type)
+            # Still too large: the original file is sent below, under its own MIME type.
 
+        if media.size > threshold_bytes:
             logger.info(
                 "File %s is %.2f MB (threshold: %d MB), using File API upload",
-                file_path.name,
-                file_size / (1024 * 1024),
+                media.name,
+                media.size / (1024 * 1024),
                 params,
             )
-
-            api_key = get_google_api_key()
-            client = genai.Client(api_key=api_key)
-
-            # Upload file
-            # Note: client.files.upload returns a File object with 'uri'
-            uploaded_file = client.files.upload(file=str(file_path), config={"mime_type": mime_type})
-            logger.info("Uploaded file %s to %s", file_path.name, uploaded_file.uri)
-
+            uploaded_file = self._file_upload_registry(get_google_api_key()).get_or_upload(media, mime_type)
             return {"fileData": {"mimeType": mime_type, "fileUri": uploaded_file.uri}}
         # Inline base64 for small files
-        file_bytes = file_path.read_bytes()
-        b64_data = base64.b64encode(file_bytes).decode("utf-8")
-        return {
-            "inlineData": {
-                "mimeType": mime_type,
-                "data": b64_data,
-            }
-        }
+        return _inline_media_part(media.read_bytes(), mime_type)
+
+    @property
+    def image_preprocessor(self) -> ImagePreprocessor:
+        """Reduces images before enrichment, caching derivatives in the pipeline cache."""
+        with self._media_helpers_lock:
+            if self._image_preprocessor is None:
+                config = self.enrichment_config
+                options = ImagePreprocessOptions(
+                    max_edge=config.image_max_edge, format=config.image_format, quality=config.image_quality
+                )
+                self._image_preprocessor = ImagePreprocessor(options, cache=self._media_store())
+            return self._image_preprocessor
+
+    def _file_upload_registry(self, api_key: str | None) -> FileUploadRegistry:
+        """File API uploads of ``api_key``'s project, reused while they are live."""
+        with self._media_helpers_lock:
+            registry = self._file_uploads.get(api_key)
+            if registry is None:
+                registry = self._file_uploads[api_key] = FileUploadRegistry(
+                    genai_uploader(api_key), self._media_store(), namespace=key_fingerprint(api_key)
+                )
+            return registry
+
+    def _media_store(self) -> Any:
+        pipeline_cache = getattr(self.ctx, "cache", None)
+        return getattr(pipeline_cache, "media", None)
 
     def _execute_media_batch(
         self, requests: list[dict[str, Any]], task_map: dict[str, dict[str, Any]]
@@ -1205,10 +1569,9 @@ class EnrichmentWorker(BaseWorker):
         Sends all images together with a combined prompt asking for JSON dict with
         results keyed by filename. This reduces 12 API calls to 1.
         """
-        from google import genai
         from google.genai import types
 
-        client = genai.Client(api_key=api_key)
+        client = get_genai_client(api_key)
 
         # Strip prefix for direct API calls
         if model_name.startswith("google-gla:"):
@@ -1253,7 +1616,7 @@ class EnrichmentWorker(BaseWorker):
         if self.rotator:
 
             def call_with_model_and_key(model: str, api_key: str) -> str:
-                client = genai.Client(api_key=api_key)
+                client = get_genai_client(api_key)
                 response = client.models.generate_content(
                     model=model,
                     contents=cast("Any", [{"parts": request_parts}]),
@@ -1264,12 +1627,13 @@ class EnrichmentWorker(BaseWorker):
             response_text = self.rotator.call_with_rotation(call_with_model_and_key)
         else:
             # No rotation - use configured model and API key
-            response = client.models.generate_content(
-                model=model_name,
-                contents=cast("Any", [{"parts": request_parts}]),
-                config=types.GenerateContentConfig(response_mime_type="application/json"),
-            )
-            response_text = response.text if response.text else ""
+            with get_adaptive_limiter("google", model_name, api_key).request_sync():
+                response = client.models.generate_content(
+                    model=model_name,
+                    contents=cast("Any", [{"parts": request_parts}]),
+                    config=types.GenerateContentConfig(response_mime_type="application/json"),
+                )
+            response_text = response.text or ""
 
         logger.debug(
             "[MediaEnricher] Single-call response received. Length: %d characters.", len(response_text)
@@ -1329,10 +1693,9 @@ class EnrichmentWorker(BaseWorker):
         api_key: str,
     ) -> list[Any]:
         """Execute media enrichment requests individually (fallback when batch fails)."""
-        from google import genai
         from google.genai import types
 
-        client = genai.Client(api_key=api_key)
+        client = get_genai_client(api_key)
 
         # Strip prefix for direct API calls
         if model_name.startswith("google-gla:"):
@@ -1352,11 +1715,12 @@ class EnrichmentWorker(BaseWorker):
                 config = req.get("config", {})
 
                 # Call Gemini API directly
-                response = client.models.generate_content(
-                    model=model_name,
-                    contents=contents,
-                    config=types.GenerateContentConfig(**config) if config else None,
-                )
+                with get_adaptive_limiter("google", model_name, api_key).request_sync():
+                    response = client.models.generate_content(
+                        model=model_name,
+                        contents=contents,
+                        config=types.GenerateContentConfig(**config) if config else None,
+                    )
 
                 # Create BatchResult-like object
                 result = type(
@@ -1411,11 +1775,16 @@ class EnrichmentWorker(BaseWorker):
             media_type = payload["media_type"]
             media_id = payload.get("media_id")
 
-            # Use staged path if available
+            # Small media is persisted from memory; anything else needs a staged file to move.
+            media = task.get("_staged_media")
             staged_path = task.get("_staged_path")
+            content = b""
             source_path = None
 
-            if staged_path and Path(staged_path).exists():
+            if isinstance(media, StagedMedia) and media.in_memory:
+                content = media.read_bytes()
+                media.close()
+            elif staged_path and Path(staged_path).exists():
                 source_path = staged_path
             else:
                 # Fallback to re-extraction (should be rare if staging works)
@@ -1452,12 +1821,12 @@ class EnrichmentWorker(BaseWorker):
             }
 
             # Persist the actual media file
-            # We pass empty bytes for content because source_path is provided
+            # Content stays empty when source_path is provided
             media_doc = Document(
-                content=b"",
+                content=content,
                 type=DocumentType.MEDIA,
                 metadata=media_metadata,
-                id=media_id if media_id else str(uuid.uuid4()),
+                id=media_id or str(uuid.uuid4()),
                 parent_id=None,  # Media files have no parent document
                 suggested_path=suggested_path,
             )
@@ -259,8 +259,8 @@ def search_media_impl(query: str, top_k: int = 5) -> SearchMediaResult:
 
     """
     try:
-        # Execute RAG search
-        request = RAGQueryRequest(text=query, top_k=top_k)
+        # Execute RAG search restricted to media (filtered inside the vector store)
+        request = RAGQueryRequest(text=query, top_k=top_k, media_only=True)
         response = search(request)
 
         # Convert RAGHit results to MediaItem format
@@ -272,7 +272,7 @@ def search_media_impl(query: str, top_k: int = 5) -> SearchMediaResult:
             media_path = metadata.get("media_path")
             original_filename = metadata.get("original_filename")
 
-            # Only include media documents
+            # Backends without structured filters may still return non-media hits
             if media_type:
                 media_items.append(
                     MediaItem(
@@ -15,6 +15,7 @@ from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
     import uuid
+    from collections.abc import Mapping
     from pathlib import Path
 
     from google import genai
@@ -93,6 +94,8 @@ class WindowProcessingParams:
     run_id: str | None = None
     adapter_content_summary: str = ""
     adapter_generation_instructions: str = ""
+    # First-turn writer responses from a batch job, keyed by window signature.
+    batch_responses: Mapping[str, Any] | None = None
 
 
 class PostMetadata(BaseModel):
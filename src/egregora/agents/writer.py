@@ -34,6 +34,7 @@ from pydantic_ai.messages import (
     ToolReturnPart,
 )
 from pydantic_ai.models import KnownModelName, Model
+from pydantic_ai.models.google import GoogleModel
 from pydantic_ai.settings import ModelSettings
 from ratelimit import limits, sleep_and_retry
 from tenacity import Retrying
@@ -45,6 +46,13 @@ from egregora.agents.types import (
     WriterDeps,
     WriterResources,
 )
+from egregora.agents.writer_batch import (
+    PrefetchedResponseModel,
+    RequestCaptureModel,
+    WriterBatch,
+    batch_write_supported,
+    capture_first_request,
+)
 from egregora.agents.writer_context import (
     WriterContext,
     WriterContextParams,
@@ -63,9 +71,12 @@ from egregora.agents.writer_setup import (
 )
 from egregora.data_primitives.document import Document, DocumentType
 from egregora.llm.api_keys import (
+    get_google_api_key,
     get_google_api_keys,
     get_openrouter_api_keys,
 )
+from egregora.llm.providers.google_batch import GoogleBatchModel
+from egregora.llm.providers.rate_limited import RateLimitedModel
 from egregora.llm.retry import RETRY_IF, RETRY_STOP, RETRY_WAIT
 from egregora.orchestration.cache import PipelineCache
 from egregora.output_sinks import OutputSinkRegistry, create_default_output_registry
@@ -78,6 +89,7 @@ if TYPE_CHECKING:
 
     from egregora.config.settings import EgregoraConfig
     from egregora.data_primitives.document import OutputSink
+    from egregora.database.task_store import TaskStore
 
 logger = logging.getLogger(__name__)
 
@@ -102,6 +114,9 @@ GEMINI_MODEL_PRIORITY = [
 JOURNAL_TEMPLATE_NAME = "journal.md.jinja"
 TEMPLATES_DIR_NAME = "templates"
 
+# User prompt that starts every writer agent run
+WRITER_USER_PROMPT = "Analyze the conversation context provided and write posts/profiles as needed."
+
 # Fallback template identifier for cache signature
 DEFAULT_TEMPLATE_SIGNATURE = "standard_writer_v1"
 
@@ -395,11 +410,21 @@ def write_posts_with_pydantic_agent(
     test_model: AgentModel | None = None,
     max_tokens_override: int | None = None,
     api_key_override: str | None = None,
+    prefetched_response: dict[str, Any] | None = None,
 ) -> tuple[list[str], list[str]]:
-    """Execute the writer flow using Pydantic-AI agent tooling."""
+    """Execute the writer flow using Pydantic-AI agent tooling.
+
+    ``prefetched_response`` is a batch-API answer to the agent's first model
+    request (see :mod:`egregora.agents.writer_batch`); later turns go live.
+    """
     logger.info("Running writer via Pydantic-AI backend")
 
     model = create_writer_model(config, context, prompt, test_model, api_key=api_key_override)
+    if prefetched_response is not None and isinstance(model, GoogleModel):
+        logger.info("Using batch response for the first writer turn of %s", context.window_label)
+        model = PrefetchedResponseModel(model, prefetched_response)
+    if test_model is None and isinstance(model, Model):
+        model = RateLimitedModel(model, api_key=api_key_override)
     model_settings: ModelSettings | None = None
     if config.models.writer.startswith("openrouter:"):
         model_settings = {"max_tokens": max_tokens_override or 1024}
@@ -433,7 +458,7 @@ def write_posts_with_pydantic_agent(
     def _run_agent_sync(loop: asyncio.AbstractEventLoop) -> Any:
         async def _run_async() -> Any:
             return await agent.run(
-                "Analyze the conversation context provided and write posts/profiles as needed.",
+                WRITER_USER_PROMPT,
                 deps=context,
                 usage_limits=usage_limits,
             )
@@ -666,6 +691,7 @@ def _execute_writer_with_error_handling(
     prompt: str,
     config: EgregoraConfig,
     deps: WriterDeps,
+    prefetched_response: dict[str, Any] | None = None,
 ) -> tuple[list[str], list[str]]:
     global _KEY_ROTATION_INDEX, _WRITER_LOOP
     last_exc: Exception | None = None
@@ -703,6 +729,8 @@ def _execute_writer_with_error_handling(
                 masked_key,
             )
 
+            # A batch response answers the first attempt only; retries go live.
+            first_turn, prefetched_response = prefetched_response, None
             try:
                 result = write_posts_with_pydantic_agent(
                     prompt=prompt,
@@ -710,6 +738,7 @@ def _execute_writer_with_error_handling(
                     context=deps,
                     max_tokens_override=openrouter_max_tokens,
                     api_key_override=key,
+                    prefetched_response=first_turn,
                 )
                 _KEY_ROTATION_INDEX = (current_key_idx + 1) % num_keys if num_keys > 0 else 0
                 return result
@@ -777,27 +806,27 @@ def _finalize_writer_results(params: WriterFinalizationParams) -> dict[str, list
     return result_payload
 
 
-# TODO: [Taskmaster] Refactor complex `write_posts_for_window` function
-def write_posts_for_window(params: WindowProcessingParams) -> dict[str, Any]:
-    """Public entry point for the writer agent."""
-    if params.smoke_test:
-        logger.info("Smoke test mode: skipping writer agent.")
-        return {RESULT_KEY_POSTS: [], RESULT_KEY_PROFILES: []}
+@dataclass
+class _PreparedWindow:
+    """Writer inputs of one window, or its cached result when nothing needs to run."""
 
-    # We check if messages list is empty
-    if not params.messages:
-        logger.warning("write_posts_for_window called with 0 messages for window %s", params.window_label)
-        return {RESULT_KEY_POSTS: [], RESULT_KEY_PROFILES: []}
+    resources: WriterResources
+    signature: str
+    cached_result: dict[str, Any] | None = None
+    deps: WriterDeps | None = None
+    prompt: str = ""
 
-    # NEW: Trace message count
-    logger.info("Writer agent received %d messages for processing", len(params.messages))
 
+def _prepare_window(params: WindowProcessingParams, *, record_cache_stats: bool = True) -> _PreparedWindow:
+    """Build a window's context, check the L3 cache and render the writer prompt."""
     # 1. Prepare dependencies (partial, will update with context later)
     resources = params.resources
     if params.run_id and resources.run_id is None:
         # Create new resources with run_id
         resources = dataclasses.replace(resources, run_id=params.run_id)
 
+    window_label = f"{params.window_start:%Y-%m-%d %H:%M} to {params.window_end:%H:%M}"
+
     # 2. Build context and calculate signature
     # We need to build context first to get XML for signature
     writer_context, signature = build_context_and_signature(
@@ -806,7 +835,7 @@ def write_posts_for_window(params: WindowProcessingParams) -> dict[str, Any]:
             resources=resources,
             cache=params.cache,
             config=params.config,
-            window_label=f"{params.window_start:%Y-%m-%d %H:%M} to {params.window_end:%H:%M}",
+            window_label=window_label,
             adapter_content_summary=params.adapter_content_summary,
             adapter_generation_instructions=params.adapter_generation_instructions,
         ),
@@ -817,36 +846,26 @@ def write_posts_for_window(params: WindowProcessingParams) -> dict[str, Any]:
     cached_result = check_writer_cache(
         params.cache,
         signature,
-        f"{params.window_start:%Y-%m-%d %H:%M} to {params.window_end:%H:%M}",
-        resources.usage,
+        window_label,
+        resources.usage if record_cache_stats else None,
     )
     if cached_result:
         # TODO: [Taskmaster] Refactor brittle cache validation logic
         # Validate cached posts still exist on disk (they may be missing if output dir is fresh)
         cached_posts = cached_result.get(RESULT_KEY_POSTS, [])
-        if cached_posts:
+        posts_exist = True
+        if cached_posts and hasattr(resources.output, "posts_dir"):
             # Check if at least one post file exists
-            posts_exist = True
-            if hasattr(resources.output, "posts_dir"):
-                posts_exist = any(
-                    list(resources.output.posts_dir.glob(f"*{slug}*.md"))
-                    for slug in cached_posts[:1]  # Check first post only for speed
-                )
-
-            if not posts_exist:
-                logger.warning(
-                    "⚠️ Cached posts not found on disk, regenerating for window %s",
-                    f"{params.window_start:%Y-%m-%d %H:%M} to {params.window_end:%H:%M}",
-                )
-                # Invalidate this cache entry
-                params.cache.writer.delete(signature)
-            else:
-                _regenerate_site_indices(resources.output)
-                return cached_result
-        else:
-            return cached_result
+            posts_exist = any(
+                list(resources.output.posts_dir.glob(f"*{slug}*.md"))
+                for slug in cached_posts[:1]  # Check first post only for speed
+            )
 
-    logger.info("Using Pydantic AI backend for writer")
+        if posts_exist:
+            return _PreparedWindow(resources=resources, signature=signature, cached_result=cached_result)
+        logger.warning("⚠️ Cached posts not found on disk, regenerating for window %s", window_label)
+        # Invalidate this cache entry
+        params.cache.writer.delete(signature)
 
     # 4. Create Deps with the generated context
     deps = prepare_writer_dependencies(
@@ -868,7 +887,7 @@ def write_posts_for_window(params: WindowProcessingParams) -> dict[str, Any]:
     # Trace final deps message count
     logger.info("WriterDeps initialized with %d messages", len(deps.messages))
 
-    # 5. Render prompt and execute agent
+    # 5. Render prompt
     # NOTE: _render_writer_prompt uses writer_context, which we stripped RAG/Profiles from.
     # The Jinja template must be robust to missing/empty rag_context/profiles_context
     # OR we need to trust the dynamic system prompts to fill them in.
@@ -876,25 +895,112 @@ def write_posts_for_window(params: WindowProcessingParams) -> dict[str, Any]:
     # {% if profiles_context %}{{ profiles_context }}{% endif %}
     # If they are empty strings, they won't render in the user prompt, which is what we want,
     # because they will be injected by system prompts.
-
     prompt = _render_writer_prompt(writer_context, deps.resources.prompts_dir)
+    return _PreparedWindow(resources=resources, signature=signature, deps=deps, prompt=prompt)
+
+
+def write_posts_for_window(params: WindowProcessingParams) -> dict[str, Any]:
+    """Public entry point for the writer agent."""
+    if params.smoke_test:
+        logger.info("Smoke test mode: skipping writer agent.")
+        return {RESULT_KEY_POSTS: [], RESULT_KEY_PROFILES: []}
+
+    # We check if messages list is empty
+    if not params.messages:
+        logger.warning("write_posts_for_window called with 0 messages for window %s", params.window_label)
+        return {RESULT_KEY_POSTS: [], RESULT_KEY_PROFILES: []}
+
+    # NEW: Trace message count
+    logger.info("Writer agent received %d messages for processing", len(params.messages))
+
+    prepared = _prepare_window(params)
+    if prepared.cached_result is not None:
+        if prepared.cached_result.get(RESULT_KEY_POSTS):
+            _regenerate_site_indices(prepared.resources.output)
+        return prepared.cached_result
+
+    logger.info("Using Pydantic AI backend for writer")
+    deps = cast("WriterDeps", prepared.deps)
 
     # Execute writer with error handling (removed economic mode - never worked)
-    saved_posts, saved_profiles = _execute_writer_with_error_handling(prompt, params.config, deps)
+    prefetched_response = (params.batch_responses or {}).get(prepared.signature)
+    saved_posts, saved_profiles = _execute_writer_with_error_handling(
+        prepared.prompt, params.config, deps, prefetched_response=prefetched_response
+    )
 
     # 6. Finalize results (output, RAG indexing, caching)
     return _finalize_writer_results(
         WriterFinalizationParams(
             saved_posts=saved_posts,
             saved_profiles=saved_profiles,
-            resources=resources,
+            resources=prepared.resources,
             deps=deps,
             cache=params.cache,
-            signature=signature,
+            signature=prepared.signature,
         )
     )
 
 
+def submit_writer_batch(
+    windows: Sequence[WindowProcessingParams],
+    task_store: TaskStore | None = None,
+) -> WriterBatch | None:
+    """Answer the first writer request of every window with one batch job.
+
+    Windows that are cached, empty or too large for the model are left out
+    and written live as usual. Pass the returned batch's ``responses`` as
+    ``WindowProcessingParams.batch_responses`` and call ``complete()`` once
+    the windows have been written.
+
+    Returns:
+        The batch, or None when the writer model has no batch API or the
+        installed pydantic-ai cannot render batch requests.
+
+    """
+    if not windows:
+        return None
+    config = windows[0].config
+    if not config.models.writer.startswith("google-gla:"):
+        logger.warning(
+            "Batch write needs a Google writer model (configured: %s); writing windows one by one",
+            config.models.writer,
+        )
+        return None
+    if not batch_write_supported():
+        logger.warning(
+            "Batch write is not supported by the installed pydantic-ai version; writing windows one by one"
+        )
+        return None
+
+    requests: dict[str, dict[str, Any]] = {}
+    for params in windows:
+        if params.smoke_test or not params.messages:
+            continue
+        prepared = _prepare_window(params, record_cache_stats=False)
+        if prepared.cached_result is not None:
+            continue
+        deps = cast("WriterDeps", prepared.deps)
+        try:
+            model = create_writer_model(config, deps, prepared.prompt)
+        except PromptTooLargeError:
+            continue  # Raised again (and handled) when the window is written
+        agent = setup_writer_agent(RequestCaptureModel(model), prepared.prompt, config=config)
+        requests[prepared.signature] = capture_first_request(agent, WRITER_USER_PROMPT, deps)
+
+    logger.info("Rendered %d writer requests for batch submission", len(requests))
+    batch = WriterBatch(
+        GoogleBatchModel(
+            api_key=get_google_api_key(),
+            model_name=config.models.writer,
+            poll_interval=30.0,
+            timeout=float(config.pipeline.batch_write_timeout),
+        ),
+        task_store,
+    )
+    batch.run(requests)
+    return batch
+
+
 def _regenerate_site_indices(adapter: OutputSink) -> None:
     """Helper to regenerate all site indices using SiteGenerator."""
     if not isinstance(adapter, MkDocsAdapter):
@@ -0,0 +1,145 @@
+"""Batch submission of writer requests through the Gemini Batch API.
+
+In batch write mode the first model request of every pending window is
+rendered up front (system prompt, tools and user prompt exactly as the agent
+would send them), all of them are submitted as one batch job, and each
+window's agent then runs as usual with that first turn answered from the
+batch results by :class:`PrefetchedResponseModel`. Tool calls, follow-up
+turns and persistence go through the normal writer path.
+
+Because every prompt is rendered before any window is written, RAG and
+profile context reflect the site as it was when the batch was submitted,
+not the posts written earlier in the same run.
+
+The job name is recorded in the task store (see
+:mod:`egregora.agents.batch_jobs`), so a run that is interrupted (or stops
+waiting) picks the same job back up instead of submitting and paying for it
+again.
+
+Rendering and parsing reuse two private ``GoogleModel`` methods so batch
+requests match live ones exactly. pyproject keeps pydantic-ai below its
+next major version, the tests pin the round trip, and
+:func:`batch_write_supported` makes batch write fall back to live writing
+if a release drops them.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, cast
+
+from google.genai import types
+from pydantic_ai.models.google import GoogleModel
+from pydantic_ai.models.wrapper import WrapperModel
+
+from egregora.agents.batch_jobs import ResumableBatch
+from egregora.agents.exceptions import AgentError
+
+if TYPE_CHECKING:
+    from pydantic_ai import Agent
+    from pydantic_ai.messages import ModelMessage, ModelResponse
+    from pydantic_ai.models import ModelRequestParameters
+    from pydantic_ai.models.google import GoogleModelSettings
+    from pydantic_ai.settings import ModelSettings
+
+    from egregora.agents.types import WriterDeps
+
+logger = logging.getLogger(__name__)
+
+# Task type under which submitted writer batch jobs are recorded.
+WRITER_BATCH_TASK = "writer_batch"
+
+# Private GoogleModel methods that render a request and parse a response.
+_GOOGLE_MODEL_HOOKS = ("_build_content_and_config", "_process_response")
+
+
+def batch_write_supported() -> bool:
+    """Whether the installed pydantic-ai still has the GoogleModel methods batch write uses."""
+    return all(callable(getattr(GoogleModel, name, None)) for name in _GOOGLE_MODEL_HOOKS)
+
+
+class _RequestCaptured(Exception):  # noqa: N818 - control flow, not an error
+    def __init__(self, request: dict[str, Any]) -> None:
+        super().__init__("writer request captured")
+        self.request = request
+
+
+class RequestCaptureModel(WrapperModel):
+    """Stops the agent at its first model request and keeps it as a batch request."""
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        google_model = cast("GoogleModel", self.wrapped)
+        model_settings, model_request_parameters = google_model.prepare_request(
+            model_settings, model_request_parameters
+        )
+        contents, config = await google_model._build_content_and_config(
+            messages, cast("GoogleModelSettings", model_settings or {}), model_request_parameters
+        )
+        # Per-call transport options do not belong in a batch request.
+        config.pop("http_options", None)
+        config = {key: value for key, value in config.items() if value is not None}
+        raise _RequestCaptured({"contents": contents, "config": config})
+
+
+class PrefetchedResponseModel(WrapperModel):
+    """Answers the first request with a batch response and later ones live."""
+
+    def __init__(self, wrapped: GoogleModel, response: dict[str, Any]) -> None:
+        super().__init__(wrapped)
+        self._response: dict[str, Any] | None = response
+
+    async def request(
+        self,
+        messages: list[ModelMessage],
+        model_settings: ModelSettings | None,
+        model_request_parameters: ModelRequestParameters,
+    ) -> ModelResponse:
+        if self._response is None:
+            return await super().request(messages, model_settings, model_request_parameters)
+        raw, self._response = self._response, None
+        google_model = cast("GoogleModel", self.wrapped)
+        _, model_request_parameters = google_model.prepare_request(model_settings, model_request_parameters)
+        response = types.GenerateContentResponse.model_validate(raw)
+        return google_model._process_response(response, model_request_parameters)
+
+
+def capture_first_request(
+    agent: Agent[WriterDeps, Any], user_prompt: str, deps: WriterDeps
+) -> dict[str, Any]:
+    """Run ``agent`` (built on a :class:`RequestCaptureModel`) up to its first model request."""
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(agent.run(user_prompt, deps=deps))
+    except _RequestCaptured as captured:
+        return captured.request
+    finally:
+        loop.close()
+    msg = f"Writer agent for {deps.window_label} finished without requesting the model"
+    raise AgentError(msg)
+
+
+class WriterBatch(ResumableBatch):
+    """One run's writer batch, keyed by window signature.
+
+    Windows whose request failed, or whose job failed, are written live.
+    """
+
+    task_type = WRITER_BATCH_TASK
+    label = "writer"
+    item_name = "windows"
+
+
+__all__ = [
+    "WRITER_BATCH_TASK",
+    "PrefetchedResponseModel",
+    "RequestCaptureModel",
+    "WriterBatch",
+    "batch_write_supported",
+    "capture_first_request",
+]
@@ -265,9 +265,8 @@ def check_writer_cache(
     cached_result = cache.writer.get(signature)
     if cached_result:
         logger.info("⚡ [L3 Cache Hit] Skipping Writer LLM for window %s", window_label)
-        if usage_tracker:
-            # Record a cache hit (0 tokens) to track efficiency
-            pass
+    if usage_tracker:
+        usage_tracker.record_cache(CacheTier.WRITER.value, hit=bool(cached_result))
     return cached_result
 
 
@@ -37,6 +37,7 @@ from egregora.agents.types import (
     WriterDeps,
 )
 from egregora.data_primitives.document import DocumentType
+from egregora.llm.token_utils import get_token_counter
 from egregora.output_sinks.exceptions import DocumentNotFoundError
 from egregora.rag import RAGQueryRequest, reset_backend, search
 
@@ -380,9 +381,9 @@ def validate_prompt_fits(
 ) -> int:
     """Validate that prompt fits within model limits.
 
-    Uses native SDK counting if possible, else character-based estimation.
+    Uses native SDK counting if possible, else the configured local tokenizer.
     """
-    token_count = count_tokens(prompt, model_instance)
+    token_count = count_tokens(prompt, model_instance, tokenizer=config.pipeline.tokenizer)
 
     max_allowed = config.pipeline.max_prompt_tokens
     use_full = config.pipeline.use_full_context_window
@@ -403,13 +404,13 @@ def validate_prompt_fits(
     return token_count
 
 
-def count_tokens(prompt: str, model: Any | None = None) -> int:
+def count_tokens(prompt: str, model: Any | None = None, *, tokenizer: str = "auto") -> int:
     """Count tokens in a prompt, using native SDK if available."""
     if model and hasattr(model, "count_tokens") and callable(model.count_tokens):
         try:
             return asyncio.run(model.count_tokens(prompt))
         except Exception:
-            logger.debug("Native token counting failed, falling back to estimation")
+            logger.debug("Native token counting failed, falling back to local tokenizer")
 
-    # Fallback to conservative estimation (4 chars per token)
-    return len(prompt) // 4
+    # Fallback to the local tokenizer (see egregora.llm.token_utils)
+    return get_token_counter(tokenizer).count_uncached(prompt)
@@ -6,21 +6,6 @@ from contextlib import contextmanager
 import typer
 from rich.console import Console
 
-from egregora.agents.exceptions import EnrichmentError, ReaderError
-from egregora.config.exceptions import (
-    ApiKeyNotFoundError,
-    ConfigError,
-    InvalidConfigurationValueError,
-    SiteStructureError,
-)
-from egregora.input_adapters.exceptions import UnknownAdapterError
-from egregora.orchestration.exceptions import (
-    ApiKeyInvalidError,
-    CommandAnnouncementError,
-    OutputSinkError,
-    ProfileGenerationError,
-)
-
 console = Console()
 
 
@@ -32,6 +17,23 @@ def handle_cli_errors(*, debug: bool = False) -> Generator[None, None, None]:
         debug: If True, print full traceback. If False, print user-friendly error.
 
     """
+    # Imported on entry rather than at module level: these live in packages whose
+    # __init__ pulls in the pipeline, and importing the CLI must stay cheap.
+    from egregora.agents.exceptions import EnrichmentError, ReaderError
+    from egregora.config.exceptions import (
+        ApiKeyNotFoundError,
+        ConfigError,
+        InvalidConfigurationValueError,
+        SiteStructureError,
+    )
+    from egregora.input_adapters.exceptions import UnknownAdapterError
+    from egregora.orchestration.exceptions import (
+        ApiKeyInvalidError,
+        CommandAnnouncementError,
+        OutputSinkError,
+        ProfileGenerationError,
+    )
+
     try:
         yield
     except (KeyboardInterrupt, SystemExit):
@@ -1,4 +1,11 @@
-"""Main Typer application for Egregora."""
+"""Main Typer application for Egregora.
+
+The CLI is invoked from cron jobs and shell scripts, so startup cost matters:
+``egregora --help`` must not import the pipeline. Module-level imports are
+limited to typer, rich and lightweight enums; every command imports its own
+dependencies (config, DuckDB, the write pipeline, ...) when it is invoked.
+``tests/benchmarks/test_cli_startup.py`` enforces the import-time budget.
+"""
 
 import logging
 import sys
@@ -12,27 +19,14 @@ try:
 except ImportError:
     dotenv = None
 
-# Deferred import if needed, but for now moving it top level as requested by linter
-# We need to make sure this doesn't break things if import fails, but diagnostics is part of the package.
 from rich.console import Console
-from rich.logging import RichHandler
 from rich.panel import Panel
 from rich.table import Table
 
-from egregora.cli.diagnostics import HealthStatus, run_diagnostics
 from egregora.cli.errorhandler import handle_cli_errors
-
-# from egregora.cli.db import db_app  # Removed - db.py no longer exists
 from egregora.cli.read import read_app
-from egregora.cli.write import run_cli_flow
-from egregora.config import load_egregora_config
-from egregora.config.exceptions import ApiKeyNotFoundError
+from egregora.cli.runs import runs_app
 from egregora.constants import SourceType, WindowUnit
-from egregora.database.duckdb_manager import DuckDBStorageManager
-from egregora.database.elo_store import EloStore
-from egregora.llm.api_keys import get_google_api_key
-from egregora.output_sinks.mkdocs.paths import MkDocsPaths
-from egregora.output_sinks.mkdocs.scaffolding import MkDocsSiteScaffolder
 
 app = typer.Typer(
     name="egregora",
@@ -40,9 +34,7 @@ app = typer.Typer(
     add_completion=False,
 )
 app.add_typer(read_app)
-
-# Database subcommands
-# app.add_typer(db_app)  # Removed - db.py no longer exists
+app.add_typer(runs_app)
 
 # Show subcommands
 show_app = typer.Typer(
@@ -51,27 +43,32 @@ show_app = typer.Typer(
 )
 app.add_typer(show_app)
 
-# Simple logging setup (no telemetry)
 console = Console()
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(message)s",
-    handlers=[
-        RichHandler(
-            console=console,
-            rich_tracebacks=True,
-            show_path=False,
-            log_time_format="[%Y-%m-%d %H:%M:%S]",  # ISO date format
-        )
-    ],
-)
-
 logger = logging.getLogger(__name__)
 
 
+def _configure_logging() -> None:
+    """Simple logging setup (no telemetry)."""
+    from rich.logging import RichHandler
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(message)s",
+        handlers=[
+            RichHandler(
+                console=console,
+                rich_tracebacks=True,
+                show_path=False,
+                log_time_format="[%Y-%m-%d %H:%M:%S]",  # ISO date format
+            )
+        ],
+    )
+
+
 @app.callback()
 def main() -> None:
-    """Initialize CLI (placeholder for future setup)."""
+    """Initialize CLI (runs before any command, but not for top-level --help)."""
+    _configure_logging()
 
 
 @app.command()
@@ -106,6 +103,9 @@ def init(
         site_name = site_root.name or "Egregora Archive"
 
     with handle_cli_errors():
+        from egregora.output_sinks.mkdocs.paths import MkDocsPaths
+        from egregora.output_sinks.mkdocs.scaffolding import MkDocsSiteScaffolder
+
         scaffolder = MkDocsSiteScaffolder()
         _, mkdocs_created = scaffolder.scaffold_site(site_root, site_name=site_name)
         docs_dir = MkDocsPaths(site_root).docs_dir
@@ -182,9 +182,39 @@ def write(
             help="JSON string of write options; if provided, overrides CLI defaults",
         ),
     ] = None,
+    trace: Annotated[
+        Path | None,
+        typer.Option(
+            "--trace",
+            help="Record per-stage timing spans to this file (.jsonl for OTel-style lines, otherwise Chrome trace JSON)",
+        ),
+    ] = None,
+    all_sources: Annotated[
+        bool,
+        typer.Option(
+            "--all-sources", help="Run every source configured in the site instead of --source-type"
+        ),
+    ] = False,
+    parallel_sources: Annotated[
+        int,
+        typer.Option(
+            "--parallel-sources",
+            min=1,
+            help="Run up to N sources at the same time (shared rate limit; one failure does not stop the rest)",
+        ),
+    ] = 1,
+    batch_write: Annotated[
+        bool,
+        typer.Option(
+            "--batch-write",
+            help="Submit all pending windows to the writer as one Gemini Batch API job (slower per window, faster backfills; resumable)",
+        ),
+    ] = False,
 ) -> None:
     """Write blog posts from chat exports using LLM-powered synthesis."""
     with handle_cli_errors(debug=debug):
+        from egregora.cli.write import run_cli_flow
+
         run_cli_flow(
             input_file=input_file,
             output=output,
@@ -205,6 +235,10 @@ def write(
             force=force,
             debug=debug,
             options=options,
+            trace=trace,
+            all_sources=all_sources,
+            parallel_sources=parallel_sources,
+            batch_write=batch_write,
         )
 
 
@@ -242,6 +276,8 @@ def top(
         console.print("Run 'egregora init' or 'egregora write' first to create a site")
         raise typer.Exit(1)
 
+    from egregora.config import load_egregora_config
+
     config = load_egregora_config(site_root)
 
     db_path = site_root / config.reader.database_path
@@ -252,6 +288,9 @@ def top(
         raise typer.Exit(1)
 
     with handle_cli_errors():
+        from egregora.database.duckdb_manager import DuckDBStorageManager
+        from egregora.database.elo_store import EloStore
+
         # Use DuckDBStorageManager directly to ensure Ibis compatibility with EloStore
         storage = DuckDBStorageManager(db_path)
         elo_store = EloStore(storage)
@@ -325,6 +364,8 @@ def show_reader_history(
         console.print("Run 'egregora init' or 'egregora write' first to create a site")
         raise typer.Exit(1)
 
+    from egregora.config import load_egregora_config
+
     config = load_egregora_config(site_root)
 
     db_path = site_root / config.reader.database_path
@@ -335,6 +376,9 @@ def show_reader_history(
         raise typer.Exit(1)
 
     with handle_cli_errors():
+        from egregora.database.duckdb_manager import DuckDBStorageManager
+        from egregora.database.elo_store import EloStore
+
         # Use DuckDBStorageManager directly to ensure Ibis compatibility with EloStore
         storage = DuckDBStorageManager(db_path)
         elo_store = EloStore(storage)
@@ -392,6 +436,8 @@ def _run_offline_demo(output_dir: Path) -> None:
         "To generate a site from your own chat export, use the `egregora write` command.[/dim]"
     )
 
+    from egregora.output_sinks.mkdocs.scaffolding import MkDocsSiteScaffolder
+
     # 1. Scaffold the site
     scaffolder = MkDocsSiteScaffolder()
     scaffolder.scaffold_site(output_dir, site_name="Egregora Demo (Offline)")
@@ -449,6 +495,9 @@ def demo(
     ] = True,
 ) -> None:
     """Generate a demo site from a sample WhatsApp export."""
+    from egregora.config.exceptions import ApiKeyNotFoundError
+    from egregora.llm.api_keys import get_google_api_key
+
     try:
         get_google_api_key()
         console.print(
@@ -463,6 +512,8 @@ def demo(
             raise typer.Exit(1)
 
         try:
+            from egregora.cli.write import run_cli_flow
+
             run_cli_flow(
                 input_file=sample_input,
                 output=output_dir,
@@ -489,6 +540,8 @@ def demo(
             console.print(
                 "[dim]The demo site scaffold has been created, but without AI-generated content.[/dim]"
             )
+            from egregora.output_sinks.mkdocs.scaffolding import MkDocsSiteScaffolder
+
             # Ensure the scaffold exists even if run_cli_flow failed mid-process
             scaffolder = MkDocsSiteScaffolder()
             scaffolder.scaffold_site(output_dir, site_name="Egregora Demo (Content Failed)")
@@ -515,6 +568,8 @@ def _load_dotenv_if_available(output_dir: Path) -> None:
 
 
 def _run_doctor_checks(*, verbose: bool) -> None:
+    from egregora.cli.diagnostics import HealthStatus, run_diagnostics
+
     console.print("[bold cyan]Running diagnostics...[/bold cyan]")
     console.print()
 
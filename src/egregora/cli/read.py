@@ -2,17 +2,16 @@
 
 import logging
 from pathlib import Path
-from typing import Annotated
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 from rich.console import Console
 from rich.table import Table
 
-from egregora.agents.reader.models import RankingResult
-from egregora.agents.reader.reader_runner import run_reader_evaluation
 from egregora.cli.errorhandler import handle_cli_errors
-from egregora.config import load_egregora_config
-from egregora.output_sinks.mkdocs import MkDocsPaths
+
+if TYPE_CHECKING:
+    from egregora.agents.reader.models import RankingResult
 
 logger = logging.getLogger(__name__)
 console = Console()
@@ -79,6 +78,11 @@ def main(
     site_root = site_root.expanduser().resolve()
 
     with handle_cli_errors():
+        # Imported here so `egregora --help` does not load the reader agent.
+        from egregora.agents.reader.reader_runner import run_reader_evaluation
+        from egregora.config import load_egregora_config
+        from egregora.output_sinks.mkdocs import MkDocsPaths
+
         # Verify .egregora directory exists
         egregora_dir = site_root / ".egregora"
         if not egregora_dir.exists():
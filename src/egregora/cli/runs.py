@@ -0,0 +1,226 @@
+"""CLI commands for the run ledger (list, inspect and compare pipeline runs)."""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from egregora.cli.errorhandler import handle_cli_errors
+
+if TYPE_CHECKING:
+    from egregora.database.run_store import RunRecord, RunStore
+
+console = Console()
+
+# Stage ratios beyond this factor are highlighted by ``egregora runs compare``.
+REGRESSION_THRESHOLD = 1.1
+
+runs_app = typer.Typer(
+    name="runs",
+    help="Inspect and compare recorded pipeline runs",
+    no_args_is_help=True,
+)
+
+SiteRootArgument = Annotated[Path, typer.Argument(help="Site root directory containing .egregora/config.yml")]
+
+
+@contextmanager
+def _open_run_store(site_root: Path) -> Iterator["RunStore"]:
+    """Open the run ledger stored in the site's pipeline database."""
+    site_root = site_root.expanduser().resolve()
+    if not (site_root / ".egregora").exists():
+        console.print(f"[red]No .egregora directory found in {site_root}[/red]")
+        console.print("Run 'egregora init' or 'egregora write' first to create a site")
+        raise typer.Exit(1)
+
+    import ibis
+
+    from egregora.config import load_egregora_config
+    from egregora.database.duckdb_manager import DuckDBStorageManager
+    from egregora.database.run_store import RunStore
+    from egregora.database.utils import resolve_db_uri
+
+    config = load_egregora_config(site_root)
+    backend = ibis.connect(resolve_db_uri(config.database.pipeline_db, site_root))
+    try:
+        yield RunStore(DuckDBStorageManager.from_ibis_backend(backend))
+    finally:
+        backend.disconnect()
+
+
+def _get_run_or_exit(store: "RunStore", run_id: str) -> "RunRecord":
+    record = store.get_run(run_id)
+    if record is None:
+        console.print(f"[red]No unique run matches '{run_id}'[/red]")
+        raise typer.Exit(1)
+    return record
+
+
+def _fmt_ms(value: float | None) -> str:
+    if value is None:
+        return "-"
+    return f"{value / 1000:.2f}s" if value >= 1000 else f"{value:.1f}ms"
+
+
+def _fmt_ratio(ratio: float | None) -> str:
+    """Format a candidate/baseline ratio, flagging >10% regressions and improvements."""
+    if ratio is None:
+        return "-"
+    if ratio > REGRESSION_THRESHOLD:
+        return f"[red]{ratio:.2f}x[/red]"
+    if ratio < 1 / REGRESSION_THRESHOLD:
+        return f"[green]{ratio:.2f}x[/green]"
+    return f"{ratio:.2f}x"
+
+
+def _fmt_rate(value: float | None) -> str:
+    return "-" if value is None else f"{value:.0%}"
+
+
+@runs_app.command(name="list")
+def list_runs(
+    site_root: SiteRootArgument,
+    *,
+    limit: Annotated[int, typer.Option("--limit", "-n", help="Number of runs to show")] = 20,
+) -> None:
+    """List the most recent pipeline runs.
+
+    Examples:
+        egregora runs list my-blog/
+        egregora runs list my-blog/ --limit 5
+
+    """
+    with handle_cli_errors(), _open_run_store(site_root) as store:
+        records = store.list_runs(limit=limit)
+
+    if not records:
+        console.print("[yellow]No runs recorded yet[/yellow]")
+        raise typer.Exit(0)
+
+    table = Table(title="📒 Pipeline Runs")
+    table.add_column("Run", style="cyan")
+    table.add_column("Started", style="dim")
+    table.add_column("Source")
+    table.add_column("Status")
+    table.add_column("Duration", justify="right")
+    table.add_column("Windows", justify="right")
+    table.add_column("Posts", justify="right")
+    table.add_column("Tokens (in/out)", justify="right")
+    table.add_column("Writer cache", justify="right")
+
+    for record in records:
+        status_style = {"completed": "green", "failed": "red"}.get(record.status, "yellow")
+        tokens = (
+            f"{record.input_tokens or 0:,}/{record.output_tokens or 0:,}"
+            if record.input_tokens is not None
+            else "-"
+        )
+        table.add_row(
+            record.run_id[:8],
+            f"{record.started_at:%Y-%m-%d %H:%M}",
+            record.source_key or record.source_type,
+            f"[{status_style}]{record.status}[/{status_style}]",
+            _fmt_ms(record.duration_ms),
+            str(record.windows if record.windows is not None else "-"),
+            str(record.posts if record.posts is not None else "-"),
+            tokens,
+            _fmt_rate(record.cache_hit_rate("writer")),
+        )
+    console.print(table)
+
+
+@runs_app.command(name="show")
+def show_run(
+    site_root: SiteRootArgument,
+    run_id: Annotated[str, typer.Argument(help="Run id (or unique prefix)")],
+    *,
+    windows: Annotated[bool, typer.Option("--windows", help="Also show per-window stage timings")] = False,
+) -> None:
+    """Show parameters, totals and per-stage timings of one run.
+
+    Examples:
+        egregora runs show my-blog/ 3f2a9c1e
+        egregora runs show my-blog/ 3f2a9c1e --windows
+
+    """
+    with handle_cli_errors(), _open_run_store(site_root) as store:
+        record = _get_run_or_exit(store, run_id)
+        stages = store.get_stages(record.run_id)
+        window_stages = store.get_stages(record.run_id, per_window=True) if windows else []
+
+    console.print(f"[bold]Run[/bold] {record.run_id} ([cyan]{record.status}[/cyan])")
+    console.print(f"Source: {record.source_key or record.source_type}  Input: {record.input_path}")
+    console.print(f"Started: {record.started_at}  Duration: {_fmt_ms(record.duration_ms)}")
+    console.print(
+        f"Windows: {record.windows}  Posts: {record.posts}  Profiles: {record.profiles}  "
+        f"Failures: {record.failures}"
+    )
+    console.print(
+        f"LLM requests: {record.llm_requests}  Input tokens: {record.input_tokens}  "
+        f"Output tokens: {record.output_tokens}"
+    )
+    for tier in record.cache_stats:
+        console.print(f"Cache [{tier}]: {_fmt_rate(record.cache_hit_rate(tier))} hit rate")
+    for task_type, counts in sorted(record.task_counts.items()):
+        summary = ", ".join(f"{status}={count}" for status, count in sorted(counts.items()))
+        console.print(f"Tasks [{task_type}]: {summary}")
+    if record.error:
+        console.print(f"[red]Error: {record.error}[/red]")
+
+    table = Table(title="⏱️  Stages")
+    if windows:
+        table.add_column("Window", style="dim")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Total", justify="right")
+    table.add_column("Failures", justify="right")
+    for metric in [*stages, *window_stages]:
+        cells = [metric.stage, str(metric.calls), _fmt_ms(metric.duration_ms), str(metric.failures)]
+        table.add_row(*([metric.window_label or "(run)"] if windows else []), *cells)
+    console.print(table)
+
+
+@runs_app.command(name="compare")
+def compare_runs(
+    site_root: SiteRootArgument,
+    baseline: Annotated[str, typer.Argument(help="Baseline run id (or unique prefix)")],
+    candidate: Annotated[str, typer.Argument(help="Candidate run id (or unique prefix)")],
+) -> None:
+    """Compare per-stage timings of two runs side by side.
+
+    Examples:
+        egregora runs compare my-blog/ 3f2a9c1e 8b7d0e42
+
+    """
+    with handle_cli_errors(), _open_run_store(site_root) as store:
+        base_record = _get_run_or_exit(store, baseline)
+        cand_record = _get_run_or_exit(store, candidate)
+        comparisons = store.compare_runs(base_record.run_id, cand_record.run_id)
+
+    table = Table(title=f"⚖️  {base_record.run_id[:8]} → {cand_record.run_id[:8]}")
+    table.add_column("Stage", style="cyan")
+    table.add_column("Baseline", justify="right")
+    table.add_column("Candidate", justify="right")
+    table.add_column("Δ", justify="right")
+    table.add_column("Ratio", justify="right")
+    table.add_row(
+        "[bold]total run[/bold]",
+        _fmt_ms(base_record.duration_ms),
+        _fmt_ms(cand_record.duration_ms),
+        "",
+        "",
+    )
+    for comparison in comparisons:
+        delta = comparison.delta_ms
+        table.add_row(
+            comparison.stage,
+            _fmt_ms(comparison.baseline_ms),
+            _fmt_ms(comparison.candidate_ms),
+            "-" if delta is None else f"{delta:+.1f}ms",
+            _fmt_ratio(comparison.ratio),
+        )
+    console.print(table)
@@ -6,14 +6,20 @@ for the 'write' command, bridging CLI arguments to the pipeline orchestration.
 
 from __future__ import annotations
 
+import contextvars
+import functools
 import json
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
 from egregora.config import RuntimeContext, load_egregora_config
 from egregora.config.settings import EgregoraConfig
@@ -32,11 +38,15 @@ from egregora.orchestration.pipelines.types import (
     WriteCommandOptions,
 )
 from egregora.orchestration.pipelines.write import run
+from egregora.tracing import tracing_session
 
 logger = logging.getLogger(__name__)
 console = Console()
 
-__all__ = ["process_whatsapp_export", "run_cli_flow"]
+if TYPE_CHECKING:
+    from datetime import date
+
+__all__ = ["SourceOutcome", "process_whatsapp_export", "run_cli_flow"]
 
 
 def _prepare_write_config(
@@ -70,6 +80,7 @@ def _prepare_write_config(
                     "use_full_context_window": options.use_full_context_window,
                     "max_windows": options.max_windows,
                     "checkpoint_enabled": options.resume,
+                    "batch_write": options.batch_write or base_config.pipeline.batch_write,
                 }
             ),
             "enrichment": base_config.enrichment.model_copy(update={"enabled": options.enable_enrichment}),
@@ -178,12 +189,24 @@ def run_cli_flow(
     debug: bool = False,
     options: str | None = None,
     smoke_test: bool = False,
+    trace: Path | None = None,
+    all_sources: bool = False,
+    parallel_sources: int = 1,
+    batch_write: bool = False,
 ) -> None:
     """Execute the write flow from CLI arguments.
 
     Args:
         source: Can be a source type (e.g., "whatsapp"), a source key from config, or None.
                 If None, will use default_source from config, or run all sources if default is None.
+        trace: Optional file to record pipeline timing spans to (see :mod:`egregora.tracing`).
+        all_sources: Run every configured source, ignoring ``source`` and ``default_source``.
+        parallel_sources: How many sources to run at the same time. Above 1, each
+                source runs in its own thread with its own database connection and
+                task queue, sharing the rate limiter and caches; one failing source
+                does not stop the others, and a combined summary is printed.
+        batch_write: Submit the writer prompts of all pending windows as one
+                Gemini Batch API job instead of calling the model per window.
 
     """
     cli_values = {
@@ -204,6 +227,7 @@ def run_cli_flow(
         "refresh": refresh,
         "force": force,
         "debug": debug,
+        "batch_write": batch_write,
     }
 
     if debug:
@@ -214,53 +238,210 @@ def run_cli_flow(
 
     output_dir = output.expanduser().resolve()
     ensure_site_initialized(output_dir)
-    validate_api_key(output_dir)
 
     # Load config to determine sources
     base_config = load_egregora_config(output_dir)
+    validate_api_key(output_dir, cache_dir=_resolve_cache_dir(output_dir, base_config))
 
     # Determine which sources to run
-    sources_to_run = _resolve_sources_to_run(source, base_config)
-
-    # Process each source
-    for source_key, source_type in sources_to_run:
-        # Prepare options with current source
-        parsed_options = _resolve_write_options(
+    if all_sources:
+        sources_to_run = [(key, src.adapter) for key, src in base_config.site.sources.items()]
+    else:
+        sources_to_run = _resolve_sources_to_run(source, base_config)
+
+    with tracing_session(trace):
+        _run_sources(
+            sources_to_run,
             input_file=input_file,
-            options_json=options,
-            cli_defaults={**cli_values, "source": source_type},
+            options=options,
+            cli_values=cli_values,
+            from_date_obj=from_date_obj,
+            to_date_obj=to_date_obj,
+            output_dir=output_dir,
+            smoke_test=smoke_test,
+            parallel_sources=parallel_sources,
         )
+    if trace is not None:
+        console.print(f"[cyan]Trace written to {trace}[/cyan]")
 
-        egregora_config = _prepare_write_config(parsed_options, from_date_obj, to_date_obj)
 
-        runtime = RuntimeContext(
-            output_dir=output_dir,
-            input_file=parsed_options.input_file,
-            model_override=parsed_options.model,
-            debug=parsed_options.debug,
-        )
+def _resolve_cache_dir(output_dir: Path, config: EgregoraConfig) -> Path:
+    cache_dir = Path(config.paths.cache_dir)
+    return cache_dir if cache_dir.is_absolute() else output_dir / cache_dir
 
-        console.print(
-            Panel(
-                f"[cyan]Source:[/cyan] {source_type} (key: {source_key})\n"
-                f"[cyan]Input:[/cyan] {parsed_options.input_file}\n"
-                f"[cyan]Output:[/cyan] {output_dir}\n"
-                f"[cyan]Windowing:[/cyan] {parsed_options.step_size} {parsed_options.step_unit.value}",
-                title="⚙️  Egregora Pipeline",
-                border_style="cyan",
-            )
+
+@dataclass(slots=True)
+class SourceOutcome:
+    """Result of running the pipeline for one source."""
+
+    source_key: str
+    source_type: str
+    seconds: float
+    windows: int = 0
+    posts: int = 0
+    error: str | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+def _run_sources(
+    sources_to_run: list[tuple[str, str]],
+    *,
+    input_file: Path,
+    options: str | None,
+    cli_values: dict[str, Any],
+    from_date_obj: date | None,
+    to_date_obj: date | None,
+    output_dir: Path,
+    smoke_test: bool,
+    parallel_sources: int = 1,
+) -> None:
+    """Run the pipeline once per resolved source, one after another or concurrently."""
+    build_params = functools.partial(
+        _build_run_params,
+        input_file=input_file,
+        options=options,
+        cli_values=cli_values,
+        from_date_obj=from_date_obj,
+        to_date_obj=to_date_obj,
+        output_dir=output_dir,
+        smoke_test=smoke_test,
+    )
+
+    if parallel_sources <= 1 or len(sources_to_run) <= 1:
+        for source_key, source_type in sources_to_run:
+            run(build_params(source_key, source_type))
+            console.print(f"[green]Processing completed successfully for source '{source_key}'.[/green]")
+        return
+
+    all_params = [build_params(source_key, source_type) for source_key, source_type in sources_to_run]
+    outcomes = _run_sources_concurrently(all_params, max_workers=parallel_sources)
+    _print_sources_summary(outcomes)
+    if not all(outcome.succeeded for outcome in outcomes):
+        raise SystemExit(1)
+
+
+def _build_run_params(
+    source_key: str,
+    source_type: str,
+    *,
+    input_file: Path,
+    options: str | None,
+    cli_values: dict[str, Any],
+    from_date_obj: date | None,
+    to_date_obj: date | None,
+    output_dir: Path,
+    smoke_test: bool,
+) -> PipelineRunParams:
+    # Prepare options with current source
+    parsed_options = _resolve_write_options(
+        input_file=input_file,
+        options_json=options,
+        cli_defaults={**cli_values, "source": source_type},
+    )
+
+    egregora_config = _prepare_write_config(parsed_options, from_date_obj, to_date_obj)
+
+    runtime = RuntimeContext(
+        output_dir=output_dir,
+        input_file=parsed_options.input_file,
+        model_override=parsed_options.model,
+        debug=parsed_options.debug,
+    )
+
+    console.print(
+        Panel(
+            f"[cyan]Source:[/cyan] {source_type} (key: {source_key})\n"
+            f"[cyan]Input:[/cyan] {parsed_options.input_file}\n"
+            f"[cyan]Output:[/cyan] {output_dir}\n"
+            f"[cyan]Windowing:[/cyan] {parsed_options.step_size} {parsed_options.step_unit.value}",
+            title="⚙️  Egregora Pipeline",
+            border_style="cyan",
         )
-        run_params = PipelineRunParams(
-            output_dir=runtime.output_dir,
-            config=egregora_config,
-            source_type=source_type,
+    )
+    return PipelineRunParams(
+        output_dir=runtime.output_dir,
+        config=egregora_config,
+        source_type=source_type,
+        source_key=source_key,
+        input_path=runtime.input_file,
+        refresh="all" if parsed_options.force else parsed_options.refresh,
+        smoke_test=smoke_test,
+    )
+
+
+def _run_sources_concurrently(
+    all_params: list[PipelineRunParams], *, max_workers: int
+) -> list[SourceOutcome]:
+    """Run one pipeline per source in a thread pool and collect every outcome."""
+    outcomes: list[SourceOutcome] = []
+    with ThreadPoolExecutor(
+        max_workers=min(max_workers, len(all_params)), thread_name_prefix="egregora-source"
+    ) as executor:
+        # Each source gets a copy of the current context, so its spans nest
+        # under the run's root span but its stage collector stays its own.
+        futures = [
+            executor.submit(contextvars.copy_context().run, _run_source_isolated, run_params)
+            for run_params in all_params
+        ]
+        try:
+            outcomes.extend(future.result() for future in as_completed(futures))
+        except BaseException:
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
+    order = {run_params.source_key: index for index, run_params in enumerate(all_params)}
+    return sorted(outcomes, key=lambda outcome: order[outcome.source_key])
+
+
+def _run_source_isolated(run_params: PipelineRunParams) -> SourceOutcome:
+    """Run one source, turning a failure into an outcome instead of an exception."""
+    source_key = run_params.source_key or run_params.source_type
+    started = time.perf_counter()
+    try:
+        results = run(run_params)
+    except Exception as exc:
+        logger.exception("Source '%s' failed", source_key)
+        return SourceOutcome(
             source_key=source_key,
-            input_path=runtime.input_file,
-            refresh="all" if parsed_options.force else parsed_options.refresh,
-            smoke_test=smoke_test,
+            source_type=run_params.source_type,
+            seconds=time.perf_counter() - started,
+            error=f"{type(exc).__name__}: {exc}",
+        )
+    console.print(f"[green]Processing completed successfully for source '{source_key}'.[/green]")
+    return SourceOutcome(
+        source_key=source_key,
+        source_type=run_params.source_type,
+        seconds=time.perf_counter() - started,
+        windows=len(results),
+        posts=sum(len(item.get("posts", [])) for item in results.values()),
+    )
+
+
+def _print_sources_summary(outcomes: list[SourceOutcome]) -> None:
+    table = Table(title="📦 Sources")
+    table.add_column("Source", style="cyan")
+    table.add_column("Type")
+    table.add_column("Status")
+    table.add_column("Duration", justify="right")
+    table.add_column("Windows", justify="right")
+    table.add_column("Posts", justify="right")
+    for outcome in outcomes:
+        table.add_row(
+            outcome.source_key,
+            outcome.source_type,
+            "[green]completed[/green]" if outcome.succeeded else f"[red]failed[/red] {outcome.error}",
+            f"{outcome.seconds:.1f}s",
+            str(outcome.windows),
+            str(outcome.posts),
         )
-        run(run_params)
-        console.print(f"[green]Processing completed successfully for source '{source_key}'.[/green]")
+    console.print(table)
+    failed = sum(not outcome.succeeded for outcome in outcomes)
+    if failed:
+        console.print(f"[red]{failed} of {len(outcomes)} sources failed.[/red]")
+    else:
+        console.print(f"[green]All {len(outcomes)} sources completed.[/green]")
 
 
 def process_whatsapp_export(
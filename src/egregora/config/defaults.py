@@ -37,6 +37,9 @@ class PipelineDefaults:
     BUFFER_RATIO: float = 0.8
     """Buffer ratio for window size estimation."""
 
+    TOKENIZER: str = "auto"
+    """Local tokenizer for windows and prompts; "auto" estimates unless tiktoken is cached locally."""
+
     DEFAULT_FROM_DATE: str | None = None
     DEFAULT_TO_DATE: str | None = None
     DEFAULT_TIMEZONE: str | None = None
@@ -81,6 +84,9 @@ class RateLimitDefaults:
     REQUESTS_PER_SECOND: float = 2.0
     """Maximum requests per second to LLM APIs."""
 
+    MAX_REQUESTS_PER_SECOND: float = 10.0
+    """Ceiling the adaptive limiter may raise a model/key's request rate to."""
+
     BURST_SIZE: int = 5
     """Maximum burst size for rate limiting."""
 
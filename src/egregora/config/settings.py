@@ -317,6 +317,58 @@ class EnrichmentSettings(BaseModel):
             "Set to 1 to explicitly disable auto-scaling and use sequential processing."
         ),
     )
+    image_max_edge: int = Field(
+        default=1024,
+        ge=0,
+        description=(
+            "Downscale images so their longest edge is at most this many pixels before "
+            "sending them to the vision model (0 sends originals)"
+        ),
+    )
+    image_format: Literal["webp", "jpeg"] = Field(
+        default="webp",
+        description="Format downscaled images are re-encoded to (metadata such as EXIF is dropped)",
+    )
+    image_quality: int = Field(
+        default=80,
+        ge=1,
+        le=100,
+        description="Encoder quality for downscaled images",
+    )
+    prefetch_windows: int = Field(
+        default=2,
+        ge=0,
+        le=16,
+        description=(
+            "Schedule and run enrichment this many windows ahead, in the background, while the "
+            "writer works on the current window (0 enriches each window just before it is written)"
+        ),
+    )
+    url_batch_threshold: int = Field(
+        default=0,
+        ge=0,
+        description=(
+            "Pending URL enrichments at which they are sent as one Gemini Batch API job instead of "
+            "live calls. Off by default (0), since the run waits up to url_batch_timeout for the job; "
+            "the batch_api strategy always uses a job"
+        ),
+    )
+    url_fetch_cache_ttl: int = Field(
+        default=7 * 24 * 3600,
+        ge=0,
+        description=(
+            "Seconds page content fetched by URL enrichment tools is reused without asking the "
+            "server again; older entries are revalidated (0 always revalidates)"
+        ),
+    )
+    url_batch_timeout: int = Field(
+        default=3600,
+        ge=60,
+        description=(
+            "Seconds to wait for a URL enrichment batch job per run. A job still running afterwards "
+            "is resumed by the next run."
+        ),
+    )
 
 
 class PipelineSettings(BaseModel):
@@ -368,6 +420,10 @@ class PipelineSettings(BaseModel):
         default=False,
         description="Use full model context window (overrides max_prompt_tokens cap)",
     )
+    tokenizer: str = Field(
+        default=PipelineDefaults.TOKENIZER,
+        description="Local tokenizer for sizing windows and prompts: 'auto' (the estimate unless tiktoken's encoding is cached locally; never downloads), 'estimate' (~4 chars/token), 'tiktoken[:encoding]' or 'sentencepiece:<model file>'",
+    )
     max_windows: int | None = Field(
         default=1,
         ge=0,
@@ -377,6 +433,15 @@ class PipelineSettings(BaseModel):
         default=False,
         description="Enable incremental processing with checkpoints (opt-in). Default: always rebuild from scratch for simplicity.",
     )
+    batch_write: bool = Field(
+        default=False,
+        description="Submit the writer prompts of all pending windows as one Gemini Batch API job (Google writer models only). Trades latency for throughput on large backfills.",
+    )
+    batch_write_timeout: int = Field(
+        default=3600,
+        ge=60,
+        description="Seconds to wait for a writer batch job per run. A job still running afterwards is resumed by the next run.",
+    )
 
 
 class PathsSettings(BaseModel):
@@ -639,7 +704,21 @@ class QuotaSettings(BaseModel):
     per_second_limit: float = Field(
         default=RateLimitDefaults.REQUESTS_PER_SECOND,
         ge=0.01,
-        description="Maximum number of LLM calls allowed per second (for async guard).",
+        description="Maximum number of LLM calls allowed per second (for async guard). With adaptive_rate_limit, the starting rate of each model/key.",
+    )
+    adaptive_rate_limit: bool = Field(
+        default=True,
+        description="Adapt each model/key's request rate to provider feedback (AIMD on 429s, Retry-After and quota headers).",
+    )
+    max_per_second_limit: float = Field(
+        default=RateLimitDefaults.MAX_REQUESTS_PER_SECOND,
+        ge=0.01,
+        description="Highest request rate the adaptive limiter may reach per model/key.",
+    )
+    tokens_per_minute: int | None = Field(
+        default=None,
+        ge=1,
+        description="Token budget per model/key and minute. Unset: learned from token-quota 429s.",
     )
     concurrency: int = Field(
         default=RateLimitDefaults.CONCURRENCY,
@@ -0,0 +1,165 @@
+"""Fetched URL content kept in the ``asset_cache`` table.
+
+URL enrichment agents fetch pages through tools, and a retried or rotated
+agent run fetched the same page again every time. :class:`AssetCache` keeps
+the last response per URL together with its validators (``ETag`` /
+``Last-Modified``) and an expiry, so fresh entries are served as they are and
+stale ones can be revalidated with a conditional request.
+
+Enrichment fetches run on worker threads, so every operation goes through its
+own cursor rather than the shared connection.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from egregora.database.schemas import (
+    ASSET_CACHE_SCHEMA,
+    add_primary_key,
+    create_table_if_not_exists,
+    quote_identifier,
+)
+
+if TYPE_CHECKING:
+    import duckdb
+
+    from egregora.database.duckdb_manager import DuckDBStorageManager
+
+TABLE_NAME = "asset_cache"
+
+
+@dataclass(frozen=True, slots=True)
+class CachedAsset:
+    """A cached response body plus the validators and expiry it was stored with."""
+
+    url: str
+    content: bytes
+    content_type: str
+    etag: str | None = None
+    last_modified: str | None = None
+    fetched_at: datetime | None = None
+    expires_at: datetime | None = None
+
+    def is_fresh(self, now: datetime | None = None) -> bool:
+        """Whether the entry can be served without asking the server."""
+        return self.expires_at is not None and self.expires_at > (now or datetime.now(UTC))
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let the server answer ``304`` if nothing changed."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    @property
+    def text(self) -> str:
+        return self.content.decode("utf-8", errors="replace")
+
+
+class AssetCache:
+    """DuckDB-backed cache of fetched content, one row per URL."""
+
+    def __init__(self, storage: DuckDBStorageManager) -> None:
+        self.storage = storage
+        self._ensure_table()
+
+    def _ensure_table(self) -> None:
+        if TABLE_NAME in self.storage.list_tables():
+            return
+        with self.storage.connection() as conn:
+            create_table_if_not_exists(conn, TABLE_NAME, ASSET_CACHE_SCHEMA, primary_key="url")
+            add_primary_key(conn, TABLE_NAME, "url")
+
+    def _cursor(self) -> duckdb.DuckDBPyConnection:
+        with self.storage.connection() as conn:
+            return conn.cursor()
+
+    def load(self, url: str) -> CachedAsset | None:
+        """Return the entry for ``url``, fresh or not, or None."""
+        cursor = self._cursor()
+        try:
+            row = cursor.execute(
+                f"SELECT url, content, content_type, etag, last_modified, fetched_at, expires_at "  # nosec B608
+                f"FROM {quote_identifier(TABLE_NAME)} WHERE url = ?",
+                [url],
+            ).fetchone()
+        finally:
+            cursor.close()
+        if row is None:
+            return None
+        return CachedAsset(
+            url=row[0],
+            content=bytes(row[1]),
+            content_type=row[2],
+            etag=row[3],
+            last_modified=row[4],
+            fetched_at=row[5],
+            expires_at=row[6],
+        )
+
+    def store(
+        self,
+        url: str,
+        content: bytes,
+        *,
+        content_type: str,
+        ttl: timedelta,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        metadata: dict[str, Any] | None = None,
+    ) -> CachedAsset:
+        """Insert or replace the entry for ``url``, fresh for ``ttl``."""
+        now = datetime.now(UTC)
+        entry = CachedAsset(
+            url=url,
+            content=content,
+            content_type=content_type,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=now,
+            expires_at=now + ttl,
+        )
+        cursor = self._cursor()
+        try:
+            cursor.execute(
+                f"INSERT OR REPLACE INTO {quote_identifier(TABLE_NAME)} "  # nosec B608
+                "(url, content_hash, content_type, content, etag, last_modified, fetched_at, expires_at, metadata) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    url,
+                    hashlib.sha256(content).hexdigest(),
+                    content_type,
+                    content,
+                    etag,
+                    last_modified,
+                    entry.fetched_at,
+                    entry.expires_at,
+                    json.dumps(metadata) if metadata is not None else None,
+                ],
+            )
+        finally:
+            cursor.close()
+        return entry
+
+    def touch(self, entry: CachedAsset, *, ttl: timedelta) -> CachedAsset:
+        """Extend a revalidated entry by ``ttl``."""
+        now = datetime.now(UTC)
+        cursor = self._cursor()
+        try:
+            cursor.execute(
+                f"UPDATE {quote_identifier(TABLE_NAME)} SET fetched_at = ?, expires_at = ? WHERE url = ?",  # nosec B608
+                [now, now + ttl, entry.url],
+            )
+        finally:
+            cursor.close()
+        return replace(entry, fetched_at=now, expires_at=now + ttl)
+
+
+__all__ = ["AssetCache", "CachedAsset"]
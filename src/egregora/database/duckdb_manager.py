@@ -59,6 +59,7 @@ from egregora.database.exceptions import (
     TableNotFoundError,
 )
 from egregora.database.schemas import quote_identifier
+from egregora.tracing import current_span, traced
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
@@ -274,6 +275,7 @@ class DuckDBStorageManager:
         """
         yield self._conn
 
+    @traced("duckdb.execute_query")
     def execute_query(self, sql: str, params: list | None = None) -> list:
         """Execute a raw SQL query and return all results.
 
@@ -289,12 +291,16 @@ class DuckDBStorageManager:
 
         """
         params = params or []
+        current_span().set_attribute("db.statement", sql[:200])
         return self._conn.execute(sql, params).fetchall()
 
+    @traced("duckdb.execute_sql")
     def execute_sql(self, sql: str, params: Sequence | None = None) -> None:
         """Execute a raw SQL statement without returning results."""
+        current_span().set_attribute("db.statement", sql[:200])
         self._conn.execute(sql, params or [])
 
+    @traced("duckdb.execute_query_single")
     def execute_query_single(self, sql: str, params: list | None = None) -> tuple | None:
         """Execute a raw SQL query and return a single result row.
 
@@ -307,8 +313,10 @@ class DuckDBStorageManager:
 
         """
         params = params or []
+        current_span().set_attribute("db.statement", sql[:200])
         return self._conn.execute(sql, params).fetchone()
 
+    @traced("duckdb.replace_rows")
     def replace_rows(
         self,
         table: str,
@@ -347,6 +355,68 @@ class DuckDBStorageManager:
         self.execute_sql(sql, params)
         self.ibis_conn.insert(table, rows)
 
+    @traced("duckdb.upsert_rows")
+    def upsert_rows(self, table: str, rows: Sequence[dict[str, Any]], *, key: str) -> int:
+        """Replace rows matching ``key`` values in a single Arrow-batched transaction.
+
+        Unlike :meth:`replace_rows`, which issues one DELETE + INSERT per call,
+        this registers all rows as one Arrow table and runs a single
+        ``DELETE ... WHERE key IN (...)`` followed by ``INSERT ... BY NAME``.
+        Rows may carry any subset of the target table's columns; missing
+        columns are inserted as NULL. When several rows share a key, the last
+        one wins.
+
+        Args:
+            table: Target table name
+            rows: Row dictionaries to upsert
+            key: Primary key column used to match existing rows
+
+        Returns:
+            Number of rows written
+
+        """
+        if not rows:
+            return 0
+
+        current_span().set_attribute("db.table", table)
+        deduped = {row[key]: row for row in rows}
+        columns = list(dict.fromkeys(col for row in deduped.values() for col in row))
+        if key not in columns:
+            msg = f"upsert_rows requires every row to provide the key column '{key}'"
+            raise InvalidOperationError(msg)
+
+        target_schema = self.read_table(table).schema()
+        batch_schema = ibis.schema({col: target_schema[col] for col in columns})
+        batch = ibis.memtable(
+            [{col: row.get(col) for col in columns} for row in deduped.values()],
+            schema=batch_schema,
+        ).to_pyarrow()
+
+        temp_view = f"_egregora_upsert_{uuid.uuid4().hex}"
+        quoted_table = quote_identifier(table)
+        quoted_view = quote_identifier(temp_view)
+        quoted_key = quote_identifier(key)
+        sql = f"""
+        BEGIN TRANSACTION;
+        DELETE FROM {quoted_table} WHERE {quoted_key} IN (SELECT {quoted_key} FROM {quoted_view});
+        INSERT INTO {quoted_table} BY NAME SELECT * FROM {quoted_view};
+        COMMIT;
+        """  # nosec B608
+
+        with self._lock:
+            self._conn.register(temp_view, batch)
+            try:
+                self._conn.execute(sql)
+            except duckdb.Error:
+                with contextlib.suppress(duckdb.Error):
+                    self._conn.execute("ROLLBACK")
+                raise
+            finally:
+                with contextlib.suppress(Exception):
+                    self._conn.unregister(temp_view)
+
+        return len(deduped)
+
     def read_table(self, name: str) -> Table:
         """Read table as Ibis expression.
 
@@ -383,6 +453,7 @@ class DuckDBStorageManager:
             logger.exception(msg)
             raise TableNotFoundError(name) from e
 
+    @traced("duckdb.write_table")
     def write_table(
         self,
         table: Table,
@@ -404,6 +475,7 @@ class DuckDBStorageManager:
             >>> storage.write_table(enriched, "conversations_enriched")
 
         """
+        current_span().set_attribute("db.table", name)
         if checkpoint:
             with self._lock:
                 # Write checkpoint to parquet
@@ -449,6 +521,7 @@ class DuckDBStorageManager:
             msg = "Append mode requires checkpoint=True"
             raise InvalidOperationError(msg)
 
+    @traced("duckdb.persist_atomic")
     def persist_atomic(self, table: Table, name: str, schema: ibis.Schema | None = None) -> None:
         """Persist an Ibis table to a DuckDB table atomically using a transaction.
 
@@ -25,9 +25,12 @@ from egregora.database.schemas import (
     ENTITY_ALIASES_SCHEMA,
     GIT_COMMITS_SCHEMA,
     GIT_REFS_SCHEMA,
+    RUN_STAGES_SCHEMA,
+    RUNS_SCHEMA,
     STAGING_MESSAGES_SCHEMA,
     TASKS_SCHEMA,
     UNIFIED_SCHEMA,
+    URL_CANDIDATES_SCHEMA,
     add_primary_key,
     create_index,
     create_table_if_not_exists,
@@ -203,6 +206,23 @@ def initialize_database(backend: BaseBackend) -> None:
     create_index(conn, "entity_aliases", "idx_entity_aliases_alias", "alias", index_type="Standard")
     create_index(conn, "entity_aliases", "idx_entity_aliases_target", "target_id", index_type="Standard")
 
+    # 10. Run Ledger
+    create_table_if_not_exists(conn, "runs", RUNS_SCHEMA, primary_key="run_id")
+    add_primary_key(conn, "runs", "run_id")
+    create_table_if_not_exists(conn, "run_stages", RUN_STAGES_SCHEMA)
+    create_index(conn, "run_stages", "idx_run_stages_run", "run_id", index_type="Standard")
+
+    # 11. Corpus-wide URL enrichment candidates
+    create_table_if_not_exists(
+        conn,
+        "url_candidates",
+        URL_CANDIDATES_SCHEMA,
+        check_constraints=get_table_check_constraints("url_candidates"),
+        primary_key=["source_key", "url"],
+    )
+    add_primary_key(conn, "url_candidates", ["source_key", "url"])
+    create_index(conn, "url_candidates", "idx_url_candidates_event", "first_event_id", index_type="Standard")
+
     logger.info("✓ Database tables initialized successfully")
 
 
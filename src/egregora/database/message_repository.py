@@ -21,12 +21,38 @@ if TYPE_CHECKING:
     from ibis.backends.duckdb import Backend as DuckDBBackend
     from ibis.expr.types import Table
 
+    from egregora.database.url_index import UrlCandidateIndex
+
+# Regex to match URLs (equivalent to egregora.ops.media.URL_PATTERN)
+URL_REGEX = r'https?://[^\s<>"{}|\\^`\[\]]+'
+
+# Message columns carried along with each candidate as its metadata.
+_CANDIDATE_COLUMNS = (
+    "ts",
+    "event_id",
+    "tenant_id",
+    "source",
+    "thread_id",
+    "author_uuid",
+    "created_at",
+    "created_by_run",
+)
+
 
 @udf.scalar.builtin
 def regexp_extract_all(text: str, pattern: str, group: int = 0) -> list[str]:
     """Extract all matches of pattern from text."""
 
 
+def url_occurrences(messages_table: Table) -> Table:
+    """One row per URL mention in ``messages_table``, with the mentioning message's metadata."""
+    candidates = messages_table.filter(messages_table.text.notnull())
+    candidates = candidates.mutate(urls=regexp_extract_all(candidates.text, URL_REGEX))
+    return candidates.select(
+        url=candidates.urls.unnest(), **{column: candidates[column] for column in _CANDIDATE_COLUMNS}
+    )
+
+
 class MessageRepository:
     """Provides an interface for querying the messages table."""
 
@@ -40,33 +66,26 @@ class MessageRepository:
         self._db = db
 
     def get_url_enrichment_candidates(
-        self, messages_table: Table, max_enrichments: int
+        self, messages_table: Table, max_enrichments: int, *, url_index: UrlCandidateIndex | None = None
     ) -> list[tuple[str, dict[str, Any]]]:
-        """Extract unique URL candidates with metadata, up to max_enrichments."""
+        """Extract unique URL candidates with metadata, up to max_enrichments.
+
+        With a ``url_index`` the window is joined against the corpus-wide index
+        instead of being scanned: a URL is a candidate of the window holding its
+        first occurrence, and only while it is still pending.
+        """
         if max_enrichments <= 0:
             return []
 
-        # Regex to match URLs (equivalent to egregora.ops.media.URL_PATTERN)
-        url_regex = r'https?://[^\s<>"{}|\\^`\[\]]+'
+        if url_index is not None:
+            try:
+                return self._indexed_url_candidates(messages_table, max_enrichments, url_index)
+            except Exception:
+                logger.exception("Failed to join window against the URL index; scanning the window instead")
 
-        # 1. Filter rows with text and extract URLs
-        candidates = messages_table.filter(messages_table.text.notnull())
-        candidates = candidates.mutate(urls=regexp_extract_all(candidates.text, url_regex))
-
-        # 2. Unnest URLs to have one row per URL found
-        candidates = candidates.select(
-            url=candidates.urls.unnest(),
-            ts=candidates.ts,
-            event_id=candidates.event_id,
-            tenant_id=candidates.tenant_id,
-            source=candidates.source,
-            thread_id=candidates.thread_id,
-            author_uuid=candidates.author_uuid,
-            created_at=candidates.created_at,
-            created_by_run=candidates.created_by_run,
-        )
+        candidates = url_occurrences(messages_table)
 
-        # 3. Filter existing enrichments (Anti Join)
+        # Filter existing enrichments (Anti Join)
         # We assume existing enrichments are in the same messages table with media_type='URL'
         # Note: This checks strictly against the DB. If there are pending enrichments not in DB,
         # they might be re-scheduled, but Enqueue logic also checks cache.
@@ -81,40 +100,50 @@ class MessageRepository:
             # Fallback if self-join fails or table structure is unexpected
             logger.exception("Failed to filter existing URL enrichments")
 
-        # 4. Deduplicate: Keep the earliest occurrence of each URL
+        # Deduplicate: Keep the earliest occurrence of each URL
         # We group by URL and use a window function to rank occurrences by timestamp
         w = ibis.window(group_by="url", order_by="ts")
         candidates = candidates.mutate(rank=ibis.row_number().over(w))
         candidates = candidates.filter(candidates.rank == 0)
 
-        # 5. Limit and sort
+        # Limit and sort
         # We order by URL as secondary key to ensure deterministic order for messages with same timestamp
         candidates = candidates.order_by(["ts", "url"]).limit(max_enrichments)
 
-        # 6. Execute
         try:
             results = candidates.execute()
         except Exception:
             # Fallback to empty if query fails
             return []
 
-        # 7. Format output
-        output_items = []
-        for row in results.to_dict("records"):
-            url = row["url"]
-            metadata = {
-                "ts": ensure_datetime(row["ts"]) if row["ts"] else None,
-                "event_id": self._uuid_to_str(row["event_id"]),
-                "tenant_id": row["tenant_id"],
-                "source": row["source"],
-                "thread_id": self._uuid_to_str(row["thread_id"]),
-                "author_uuid": self._uuid_to_str(row["author_uuid"]),
-                "created_at": row["created_at"],
-                "created_by_run": self._uuid_to_str(row["created_by_run"]),
-            }
-            output_items.append((url, metadata))
+        return [(row["url"], self._candidate_metadata(row)) for row in results.to_dict("records")]
 
-        return output_items
+    def _indexed_url_candidates(
+        self, messages_table: Table, max_enrichments: int, url_index: UrlCandidateIndex
+    ) -> list[tuple[str, dict[str, Any]]]:
+        index = url_index.table()
+        index = index.filter(index.status == "pending")
+        window = messages_table.select(
+            event_key=messages_table.event_id.cast("string"),
+            **{column: messages_table[column] for column in _CANDIDATE_COLUMNS},
+        )
+        candidates = index.join(window, index.first_event_id == window.event_key).select(
+            "url", *_CANDIDATE_COLUMNS
+        )
+        results = candidates.order_by(["ts", "url"]).limit(max_enrichments).execute()
+        return [(row["url"], self._candidate_metadata(row)) for row in results.to_dict("records")]
+
+    def _candidate_metadata(self, row: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "ts": ensure_datetime(row["ts"]) if row["ts"] else None,
+            "event_id": self._uuid_to_str(row["event_id"]),
+            "tenant_id": row["tenant_id"],
+            "source": row["source"],
+            "thread_id": self._uuid_to_str(row["thread_id"]),
+            "author_uuid": self._uuid_to_str(row["author_uuid"]),
+            "created_at": row["created_at"],
+            "created_by_run": self._uuid_to_str(row["created_by_run"]),
+        }
 
     def _iter_table_batches(self, table: Table, batch_size: int = 1000) -> Iterator[list[dict[str, Any]]]:
         """Stream table rows as batches of dictionaries without loading entire table into memory."""
@@ -146,21 +175,10 @@ class MessageRepository:
         # We capture group 0 by passing 0 to regexp_extract_all
         plain_file_pattern = r"\b([\w\-\.]+\.\w{2,})\b"
 
-        cols = [
-            "ts",
-            "event_id",
-            "tenant_id",
-            "source",
-            "thread_id",
-            "author_uuid",
-            "created_at",
-            "created_by_run",
-        ]
-
         # Helper to construct candidate sets
         def _extract_candidates(pattern: str, group: int) -> Table:
             q = candidates.mutate(filenames=regexp_extract_all(candidates.text, pattern, group))
-            return q.select(filename=q.filenames.unnest(), **{c: q[c] for c in cols})
+            return q.select(filename=q.filenames.unnest(), **{c: q[c] for c in _CANDIDATE_COLUMNS})
 
         # Set 1: Markdown References (Images & Links)
         q1 = _extract_candidates(md_pattern, 1)
@@ -202,16 +220,7 @@ class MessageRepository:
             if not ref:
                 continue
 
-            metadata = {
-                "ts": ensure_datetime(row["ts"]) if row["ts"] else None,
-                "event_id": self._uuid_to_str(row["event_id"]),
-                "tenant_id": row["tenant_id"],
-                "source": row["source"],
-                "thread_id": self._uuid_to_str(row["thread_id"]),
-                "author_uuid": self._uuid_to_str(row["author_uuid"]),
-                "created_at": row["created_at"],
-                "created_by_run": self._uuid_to_str(row["created_by_run"]),
-            }
+            metadata = self._candidate_metadata(row)
 
             doc_id = str(uuid.uuid5(uuid.NAMESPACE_URL, ref))
             doc = Document(
@@ -5,7 +5,15 @@ import logging
 import duckdb
 
 # Import the target schema and the type conversion utility
-from egregora.database.schemas import UNIFIED_SCHEMA, get_table_check_constraints, ibis_to_duckdb_type
+from egregora.database.schemas import (
+    TASKS_SCHEMA,
+    UNIFIED_SCHEMA,
+    VALID_TASK_STATUSES,
+    VALID_TASK_TYPES,
+    create_table_if_not_exists,
+    get_table_check_constraints,
+    ibis_to_duckdb_type,
+)
 from egregora.database.utils import quote_identifier
 
 logger = logging.getLogger(__name__)
@@ -108,3 +116,49 @@ def migrate_documents_table(conn: duckdb.DuckDBPyConnection) -> None:
         conn.execute(f"ALTER TABLE {temp_table_name} RENAME TO documents;")
     else:
         logger.info("Schema is already up to date. No migration needed.")
+
+
+def _task_checks_are_current(conn: duckdb.DuckDBPyConnection) -> bool:
+    """Whether the CHECK constraints of ``tasks`` accept every current task type and status."""
+    rows = conn.execute(
+        "SELECT expression FROM duckdb_constraints() WHERE table_name='tasks' AND constraint_type='CHECK'"
+    ).fetchall()
+    checks = " ".join(row[0] or "" for row in rows)
+    if not checks:
+        # Created without constraints (TaskStore's fallback); anything is accepted.
+        return True
+    return all(f"'{value}'" in checks for value in (*VALID_TASK_TYPES, *VALID_TASK_STATUSES))
+
+
+def migrate_tasks_table(conn: duckdb.DuckDBPyConnection) -> None:
+    """Rebuild 'tasks' when its CHECK constraints predate the current task types or statuses.
+
+    DuckDB cannot alter a CHECK constraint, so the table is recreated with the
+    current constraints and its rows are copied over. Idempotent.
+    """
+    if _task_checks_are_current(conn):
+        return
+
+    existing_columns = _get_existing_columns(conn, "tasks")
+    columns = ", ".join(quote_identifier(name) for name in TASKS_SCHEMA if name in existing_columns)
+    temp_table_name = "tasks_temp"
+    logger.info("Rebuilding tasks table with the current task types")
+    conn.execute("BEGIN TRANSACTION")
+    try:
+        conn.execute(f"DROP TABLE IF EXISTS {quote_identifier(temp_table_name)}")
+        create_table_if_not_exists(
+            conn,
+            temp_table_name,
+            TASKS_SCHEMA,
+            check_constraints=get_table_check_constraints("tasks"),
+            primary_key="task_id",
+        )
+        conn.execute(
+            f"INSERT INTO {quote_identifier(temp_table_name)} ({columns}) SELECT {columns} FROM tasks"  # nosec B608
+        )
+        conn.execute("DROP TABLE tasks")
+        conn.execute(f"ALTER TABLE {quote_identifier(temp_table_name)} RENAME TO tasks")
+        conn.execute("COMMIT")
+    except duckdb.Error:
+        conn.execute("ROLLBACK")
+        raise
@@ -5,7 +5,7 @@ This repository handles routing document operations to the unified documents tab
 
 from __future__ import annotations
 
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 from typing import TYPE_CHECKING, Any
 
 from egregora.data_primitives.document import Document, DocumentType
@@ -13,10 +13,13 @@ from egregora.database.exceptions import (
     DatabaseOperationError,
     DocumentNotFoundError,
 )
+from egregora.database.streaming import stream_ibis, stream_ibis_batches
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
+    from ibis.expr.types import Table
+
     from egregora.database.duckdb_manager import DuckDBStorageManager
 
 
@@ -29,6 +32,34 @@ class ContentRepository:
 
     def save(self, doc: Document) -> None:
         """Save document to the unified documents table."""
+        row = self._document_to_row(doc)
+        try:
+            self.db.replace_rows(self._table_name, [row], by_keys={"id": row["id"]})
+        except Exception as e:
+            msg = f"Failed to save document {row['id']}: {e}"
+            raise DatabaseOperationError(msg) from e
+
+    def save_many(self, docs: Iterable[Document]) -> int:
+        """Save many documents with a single batched upsert.
+
+        All rows are sent to DuckDB as one Arrow table and replaced by primary
+        key in one transaction, instead of one DELETE + INSERT per document.
+
+        Returns:
+            Number of distinct documents written
+
+        """
+        rows = [self._document_to_row(doc) for doc in docs]
+        if not rows:
+            return 0
+        try:
+            return self.db.upsert_rows(self._table_name, rows, key="id")
+        except Exception as e:
+            msg = f"Failed to save {len(rows)} documents: {e}"
+            raise DatabaseOperationError(msg) from e
+
+    def _document_to_row(self, doc: Document) -> dict[str, Any]:
+        """Map a Document onto a row of the unified documents table."""
         # 1. Base mapping (Common to all types)
         row: dict[str, Any] = {
             "id": doc.document_id,  # Use stable ID property
@@ -91,27 +122,45 @@ class ContentRepository:
         elif doc.type == DocumentType.ANNOTATION:
             pass
 
-        try:
-            self.db.replace_rows("documents", [row], by_keys={"id": row["id"]})
-        except Exception as e:
-            msg = f"Failed to save document {row['id']}: {e}"
-            raise DatabaseOperationError(msg) from e
+        return row
 
     def get_all(self) -> Iterator[Document]:
         """Stream all documents from the unified table."""
+        yield from self.iter_documents()
+
+    def iter_documents(
+        self, doc_type: DocumentType | None = None, *, batch_size: int = 1000
+    ) -> Iterator[Document]:
+        """Stream documents with a single query, fetching ``batch_size`` rows at a time."""
         try:
-            t = self.db.read_table("documents")
-            # Return Document objects, not dicts
-            for row in t.execute().to_dict(orient="records"):
-                yield self._row_to_document(row)
+            for batch in stream_ibis(
+                self._documents_expr(doc_type), self.db.ibis_conn, batch_size=batch_size
+            ):
+                for row in batch:
+                    yield self._row_to_document(row)
         except Exception as e:
             msg = f"Failed to get all documents: {e}"
             raise DatabaseOperationError(msg) from e
 
+    def iter_batches(self, doc_type: DocumentType | None = None, *, batch_size: int = 1000) -> Iterator[Any]:
+        """Stream raw rows of the documents table as Arrow ``RecordBatch`` objects.
+
+        Intended for bulk consumers (exports, materialization, indexing) that
+        can work on columnar data without building Document objects or
+        DataFrames.
+        """
+        try:
+            yield from stream_ibis_batches(
+                self._documents_expr(doc_type), self.db.ibis_conn, batch_size=batch_size
+            )
+        except Exception as e:
+            msg = f"Failed to stream documents: {e}"
+            raise DatabaseOperationError(msg) from e
+
     def get(self, doc_type: DocumentType, identifier: str) -> Document:
         """Retrieve a single document by type and identifier."""
         try:
-            t = self.db.read_table("documents")
+            t = self.db.read_table(self._table_name)
 
             # Filter by ID and Type
             # Also support slug lookup for Posts?
@@ -137,21 +186,57 @@ class ContentRepository:
             msg = f"Failed to get document: {e}"
             raise DatabaseOperationError(msg) from e
 
+    def get_many(self, doc_type: DocumentType, identifiers: Iterable[str]) -> dict[str, Document]:
+        """Retrieve several documents of one type with a single keyed lookup.
+
+        Identifiers are matched against the ``id`` primary key (and, for posts,
+        against ``slug`` as :meth:`get` does). Missing identifiers are simply
+        absent from the result.
+
+        Returns:
+            Mapping of requested identifier to Document
+
+        """
+        wanted = set(identifiers)
+        if not wanted:
+            return {}
+        try:
+            t = self.db.read_table(self._table_name)
+            match = t.id.isin(wanted)
+            if doc_type == DocumentType.POST:
+                match |= t.slug.isin(wanted)
+            expr = t.filter((t.doc_type == doc_type.value) & match)
+
+            found: dict[str, Document] = {}
+            for batch in stream_ibis(expr, self.db.ibis_conn):
+                for row in batch:
+                    doc = self._row_to_document(row)
+                    if row["id"] in wanted:
+                        found[row["id"]] = doc
+                    elif row.get("slug") in wanted:
+                        found.setdefault(row["slug"], doc)
+        except Exception as e:
+            msg = f"Failed to get documents: {e}"
+            raise DatabaseOperationError(msg) from e
+        return found
+
     def list(self, doc_type: DocumentType | None = None) -> Iterator[dict[str, Any]]:
         """List documents metadata."""
         try:
-            t = self.db.read_table("documents")
-            if doc_type:
-                t = t.filter(t.doc_type == doc_type.value)
-
-            yield from t.execute().to_dict(orient="records")
+            for batch in stream_ibis(self._documents_expr(doc_type), self.db.ibis_conn):
+                yield from batch
         except Exception as e:
-            # Fallback or error?
-            # Old code had fallback. New code assumes 'documents' exists.
             # If 'documents' table missing, it will raise TableNotFoundError which is fine.
             msg = f"Failed to list documents: {e}"
             raise DatabaseOperationError(msg) from e
 
+    def _documents_expr(self, doc_type: DocumentType | None) -> Table:
+        """Build the (optionally type-filtered) documents query in primary key order."""
+        t = self.db.read_table(self._table_name)
+        if doc_type:
+            t = t.filter(t.doc_type == doc_type.value)
+        return t.order_by(t.id)
+
     def _row_to_document(self, row: dict) -> Document:
         """Convert a DB row to a Document object."""
         doc_type_str = row.get("doc_type")
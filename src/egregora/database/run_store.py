@@ -1,5 +1,283 @@
-"""Defines the RunStore for managing pipeline runs."""
+"""Persistent ledger of pipeline runs.
+
+Every ``egregora write`` run gets a row in the ``runs`` table (parameters,
+outcome, token usage, cache hit counts, task counts) and one row per stage
+in ``run_stages`` with aggregated span timings, both overall and per window.
+The ledger is what ``egregora runs list|show|compare`` reads, so two runs
+can be compared after an upgrade to spot performance regressions.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+from egregora.database.schemas import RUN_STAGES_SCHEMA, RUNS_SCHEMA
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from egregora.database.duckdb_manager import DuckDBStorageManager
+    from egregora.llm.usage import UsageTracker
+    from egregora.tracing import StageTimingCollector
+
+logger = logging.getLogger(__name__)
+
+_NS_PER_MS = 1_000_000
+
+_RUN_COLUMNS = tuple(RUNS_SCHEMA.names)
+
+
+@dataclass(frozen=True, slots=True)
+class RunRecord:
+    """One row of the ``runs`` table."""
+
+    run_id: str
+    source_type: str
+    source_key: str | None
+    input_path: str | None
+    parameters: dict[str, Any]
+    status: str
+    started_at: datetime
+    finished_at: datetime | None = None
+    duration_ms: float | None = None
+    windows: int | None = None
+    posts: int | None = None
+    profiles: int | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+    llm_requests: int | None = None
+    cache_stats: dict[str, dict[str, int]] = field(default_factory=dict)
+    task_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    failures: int | None = None
+    error: str | None = None
+
+    def cache_hit_rate(self, tier: str) -> float | None:
+        """Return the hit rate for ``tier``, or None if it was never looked up."""
+        stats = self.cache_stats.get(tier)
+        if not stats:
+            return None
+        total = stats.get("hits", 0) + stats.get("misses", 0)
+        return stats.get("hits", 0) / total if total else None
+
+
+@dataclass(frozen=True, slots=True)
+class StageMetric:
+    """Aggregated timings for one stage (optionally within one window)."""
+
+    stage: str
+    calls: int
+    duration_ms: float
+    failures: int
+    window_label: str | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class StageComparison:
+    """Side-by-side timings of one stage across two runs."""
+
+    stage: str
+    baseline_ms: float | None
+    candidate_ms: float | None
+
+    @property
+    def delta_ms(self) -> float | None:
+        if self.baseline_ms is None or self.candidate_ms is None:
+            return None
+        return self.candidate_ms - self.baseline_ms
+
+    @property
+    def ratio(self) -> float | None:
+        if not self.baseline_ms or self.candidate_ms is None:
+            return None
+        return self.candidate_ms / self.baseline_ms
 
 
 class RunStore:
-    """Placeholder for the RunStore."""
+    """DuckDB-backed ledger of pipeline runs and their per-stage metrics."""
+
+    def __init__(self, storage: DuckDBStorageManager) -> None:
+        """Initialize the run store.
+
+        Args:
+            storage: The central DuckDB storage manager.
+
+        """
+        self.storage = storage
+        self._ensure_tables()
+
+    def _ensure_tables(self) -> None:
+        tables = set(self.storage.list_tables())
+        if "runs" not in tables:
+            self.storage.ibis_conn.create_table("runs", schema=RUNS_SCHEMA)
+        if "run_stages" not in tables:
+            self.storage.ibis_conn.create_table("run_stages", schema=RUN_STAGES_SCHEMA)
+
+    # -- writing -----------------------------------------------------------
+    def start_run(
+        self,
+        run_id: str,
+        *,
+        source_type: str,
+        source_key: str | None = None,
+        input_path: str | None = None,
+        parameters: Mapping[str, Any] | None = None,
+        started_at: datetime | None = None,
+    ) -> None:
+        """Record a run as ``running`` so crashed runs still show up."""
+        self.storage.execute_sql(
+            "INSERT INTO runs (run_id, source_type, source_key, input_path, parameters, status, started_at) "
+            "VALUES (?, ?, ?, ?, ?, 'running', ?)",
+            [
+                run_id,
+                source_type,
+                source_key,
+                input_path,
+                json.dumps(dict(parameters or {}), default=str),
+                started_at or datetime.now(UTC),
+            ],
+        )
+
+    def finish_run(
+        self,
+        run_id: str,
+        *,
+        status: str,
+        windows: int = 0,
+        posts: int = 0,
+        profiles: int = 0,
+        usage: UsageTracker | None = None,
+        task_counts: Mapping[str, Mapping[str, int]] | None = None,
+        failures: int = 0,
+        error: str | None = None,
+    ) -> None:
+        """Store the outcome and totals of a run."""
+        finished_at = datetime.now(UTC)
+        row = self.storage.execute_query_single("SELECT started_at FROM runs WHERE run_id = ?", [run_id])
+        duration_ms = None
+        if row is not None and row[0] is not None:
+            started_at = row[0] if row[0].tzinfo else row[0].replace(tzinfo=UTC)
+            duration_ms = (finished_at - started_at).total_seconds() * 1000
+
+        run_usage = usage.usage if usage is not None else None
+        self.storage.execute_sql(
+            "UPDATE runs SET status = ?, finished_at = ?, duration_ms = ?, windows = ?, posts = ?, "
+            "profiles = ?, input_tokens = ?, output_tokens = ?, llm_requests = ?, cache_stats = ?, "
+            "task_counts = ?, failures = ?, error = ? WHERE run_id = ?",
+            [
+                status,
+                finished_at,
+                duration_ms,
+                windows,
+                posts,
+                profiles,
+                run_usage.input_tokens if run_usage else None,
+                run_usage.output_tokens if run_usage else None,
+                run_usage.requests if run_usage else None,
+                json.dumps(usage.cache_stats() if usage is not None else {}),
+                json.dumps(task_counts or {}),
+                failures,
+                error,
+                run_id,
+            ],
+        )
+
+    def record_stages(self, run_id: str, collector: StageTimingCollector) -> int:
+        """Persist the aggregated span timings gathered during a run."""
+        rows = [
+            (run_id, stage, None, timing.calls, timing.duration_ns / _NS_PER_MS, timing.failures)
+            for stage, timing in collector.stages.items()
+        ]
+        rows.extend(
+            (run_id, stage, window, timing.calls, timing.duration_ns / _NS_PER_MS, timing.failures)
+            for (window, stage), timing in collector.windows.items()
+        )
+        if not rows:
+            return 0
+        with self.storage.connection() as conn:
+            conn.executemany(
+                "INSERT INTO run_stages (run_id, stage, window_label, calls, duration_ms, failures) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+        return len(rows)
+
+    def count_tasks_since(self, since: datetime, source_key: str | None = None) -> dict[str, dict[str, int]]:
+        """Count background tasks created since ``since`` by type and status.
+
+        With ``source_key``, only that source's tasks are counted, which keeps
+        the counts right when several sources run at the same time.
+        """
+        if "tasks" not in self.storage.list_tables():
+            return {}
+        sql = "SELECT task_type, status, COUNT(*) FROM tasks WHERE created_at >= ?"
+        params: list[Any] = [since]
+        if source_key is not None:
+            sql += " AND source_key = ?"
+            params.append(source_key)
+        counts: dict[str, dict[str, int]] = {}
+        for task_type, status, total in self.storage.execute_query(f"{sql} GROUP BY ALL", params):
+            counts.setdefault(task_type, {})[status] = int(total)
+        return counts
+
+    # -- reading -----------------------------------------------------------
+    def list_runs(self, limit: int = 20) -> list[RunRecord]:
+        """Return the most recent runs, newest first."""
+        rows = self.storage.execute_query(
+            f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs ORDER BY started_at DESC LIMIT ?",  # nosec B608
+            [limit],
+        )
+        return [_run_from_row(row) for row in rows]
+
+    def get_run(self, run_id: str) -> RunRecord | None:
+        """Return a run by id or unique id prefix."""
+        rows = self.storage.execute_query(
+            f"SELECT {', '.join(_RUN_COLUMNS)} FROM runs WHERE starts_with(run_id, ?) LIMIT 2",  # nosec B608
+            [run_id],
+        )
+        if len(rows) != 1:
+            return None
+        return _run_from_row(rows[0])
+
+    def get_stages(self, run_id: str, *, per_window: bool = False) -> list[StageMetric]:
+        """Return stage timings for a run, slowest first."""
+        window_filter = "window_label IS NOT NULL" if per_window else "window_label IS NULL"
+        rows = self.storage.execute_query(
+            "SELECT stage, calls, duration_ms, failures, window_label FROM run_stages "  # nosec B608
+            f"WHERE run_id = ? AND {window_filter} ORDER BY window_label, duration_ms DESC",
+            [run_id],
+        )
+        return [
+            StageMetric(
+                stage=stage,
+                calls=int(calls),
+                duration_ms=float(duration_ms),
+                failures=int(failures),
+                window_label=window_label,
+            )
+            for stage, calls, duration_ms, failures, window_label in rows
+        ]
+
+    def compare_runs(self, baseline_id: str, candidate_id: str) -> list[StageComparison]:
+        """Line up stage timings of two runs, biggest regression first."""
+        baseline = {metric.stage: metric.duration_ms for metric in self.get_stages(baseline_id)}
+        candidate = {metric.stage: metric.duration_ms for metric in self.get_stages(candidate_id)}
+        comparisons = [
+            StageComparison(stage=stage, baseline_ms=baseline.get(stage), candidate_ms=candidate.get(stage))
+            for stage in baseline.keys() | candidate.keys()
+        ]
+        return sorted(comparisons, key=lambda c: (c.delta_ms is None, -(c.delta_ms or 0.0), c.stage))
+
+
+def _run_from_row(row: tuple) -> RunRecord:
+    values = dict(zip(_RUN_COLUMNS, row, strict=True))
+    for column in ("parameters", "cache_stats", "task_counts"):
+        raw = values[column]
+        values[column] = json.loads(raw) if isinstance(raw, str) else (raw or {})
+    return RunRecord(**values)
+
+
+__all__ = ["RunRecord", "RunStore", "StageComparison", "StageMetric"]
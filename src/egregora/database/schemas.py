@@ -28,9 +28,12 @@ __all__ = [
     "ENTITY_ALIASES_SCHEMA",
     "GIT_COMMITS_SCHEMA",
     "GIT_REFS_SCHEMA",
+    "RUNS_SCHEMA",
+    "RUN_STAGES_SCHEMA",
     "STAGING_MESSAGES_SCHEMA",
     "TASKS_SCHEMA",
     "UNIFIED_SCHEMA",
+    "URL_CANDIDATES_SCHEMA",
     "add_check_constraint",
     "create_index",
     "create_table_if_not_exists",
@@ -298,6 +301,7 @@ def get_table_check_constraints(table_name: str) -> dict[str, str]:
         CHECK constraints for enum-like fields. Currently supports:
         - posts.status: Must be one of VALID_POST_STATUSES
         - tasks.status: Must be one of VALID_TASK_STATUSES
+        - url_candidates.status: Must be one of VALID_URL_CANDIDATE_STATUSES
 
     """
     if table_name == "posts":
@@ -310,6 +314,9 @@ def get_table_check_constraints(table_name: str) -> dict[str, str]:
         valid_task_types = ", ".join(f"'{task_type}'" for task_type in VALID_TASK_TYPES)
         constraints["chk_tasks_task_type"] = f"task_type IN ({valid_task_types})"
         return constraints
+    if table_name == "url_candidates":
+        valid_values = ", ".join(f"'{status}'" for status in VALID_URL_CANDIDATE_STATUSES)
+        return {"chk_url_candidates_status": f"status IN ({valid_values})"}
     if table_name == "annotations":
         valid_values = ", ".join(f"'{parent_type}'" for parent_type in VALID_ANNOTATION_PARENT_TYPES)
         return {"chk_annotations_parent_type": f"parent_type IN ({valid_values})"}
@@ -368,9 +375,17 @@ def get_table_foreign_keys(table_name: str) -> list[str]:
 VALID_POST_STATUSES = ("draft", "published", "archived")
 VALID_TASK_STATUSES = ("pending", "processing", "completed", "failed", "superseded")
 VALID_MEDIA_TYPES = ("image", "video", "audio")
-VALID_TASK_TYPES = ("generate_banner", "update_profile", "enrich_media", "enrich_url")
+VALID_TASK_TYPES = (
+    "generate_banner",
+    "update_profile",
+    "enrich_media",
+    "enrich_url",
+    "enrich_url_batch",
+    "writer_batch",
+)
 VALID_ANNOTATION_PARENT_TYPES = ("message", "post", "annotation")
 VALID_RELATION_TYPES = ("mentions", "authored_by", "reply_to", "related_to")
+VALID_URL_CANDIDATE_STATUSES = ("pending", "scheduled", "enriched")
 
 # Common columns for all types
 BASE_COLUMNS = {
@@ -433,11 +448,64 @@ TASKS_SCHEMA = ibis.schema(
         "created_at": dt.Timestamp(timezone="UTC"),
         "processed_at": dt.Timestamp(timezone="UTC", nullable=True),
         "error": dt.String(nullable=True),
+        # Source that enqueued the task; keeps concurrently running sources apart.
+        "source_key": dt.String(nullable=True),
         # run_id is no longer part of the schema in V2, but was in V1.
         # Removing run_id dependency for clean break.
     }
 )
 
+# ----------------------------------------------------------------------------
+# URL Candidates Schema (corpus-wide index of URLs awaiting enrichment)
+# ----------------------------------------------------------------------------
+URL_CANDIDATES_SCHEMA = ibis.schema(
+    {
+        "source_key": dt.string,  # Source the URL was indexed for ("" without one)
+        "url": dt.string,
+        "first_event_id": dt.string,  # Message where the URL first appears
+        "first_ts": dt.Timestamp(timezone="UTC"),
+        "status": dt.string,  # "pending", "scheduled", "enriched"
+    }
+)
+
+# ----------------------------------------------------------------------------
+# Run Ledger Schemas (one row per pipeline run, plus per-stage timings)
+# ----------------------------------------------------------------------------
+RUNS_SCHEMA = ibis.schema(
+    {
+        "run_id": dt.string,
+        "source_type": dt.string,
+        "source_key": dt.String(nullable=True),
+        "input_path": dt.String(nullable=True),
+        "parameters": dt.JSON(nullable=True),  # Effective pipeline settings for the run
+        "status": dt.string,  # "running", "completed", "failed"
+        "started_at": dt.Timestamp(timezone="UTC"),
+        "finished_at": dt.Timestamp(timezone="UTC", nullable=True),
+        "duration_ms": dt.Float64(nullable=True),
+        "windows": dt.Int64(nullable=True),
+        "posts": dt.Int64(nullable=True),
+        "profiles": dt.Int64(nullable=True),
+        "input_tokens": dt.Int64(nullable=True),
+        "output_tokens": dt.Int64(nullable=True),
+        "llm_requests": dt.Int64(nullable=True),
+        "cache_stats": dt.JSON(nullable=True),  # {"writer": {"hits": 3, "misses": 1}, ...}
+        "task_counts": dt.JSON(nullable=True),  # {"enrich_url": {"completed": 4}, ...}
+        "failures": dt.Int64(nullable=True),
+        "error": dt.String(nullable=True),
+    }
+)
+
+RUN_STAGES_SCHEMA = ibis.schema(
+    {
+        "run_id": dt.string,
+        "stage": dt.string,  # Span name, e.g. "pipeline.writer"
+        "window_label": dt.String(nullable=True),  # Set for per-window rows
+        "calls": dt.int64,
+        "duration_ms": dt.float64,
+        "failures": dt.int64,
+    }
+)
+
 # ============================================================================
 # Unified Schema
 # ============================================================================
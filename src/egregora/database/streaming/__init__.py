@@ -6,6 +6,7 @@ architecture principle.
 
 Public API:
     - stream_ibis: Stream Ibis expression rows in batches
+    - stream_ibis_batches: Stream Ibis expression results as Arrow record batches
     - copy_expr_to_parquet: Write Ibis expression directly to Parquet
     - copy_expr_to_ndjson: Write Ibis expression directly to NDJSON
     - ensure_deterministic_order: Sort expression for reproducible iteration
@@ -16,6 +17,13 @@ from egregora.database.streaming.stream import (
     copy_expr_to_parquet,
     ensure_deterministic_order,
     stream_ibis,
+    stream_ibis_batches,
 )
 
-__all__ = ["copy_expr_to_ndjson", "copy_expr_to_parquet", "ensure_deterministic_order", "stream_ibis"]
+__all__ = [
+    "copy_expr_to_ndjson",
+    "copy_expr_to_parquet",
+    "ensure_deterministic_order",
+    "stream_ibis",
+    "stream_ibis_batches",
+]
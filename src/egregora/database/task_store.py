@@ -13,9 +13,12 @@ import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
+from egregora.database.migrations import migrate_tasks_table
 from egregora.database.schemas import TASKS_SCHEMA, quote_identifier
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from egregora.database.duckdb_manager import DuckDBStorageManager
 
 logger = logging.getLogger(__name__)
@@ -24,15 +27,27 @@ logger = logging.getLogger(__name__)
 class TaskStore:
     """DuckDB-backed task queue for async operations."""
 
-    def __init__(self, storage: DuckDBStorageManager) -> None:
+    def __init__(self, storage: DuckDBStorageManager, source_key: str | None = None) -> None:
         """Initialize the task store.
 
         Args:
             storage: The central DuckDB storage manager.
+            source_key: Source this store works for. Tasks are stamped with it
+                and only this source's tasks (plus unstamped legacy ones) are
+                fetched, so sources running concurrently never pick up each
+                other's work.
 
         """
         self.storage = storage
+        self.source_key = source_key
         self._ensure_table()
+        # Schema evolution: databases created before tasks were source-scoped,
+        # or before the batch job task types existed.
+        self.storage.execute_sql(
+            f"ALTER TABLE {quote_identifier('tasks')} ADD COLUMN IF NOT EXISTS source_key VARCHAR"
+        )
+        with self.storage.connection() as conn:
+            migrate_tasks_table(conn)
 
     def _ensure_table(self) -> None:
         """Create the tasks table if it was dropped or the database was rebuilt."""
@@ -73,6 +88,7 @@ class TaskStore:
             "created_at": datetime.now(UTC),
             "processed_at": None,
             "error": None,
+            "source_key": self.source_key,
         }
 
         # Pass as a list to ensure it's treated as a row, not scalar values
@@ -111,6 +127,7 @@ class TaskStore:
                     "created_at": now,
                     "processed_at": None,
                     "error": None,
+                    "source_key": self.source_key,
                 }
             )
 
@@ -138,6 +155,8 @@ class TaskStore:
 
         if task_type:
             query = query.filter(t.task_type == task_type)
+        if self.source_key is not None:
+            query = query.filter((t.source_key == self.source_key) | t.source_key.isnull())
 
         # Order by creation time to ensure FIFO processing
         # (Workers may override this order for optimization, e.g., coalescing)
@@ -145,6 +164,18 @@ class TaskStore:
 
         return query.execute().to_dict(orient="records")
 
+    def pending_among(self, task_ids: Iterable[str]) -> set[str]:
+        """Return which of ``task_ids`` are still pending."""
+        ids = [str(task_id) for task_id in task_ids]
+        if not ids:
+            return set()
+        rows = self.storage.execute_query(
+            f"SELECT CAST(task_id AS VARCHAR) FROM {quote_identifier('tasks')} "  # nosec B608
+            "WHERE status = 'pending' AND CAST(task_id AS VARCHAR) IN (SELECT unnest(?))",
+            [ids],
+        )
+        return {row[0] for row in rows}
+
     def _update_status(
         self,
         task_id: uuid.UUID | str,
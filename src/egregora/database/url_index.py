@@ -0,0 +1,144 @@
+"""Corpus-wide index of URLs awaiting enrichment.
+
+URL candidates used to be found by scanning every window's messages for URLs
+(regex extraction, unnest, anti-join, ranking), so a URL in an overlapping
+region was extracted once per window and could be scheduled twice.
+:class:`UrlCandidateIndex` extracts them once per run in a single vectorized
+pass over all messages and keeps one row per source and URL: where it first
+appears and whether it is still pending. Windows then join against their
+source's rows by event id.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from typing import TYPE_CHECKING
+
+import ibis
+
+from egregora.database.message_repository import url_occurrences
+from egregora.database.schemas import (
+    URL_CANDIDATES_SCHEMA,
+    VALID_URL_CANDIDATE_STATUSES,
+    add_primary_key,
+    create_table_if_not_exists,
+    get_table_check_constraints,
+    quote_identifier,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from ibis.expr.types import Table
+
+    from egregora.database.duckdb_manager import DuckDBStorageManager
+
+logger = logging.getLogger(__name__)
+
+TABLE_NAME = "url_candidates"
+
+
+class UrlCandidateIndex:
+    """DuckDB-backed index of (source_key, url, first_event_id, first_ts, status)."""
+
+    def __init__(self, storage: DuckDBStorageManager, source_key: str | None = None) -> None:
+        """Initialize the index.
+
+        Args:
+            storage: The central DuckDB storage manager.
+            source_key: Source this index works for. Rows are keyed by source
+                and URL, so sources running concurrently never reset or claim
+                each other's URLs, and a URL first seen by one source is still
+                a candidate for another.
+
+        """
+        self.storage = storage
+        # Primary key columns cannot be NULL; runs without a source key share "".
+        self.source_key = source_key or ""
+        self._ensure_table()
+
+    def _ensure_table(self) -> None:
+        if TABLE_NAME in self.storage.list_tables():
+            if "source_key" in self.storage.get_table_columns(TABLE_NAME):
+                return
+            # Indexes from before rows were per source are keyed by URL alone and
+            # DuckDB cannot change a primary key. Every run repopulates the index
+            # from its messages, so it is recreated.
+            self.storage.drop_table(TABLE_NAME)
+        with self.storage.connection() as conn:
+            create_table_if_not_exists(
+                conn,
+                TABLE_NAME,
+                URL_CANDIDATES_SCHEMA,
+                check_constraints=get_table_check_constraints(TABLE_NAME),
+                primary_key=["source_key", "url"],
+            )
+            add_primary_key(conn, TABLE_NAME, ["source_key", "url"])
+        self.storage.get_table_columns(TABLE_NAME, refresh=True)
+
+    def update(self, messages_table: Table) -> int:
+        """Add the URLs mentioned in ``messages_table``, keeping each URL's earliest mention.
+
+        New URLs start out pending. URLs this source scheduled in an earlier run
+        go back to pending, so work lost with that run is picked up again; the
+        enrichment cache keeps finished ones from being redone. Returns the
+        number of distinct URLs seen.
+        """
+        occurrences = url_occurrences(messages_table)
+        occurrences = occurrences.mutate(
+            rank=ibis.row_number().over(ibis.window(group_by="url", order_by=["ts", "event_id"]))
+        )
+        firsts = occurrences.filter(occurrences.rank == 0).select(
+            url=occurrences.url,
+            first_event_id=occurrences.event_id.cast("string"),
+            first_ts=occurrences.ts,
+        )
+        batch = firsts.to_pyarrow()
+
+        table = quote_identifier(TABLE_NAME)
+        view = f"_egregora_url_candidates_{uuid.uuid4().hex}"
+        sql = f"""
+        INSERT INTO {table} (source_key, url, first_event_id, first_ts, status)
+        SELECT ?, url, first_event_id, first_ts, 'pending' FROM {quote_identifier(view)}
+        ON CONFLICT (source_key, url) DO UPDATE SET
+            first_event_id = CASE
+                WHEN excluded.first_ts < first_ts THEN excluded.first_event_id ELSE first_event_id
+            END,
+            first_ts = LEAST(first_ts, excluded.first_ts)
+        """  # nosec B608
+        self._ensure_table()
+        with self.storage.connection() as conn:
+            conn.register(view, batch)
+            try:
+                conn.execute(sql, [self.source_key])
+            finally:
+                conn.unregister(view)
+        self.storage.execute_sql(
+            f"UPDATE {table} SET status = 'pending' WHERE status = 'scheduled' AND source_key = ?",  # nosec B608
+            [self.source_key],
+        )
+        logger.info("Indexed %d distinct URLs for enrichment", batch.num_rows)
+        return batch.num_rows
+
+    def mark(self, urls: Iterable[str], status: str) -> None:
+        """Set the status of this source's ``urls``."""
+        if status not in VALID_URL_CANDIDATE_STATUSES:
+            msg = f"Invalid URL candidate status: {status}"
+            raise ValueError(msg)
+        urls = list(urls)
+        if not urls:
+            return
+        self.storage.execute_sql(
+            f"UPDATE {quote_identifier(TABLE_NAME)} SET status = ? "  # nosec B608
+            "WHERE source_key = ? AND url IN (SELECT unnest(?))",
+            [status, self.source_key, urls],
+        )
+
+    def table(self) -> Table:
+        """The index rows of this source, as an Ibis table."""
+        index = self.storage.read_table(TABLE_NAME)
+        return index.filter(index.source_key == self.source_key)
+
+
+__all__ = ["UrlCandidateIndex"]
@@ -291,6 +291,13 @@ class InputAdapter(ABC):
         """
         return {}
 
+    def close(self) -> None:  # noqa: B027 - optional hook, no-op by default
+        """Release resources held between calls, such as open archives (OPTIONAL).
+
+        Called when the pipeline that used the adapter tears down. The default
+        implementation does nothing.
+        """
+
     def __repr__(self) -> str:
         """String representation of the adapter."""
         return f"{self.__class__.__name__}(source='{self.source_identifier}')"
@@ -0,0 +1,107 @@
+"""On-disk HTTP response cache with conditional revalidation.
+
+Used by API-backed input adapters so repeated ingests of the same feed turn
+into ``304 Not Modified`` round-trips instead of full downloads. Each entry is
+stored as two files named after a hash of the request (URL + query params):
+``<key>.body`` with the raw response bytes and ``<key>.json`` with the
+validators (``ETag`` / ``Last-Modified``) needed to build the next
+``If-None-Match`` / ``If-Modified-Since`` request.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class CachedResponse:
+    """A cached response body plus the validators it was served with."""
+
+    url: str
+    body: bytes
+    etag: str | None = None
+    last_modified: str | None = None
+
+    def conditional_headers(self) -> dict[str, str]:
+        """Headers that let the server answer ``304`` if nothing changed."""
+        headers: dict[str, str] = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class HttpCache:
+    """File-backed cache of HTTP responses keyed by URL and query parameters."""
+
+    def __init__(self, cache_dir: Path) -> None:
+        self.cache_dir = cache_dir
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key_for(url: str, params: dict[str, Any] | None = None) -> str:
+        """Stable cache key for a request."""
+        canonical = json.dumps({"url": url, "params": params or {}}, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> CachedResponse | None:
+        """Return the cached response for ``key``, or None if absent or unreadable."""
+        meta_path = self.cache_dir / f"{key}.json"
+        body_path = self.cache_dir / f"{key}.body"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("Ignoring unreadable HTTP cache entry %s: %s", key, exc)
+            return None
+        return CachedResponse(
+            url=meta.get("url", ""),
+            body=body,
+            etag=meta.get("etag"),
+            last_modified=meta.get("last_modified"),
+        )
+
+    def store(self, key: str, response: httpx.Response) -> CachedResponse:
+        """Persist a ``200`` response together with its validators."""
+        entry = CachedResponse(
+            url=str(response.url),
+            body=response.content,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        # Body first: a metadata file without a body is treated as a miss.
+        (self.cache_dir / f"{key}.body").write_bytes(entry.body)
+        meta = {
+            "url": entry.url,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "stored_at": datetime.now(UTC).isoformat(),
+        }
+        (self.cache_dir / f"{key}.json").write_text(json.dumps(meta), encoding="utf-8")
+        return entry
+
+    def load_state(self, name: str) -> dict[str, Any]:
+        """Read a small JSON state document (e.g. a pagination cursor)."""
+        try:
+            return json.loads((self.cache_dir / f"{name}.state.json").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def save_state(self, name: str, state: dict[str, Any]) -> None:
+        """Write a small JSON state document next to the cached responses."""
+        (self.cache_dir / f"{name}.state.json").write_text(json.dumps(state), encoding="utf-8")
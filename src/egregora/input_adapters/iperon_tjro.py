@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING, Any
+from pathlib import Path
+from typing import Any
 from uuid import UUID, uuid5
 
 import httpx
@@ -14,9 +16,8 @@ import ibis
 
 from egregora.database.schemas import STAGING_MESSAGES_SCHEMA
 from egregora.input_adapters.base import AdapterMeta, InputAdapter
-
-if TYPE_CHECKING:
-    from pathlib import Path
+from egregora.input_adapters.http_cache import HttpCache
+from egregora.security.http import create_async_http_client
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +25,10 @@ logger = logging.getLogger(__name__)
 AUTHOR_NAMESPACE = UUID("1b7ca5a9-2fdb-4584-9621-a4a71af9d4a4")
 RUN_IDENTIFIER = "adapter:iperon-tjro"
 BASE_URL = "https://comunicaapi.pje.jus.br/api/v1/comunicacao"
+REQUEST_TIMEOUT = 30.0
+DEFAULT_CONCURRENCY = 4
+# Relative to the directory holding the adapter config file.
+DEFAULT_CACHE_DIR = Path(".egregora") / ".cache" / "http" / "iperon-tjro"
 
 
 @dataclass(slots=True)
@@ -35,6 +40,41 @@ class RequestPlan:
     start_page: int = 1
     max_pages: int | None = None
     mock_items: list[dict[str, Any]] = field(default_factory=list)
+    base_url: str = BASE_URL
+    concurrency: int = DEFAULT_CONCURRENCY
+    cache_dir: Path | None = None
+
+
+class _CachedFetcher:
+    """Bounded-concurrency JSON fetcher with ETag/Last-Modified revalidation."""
+
+    def __init__(self, client: httpx.AsyncClient, cache: HttpCache | None, concurrency: int) -> None:
+        self._client = client
+        self._cache = cache
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.not_modified = 0
+
+    @property
+    def cache(self) -> HttpCache | None:
+        return self._cache
+
+    async def get_json(self, url: str, params: dict[str, Any] | None = None) -> Any:
+        key = HttpCache.key_for(url, params)
+        cached = self._cache.load(key) if self._cache else None
+        headers = cached.conditional_headers() if cached else {}
+
+        async with self._semaphore:
+            response = await self._client.get(url, params=params, headers=headers)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            self.not_modified += 1
+            body = cached.body
+        else:
+            response.raise_for_status()
+            body = response.content
+            if self._cache:
+                self._cache.store(key, response)
+        return json.loads(body)
 
 
 class IperonTJROAdapter(InputAdapter):
@@ -80,14 +120,8 @@ class IperonTJROAdapter(InputAdapter):
         if plan.mock_items:
             items.extend(plan.mock_items)
 
-        if plan.urls:
-            for url in plan.urls:
-                try:
-                    items.extend(self._fetch_url(url))
-                except Exception:
-                    logger.exception("Failed to fetch data from %s", url)
-        elif plan.query_params:
-            items.extend(self._fetch_from_query(plan))
+        if plan.urls or plan.query_params:
+            items.extend(asyncio.run(self._fetch_all(plan)))
 
         if not items:
             logger.warning("No communications returned for %s", input_path)
@@ -123,6 +157,10 @@ class IperonTJROAdapter(InputAdapter):
         if plan.max_pages is not None:
             plan.max_pages = int(plan.max_pages)
         plan.mock_items = data.get("mock_items", [])
+        plan.base_url = data.get("base_url", BASE_URL)
+        plan.concurrency = max(int(data.get("concurrency", DEFAULT_CONCURRENCY)), 1)
+        if data.get("cache", True):
+            plan.cache_dir = path.parent / data.get("cache_dir", DEFAULT_CACHE_DIR)
 
         return plan
 
@@ -130,34 +168,90 @@ class IperonTJROAdapter(InputAdapter):
     # API access
     # ------------------------------------------------------------------
 
-    def _fetch_url(self, url: str, params: dict[str, Any] | None = None) -> list[dict[str, Any]]:
-        with httpx.Client(timeout=30.0) as client:
-            response = client.get(url, params=params)
-            response.raise_for_status()
-            payload = response.json()
+    async def _fetch_all(self, plan: RequestPlan) -> list[dict[str, Any]]:
+        """Fetch every configured URL (or query page) over one pooled client."""
+        cache = HttpCache(plan.cache_dir) if plan.cache_dir else None
+        async with create_async_http_client(
+            timeout=REQUEST_TIMEOUT,
+            max_connections=plan.concurrency,
+            max_per_host=plan.concurrency,
+            follow_redirects=False,
+        ) as client:
+            fetcher = _CachedFetcher(client, cache, plan.concurrency)
+            if plan.urls:
+                batches = await asyncio.gather(*(self._fetch_url_safely(fetcher, url) for url in plan.urls))
+                records = [item for batch in batches for item in batch]
+            else:
+                records = await self._fetch_from_query(fetcher, plan)
+        if fetcher.not_modified:
+            logger.info("TJRO: %d responses served from cache (304 Not Modified)", fetcher.not_modified)
+        return records
+
+    async def _fetch_url_safely(self, fetcher: _CachedFetcher, url: str) -> list[dict[str, Any]]:
+        try:
+            return await self._fetch_url(fetcher, url)
+        except Exception:
+            logger.exception("Failed to fetch data from %s", url)
+            return []
+
+    async def _fetch_url(
+        self, fetcher: _CachedFetcher, url: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        payload = await fetcher.get_json(url, params=params)
         return payload.get("items", [])
 
-    def _fetch_from_query(self, plan: RequestPlan) -> list[dict[str, Any]]:
+    async def _fetch_page(
+        self, fetcher: _CachedFetcher, plan: RequestPlan, params: dict[str, Any], page: int
+    ) -> list[dict[str, Any]]:
+        logger.info("Fetching TJRO page %s", page)
+        return await self._fetch_url(fetcher, plan.base_url, params={**params, "pagina": page})
+
+    async def _fetch_from_query(self, fetcher: _CachedFetcher, plan: RequestPlan) -> list[dict[str, Any]]:
+        """Page through the query, resuming from the cursor left by previous runs.
+
+        Pages already seen by a previous run are revalidated concurrently (cheap
+        304s when unchanged); new pages are then probed ``concurrency`` at a time
+        until the first empty page. The cursor (last non-empty page) is saved
+        after every batch, so an interrupted ingest picks up where it stopped.
+        """
         params = dict(plan.query_params or {})
         params.setdefault("nomeParte", "IPERON")
         params.setdefault("siglaTribunal", "TJRO")
         params.setdefault("meio", "D")
         params.setdefault("itensPorPagina", 100)
 
-        records: list[dict[str, Any]] = []
-        page = max(plan.start_page, 1)
-        while True:
-            page_params = dict(params)
-            page_params["pagina"] = page
-            logger.info("Fetching TJRO page %s", page)
-            batch = self._fetch_url(BASE_URL, params=page_params)
-            if not batch:
-                break
-            records.extend(batch)
-            page += 1
-            if plan.max_pages and page > plan.max_pages:
+        first_page = max(plan.start_page, 1)
+        # ``max_pages: 0`` means no limit, like an absent value.
+        last_page = plan.max_pages or None
+        cursor_name = f"cursor-{HttpCache.key_for(plan.base_url, params)}"
+        cache = fetcher.cache
+        known_until = cache.load_state(cursor_name).get("last_page", 0) if cache else 0
+        if last_page:
+            known_until = min(known_until, last_page)
+
+        pages: list[list[dict[str, Any]]] = []
+        next_page = first_page
+        batch_size = max(known_until - first_page + 1, plan.concurrency)
+        while last_page is None or next_page <= last_page:
+            stop = next_page + batch_size if last_page is None else min(next_page + batch_size, last_page + 1)
+            window = range(next_page, stop)
+            batches = await asyncio.gather(
+                *(self._fetch_page(fetcher, plan, params, page) for page in window)
+            )
+            reached_end = False
+            for batch in batches:
+                if not batch:
+                    reached_end = True
+                    break
+                pages.append(batch)
+            if cache:
+                cache.save_state(cursor_name, {"last_page": first_page + len(pages) - 1})
+            if reached_end:
                 break
-        return records
+            next_page = stop
+            batch_size = plan.concurrency
+
+        return [item for batch in pages for item in batch]
 
     # ------------------------------------------------------------------
     # Normalization
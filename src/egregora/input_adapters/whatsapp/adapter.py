@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import zipfile
 from datetime import UTC, datetime
 from pathlib import Path
@@ -25,7 +26,7 @@ from egregora.input_adapters.whatsapp.exceptions import (
 from egregora.input_adapters.whatsapp.parsing import WhatsAppExport, parse_source
 from egregora.input_adapters.whatsapp.utils import discover_chat_file
 from egregora.ops.media import detect_media_type
-from egregora.security.zip import validate_zip_contents
+from egregora.security.zip import ZipArchive
 
 if TYPE_CHECKING:
     import uuid
@@ -63,6 +64,9 @@ class WhatsAppAdapter(InputAdapter):
         """
         self._author_namespace = author_namespace
         self._config = config
+        # One validated handle per export, reused across deliver_media() calls.
+        self._archives: dict[Path, ZipArchive] = {}
+        self._archives_lock = threading.Lock()
 
     @property
     def source_name(self) -> str:
@@ -153,29 +157,35 @@ class WhatsAppAdapter(InputAdapter):
             raise ZipPathNotFoundError(str(zip_path))
         return zip_path
 
+    def _archive(self, zip_path: Path) -> ZipArchive:
+        """Return the cached handle for ``zip_path``, reopening it if the file changed."""
+        key = zip_path.resolve()
+        with self._archives_lock:
+            archive = self._archives.get(key)
+            if archive is not None and archive.is_current():
+                return archive
+            if archive is not None:
+                archive.close()
+            archive = ZipArchive(zip_path)
+            self._archives[key] = archive
+            return archive
+
+    def close(self) -> None:
+        """Close ZIP handles opened by :meth:`deliver_media`."""
+        with self._archives_lock:
+            archives, self._archives = list(self._archives.values()), {}
+        for archive in archives:
+            archive.close()
+
     def _extract_media_from_zip(self, zip_path: Path, media_reference: str) -> Document:
         try:
-            with zipfile.ZipFile(zip_path, "r") as zf:
-                validate_zip_contents(zf)
-                found_path = self._find_media_in_zip(zip_path, zf, media_reference)
-
-                file_content = zf.read(found_path)
-                logger.debug("Delivered media: %s", media_reference)
-
-                media_type = self._detect_media_type(Path(media_reference))
-                media_slug = slugify(Path(media_reference).stem) if media_reference else None
-
-                return Document(
-                    content=file_content,
-                    type=DocumentType.MEDIA,
-                    metadata={
-                        "original_filename": media_reference,
-                        "media_type": media_type,
-                        "slug": media_slug or None,
-                        "nav_exclude": True,
-                        "hide": ["navigation"],
-                    },
-                )
+            archive = self._archive(zip_path)
+            info = archive.find(media_reference)
+            if info is None:
+                raise MediaNotFoundError(str(zip_path), media_reference)
+
+            file_content = archive.read(info)
+            logger.debug("Delivered media: %s", media_reference)
         except zipfile.BadZipFile as e:
             raise InvalidZipFileError(str(zip_path)) from e
         except (KeyError, OSError, PermissionError) as e:
@@ -183,13 +193,20 @@ class WhatsAppAdapter(InputAdapter):
                 media_reference, str(zip_path), f"Failed to extract file from ZIP: {e}"
             ) from e
 
-    def _find_media_in_zip(self, zip_path: Path, zf: zipfile.ZipFile, media_reference: str) -> str:
-        for info in zf.infolist():
-            if info.is_dir():
-                continue
-            if Path(info.filename).name.lower() == media_reference.lower():
-                return info.filename
-        raise MediaNotFoundError(str(zip_path), media_reference)
+        media_type = self._detect_media_type(Path(media_reference))
+        media_slug = slugify(Path(media_reference).stem) if media_reference else None
+
+        return Document(
+            content=file_content,
+            type=DocumentType.MEDIA,
+            metadata={
+                "original_filename": media_reference,
+                "media_type": media_type,
+                "slug": media_slug or None,
+                "nav_exclude": True,
+                "hide": ["navigation"],
+            },
+        )
 
     def _detect_media_type(self, media_path: Path) -> str | None:
         return detect_media_type(media_path)
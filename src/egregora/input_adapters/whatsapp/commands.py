@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Any
 import ibis
 
 if TYPE_CHECKING:  # pragma: no cover - for type checkers
+    from ibis.expr import types as ir
     from ibis.expr.types import Table
 
 # Command parsing constants
@@ -43,42 +44,32 @@ def _is_nan(value: Any) -> bool:
     return isinstance(value, float) and math.isnan(value)
 
 
-SMART_QUOTES_TRANSLATION = str.maketrans(
-    {
-        "\u201c": '"',
-        "\u201d": '"',
-        "\u2018": "'",
-        "\u2019": "'",
-    }
-)
+# Smart quotes and their ASCII replacements, position by position.
+_SMART_QUOTES = "\u201c\u201d\u2018\u2019"
+_ASCII_QUOTES = "\"\"''"
 
 logger = logging.getLogger(__name__)
 
+# The helpers below are plain Ibis expressions rather than Python UDFs: they
+# run inside DuckDB, and need no per-connection function registration (which
+# races when pipelines for several sources share one database).
 
-@ibis.udf.scalar.python
-def normalize_smart_quotes(value: str) -> str:
+
+def normalize_smart_quotes(value: ir.StringValue) -> ir.StringValue:
     """Converts smart quotes (e.g., `'` `"` `”`) to standard ASCII quotes."""
-    if value is None:
-        return None
-    return value.translate(SMART_QUOTES_TRANSLATION)
+    return value.translate(_SMART_QUOTES, _ASCII_QUOTES)
 
 
-@ibis.udf.scalar.python
-def strip_wrapping_quotes(value: str) -> str:
+def strip_wrapping_quotes(value: ir.StringValue) -> ir.StringValue:
     """Removes a single pair of matching wrapping quotes (`"` or `'`) from a string."""
-    if value and len(value) > 1:
-        if value.startswith('"') and value.endswith('"'):
-            return value[1:-1]
-        if value.startswith("'") and value.endswith("'"):
-            return value[1:-1]
-    return value
-
-
-@ibis.udf.scalar.python
-def _normalize_whitespace(value: str) -> str:
-    if value is None:
-        return ""
-    return value.strip()
+    wrapped = (value.length() > 1) & (
+        (value.startswith('"') & value.endswith('"')) | (value.startswith("'") & value.endswith("'"))
+    )
+    return ibis.ifelse(wrapped, value.substr(1, value.length() - 2), value)
+
+
+def _normalize_whitespace(value: ir.StringValue) -> ir.StringValue:
+    return ibis.coalesce(value.strip(), ibis.literal(""))
 
 
 def extract_commands(messages: Table) -> list[dict]:
@@ -0,0 +1,162 @@
+"""Reuse of Gemini File API uploads across windows and runs.
+
+Files uploaded to the File API stay available for 48 hours. The registry
+remembers each upload under the SHA-256 of the file contents (and the API key,
+since uploads belong to the key's project), so a forwarded video or PDF that
+shows up again is referenced by its existing URI instead of being uploaded
+again. Entries are dropped shortly before the file expires; the next use then
+uploads a fresh copy.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Protocol
+
+from egregora.llm.providers.genai_clients import get_genai_client
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import diskcache
+
+    from egregora.ops.media_staging import StagedMedia
+
+logger = logging.getLogger(__name__)
+
+# How long the File API keeps uploads when it does not say.
+DEFAULT_FILE_TTL = timedelta(hours=48)
+# Stop reusing a file this long before it expires, so requests that are
+# queued or batched with its URI still find it.
+EXPIRY_MARGIN = timedelta(hours=1)
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class UploadedFile:
+    """A file available to the model through the File API."""
+
+    uri: str
+    mime_type: str
+    expires_at: datetime
+
+    def to_dict(self) -> dict[str, str]:
+        return {"uri": self.uri, "mime_type": self.mime_type, "expires_at": self.expires_at.isoformat()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> UploadedFile:
+        return cls(data["uri"], data["mime_type"], datetime.fromisoformat(data["expires_at"]))
+
+
+class Uploader(Protocol):
+    def __call__(self, source: Path | StagedMedia, mime_type: str) -> UploadedFile: ...
+
+
+def genai_uploader(api_key: str | None) -> Uploader:
+    """Upload with the File API of ``api_key``'s project."""
+    client = get_genai_client(api_key)
+
+    def upload(source: Path | StagedMedia, mime_type: str) -> UploadedFile:
+        file = str(source) if isinstance(source, Path) else source.open()
+        uploaded = client.files.upload(file=file, config={"mime_type": mime_type})
+        expires_at = uploaded.expiration_time
+        if not isinstance(expires_at, datetime):
+            expires_at = datetime.now(UTC) + DEFAULT_FILE_TTL
+        return UploadedFile(str(uploaded.uri), mime_type, expires_at)
+
+    return upload
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file in chunks, without reading it into memory."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class FileUploadRegistry:
+    """Uploads files at most once per content hash while their upload is live.
+
+    ``store`` (a diskcache, e.g. the pipeline cache's media store) keeps the
+    registry across runs; without one it lasts for this process. Concurrent
+    requests for the same content share one upload.
+    """
+
+    def __init__(
+        self,
+        uploader: Uploader,
+        store: diskcache.Cache | None = None,
+        *,
+        namespace: str = "default",
+        clock: Callable[[], datetime] = lambda: datetime.now(UTC),
+    ) -> None:
+        self._uploader = uploader
+        self._store = store
+        self._memory: dict[str, UploadedFile] = {}
+        self._namespace = namespace
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._content_locks: dict[str, threading.Lock] = {}
+        self.uploads = 0
+        self.reused = 0
+
+    def get_or_upload(self, source: Path | StagedMedia, mime_type: str) -> UploadedFile:
+        """Return a live upload of ``source``'s contents, uploading only if there is none.
+
+        Staged media carries its hash already; files on disk are hashed here.
+        """
+        digest = file_sha256(source) if isinstance(source, Path) else source.sha256
+        key = f"file-upload:{self._namespace}:{digest}:{mime_type}"
+        with self._lock:
+            content_lock = self._content_locks.setdefault(key, threading.Lock())
+        with content_lock:
+            live = self._lookup(key)
+            if live is not None:
+                with self._lock:
+                    self.reused += 1
+                logger.info("Reusing File API upload %s for %s", live.uri, source.name)
+                return live
+
+            uploaded = self._uploader(source, mime_type)
+            with self._lock:
+                self.uploads += 1
+            logger.info("Uploaded file %s to %s", source.name, uploaded.uri)
+            self._remember(key, uploaded)
+            return uploaded
+
+    def _lookup(self, key: str) -> UploadedFile | None:
+        entry: UploadedFile | None = self._memory.get(key)
+        if entry is None and self._store is not None:
+            stored = self._store.get(key)
+            if isinstance(stored, dict):
+                entry = UploadedFile.from_dict(stored)
+        if entry is None or entry.expires_at - EXPIRY_MARGIN <= self._clock():
+            return None
+        return entry
+
+    def _remember(self, key: str, uploaded: UploadedFile) -> None:
+        usable_for = (uploaded.expires_at - EXPIRY_MARGIN - self._clock()).total_seconds()
+        if usable_for <= 0:
+            return
+        self._memory[key] = uploaded
+        if self._store is not None:
+            self._store.set(key, uploaded.to_dict(), expire=usable_for)
+
+
+__all__ = [
+    "DEFAULT_FILE_TTL",
+    "EXPIRY_MARGIN",
+    "FileUploadRegistry",
+    "UploadedFile",
+    "Uploader",
+    "file_sha256",
+    "genai_uploader",
+]
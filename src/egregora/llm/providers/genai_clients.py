@@ -0,0 +1,112 @@
+"""Shared Gemini clients, one per API key and endpoint.
+
+Each ``genai.Client`` owns its HTTP transport, so building one per request
+(as enrichment, banner generation and the batch provider used to) threw away
+the keep-alive connection every time and paid a new TCP and TLS handshake.
+:func:`get_genai_client` hands out one client per (API key, base URL) instead;
+the clients are thread-safe and are shared by every caller.
+
+Pipelines hold the pool open with :func:`genai_client_session`; when the last
+session ends the clients are closed. Clients requested again afterwards are
+simply rebuilt.
+"""
+
+from __future__ import annotations
+
+import atexit
+import contextlib
+import logging
+import threading
+from typing import TYPE_CHECKING, Any, cast
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from google import genai
+
+logger = logging.getLogger(__name__)
+
+type ClientKey = tuple[str | None, str | None]
+
+
+def _build_client(api_key: str | None, base_url: str | None) -> genai.Client:
+    from google import genai
+
+    http_options = {"base_url": base_url} if base_url else None
+    return genai.Client(api_key=api_key, http_options=cast("Any", http_options))
+
+
+class GenaiClientPool:
+    """Thread-safe pool of ``genai.Client`` instances keyed by API key and base URL."""
+
+    def __init__(self, factory: Callable[[str | None, str | None], genai.Client] = _build_client) -> None:
+        self._factory = factory
+        self._clients: dict[ClientKey, genai.Client] = {}
+        self._lock = threading.Lock()
+        self._sessions = 0
+
+    def get(self, api_key: str | None = None, *, base_url: str | None = None) -> genai.Client:
+        """Return the client for ``api_key`` and ``base_url``, building it on first use."""
+        key = (api_key, base_url)
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = self._clients[key] = self._factory(api_key, base_url)
+            return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    @contextlib.contextmanager
+    def session(self) -> Iterator[GenaiClientPool]:
+        """Keep the clients open while any session lasts; close them after the last one."""
+        with self._lock:
+            self._sessions += 1
+        try:
+            yield self
+        finally:
+            with self._lock:
+                self._sessions -= 1
+                last = self._sessions == 0
+            if last:
+                self.close()
+
+    def close(self) -> None:
+        """Close and drop every client."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception:  # pragma: no cover - best effort during teardown
+                logger.debug("Failed to close Gemini client", exc_info=True)
+
+
+_pool = GenaiClientPool()
+
+
+def get_genai_client(api_key: str | None = None, *, base_url: str | None = None) -> genai.Client:
+    """Return the shared client for ``api_key`` (and ``base_url``, if not the default endpoint)."""
+    return _pool.get(api_key, base_url=base_url)
+
+
+def genai_client_session() -> contextlib.AbstractContextManager[GenaiClientPool]:
+    """Hold the shared clients open for the duration of a pipeline run."""
+    return _pool.session()
+
+
+def close_genai_clients() -> None:
+    """Close the shared clients."""
+    _pool.close()
+
+
+atexit.register(close_genai_clients)
+
+
+__all__ = [
+    "GenaiClientPool",
+    "close_genai_clients",
+    "genai_client_session",
+    "get_genai_client",
+]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import base64
+import contextlib
 import json
 import logging
 from dataclasses import dataclass
@@ -23,9 +24,10 @@ from egregora.llm.exceptions import (
     BatchResultDownloadError,
     InvalidLLMResponseError,
 )
+from egregora.llm.providers.genai_clients import get_genai_client
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -129,7 +131,16 @@ class GoogleBatchModel(Model):
         """
         if not requests:
             return []
+        job_name = self.submit_batch(requests)
+        return self.collect_batch(job_name, requests)
 
+    def submit_batch(self, requests: list[dict[str, Any]], display_name: str = "egregora-batch") -> str:
+        """Create a batch job for ``requests`` without waiting for it; return the job name.
+
+        ``config`` may carry anything ``GenerateContentConfig`` accepts (system
+        instruction, tools, ...). Together with :meth:`collect_batch` this lets
+        callers record the job name and pick the job up again in a later run.
+        """
         # Build inline requests (no file upload needed for <20MB)
         inline_requests = []
         for req in requests:
@@ -137,31 +148,42 @@ class GoogleBatchModel(Model):
                 "contents": req["contents"],
             }
             if req.get("config"):
-                inline_req["generation_config"] = req["config"]
+                inline_req["config"] = req["config"]
             inline_requests.append(inline_req)
 
-        client = genai.Client(api_key=self.api_key)
-
-        try:
+        client = get_genai_client(self.api_key)
+        with self._map_client_errors():
             logger.info("[BatchAPI] Creating batch job with %d inline requests", len(inline_requests))
 
             # Create batch job with inline requests (no file upload)
             batch_job = client.batches.create(
                 model=self.model_name,
                 src=cast("Any", inline_requests),
-                config=types.CreateBatchJobConfig(display_name="egregora-batch"),
+                config=types.CreateBatchJobConfig(display_name=display_name),
             )
 
-            logger.info("[BatchAPI] Batch job created: %s", batch_job.name)
+        logger.info("[BatchAPI] Batch job created: %s", batch_job.name)
+        return cast("str", batch_job.name)
 
+    def collect_batch(self, job_name: str, requests: list[dict[str, Any]]) -> list[BatchResult]:
+        """Wait for the batch job ``job_name`` and return its results.
+
+        Only the ``tag`` of each request is used, to label results in order.
+        """
+        client = get_genai_client(self.api_key)
+        with self._map_client_errors():
             # Poll for completion
-            completed_job = self._poll_job(client, batch_job.name)
+            completed_job = self._poll_job(client, job_name)
 
             logger.info("[BatchAPI] Batch job completed: %s", completed_job.state.name)
 
             # Get results from inlineResponse (inline requests return inline responses)
             return self._extract_inline_results(completed_job, requests)
 
+    @contextlib.contextmanager
+    def _map_client_errors(self) -> Iterator[None]:
+        try:
+            yield
         except genai.errors.ClientError as e:
             if e.code == HTTP_TOO_MANY_REQUESTS:
                 logger.warning("[BatchAPI] Quota exceeded: %s", e.message)
@@ -200,7 +222,7 @@ class GoogleBatchModel(Model):
             # Fallback: try to get results from output_uri (file-based response)
             if hasattr(job, "output_uri") and job.output_uri:
                 logger.info("[BatchAPI] Using output_uri for results: %s", job.output_uri)
-                return self._download_results(genai.Client(api_key=self.api_key), job.output_uri, requests)
+                return self._download_results(get_genai_client(self.api_key), job.output_uri, requests)
 
             # No results available
             for _idx, req in enumerate(requests):
@@ -217,6 +239,9 @@ class GoogleBatchModel(Model):
         """Convert SDK response object to dict format."""
         if isinstance(response, dict):
             return response
+        if isinstance(response, types.GenerateContentResponse):
+            # Keeps every part (function calls, thought signatures), not just text.
+            return response.model_dump(exclude_none=True)
 
         result: dict[str, Any] = {}
         if hasattr(response, "candidates"):
@@ -2,6 +2,8 @@
 
 For each model, tries all API keys before moving to next model.
 Raises AllModelsExhaustedError after exhausting all Gemini models+keys.
+Each call is paced by the adaptive limiter of its (model, key), so a key
+that was just throttled waits out its ``Retry-After`` before it is reused.
 """
 
 from __future__ import annotations
@@ -15,6 +17,7 @@ from egregora.llm.providers.model_cycler import (
     GeminiKeyRotator,
     default_rate_limit_check,
 )
+from egregora.llm.rate_limit import get_adaptive_limiter
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -147,7 +150,8 @@ class ModelKeyRotator:
             while True:
                 api_key = self.key_rotator.current_key
                 try:
-                    result = call_fn(model, api_key)
+                    with get_adaptive_limiter("google", model, api_key).request_sync():
+                        result = call_fn(model, api_key)
 
                     # Success! Proactively rotate key for load balancing
                     self.key_rotator.rotate()
@@ -3,28 +3,43 @@
 from __future__ import annotations
 
 import logging
+import time
 from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING, Any
 
-from pydantic_ai.models import Model, ModelRequestParameters, ModelSettings
+from pydantic_ai.models.wrapper import WrapperModel
 
-from egregora.llm.rate_limit import get_rate_limiter
+from egregora.llm.rate_limit import get_adaptive_limiter, get_rate_limiter
+from egregora.tracing import span
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator
 
     from pydantic_ai import RunContext
     from pydantic_ai.messages import ModelMessage, ModelResponse
-    from pydantic_ai.models import StreamedResponse
+    from pydantic_ai.models import Model, ModelRequestParameters, ModelSettings, StreamedResponse
 
 logger = logging.getLogger(__name__)
 
 
-class RateLimitedModel(Model):
-    """Wraps a pydantic-ai Model to enforce global rate limits."""
+class RateLimitedModel(WrapperModel):
+    """Wraps a pydantic-ai Model to enforce rate limits.
 
-    def __init__(self, wrapped_model: Model) -> None:
-        self.wrapped_model = wrapped_model
+    Each request passes the adaptive limiter of its (provider, model, API
+    key), which learns from 429s and token usage, and then the global limiter
+    (process-wide concurrency and request ceiling). Waiting out a throttled
+    key therefore does not hold a global slot.
+    """
+
+    def __init__(self, wrapped_model: Model, *, api_key: str | None = None) -> None:
+        super().__init__(wrapped_model)
+        self.adaptive_limiter = get_adaptive_limiter(
+            wrapped_model.system or "default", wrapped_model.model_name, api_key
+        )
+
+    @property
+    def wrapped_model(self) -> Model:
+        return self.wrapped
 
     async def request(
         self,
@@ -35,12 +50,21 @@ class RateLimitedModel(Model):
         """Make a rate-limited request."""
         limiter = get_rate_limiter()
 
-        # Use async acquire directly, no thread needed
-        await limiter.acquire()
-        try:
-            return await self.wrapped_model.request(messages, model_settings, model_request_parameters)
-        finally:
-            limiter.release()
+        with span("llm.request", model=self.model_name) as current:
+            # Use async acquire directly, no thread needed
+            waited = time.perf_counter()
+            # The key's limiter first: a throttled key must not sit on process-wide slots while it waits.
+            async with self.adaptive_limiter.request() as permit:
+                await limiter.acquire()
+                try:
+                    current.set_attribute(
+                        "rate_limit.wait_ms", round((time.perf_counter() - waited) * 1000, 3)
+                    )
+                    response = await self.wrapped.request(messages, model_settings, model_request_parameters)
+                    permit.tokens_used = response.usage.input_tokens + response.usage.output_tokens
+                    return response
+                finally:
+                    limiter.release()
 
     @asynccontextmanager
     async def request_stream(
@@ -53,26 +77,20 @@ class RateLimitedModel(Model):
         """Make a rate-limited stream request."""
         limiter = get_rate_limiter()
 
-        # Use async acquire directly, no thread needed
-        await limiter.acquire()
-        try:
-            # Note: passing run_context might fail if wrapped_model doesn't support it in older versions
-            # but we are fixing type signature to match base class.
-            kwargs = {}
-            if run_context is not None:
-                kwargs["run_context"] = run_context
-
-            async with self.wrapped_model.request_stream(
-                messages, model_settings, model_request_parameters, **kwargs
-            ) as stream:
-                yield stream
-        finally:
-            limiter.release()
-
-    @property
-    def model_name(self) -> str:
-        return self.wrapped_model.model_name
-
-    @property
-    def system(self) -> str | None:
-        return self.wrapped_model.system
+        with span("llm.request_stream", model=self.model_name) as current:
+            # Use async acquire directly, no thread needed
+            waited = time.perf_counter()
+            async with self.adaptive_limiter.request() as permit:
+                await limiter.acquire()
+                try:
+                    current.set_attribute(
+                        "rate_limit.wait_ms", round((time.perf_counter() - waited) * 1000, 3)
+                    )
+                    async with self.wrapped.request_stream(
+                        messages, model_settings, model_request_parameters, run_context
+                    ) as stream:
+                        yield stream
+                    usage = stream.get().usage
+                    permit.tokens_used = usage.input_tokens + usage.output_tokens
+                finally:
+                    limiter.release()
@@ -1,37 +1,60 @@
-"""Global rate limiter for LLM API calls."""
+"""Rate limiters for LLM API calls.
+
+:class:`AsyncGlobalRateLimiter` is a process-wide ceiling on concurrency and
+request rate. Below it, :class:`AdaptiveRateLimiter` paces each
+(provider, model, API key) with AIMD driven by provider feedback: 429s,
+``Retry-After`` / quota headers and token usage.
+"""
 
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import logging
+import re
 import threading
 import time
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# How often a request waiting for a concurrency slot re-checks (seconds).
+_SLOT_POLL_INTERVAL = 0.01
+
 
 class AsyncGlobalRateLimiter:
-    """An asyncio-native rate limiter that enforces max concurrency and requests per second."""
+    """An asyncio-native rate limiter that enforces max concurrency and requests per second.
+
+    The limiter is shared by every event loop in the process (pipelines for
+    different sources may run in parallel threads, each with its own loop),
+    so its state is guarded by thread primitives and waiting is done with
+    ``asyncio.sleep`` instead of loop-bound asyncio locks.
+    """
 
     def __init__(self, requests_per_second: float, max_concurrency: int) -> None:
         self.requests_per_second = requests_per_second
         self.max_concurrency = max_concurrency
-        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._semaphore = threading.BoundedSemaphore(self.max_concurrency)
         self._last_request_time = 0.0
-        self._lock = asyncio.Lock()  # To protect _last_request_time updates
+        self._lock = threading.Lock()  # To protect _last_request_time updates
 
     async def acquire(self) -> None:
         """Acquire permission to make a request. Suspends if limits are reached."""
         # 1. Enforce Concurrency Limit
-        await self._semaphore.acquire()
+        while not self._semaphore.acquire(blocking=False):  # noqa: ASYNC110 - slots span event loops
+            await asyncio.sleep(_SLOT_POLL_INTERVAL)
 
         try:
             # 2. Enforce Rate Limit (Requests per Second)
             interval = 1.0 / self.requests_per_second
 
-            async with self._lock:
+            with self._lock:
                 now = time.monotonic()
                 time_since_last = now - self._last_request_time
 
@@ -81,9 +104,19 @@ def get_rate_limiter() -> AsyncGlobalRateLimiter:
 
 
 def init_rate_limiter(requests_per_second: float, max_concurrency: int) -> None:
-    """Initialize the global rate limiter with specific config."""
+    """Initialize the global rate limiter with specific config.
+
+    Re-initializing with the limits already in force keeps the existing
+    limiter, so pipelines started side by side share one budget.
+    """
     global _limiter
     with _limiter_lock:
+        if (
+            _limiter is not None
+            and _limiter.requests_per_second == requests_per_second
+            and _limiter.max_concurrency == max_concurrency
+        ):
+            return
         _limiter = AsyncGlobalRateLimiter(
             requests_per_second=requests_per_second, max_concurrency=max_concurrency
         )
@@ -92,3 +125,477 @@ def init_rate_limiter(requests_per_second: float, max_concurrency: int) -> None:
         requests_per_second,
         max_concurrency,
     )
+
+
+# ---------------------------------------------------------------------------
+# Adaptive (AIMD) rate limiting per provider, model and key
+# ---------------------------------------------------------------------------
+
+HTTP_TOO_MANY_REQUESTS = 429
+
+# Window over which live request and token rates are measured (seconds).
+_METRICS_WINDOW = 60.0
+# Floor for a token budget learned from token-quota 429s.
+_MIN_TOKENS_PER_MINUTE = 1_000
+# Share of a learned token budget added back per successful request.
+_TOKEN_BUDGET_INCREASE = 0.01
+
+_RETRY_DELAY_RE = re.compile(r"^\s*(\d+(?:\.\d+)?)s\s*$")
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitFeedback:
+    """What a provider told us about its limits on one response."""
+
+    throttled: bool = False
+    retry_after: float | None = None
+    token_limited: bool = False
+    limit_requests: int | None = None
+    remaining_requests: int | None = None
+    limit_tokens: int | None = None
+    remaining_tokens: int | None = None
+
+
+def _int_header(headers: Mapping[str, str], *names: str) -> int | None:
+    for name in names:
+        value = headers.get(name)
+        if value is None:
+            continue
+        try:
+            return int(float(value))
+        except ValueError:
+            continue
+    return None
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` value (delta seconds or an HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def parse_rate_limit_headers(
+    headers: Mapping[str, str] | None, *, throttled: bool = False
+) -> RateLimitFeedback:
+    """Read ``Retry-After`` and ``x-ratelimit-*`` quota headers."""
+    if not headers:
+        return RateLimitFeedback(throttled=throttled)
+    lowered = {str(key).lower(): str(value) for key, value in headers.items()}
+    return RateLimitFeedback(
+        throttled=throttled,
+        retry_after=parse_retry_after(lowered.get("retry-after")),
+        limit_requests=_int_header(lowered, "x-ratelimit-limit-requests", "x-ratelimit-limit"),
+        remaining_requests=_int_header(lowered, "x-ratelimit-remaining-requests", "x-ratelimit-remaining"),
+        limit_tokens=_int_header(lowered, "x-ratelimit-limit-tokens"),
+        remaining_tokens=_int_header(lowered, "x-ratelimit-remaining-tokens"),
+    )
+
+
+def _error_details(body: Any) -> list[dict[str, Any]]:
+    """Return the ``google.rpc`` detail entries of a Google API error body."""
+    if isinstance(body, list) and len(body) == 1:
+        body = body[0]
+    if not isinstance(body, dict):
+        return []
+    error = body.get("error", body)
+    details = error.get("details") if isinstance(error, dict) else None
+    return [detail for detail in details or [] if isinstance(detail, dict)]
+
+
+def rate_limit_feedback(exc: BaseException) -> RateLimitFeedback | None:
+    """Return the feedback carried by a rate-limit error, or None for other errors.
+
+    Understands pydantic-ai ``ModelHTTPError`` (``status_code``/``body``),
+    google-genai ``APIError`` (``code``/``details``/``response``) and
+    httpx ``HTTPStatusError``; Gemini's ``RetryInfo`` and ``QuotaFailure``
+    details are used when the response carries no headers.
+    """
+    response = getattr(exc, "response", None)
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    message = str(exc)
+    if status != HTTP_TOO_MANY_REQUESTS and "RESOURCE_EXHAUSTED" not in message:
+        return None
+
+    feedback = parse_rate_limit_headers(getattr(response, "headers", None), throttled=True)
+    retry_after = feedback.retry_after
+    token_limited = False
+    for detail in _error_details(getattr(exc, "body", None) or getattr(exc, "details", None)):
+        detail_type = str(detail.get("@type", ""))
+        if detail_type.endswith("RetryInfo") and retry_after is None:
+            match = _RETRY_DELAY_RE.match(str(detail.get("retryDelay", "")))
+            if match:
+                retry_after = float(match.group(1))
+        elif detail_type.endswith("QuotaFailure"):
+            token_limited = token_limited or any(
+                "token" in str(violation.get("quotaId", "")).lower()
+                for violation in detail.get("violations", [])
+                if isinstance(violation, dict)
+            )
+    return replace(feedback, retry_after=retry_after, token_limited=token_limited)
+
+
+@dataclass(frozen=True, slots=True)
+class RateLimitMetrics:
+    """Live view of one adaptive limiter."""
+
+    provider: str
+    model: str
+    key_id: str
+    requests_per_second: float
+    tokens_per_minute: int | None
+    requests: int
+    throttled: int
+    in_flight: int
+    requests_last_minute: int
+    tokens_last_minute: int
+    waited_seconds: float
+    blocked_for: float
+
+    @property
+    def request_utilization(self) -> float:
+        """Share of the current request allowance used over the last minute."""
+        allowance = self.requests_per_second * _METRICS_WINDOW
+        return min(1.0, self.requests_last_minute / allowance) if allowance else 0.0
+
+    @property
+    def token_utilization(self) -> float | None:
+        if not self.tokens_per_minute:
+            return None
+        return min(1.0, self.tokens_last_minute / self.tokens_per_minute)
+
+    def describe(self) -> str:
+        tokens = (
+            f", {self.tokens_last_minute}/{self.tokens_per_minute} tok/min" if self.tokens_per_minute else ""
+        )
+        return (
+            f"{self.provider}/{self.model}/{self.key_id}: {self.requests_per_second:.2f} req/s "
+            f"({self.request_utilization:.0%} used{tokens}), {self.requests} requests, "
+            f"{self.throttled} throttled, waited {self.waited_seconds:.1f}s"
+        )
+
+
+class RatePermit:
+    """One admitted request; set ``tokens_used``/``headers`` before it finishes."""
+
+    __slots__ = ("headers", "started_at", "tokens_used")
+
+    def __init__(self, started_at: float) -> None:
+        self.started_at = started_at
+        self.tokens_used = 0
+        self.headers: Mapping[str, str] | None = None
+
+
+class AdaptiveRateLimiter:
+    """AIMD request-rate and token-budget limiter for one (provider, model, key).
+
+    Every success raises the allowed rate by ``increase_step`` requests per
+    second (up to ``max_rps``); a 429 multiplies it by ``decrease_factor``
+    (down to ``min_rps``) and pauses the key for the provider's
+    ``Retry-After`` (or ``default_backoff``). Only one decrease happens per
+    congestion event: 429s for requests sent before the last decrease are
+    counted but do not cut the rate again.
+
+    Tokens are charged after each request from the reported usage, against a
+    ``tokens_per_minute`` budget that refills continuously; a request waits
+    while the budget is overdrawn. Without a configured budget, one is learnt
+    from the observed token rate when the provider reports a token quota
+    429, and then grows additively like the request rate.
+
+    The limiter is thread-safe and usable from sync code
+    (:meth:`request_sync`) and from any event loop (:meth:`request`).
+    """
+
+    def __init__(
+        self,
+        *,
+        provider: str = "default",
+        model: str = "default",
+        key_id: str = "default",
+        initial_rps: float = 1.0,
+        min_rps: float = 0.05,
+        max_rps: float = 10.0,
+        increase_step: float = 0.05,
+        decrease_factor: float = 0.5,
+        default_backoff: float = 5.0,
+        tokens_per_minute: int | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.provider = provider
+        self.model = model
+        self.key_id = key_id
+        self.min_rps = min_rps
+        self.max_rps = max(max_rps, min_rps)
+        self.rate = min(max(initial_rps, min_rps), self.max_rps)
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.default_backoff = default_backoff
+        self.tokens_per_minute = tokens_per_minute
+        self._learned_token_budget = tokens_per_minute is None
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        now = clock()
+        self._next_slot = now
+        self._blocked_until = now
+        self._last_decrease = float("-inf")
+        self._token_balance = float(tokens_per_minute or 0)
+        self._token_refilled_at = now
+        self._recent: deque[tuple[float, int]] = deque()
+        self._requests = 0
+        self._throttled = 0
+        self._in_flight = 0
+        self._waited = 0.0
+
+    # -- admission -----------------------------------------------------------
+    def reserve(self) -> tuple[float, RatePermit]:
+        """Book the next slot; return how long to wait before using it."""
+        with self._lock:
+            now = self._clock()
+            self._refill_tokens(now)
+            start = max(now, self._next_slot, self._blocked_until)
+            if self.tokens_per_minute and self._token_balance < 0:
+                start = max(start, now + -self._token_balance / (self.tokens_per_minute / _METRICS_WINDOW))
+            self._next_slot = start + 1.0 / self.rate
+            self._in_flight += 1
+            self._waited += start - now
+            return start - now, RatePermit(start)
+
+    def acquire_sync(self) -> RatePermit:
+        delay, permit = self.reserve()
+        if delay > 0:
+            self._sleep(delay)
+        return permit
+
+    async def acquire(self) -> RatePermit:
+        delay, permit = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return permit
+
+    @contextmanager
+    def request_sync(self) -> Iterator[RatePermit]:
+        """Admit one synchronous request and learn from how it ends."""
+        permit = self.acquire_sync()
+        try:
+            yield permit
+        except BaseException as exc:
+            self._finish_with_error(permit, exc)
+            raise
+        self.on_success(permit)
+
+    @asynccontextmanager
+    async def request(self) -> AsyncIterator[RatePermit]:
+        """Admit one async request and learn from how it ends."""
+        permit = await self.acquire()
+        try:
+            yield permit
+        except BaseException as exc:
+            self._finish_with_error(permit, exc)
+            raise
+        self.on_success(permit)
+
+    # -- feedback ------------------------------------------------------------
+    def on_success(self, permit: RatePermit) -> None:
+        """Additive increase, and charge the tokens the request used."""
+        feedback = parse_rate_limit_headers(permit.headers)
+        with self._lock:
+            now = self._clock()
+            self._release(now, permit.tokens_used)
+            self.rate = min(self.max_rps, self.rate + self.increase_step)
+            if self._learned_token_budget and self.tokens_per_minute:
+                self.tokens_per_minute += max(1, int(self.tokens_per_minute * _TOKEN_BUDGET_INCREASE))
+            if feedback.limit_tokens:
+                self.tokens_per_minute = min(
+                    self.tokens_per_minute or feedback.limit_tokens, feedback.limit_tokens
+                )
+                self._learned_token_budget = False
+            if feedback.remaining_tokens is not None and self.tokens_per_minute:
+                self._token_balance = min(self._token_balance, float(feedback.remaining_tokens))
+            if feedback.remaining_requests == 0 and feedback.retry_after:
+                self._blocked_until = max(self._blocked_until, now + feedback.retry_after)
+
+    def on_rate_limited(self, permit: RatePermit, feedback: RateLimitFeedback) -> None:
+        """Multiplicative decrease and pause after a 429."""
+        with self._lock:
+            now = self._clock()
+            self._release(now, 0)
+            self._throttled += 1
+            backoff = feedback.retry_after if feedback.retry_after is not None else self.default_backoff
+            self._blocked_until = max(self._blocked_until, now + backoff)
+            if permit.started_at <= self._last_decrease:
+                return  # Same congestion event as an earlier 429
+            self._last_decrease = now
+            self.rate = max(self.min_rps, self.rate * self.decrease_factor)
+            if feedback.token_limited:
+                observed = sum(tokens for _, tokens in self._recent)
+                budget = (
+                    min(self.tokens_per_minute or observed, observed) if observed else self.tokens_per_minute
+                )
+                if budget:
+                    self.tokens_per_minute = max(_MIN_TOKENS_PER_MINUTE, int(budget * self.decrease_factor))
+                    self._token_balance = min(self._token_balance, 0.0)
+        logger.info(
+            "Rate limited on %s/%s/%s: %.2f req/s, paused %.1fs",
+            self.provider,
+            self.model,
+            self.key_id,
+            self.rate,
+            backoff,
+        )
+
+    def _finish_with_error(self, permit: RatePermit, exc: BaseException) -> None:
+        feedback = rate_limit_feedback(exc)
+        if feedback is not None:
+            self.on_rate_limited(permit, feedback)
+            return
+        with self._lock:
+            self._release(self._clock(), permit.tokens_used)
+
+    def _release(self, now: float, tokens: int) -> None:
+        self._in_flight = max(0, self._in_flight - 1)
+        self._requests += 1
+        self._recent.append((now, tokens))
+        self._trim(now)
+        if tokens and self.tokens_per_minute:
+            self._refill_tokens(now)
+            self._token_balance -= tokens
+
+    def _refill_tokens(self, now: float) -> None:
+        if self.tokens_per_minute:
+            elapsed = now - self._token_refilled_at
+            self._token_balance = min(
+                float(self.tokens_per_minute),
+                self._token_balance + elapsed * self.tokens_per_minute / _METRICS_WINDOW,
+            )
+        self._token_refilled_at = now
+
+    def _trim(self, now: float) -> None:
+        while self._recent and self._recent[0][0] < now - _METRICS_WINDOW:
+            self._recent.popleft()
+
+    # -- metrics -------------------------------------------------------------
+    def blocked_for(self) -> float:
+        """Seconds until this key may send again after a 429."""
+        with self._lock:
+            return max(0.0, self._blocked_until - self._clock())
+
+    def metrics(self) -> RateLimitMetrics:
+        with self._lock:
+            now = self._clock()
+            self._trim(now)
+            return RateLimitMetrics(
+                provider=self.provider,
+                model=self.model,
+                key_id=self.key_id,
+                requests_per_second=self.rate,
+                tokens_per_minute=self.tokens_per_minute,
+                requests=self._requests,
+                throttled=self._throttled,
+                in_flight=self._in_flight,
+                requests_last_minute=len(self._recent),
+                tokens_last_minute=sum(tokens for _, tokens in self._recent),
+                waited_seconds=self._waited,
+                blocked_for=max(0.0, self._blocked_until - now),
+            )
+
+
+def key_fingerprint(api_key: str | None) -> str:
+    """Short, non-reversible id for an API key (safe to log)."""
+    if not api_key:
+        return "default"
+    return hashlib.sha256(api_key.encode()).hexdigest()[:8]
+
+
+# pydantic-ai provider prefixes that share Gemini quotas with the direct genai calls.
+_PROVIDER_ALIASES = {"google-gla": "google", "google-vertex": "google", "gemini": "google"}
+
+
+def limiter_key(provider: str, model: str) -> tuple[str, str]:
+    """Normalize a (provider, model) pair so every caller of one model shares a limiter.
+
+    Pydantic-ai models report ``("google", "gemini-2.5-flash")`` while the
+    direct genai paths pass configured names such as
+    ``google-gla:gemini-2.5-flash`` or ``models/gemini-2.5-flash``; all of
+    them map to ``("google", "gemini-2.5-flash")``.
+    """
+    prefix, sep, name = model.partition(":")
+    # Provider prefixes never contain "/"; OpenRouter names ("vendor/model:free") do.
+    if sep and "/" not in prefix:
+        provider, model = prefix, name
+    provider = _PROVIDER_ALIASES.get(provider, provider)
+    return provider, model.removeprefix("models/")
+
+
+class AdaptiveRateLimiterRegistry:
+    """Creates and holds one :class:`AdaptiveRateLimiter` per (provider, model, key)."""
+
+    def __init__(self, **limiter_options: Any) -> None:
+        self.limiter_options = limiter_options
+        self._limiters: dict[tuple[str, str, str], AdaptiveRateLimiter] = {}
+        self._lock = threading.Lock()
+
+    def get(self, provider: str, model: str, api_key: str | None = None) -> AdaptiveRateLimiter:
+        key = (*limiter_key(provider, model), key_fingerprint(api_key))
+        with self._lock:
+            limiter = self._limiters.get(key)
+            if limiter is None:
+                limiter = AdaptiveRateLimiter(
+                    provider=key[0], model=key[1], key_id=key[2], **self.limiter_options
+                )
+                self._limiters[key] = limiter
+            return limiter
+
+    def snapshot(self) -> list[RateLimitMetrics]:
+        """Return live metrics of every limiter, busiest first."""
+        with self._lock:
+            limiters = list(self._limiters.values())
+        return sorted((limiter.metrics() for limiter in limiters), key=lambda m: -m.requests)
+
+
+_adaptive_registry = AdaptiveRateLimiterRegistry()
+
+
+def get_adaptive_limiter(provider: str, model: str, api_key: str | None = None) -> AdaptiveRateLimiter:
+    """Return the process-wide adaptive limiter for (provider, model, key)."""
+    return _adaptive_registry.get(provider, model, api_key)
+
+
+def get_adaptive_registry() -> AdaptiveRateLimiterRegistry:
+    """Return the process-wide registry (for metrics snapshots)."""
+    return _adaptive_registry
+
+
+def init_adaptive_rate_limits(
+    *,
+    initial_rps: float,
+    max_rps: float,
+    tokens_per_minute: int | None = None,
+    adaptive: bool = True,
+) -> None:
+    """Configure limiters created from now on (existing ones keep their learnt state).
+
+    With ``adaptive=False`` rates stay at ``initial_rps``; 429 pauses
+    (``Retry-After``) and token budgets still apply.
+    """
+    options: dict[str, Any] = {
+        "initial_rps": initial_rps,
+        "max_rps": max_rps,
+        "tokens_per_minute": tokens_per_minute,
+    }
+    if not adaptive:
+        options |= {"increase_step": 0.0, "decrease_factor": 1.0}
+    _adaptive_registry.limiter_options = options
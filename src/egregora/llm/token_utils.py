@@ -1,7 +1,42 @@
-"""Token counting and estimation utilities."""
+"""Token counting and estimation utilities.
+
+Token counts are computed locally by a pluggable tokenizer backend, selected
+with a spec string (``pipeline.tokenizer``):
+
+- ``"estimate"``: ~4 characters per token, no dependencies.
+- ``"tiktoken[:<encoding>]"``: a tiktoken BPE encoding (``o200k_base`` by
+  default, OpenAI's vocabulary). The encoding file is downloaded once into
+  tiktoken's cache; point ``TIKTOKEN_CACHE_DIR`` at a shipped copy to run
+  offline.
+- ``"sentencepiece:<model file>"``: a local SentencePiece model, e.g. the
+  Gemma ``tokenizer.model``, which matches Gemini's vocabulary.
+- ``"auto"`` (the default): the estimate, unless tiktoken's encoding file is
+  already in its local cache. It never downloads anything.
+
+:func:`get_token_counter` returns one shared :class:`TokenCounter` per spec,
+which memoizes counts per text so each message is tokenized once per process.
+"""
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Protocol
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIKTOKEN_ENCODING = "o200k_base"
+
+# Where tiktoken fetches the BPE files of OpenAI's public encodings from.
+TIKTOKEN_ENCODING_URL = "https://openaipublic.blob.core.windows.net/encodings/{encoding}.tiktoken"
+
+# Distinct texts whose counts are remembered per counter.
+TOKEN_COUNT_CACHE_SIZE = 65_536
+
 
 def estimate_tokens(text: str) -> int:
     """Estimate token count (rough approximation: ~4 chars per token).
@@ -16,3 +51,139 @@ def estimate_tokens(text: str) -> int:
 
     """
     return len(text) // 4
+
+
+class Tokenizer(Protocol):
+    """A local tokenizer backend."""
+
+    name: str
+
+    def count(self, text: str) -> int: ...
+
+
+class EstimateTokenizer:
+    """Character-based estimate (see :func:`estimate_tokens`)."""
+
+    name = "estimate"
+
+    def count(self, text: str) -> int:
+        return estimate_tokens(text)
+
+
+class TiktokenTokenizer:
+    """Counts tokens with a tiktoken BPE encoding."""
+
+    def __init__(self, encoding: str = DEFAULT_TIKTOKEN_ENCODING) -> None:
+        import tiktoken
+
+        self._encoding = tiktoken.get_encoding(encoding)
+        self.name = f"tiktoken:{encoding}"
+
+    def count(self, text: str) -> int:
+        return len(self._encoding.encode_ordinary(text))
+
+
+class SentencePieceTokenizer:
+    """Counts tokens with a local SentencePiece model file."""
+
+    def __init__(self, model_path: str) -> None:
+        import sentencepiece
+
+        self._processor = sentencepiece.SentencePieceProcessor(model_file=model_path)
+        self.name = f"sentencepiece:{model_path}"
+
+    def count(self, text: str) -> int:
+        return len(self._processor.encode(text))
+
+
+def tiktoken_encoding_cached(encoding: str = DEFAULT_TIKTOKEN_ENCODING) -> bool:
+    """Return whether ``encoding``'s BPE file is in tiktoken's local cache.
+
+    Mirrors the cache lookup of ``tiktoken.load.read_file_cached``, so a
+    ``True`` means loading the encoding will not touch the network.
+    """
+    cache_dir = os.environ.get("TIKTOKEN_CACHE_DIR", os.environ.get("DATA_GYM_CACHE_DIR"))
+    if cache_dir is None:
+        cache_dir = str(Path(tempfile.gettempdir()) / "data-gym-cache")
+    if not cache_dir:  # caching disabled
+        return False
+    url = TIKTOKEN_ENCODING_URL.format(encoding=encoding)
+    cache_key = hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest()
+    return (Path(cache_dir) / cache_key).exists()
+
+
+def load_tokenizer(spec: str) -> Tokenizer:
+    """Build the tokenizer backend described by ``spec``.
+
+    Raises:
+        ValueError: If ``spec`` names an unknown backend.
+        ImportError: If the backend's package is not installed.
+
+    """
+    backend, _, argument = spec.partition(":")
+    if backend == "estimate":
+        return EstimateTokenizer()
+    if backend == "tiktoken":
+        return TiktokenTokenizer(argument or DEFAULT_TIKTOKEN_ENCODING)
+    if backend == "sentencepiece" and argument:
+        return SentencePieceTokenizer(argument)
+    if backend == "auto":
+        if not tiktoken_encoding_cached():
+            return EstimateTokenizer()
+        try:
+            return TiktokenTokenizer()
+        except Exception as exc:  # missing package or unreadable encoding file
+            logger.debug("tiktoken unavailable, estimating token counts: %s", exc)
+            return EstimateTokenizer()
+    msg = f"Unknown tokenizer {spec!r}; expected 'estimate', 'auto', 'tiktoken[:encoding]' or 'sentencepiece:<path>'"
+    raise ValueError(msg)
+
+
+class TokenCounter:
+    """Counts tokens with a tokenizer, remembering the count of each text."""
+
+    def __init__(self, tokenizer: Tokenizer, cache_size: int = TOKEN_COUNT_CACHE_SIZE) -> None:
+        self.tokenizer = tokenizer
+        self._count = functools.lru_cache(maxsize=cache_size)(tokenizer.count)
+
+    @property
+    def name(self) -> str:
+        return self.tokenizer.name
+
+    def count(self, text: str) -> int:
+        """Return the token count of ``text`` (memoized; use for short, repeated texts)."""
+        return self._count(text)
+
+    def count_uncached(self, text: str) -> int:
+        """Return the token count of a one-off text, such as a full prompt."""
+        return self.tokenizer.count(text)
+
+    def cache_stats(self) -> dict[str, int]:
+        info = self._count.cache_info()
+        return {"hits": info.hits, "misses": info.misses}
+
+
+@functools.lru_cache(maxsize=8)
+def get_token_counter(spec: str = "auto") -> TokenCounter:
+    """Return the shared counter for ``spec``, falling back to the estimate if it cannot load."""
+    try:
+        tokenizer = load_tokenizer(spec)
+    except (ImportError, OSError, ValueError) as exc:
+        logger.warning("Could not load tokenizer %r, estimating token counts instead: %s", spec, exc)
+        tokenizer = EstimateTokenizer()
+    logger.debug("Counting tokens with %s", tokenizer.name)
+    return TokenCounter(tokenizer)
+
+
+__all__ = [
+    "DEFAULT_TIKTOKEN_ENCODING",
+    "EstimateTokenizer",
+    "SentencePieceTokenizer",
+    "TiktokenTokenizer",
+    "TokenCounter",
+    "Tokenizer",
+    "estimate_tokens",
+    "get_token_counter",
+    "load_tokenizer",
+    "tiktoken_encoding_cached",
+]
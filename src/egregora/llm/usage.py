@@ -7,19 +7,34 @@ from dataclasses import dataclass, field
 
 from pydantic_ai.usage import RunUsage
 
+# Limit history size to avoid unbounded memory growth; totals live in ``usage``
+# and are persisted to the run ledger at the end of a run.
+MAX_HISTORY = 50
+
 
 @dataclass
 class UsageTracker:
     """Track aggregated LLM usage metrics."""
 
     usage: RunUsage = field(default_factory=RunUsage)
-    history: deque[RunUsage] = field(default_factory=deque)
+    history: deque[RunUsage] = field(default_factory=lambda: deque(maxlen=MAX_HISTORY))
+    cache_hits: dict[str, int] = field(default_factory=dict)
+    cache_misses: dict[str, int] = field(default_factory=dict)
 
     def record(self, run_usage: RunUsage) -> None:
         """Add usage and keep history for debugging."""
         self.usage.incr(run_usage)
         self.history.append(run_usage)
-        # Limit history size to avoid unbounded memory growth
-        max_history = 50
-        if len(self.history) > max_history:
-            self.history.popleft()
+
+    def record_cache(self, tier: str, *, hit: bool, count: int = 1) -> None:
+        """Count ``count`` cache lookups for ``tier`` (e.g. ``"writer"``)."""
+        counter = self.cache_hits if hit else self.cache_misses
+        counter[tier] = counter.get(tier, 0) + count
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Return ``{tier: {"hits": n, "misses": m}}`` for every tier looked up."""
+        tiers = sorted(self.cache_hits.keys() | self.cache_misses.keys())
+        return {
+            tier: {"hits": self.cache_hits.get(tier, 0), "misses": self.cache_misses.get(tier, 0)}
+            for tier in tiers
+        }
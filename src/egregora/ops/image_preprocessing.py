@@ -0,0 +1,136 @@
+"""Downscale and re-encode images before they are sent to a vision model.
+
+Vision models resize large images themselves, so sending a 12-megapixel phone
+photo inline only costs upload bytes and input tokens. :class:`ImagePreprocessor`
+shrinks images to a maximum edge, drops EXIF and other metadata (after applying
+the EXIF orientation) and re-encodes them as WebP or JPEG. Derivatives are
+cached by the hash of the original bytes plus the options, so re-runs and
+duplicate media reuse them.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal
+
+from PIL import Image, ImageOps
+
+if TYPE_CHECKING:
+    import diskcache
+
+logger = logging.getLogger(__name__)
+
+# Formats worth re-encoding. GIFs are left alone: re-encoding would drop animation.
+PREPROCESSABLE_MIME_TYPES = frozenset({"image/jpeg", "image/png", "image/webp", "image/bmp", "image/tiff"})
+
+_OUTPUT_MIME_TYPES = {"webp": "image/webp", "jpeg": "image/jpeg"}
+
+
+@dataclass(frozen=True, slots=True)
+class ImagePreprocessOptions:
+    """How images are reduced before enrichment."""
+
+    max_edge: int = 1024
+    format: Literal["webp", "jpeg"] = "webp"
+    quality: int = 80
+
+    @property
+    def mime_type(self) -> str:
+        return _OUTPUT_MIME_TYPES[self.format]
+
+    @property
+    def cache_token(self) -> str:
+        return f"{self.max_edge}:{self.format}:{self.quality}"
+
+
+@dataclass(frozen=True, slots=True)
+class PreparedImage:
+    """An image ready to be sent: bytes, MIME type and pixel size."""
+
+    data: bytes
+    mime_type: str
+    width: int
+    height: int
+
+
+def downscale_image(data: bytes, options: ImagePreprocessOptions) -> PreparedImage | None:
+    """Resize ``data`` to ``options.max_edge`` and re-encode it without metadata.
+
+    Returns ``None`` when the image cannot be decoded or the derivative would
+    not be smaller than the original, in which case the original should be sent.
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as original:
+            # Let JPEG decode at a reduced scale instead of decoding every pixel.
+            original.draft("RGB", (options.max_edge, options.max_edge))
+            image = ImageOps.exif_transpose(original)
+            image.thumbnail((options.max_edge, options.max_edge), Image.Resampling.LANCZOS)
+            if options.format == "jpeg":
+                image = _flatten(image)
+            elif image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGBA")
+            buffer = io.BytesIO()
+            image.save(buffer, format=options.format.upper(), quality=options.quality)
+    except (OSError, ValueError, Image.DecompressionBombError) as exc:
+        logger.debug("Not preprocessing undecodable image: %s", exc)
+        return None
+
+    encoded = buffer.getvalue()
+    if len(encoded) >= len(data):
+        return None
+    return PreparedImage(encoded, options.mime_type, image.width, image.height)
+
+
+def _flatten(image: Image.Image) -> Image.Image:
+    """Convert to RGB, compositing any transparency onto white."""
+    if image.mode in ("RGBA", "LA", "P"):
+        rgba = image.convert("RGBA")
+        background = Image.new("RGB", rgba.size, (255, 255, 255))
+        background.paste(rgba, mask=rgba.getchannel("A"))
+        return background
+    return image.convert("RGB")
+
+
+class ImagePreprocessor:
+    """Reduces images, caching derivatives by content hash.
+
+    Safe to call from several threads; Pillow releases the GIL while decoding,
+    resizing and encoding, so a thread pool reduces several images at once.
+    """
+
+    def __init__(
+        self, options: ImagePreprocessOptions | None = None, cache: diskcache.Cache | None = None
+    ) -> None:
+        self.options = options or ImagePreprocessOptions()
+        self.cache = cache
+
+    def prepare(self, data: bytes, mime_type: str) -> tuple[bytes, str]:
+        """Return the bytes and MIME type to send for an image."""
+        if mime_type not in PREPROCESSABLE_MIME_TYPES or self.options.max_edge <= 0:
+            return data, mime_type
+
+        key = f"image:{self.options.cache_token}:{hashlib.sha256(data).hexdigest()}"
+        cached = self.cache.get(key) if self.cache is not None else None
+        if not isinstance(cached, tuple):
+            prepared = downscale_image(data, self.options)
+            # An empty entry remembers that the original is the better choice.
+            cached = (prepared.data, prepared.mime_type) if prepared else (b"", "")
+            if self.cache is not None:
+                self.cache.set(key, cached)
+        derivative, derivative_mime = cached
+        if not derivative:
+            return data, mime_type
+        logger.debug("Reduced %s image from %d to %d bytes", mime_type, len(data), len(derivative))
+        return derivative, derivative_mime
+
+
+__all__ = [
+    "PREPROCESSABLE_MIME_TYPES",
+    "ImagePreprocessOptions",
+    "ImagePreprocessor",
+    "PreparedImage",
+    "downscale_image",
+]
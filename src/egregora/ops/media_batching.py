@@ -0,0 +1,212 @@
+"""Pack media enrichment requests into batches by estimated size.
+
+Ten videos and ten stickers are very different batches. Each prepared request
+is sized in request bytes (inline base64 counts in full, a File API reference
+barely at all) and in estimated input tokens, following Gemini's accounting:
+
+- images: 258 tokens when both sides are at most 384 px, otherwise 258 per
+  768x768 tile;
+- video: 263 tokens per second, audio: 32 per second, PDF: 258 per page,
+  with duration and page count estimated from the file size;
+- text: about four characters per token.
+
+:func:`pack_media_requests` fills batches up to :class:`MediaBatchLimits`
+(first-fit decreasing) and sets aside requests too large for any batch, which
+are then sent on their own.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import io
+import math
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
+
+from PIL import Image
+
+from egregora.llm.token_utils import estimate_tokens
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+IMAGE_TILE_TOKENS = 258
+IMAGE_SMALL_EDGE = 384
+IMAGE_TILE_EDGE = 768
+VIDEO_TOKENS_PER_SECOND = 263
+AUDIO_TOKENS_PER_SECOND = 32
+PDF_TOKENS_PER_PAGE = 258
+
+# Deliberately low rates, so durations and page counts err on the large side.
+VIDEO_BYTES_PER_SECOND = 125_000  # 1 Mbit/s
+AUDIO_BYTES_PER_SECOND = 2_000  # 16 kbit/s voice notes
+PDF_BYTES_PER_PAGE = 50_000
+
+# Images whose dimensions cannot be read are counted as this many tiles.
+UNKNOWN_IMAGE_TILES = 4
+
+# JSON framing, MIME types and field names around each part.
+_PART_OVERHEAD_BYTES = 64
+# Base64 characters decoded to find an image's dimensions in its header.
+_IMAGE_HEADER_CHARS = 64 * 1024
+
+
+@dataclass(frozen=True, slots=True)
+class MediaBatchLimits:
+    """What one batch may hold. ``None`` leaves a dimension unbounded."""
+
+    # Requests carrying inline data are capped at 20 MB; leave headroom.
+    max_request_bytes: int = 18 * 1024 * 1024
+    max_tokens: int | None = 250_000
+    # Every item adds a JSON result to one response, bounded by the output limit.
+    max_items: int | None = 24
+
+
+# One generate_content call holding every item (the ``batch_all`` strategy).
+SINGLE_CALL_LIMITS = MediaBatchLimits()
+# One Batch API job of inline requests; each request has its own context.
+BATCH_JOB_LIMITS = MediaBatchLimits(max_tokens=None, max_items=None)
+
+
+@dataclass(frozen=True, slots=True)
+class MediaRequestSize:
+    """Estimated size of one request."""
+
+    request_bytes: int
+    tokens: int
+
+
+@dataclass(slots=True)
+class MediaBatchPlan:
+    """Batches to send together and requests to send on their own."""
+
+    batches: list[list[dict[str, Any]]] = field(default_factory=list)
+    oversized: list[dict[str, Any]] = field(default_factory=list)
+
+
+def estimate_media_tokens(
+    mime_type: str, size_bytes: int, *, width: int | None = None, height: int | None = None
+) -> int:
+    """Estimate the input tokens of a media file.
+
+    ``mime_type`` may also be a bare category ("image", "video"), as media
+    task payloads store it.
+    """
+    kind = mime_type.partition("/")[0]
+    if kind == "image":
+        if width is None or height is None:
+            return UNKNOWN_IMAGE_TILES * IMAGE_TILE_TOKENS
+        if width <= IMAGE_SMALL_EDGE and height <= IMAGE_SMALL_EDGE:
+            return IMAGE_TILE_TOKENS
+        tiles = math.ceil(width / IMAGE_TILE_EDGE) * math.ceil(height / IMAGE_TILE_EDGE)
+        return tiles * IMAGE_TILE_TOKENS
+    if kind == "video":
+        return math.ceil(size_bytes / VIDEO_BYTES_PER_SECOND) * VIDEO_TOKENS_PER_SECOND
+    if kind == "audio":
+        return math.ceil(size_bytes / AUDIO_BYTES_PER_SECOND) * AUDIO_TOKENS_PER_SECOND
+    if mime_type == "application/pdf":
+        return math.ceil(size_bytes / PDF_BYTES_PER_PAGE) * PDF_TOKENS_PER_PAGE
+    return math.ceil(size_bytes / 4)
+
+
+def inline_image_dimensions(data: str) -> tuple[int, int] | None:
+    """Read an inline (base64) image's size from its header without decoding it all."""
+    prefix = data[: _IMAGE_HEADER_CHARS - _IMAGE_HEADER_CHARS % 4]
+    try:
+        with Image.open(io.BytesIO(base64.b64decode(prefix))) as image:
+            return image.size
+    except (OSError, ValueError, binascii.Error, Image.DecompressionBombError):
+        return None
+
+
+def estimate_request_size(request: Mapping[str, Any], *, file_size: int = 0) -> MediaRequestSize:
+    """Estimate a prepared request. ``file_size`` sizes parts sent as File API references."""
+    request_bytes = 0
+    tokens = 0
+    for content in request.get("contents", []):
+        for part in content.get("parts", []):
+            request_bytes += _PART_OVERHEAD_BYTES
+            if "text" in part:
+                request_bytes += len(part["text"])
+                tokens += estimate_tokens(part["text"])
+            elif "inlineData" in part:
+                inline = part["inlineData"]
+                data, mime_type = inline["data"], inline["mimeType"]
+                request_bytes += len(data)
+                is_image = mime_type.partition("/")[0] == "image"
+                dimensions = inline_image_dimensions(data) if is_image else None
+                width, height = dimensions or (None, None)
+                tokens += estimate_media_tokens(mime_type, len(data) * 3 // 4, width=width, height=height)
+            elif "fileData" in part:
+                file_data = part["fileData"]
+                request_bytes += len(file_data["fileUri"])
+                tokens += estimate_media_tokens(file_data["mimeType"], file_size)
+    return MediaRequestSize(request_bytes, tokens)
+
+
+def pack_media_requests(
+    requests: list[dict[str, Any]], sizes: Mapping[str, MediaRequestSize], limits: MediaBatchLimits
+) -> MediaBatchPlan:
+    """Pack requests (keyed by ``tag`` in ``sizes``) into as few batches as fit ``limits``.
+
+    Largest requests are placed first, each into the first batch with room.
+    Requests that exceed the limits on their own go to ``oversized``. Batches
+    keep the original request order.
+    """
+    plan = MediaBatchPlan()
+    fitting: list[tuple[int, dict[str, Any], MediaRequestSize]] = []
+    for index, request in enumerate(requests):
+        size = sizes[request["tag"]]
+        if _fits(size.request_bytes, size.tokens, 1, limits):
+            fitting.append((index, request, size))
+        else:
+            plan.oversized.append(request)
+
+    def load(item: tuple[int, dict[str, Any], MediaRequestSize]) -> float:
+        _, _, size = item
+        shares = [size.request_bytes / limits.max_request_bytes]
+        if limits.max_tokens:
+            shares.append(size.tokens / limits.max_tokens)
+        return max(shares)
+
+    bins: list[list[tuple[int, dict[str, Any], MediaRequestSize]]] = []
+    totals: list[tuple[int, int]] = []
+    for item in sorted(fitting, key=load, reverse=True):
+        _, _, size = item
+        for position, (used_bytes, used_tokens) in enumerate(totals):
+            if _fits(
+                used_bytes + size.request_bytes, used_tokens + size.tokens, len(bins[position]) + 1, limits
+            ):
+                bins[position].append(item)
+                totals[position] = (used_bytes + size.request_bytes, used_tokens + size.tokens)
+                break
+        else:
+            bins.append([item])
+            totals.append((size.request_bytes, size.tokens))
+
+    ordered = sorted((sorted(batch, key=itemgetter(0)) for batch in bins), key=lambda batch: batch[0][0])
+    plan.batches = [[request for _, request, _ in batch] for batch in ordered]
+    return plan
+
+
+def _fits(request_bytes: int, tokens: int, items: int, limits: MediaBatchLimits) -> bool:
+    return (
+        request_bytes <= limits.max_request_bytes
+        and (limits.max_tokens is None or tokens <= limits.max_tokens)
+        and (limits.max_items is None or items <= limits.max_items)
+    )
+
+
+__all__ = [
+    "BATCH_JOB_LIMITS",
+    "SINGLE_CALL_LIMITS",
+    "MediaBatchLimits",
+    "MediaBatchPlan",
+    "MediaRequestSize",
+    "estimate_media_tokens",
+    "estimate_request_size",
+    "inline_image_dimensions",
+    "pack_media_requests",
+]
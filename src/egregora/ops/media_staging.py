@@ -0,0 +1,92 @@
+"""Stage media from the source ZIP for enrichment without temp-file round trips.
+
+Media used to be extracted into a staging directory and then read straight back
+for base64 encoding. :func:`stage_zip_member` instead reads a member from the
+already open archive into memory, or into a :class:`~tempfile.SpooledTemporaryFile`
+when it is larger than the spool threshold, hashing it on the way. The result is
+only written to a real file when something needs a path (persisting large media).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import shutil
+import tempfile
+from pathlib import Path
+from typing import IO, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import zipfile
+
+# Members up to this size are held in memory; larger ones spool to disk.
+MEDIA_SPOOL_THRESHOLD = 8 * 1024 * 1024
+
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class StagedMedia:
+    """A media file read for enrichment, in memory or spooled to disk.
+
+    ``size`` and ``sha256`` describe the bytes actually read.
+    """
+
+    def __init__(self, name: str, buffer: IO[bytes], size: int, sha256: str) -> None:
+        self.name = name
+        self.size = size
+        self.sha256 = sha256
+        self._buffer = buffer
+
+    @property
+    def in_memory(self) -> bool:
+        return isinstance(self._buffer, io.BytesIO)
+
+    def open(self) -> IO[bytes]:
+        """Return the contents as a file object positioned at the start."""
+        self._buffer.seek(0)
+        return self._buffer
+
+    def read_bytes(self) -> bytes:
+        if isinstance(self._buffer, io.BytesIO):
+            return self._buffer.getvalue()
+        return self.open().read()
+
+    def write_to(self, path: Path) -> Path:
+        """Write the contents to ``path``."""
+        with path.open("wb") as dest:
+            shutil.copyfileobj(self.open(), dest, _COPY_CHUNK_SIZE)
+        return path
+
+    def close(self) -> None:
+        self._buffer.close()
+
+
+def build_media_index(zf: zipfile.ZipFile) -> dict[str, str]:
+    """Map lower-cased basenames to member names, for O(1) lookup by attachment name."""
+    return {Path(info.filename).name.lower(): info.filename for info in zf.infolist() if not info.is_dir()}
+
+
+def stage_zip_member(
+    zf: zipfile.ZipFile, member: str, *, spool_threshold: int = MEDIA_SPOOL_THRESHOLD
+) -> StagedMedia:
+    """Read ``member`` from an open archive into memory or a spooled temporary file."""
+    digest = hashlib.sha256()
+    size = 0
+    buffer: IO[bytes] = (
+        io.BytesIO()
+        if zf.getinfo(member).file_size <= spool_threshold
+        else tempfile.SpooledTemporaryFile(max_size=spool_threshold, prefix="egregora_media_")
+    )
+    try:
+        with zf.open(member) as source:
+            while chunk := source.read(_COPY_CHUNK_SIZE):
+                digest.update(chunk)
+                buffer.write(chunk)
+                size += len(chunk)
+    except BaseException:
+        buffer.close()
+        raise
+    return StagedMedia(Path(member).name, buffer, size, digest.hexdigest())
+
+
+__all__ = ["MEDIA_SPOOL_THRESHOLD", "StagedMedia", "build_media_index", "stage_zip_member"]
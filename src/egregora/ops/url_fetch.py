@@ -0,0 +1,133 @@
+"""Fetch URL content once and share it between enrichment tool calls.
+
+Enrichment agents fetch pages through tools, and each retried or rotated
+agent run used to fetch the same page again. :class:`CachedUrlFetcher` goes
+through the :class:`~egregora.database.asset_cache.AssetCache` first:
+
+- entries younger than the TTL are served without touching the network;
+- stale entries are revalidated with ``If-None-Match`` / ``If-Modified-Since``,
+  so an unchanged page costs a ``304`` instead of a download;
+- when the server cannot be reached, a stale entry is served rather than
+  failing the tool call.
+
+Requests go through the shared client of the running event loop
+(:func:`~egregora.security.http.get_async_http_client`).
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import duckdb
+import httpx
+
+from egregora.database.asset_cache import CachedAsset
+from egregora.security.http import get_async_http_client
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from egregora.database.asset_cache import AssetCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FETCH_TTL = timedelta(days=7)
+
+
+class CachedUrlFetcher:
+    """HTTP GET through the asset cache, with TTL and conditional revalidation."""
+
+    def __init__(
+        self,
+        cache: AssetCache | None = None,
+        *,
+        ttl: timedelta = DEFAULT_FETCH_TTL,
+        client: httpx.AsyncClient | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        self.cache = cache
+        self.ttl = ttl
+        self.timeout = timeout
+        self._client = client
+        self.hits = 0
+        self.revalidated = 0
+        self.fetched = 0
+
+    async def get(self, url: str, *, headers: Mapping[str, str] | None = None) -> CachedAsset:
+        """Return the content of ``url``, from the cache when it is fresh or unchanged.
+
+        Raises:
+            httpx.RequestError: The request failed and nothing is cached.
+            httpx.HTTPStatusError: The server answered with an error and nothing is cached.
+
+        """
+        cached = self._load(url)
+        if cached is not None and cached.is_fresh():
+            self.hits += 1
+            return cached
+
+        request_headers = dict(headers or {})
+        if cached is not None:
+            request_headers.update(cached.conditional_headers())
+        client = self._client or get_async_http_client()
+        try:
+            response = await client.get(url, headers=request_headers, timeout=self.timeout)
+            if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+                self.revalidated += 1
+                return self._touch(cached)
+            response.raise_for_status()
+        except (httpx.RequestError, httpx.HTTPStatusError) as exc:
+            if cached is None:
+                raise
+            logger.warning("Serving stale cached content for %s: %s", url, exc)
+            return cached
+
+        self.fetched += 1
+        return self._store(url, response)
+
+    def _load(self, url: str) -> CachedAsset | None:
+        if self.cache is None:
+            return None
+        try:
+            return self.cache.load(url)
+        except duckdb.Error:
+            logger.warning("Could not read cached content for %s", url, exc_info=True)
+            return None
+
+    def _touch(self, cached: CachedAsset) -> CachedAsset:
+        if self.cache is None:
+            return cached
+        try:
+            return self.cache.touch(cached, ttl=self.ttl)
+        except duckdb.Error:
+            logger.warning("Could not refresh cached content for %s", cached.url, exc_info=True)
+            return cached
+
+    def _store(self, url: str, response: httpx.Response) -> CachedAsset:
+        content_type = response.headers.get("Content-Type", "application/octet-stream")
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if self.cache is not None:
+            try:
+                return self.cache.store(
+                    url,
+                    response.content,
+                    content_type=content_type,
+                    ttl=self.ttl,
+                    etag=etag,
+                    last_modified=last_modified,
+                )
+            except duckdb.Error:
+                logger.warning("Could not cache content for %s", url, exc_info=True)
+        return CachedAsset(
+            url=url,
+            content=response.content,
+            content_type=content_type,
+            etag=etag,
+            last_modified=last_modified,
+        )
+
+
+__all__ = ["DEFAULT_FETCH_TTL", "CachedUrlFetcher"]
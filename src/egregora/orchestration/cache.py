@@ -10,6 +10,7 @@ from __future__ import annotations
 import contextlib
 import json
 import logging
+import time
 from dataclasses import dataclass
 from enum import Enum
 from hashlib import sha256
@@ -24,11 +25,48 @@ from egregora.orchestration.exceptions import (
 )
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
     from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
+# Keys per membership query, well under SQLite's bound-parameter limit.
+_CONTAINS_CHUNK_SIZE = 500
+
+
+def contains_many(cache: diskcache.Cache, keys: Iterable[str]) -> set[str]:
+    """Return the subset of ``keys`` present (and unexpired) in ``cache``.
+
+    Same semantics as ``key in cache``, but each chunk of keys is one query
+    against diskcache's SQLite index instead of one lookup per key. diskcache
+    has no public bulk lookup, so this uses ``Cache._sql`` (the tests pin it
+    against the installed diskcache) and falls back to ``key in cache``
+    inside one transaction when a release drops it.
+    """
+    keys = list(keys)
+    sql = getattr(cache, "_sql", None)
+    if not callable(sql):
+        with cache.transact():
+            return {key for key in keys if key in cache}
+
+    wanted: dict[tuple[Any, bool], str] = {cache.disk.put(key): key for key in keys}
+    found: set[str] = set()
+    now = time.time()
+    db_keys = list(wanted)
+    for start in range(0, len(db_keys), _CONTAINS_CHUNK_SIZE):
+        chunk = db_keys[start : start + _CONTAINS_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        # Mirrors Cache.__contains__ for a chunk of keys.
+        rows = sql(
+            f"SELECT key, raw FROM Cache WHERE key IN ({placeholders})"  # nosec B608
+            " AND (expire_time IS NULL OR expire_time > ?)",
+            (*(db_key for db_key, _raw in chunk), now),
+        ).fetchall()
+        found.update(wanted[(db_key, bool(raw))] for db_key, raw in rows if (db_key, bool(raw)) in wanted)
+    return found
+
+
 # --- Cache Backend Definitions ---
 
 
@@ -69,6 +107,9 @@ class DiskCacheBackend:
         with contextlib.suppress(KeyError):
             del self._cache[key]
 
+    def contains_many(self, keys: Iterable[str]) -> set[str]:
+        return contains_many(self._cache, keys)
+
     def close(self) -> None:
         self._cache.close()
 
@@ -139,10 +180,30 @@ class EnrichmentCache:
         key: Annotated[str, "The cache key to store the payload under"],
         payload: Annotated[dict[str, Any], "The payload to store"],
     ) -> None:
-        """Persist enrichment payload."""
+        """Persist enrichment payload.
+
+        Only dicts are stored, so a cache hit can be trusted without loading it.
+        """
+        if not isinstance(payload, dict):
+            raise CachePayloadTypeError(key, type(payload))
         self.backend.set(key, payload, expire=None)
         logger.debug("Cached enrichment entry for key %s", key)
 
+    def contains_many(
+        self, keys: Annotated[Iterable[str], "The cache keys to look up"]
+    ) -> Annotated[set[str], "The keys that have an entry"]:
+        """Return which of ``keys`` are cached, without loading their payloads."""
+        if isinstance(self.backend, DiskCacheBackend):
+            return self.backend.contains_many(keys)
+        present = set()
+        for key in keys:
+            try:
+                self.backend.get(key)
+            except CacheKeyNotFoundError:
+                continue
+            present.add(key)
+        return present
+
     def delete(self, key: Annotated[str, "The cache key to delete"]) -> None:
         """Remove an entry from the cache if present."""
         self.backend.delete(key)
@@ -201,10 +262,21 @@ class PipelineCache:
         writer_dir = self.base_dir / "writer"
         self.writer = diskcache.Cache(str(writer_dir))
 
+        # Media derivatives (downscaled images) keyed by content hash and
+        # options; they never go stale, so there is no refresh tier for them.
+        media_dir = self.base_dir / "media"
+        self.media = diskcache.Cache(str(media_dir))
+
         logger.debug("Initialized PipelineCache at %s", self.base_dir)
         if self.refresh_tiers:
             logger.info("Refresh requested for tiers: %s", self.refresh_tiers)
 
+    def contains_many(self, keys: Iterable[str], tier: CacheTier = CacheTier.ENRICHMENT) -> set[str]:
+        """Return which of ``keys`` have an entry in ``tier``, in one bulk query."""
+        if tier is CacheTier.ENRICHMENT:
+            return self.enrichment.contains_many(keys)
+        return contains_many(self.rag if tier is CacheTier.RAG else self.writer, keys)
+
     def should_refresh(self, tier: CacheTier) -> bool:
         """Check if a specific tier was requested for refresh via CLI."""
         return "all" in self.refresh_tiers or tier.value in self.refresh_tiers
@@ -214,3 +286,4 @@ class PipelineCache:
         self.enrichment.close()
         self.rag.close()
         self.writer.close()
+        self.media.close()
@@ -12,7 +12,7 @@ from __future__ import annotations
 import uuid
 from dataclasses import dataclass, field, replace
 from datetime import UTC, datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -25,10 +25,12 @@ if TYPE_CHECKING:
     from egregora.data_primitives.document import OutputSink, UrlContext
     from egregora.database.protocols import StorageProtocol
     from egregora.database.task_store import TaskStore
+    from egregora.database.url_index import UrlCandidateIndex
     from egregora.input_adapters.base import InputAdapter
     from egregora.llm.usage import UsageTracker
     from egregora.orchestration.cache import PipelineCache
     from egregora.orchestration.error_boundary import ErrorBoundary
+    from egregora.orchestration.pipelines.etl.enrichment_prefetch import EnrichmentPrefetcher
     from egregora.output_sinks import OutputSinkRegistry
     from egregora.rag.embedding_router import EmbeddingRouter
 
@@ -126,6 +128,9 @@ class PipelineState:
     # Stores (Optional)
     annotations_store: AnnotationStore | None = None
     task_store: TaskStore | None = None
+    url_index: UrlCandidateIndex | None = None
+    # Set while windows are enriched ahead in the background; other workers leave enrichment to it.
+    enrichment_prefetcher: EnrichmentPrefetcher | None = None
 
     # Pure Content Library Facade
     library: object = None  # Pure ContentLibrary (avoid V2→Pure import)
@@ -138,6 +143,8 @@ class PipelineState:
     embedding_router: EmbeddingRouter | None = None
     error_boundary: ErrorBoundary | None = None
     smoke_test: bool = False
+    # First-turn writer responses from a batch write job, keyed by window signature.
+    writer_batch_responses: dict[str, Any] = field(default_factory=dict)
 
 
 @dataclass(frozen=True, slots=True)
@@ -215,6 +222,10 @@ class PipelineContext:
     def task_store(self) -> TaskStore | None:
         return self.state.task_store
 
+    @property
+    def url_index(self) -> UrlCandidateIndex | None:
+        return self.state.url_index
+
     @property
     def library(self) -> object:  # Pure ContentLibrary (avoid V2→Pure import)
         return self.state.library
@@ -2,47 +2,175 @@
 
 This module reads from the database sink and writes to the filesystem sink (MkDocsAdapter),
 bridging the "Database Source of Truth" with the "Static Site Artifact".
+
+Documents are read with a single streaming query and rendered/written on a
+thread pool. Work is striped by target directory: every file in a given
+directory is handled by the same single-threaded lane, so writes within a
+directory keep their source order (and collision checks never race), while
+different directories proceed in parallel. Files are written atomically
+(temp file + rename) and skipped entirely when the rendered bytes match what
+is already on disk, so rebuilding an unchanged site touches almost nothing.
 """
 
+from __future__ import annotations
+
+import contextlib
 import logging
+import os
+import tempfile
+import threading
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
 from typing import TYPE_CHECKING
 
 from egregora.data_primitives.document import DocumentType, OutputSink
-from egregora.output_sinks.exceptions import DocumentNotFoundError
+from egregora.knowledge.profiles import ensure_author_entries
 
 if TYPE_CHECKING:
+    from egregora.data_primitives.document import Document
+    from egregora.output_sinks.base import RenderedDocument
     from egregora.output_sinks.mkdocs.adapter import MkDocsAdapter
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+# Documents queued per lane before the reader blocks (bounds memory while streaming).
+MAX_PENDING_PER_WORKER = 64
+DEFAULT_FILE_MODE = 0o644
+
+
+@dataclass
+class MaterializationStats:
+    """Counters describing a materialization run."""
+
+    written: int = 0
+    unchanged: int = 0
+    persisted: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.written + self.unchanged + self.persisted
+
+
+def write_if_changed(path: Path, payload: bytes) -> bool:
+    """Atomically write ``payload`` to ``path`` unless it already has those bytes.
+
+    The file is written to a temporary sibling and renamed into place, so
+    readers (e.g. ``mkdocs serve``) never observe a partially written file.
+
+    Returns:
+        True if the file was written, False if it was already up to date.
+
+    """
+    mode = DEFAULT_FILE_MODE
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        pass
+    else:
+        if stat.st_size == len(payload) and path.read_bytes() == payload:
+            return False
+        mode = stat.st_mode & 0o777
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            handle.write(payload)
+        # mkstemp creates owner-only files; keep site files world-readable like write_text would.
+        Path(tmp_name).chmod(mode)
+        Path(tmp_name).replace(path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            Path(tmp_name).unlink()
+        raise
+    return True
+
 
-def materialize_site(source: OutputSink, destination: "MkDocsAdapter") -> None:
+class _Materializer:
+    """Fans rendering and writes out over per-directory lanes."""
+
+    def __init__(self, destination: MkDocsAdapter, posts: list[Document], max_workers: int) -> None:
+        self._destination = destination
+        self._posts = posts
+        self._lanes = [
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix=f"materialize-{i}")
+            for i in range(max_workers)
+        ]
+        self._pending = threading.BoundedSemaphore(max_workers * MAX_PENDING_PER_WORKER)
+        self._futures: list[Future[None]] = []
+        self._lock = threading.Lock()
+        self._authors: set[str] = set()
+        self.stats = MaterializationStats()
+
+    def submit(self, document: Document, lane_key: str) -> None:
+        self._pending.acquire()
+        lane = self._lanes[zlib.crc32(lane_key.encode("utf-8")) % len(self._lanes)]
+        try:
+            future = lane.submit(self._materialize, document)
+        except BaseException:
+            self._pending.release()
+            raise
+        future.add_done_callback(lambda _f: self._pending.release())
+        self._futures.append(future)
+
+    def _materialize(self, document: Document) -> None:
+        rendered: RenderedDocument | None = self._destination.render(document, posts=self._posts)
+        if rendered is None:
+            self._destination.persist(document)
+            self._count("persisted")
+            return
+        written = write_if_changed(rendered.path, rendered.payload)
+        self._count("written" if written else "unchanged", rendered.authors)
+
+    def _count(self, field: str, authors: tuple[str, ...] = ()) -> None:
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
+            self._authors.update(authors)
+
+    def finish(self) -> MaterializationStats:
+        """Wait for all submitted documents, re-raising the first failure."""
+        for future in self._futures:
+            future.result()
+        if self._authors:
+            ensure_author_entries(self._destination.posts_dir, sorted(self._authors))
+        return self.stats
+
+    def shutdown(self) -> None:
+        for lane in self._lanes:
+            lane.shutdown(wait=True, cancel_futures=True)
+
+
+def _lane_key(document: Document, destination: MkDocsAdapter) -> str:
+    """Group documents whose canonical URLs share a parent (i.e. a directory) onto one lane."""
+    url = destination.url_convention.canonical_url(document, destination.url_context)
+    return url.rstrip("/").rsplit("/", 1)[0]
+
+
+def materialize_site(
+    source: OutputSink, destination: MkDocsAdapter, *, max_workers: int | None = None
+) -> MaterializationStats:
     """Sync all documents from DB to Filesystem."""
     logger.info("🧱 [bold cyan]Materializing site from database...[/]")
 
-    count = 0
-    # Iterate all types
-    for doc_type in [
-        DocumentType.POST,
-        DocumentType.PROFILE,
-        DocumentType.JOURNAL,
-        DocumentType.MEDIA,
-        DocumentType.ANNOTATION,
-    ]:
-        # We need a robust iterator that yields full Document objects
-        # DbOutputSink.list() yields metadata. We can use that to fetch docs.
-
-        for meta in source.list(doc_type):
-            try:
-                doc = source.get(doc_type, meta.identifier)
-                destination.persist(doc)
-                count += 1
-            except DocumentNotFoundError:
-                logger.warning(
-                    "Skipping materialization of missing document: type=%s, id=%s",
-                    doc_type.value,
-                    meta.identifier,
-                )
-                continue
-
-    logger.info("✅ [green]Materialized %d documents to filesystem.[/]", count)
+    # Related-post and author-post listings need the whole post corpus; read it once
+    # up front instead of once per rendered post/profile.
+    posts = list(destination.documents(DocumentType.POST))
+
+    materializer = _Materializer(destination, posts, max_workers or DEFAULT_MAX_WORKERS)
+    try:
+        for document in source.documents():
+            materializer.submit(document, _lane_key(document, destination))
+        stats = materializer.finish()
+    finally:
+        materializer.shutdown()
+
+    logger.info(
+        "✅ [green]Materialized %d documents to filesystem (%d written, %d unchanged).[/]",
+        stats.total,
+        stats.written + stats.persisted,
+        stats.unchanged,
+    )
+    return stats
@@ -42,11 +42,11 @@ def process_background_tasks(ctx: PipelineContext) -> None:
     except Exception as e:
         logger.warning("Profile worker background task failed: %s", e)
 
-    # Enrichment (If pending items remain)
-    if ctx.config.enrichment.enabled:
+    # Enrichment (If pending items remain and no prefetcher is draining them)
+    if ctx.config.enrichment.enabled and ctx.state.enrichment_prefetcher is None:
         try:
-            enrichment_worker = EnrichmentWorker(ctx)
-            enrichment_worker.run()
+            with EnrichmentWorker(ctx) as enrichment_worker:
+                enrichment_worker.run()
         except Exception as e:
             logger.warning("Enrichment worker background task failed: %s", e)
 
@@ -54,6 +54,7 @@ def prepare_write_config(
                     "use_full_context_window": options.use_full_context_window,
                     "max_windows": options.max_windows,
                     "checkpoint_enabled": options.resume,
+                    "batch_write": options.batch_write or base_config.pipeline.batch_write,
                 }
             ),
             "enrichment": base_config.enrichment.model_copy(update={"enabled": options.enable_enrichment}),
@@ -0,0 +1,192 @@
+"""Run enrichment for upcoming windows while the writer works on the current one.
+
+Enrichment used to be scheduled and drained right before each window's writer
+call, so every window paid for both in sequence. :class:`EnrichmentPrefetcher`
+schedules enrichment for windows ahead of the writer and drains the task queue
+on a background thread; a window only waits for the tasks scheduled for it.
+
+Scheduling reads the window tables and stays on the pipeline thread. The
+background worker gets its own cursor on the pipeline database (a DuckDB
+connection must not be shared between threads), so its task updates and
+enrichment rows are committed there and seen by the pipeline thread.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import dataclasses
+import logging
+import threading
+from typing import TYPE_CHECKING, Self
+
+import ibis
+
+from egregora.agents.enricher import EnrichmentRuntimeContext, EnrichmentWorker, schedule_enrichment
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.task_store import TaskStore
+from egregora.orchestration.context import PipelineContext
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from types import TracebackType
+
+    import ibis.expr.types as ir
+
+    from egregora.input_adapters.base import MediaMapping
+
+logger = logging.getLogger(__name__)
+
+# Stop scheduling further ahead while this many prefetched tasks are still queued.
+MAX_QUEUED_TASKS = 200
+POLL_INTERVAL = 0.2
+
+
+class EnrichmentPrefetcher:
+    """Schedules enrichment on the pipeline thread and runs it on a background thread."""
+
+    def __init__(
+        self,
+        ctx: PipelineContext,
+        *,
+        max_queued_tasks: int = MAX_QUEUED_TASKS,
+        poll_interval: float = POLL_INTERVAL,
+    ) -> None:
+        self.ctx = ctx
+        self.max_queued_tasks = max_queued_tasks
+        self.poll_interval = poll_interval
+        self._runtime = EnrichmentRuntimeContext(
+            cache=ctx.cache.enrichment,
+            output_sink=ctx.output_sink,
+            site_root=ctx.site_root,
+            usage_tracker=ctx.usage_tracker,
+            pii_prevention=None,
+            task_store=ctx.task_store,
+            url_index=ctx.url_index,
+        )
+        self._queued: set[str] = set()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._progress = threading.Condition()
+        self._passes = 0
+        self._thread: threading.Thread | None = None
+        self._worker_storage: DuckDBStorageManager | None = None
+
+    def __enter__(self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the background worker."""
+        with self.ctx.storage.connection() as conn:
+            cursor = conn.cursor()
+        self._worker_storage = DuckDBStorageManager.from_ibis_backend(
+            ibis.duckdb.from_connection(cursor), checkpoint_dir=self.ctx.storage.checkpoint_dir
+        )
+        source_key = self.ctx.task_store.source_key if self.ctx.task_store else None
+        worker_ctx = PipelineContext(
+            self.ctx.config_obj,
+            dataclasses.replace(
+                self.ctx.state,
+                storage=self._worker_storage,
+                task_store=TaskStore(self._worker_storage, source_key=source_key),
+            ),
+        )
+        self.ctx.state.enrichment_prefetcher = self
+        self._thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._drain, worker_ctx),
+            name="enrichment-prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def schedule(self, window_table: ir.Table, media_mapping: MediaMapping) -> list[str]:
+        """Schedule enrichment for a window and return the ids of its tasks."""
+        task_ids = schedule_enrichment(
+            window_table, media_mapping, self.ctx.config.enrichment, self._runtime, run_id=self.ctx.run_id
+        )
+        if task_ids:
+            self._queued.update(task_ids)
+            self._wake.set()
+        return task_ids
+
+    def saturated(self) -> bool:
+        """Whether enough prefetched work is queued that scheduling further ahead should wait."""
+        if len(self._queued) < self.max_queued_tasks or self.ctx.task_store is None:
+            return False
+        self._queued = self.ctx.task_store.pending_among(self._queued)
+        return len(self._queued) >= self.max_queued_tasks
+
+    def wait(self, task_ids: Iterable[str]) -> None:
+        """Block until the given tasks are no longer pending."""
+        remaining = set(task_ids)
+        task_store = self.ctx.task_store
+        if not remaining or task_store is None:
+            return
+        with self._progress:
+            started_at = self._passes
+        while remaining := task_store.pending_among(remaining):
+            if self._thread is None or not self._thread.is_alive():
+                logger.warning(
+                    "Enrichment prefetch worker stopped; enriching %d tasks inline", len(remaining)
+                )
+                _drain_inline(self.ctx)
+                return
+            with self._progress:
+                # A pass that began after these tasks were queued and still left them
+                # pending means the worker will not take them (e.g. enrichment disabled).
+                if self._passes >= started_at + 2:
+                    logger.warning("%d enrichment tasks were left pending by the worker", len(remaining))
+                    return
+                self._wake.set()
+                self._progress.wait(self.poll_interval)
+
+    def close(self) -> None:
+        """Stop the background worker once its current batch is done."""
+        if self.ctx.state.enrichment_prefetcher is self:
+            self.ctx.state.enrichment_prefetcher = None
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._worker_storage is not None:
+            self._worker_storage.close()
+            self._worker_storage = None
+
+    def _drain(self, worker_ctx: PipelineContext) -> None:
+        try:
+            with EnrichmentWorker(worker_ctx) as worker:
+                while not self._stop.is_set():
+                    self._wake.wait(self.poll_interval)
+                    self._wake.clear()
+                    while not self._stop.is_set() and worker.run():
+                        self._notify()
+                    with self._progress:
+                        self._passes += 1
+                        self._progress.notify_all()
+        except Exception:
+            logger.exception("Enrichment prefetch worker failed")
+        finally:
+            self._notify()
+
+    def _notify(self) -> None:
+        with self._progress:
+            self._progress.notify_all()
+
+
+def _drain_inline(ctx: PipelineContext) -> None:
+    with EnrichmentWorker(ctx) as worker:
+        while worker.run():
+            pass
+
+
+__all__ = ["MAX_QUEUED_TASKS", "EnrichmentPrefetcher"]
@@ -15,7 +15,7 @@ import logging
 import math
 import uuid
 from collections import deque
-from collections.abc import Iterator
+from collections.abc import Generator, Iterator
 from dataclasses import dataclass
 from datetime import date as date_type
 from datetime import timedelta
@@ -32,13 +32,17 @@ from egregora.config.settings import parse_date_arg, validate_timezone
 from egregora.data_primitives.document import OutputSink, UrlContext
 from egregora.input_adapters.whatsapp.commands import extract_commands, filter_egregora_messages
 from egregora.knowledge.profiles import filter_opted_out_authors, process_commands
+from egregora.llm.token_utils import get_token_counter
 from egregora.ops.media import process_media_for_window
 from egregora.orchestration.context import PipelineContext, PipelineRunParams
+from egregora.orchestration.pipelines.etl.enrichment_prefetch import EnrichmentPrefetcher
 from egregora.output_sinks import create_and_initialize_adapter
 from egregora.rag import index_documents, reset_backend
+from egregora.tracing import span, traced
 from egregora.transformations import (
     Window,
     WindowConfig,
+    WindowTokenIndex,
     create_windows,
     split_window_into_n_parts,
 )
@@ -64,6 +68,8 @@ class PreparedPipelineData:
     context: PipelineContext
     enable_enrichment: bool
     embedding_model: str
+    # Per-message token counts; windows are sized by message count without it
+    token_index: WindowTokenIndex | None = None
 
 
 @dataclass
@@ -271,8 +277,10 @@ def _parse_and_validate_source(
 
     """
     logger.info("[bold cyan]📦 Parsing with adapter:[/] %s", adapter.source_name)
-    messages_table = adapter.parse(input_path, timezone=timezone, output_adapter=output_adapter)
-    total_messages = messages_table.count().execute()
+    with span("pipeline.parse", adapter=adapter.source_name) as current:
+        messages_table = adapter.parse(input_path, timezone=timezone, output_adapter=output_adapter)
+        total_messages = messages_table.count().execute()
+        current.set_attribute("messages", total_messages)
     logger.info("[green]✅ Parsed[/] %s messages", total_messages)
 
     metadata = adapter.get_metadata(input_path)
@@ -281,6 +289,7 @@ def _parse_and_validate_source(
     return messages_table
 
 
+@traced("pipeline.prepare")
 def prepare_pipeline_data(
     adapter: InputAdapter,
     run_params: PipelineRunParams,
@@ -341,6 +350,10 @@ def prepare_pipeline_data(
         filter_options,
     )
 
+    if enable_enrichment and config.enrichment.enable_url and ctx.url_index is not None:
+        with span("pipeline.url_index"):
+            ctx.url_index.update(messages_table)
+
     logger.info("🎯 [bold cyan]Creating windows:[/] step_size=%s, unit=%s", step_size, step_unit)
     window_config = WindowConfig(
         step_size=step_size,
@@ -352,6 +365,10 @@ def prepare_pipeline_data(
         messages_table,
         config=window_config,
     )
+    token_counter = get_token_counter(config.pipeline.tokenizer)
+    with span("pipeline.token_index"):
+        token_index = WindowTokenIndex.build(messages_table, token_counter)
+    logger.info("Counted %d message tokens with %s", token_index.total_tokens, token_counter.name)
 
     # Update context with adapter
     ctx = ctx.with_adapter(adapter)
@@ -385,6 +402,7 @@ def prepare_pipeline_data(
         context=ctx,
         enable_enrichment=enable_enrichment,
         embedding_model=embedding_model,
+        token_index=token_index,
     )
 
 
@@ -402,6 +420,7 @@ def perform_enrichment(
         usage_tracker=context.usage_tracker,
         pii_prevention=None,
         task_store=context.task_store,
+        url_index=context.url_index,
     )
 
     schedule_enrichment(
@@ -450,31 +469,78 @@ def _extract_adapter_info(ctx: PipelineContext) -> tuple[str, str]:
     return (summary or "").strip(), (instructions or "").strip()
 
 
-def _calculate_max_window_size(config: EgregoraConfig) -> int:
-    """Calculate maximum window size based on LLM context window."""
+def _max_prompt_tokens(config: EgregoraConfig) -> int:
     use_full_window = getattr(config.pipeline, "use_full_context_window", False)
-    # Corresponds to a 1M token context window, expressed in characters
+    # Corresponds to a 1M token context window
     full_context_window_size = 1_048_576
+    return full_context_window_size if use_full_window else config.pipeline.max_prompt_tokens
 
-    max_tokens = full_context_window_size if use_full_window else config.pipeline.max_prompt_tokens
 
+def _calculate_max_window_size(config: EgregoraConfig) -> int:
+    """Calculate maximum window size (in messages) based on LLM context window."""
     avg_tokens_per_message = PipelineDefaults.AVG_TOKENS_PER_MESSAGE
     buffer_ratio = PipelineDefaults.BUFFER_RATIO
-    return int((max_tokens * buffer_ratio) / avg_tokens_per_message)
+    return int((_max_prompt_tokens(config) * buffer_ratio) / avg_tokens_per_message)
+
 
+def _calculate_max_window_tokens(config: EgregoraConfig) -> int:
+    """Calculate the conversation token budget of a window, leaving room for the rest of the prompt."""
+    return int(_max_prompt_tokens(config) * PipelineDefaults.BUFFER_RATIO)
 
-def get_pending_conversations(dataset: PreparedPipelineData) -> Iterator[Conversation]:
+
+def get_pending_conversations(dataset: PreparedPipelineData) -> Generator[Conversation]:
     """Yield prepared conversations ready for processing.
 
     This generator handles:
     1. Window iteration
-    2. Size validation and splitting (heuristic)
+    2. Size validation and splitting (by token count)
     3. Media processing
     4. Enrichment
     5. Command extraction (partial)
+
+    With ``enrichment.prefetch_windows`` set, enrichment for the next windows is
+    scheduled ahead and runs in the background while the caller writes the
+    current one; each conversation is yielded once its own tasks are done.
     """
     ctx = dataset.context
-    max_window_size = _calculate_max_window_size(ctx.config)
+    windows = _iter_sized_windows(dataset)
+    prefetch_windows = ctx.config.enrichment.prefetch_windows if dataset.enable_enrichment else 0
+    if prefetch_windows <= 0:
+        for window, depth in windows:
+            window_table, media_mapping = _process_window_media(dataset, window)
+            if dataset.enable_enrichment:
+                window_table = perform_enrichment(ctx, window_table, media_mapping)
+            yield _make_conversation(ctx, window, depth, window_table, media_mapping)
+        return
+
+    with EnrichmentPrefetcher(ctx) as prefetcher:
+        ahead: deque[tuple[Window, int, ir.Table, MediaMapping, list[str]]] = deque()
+
+        def next_ready() -> Conversation:
+            window, depth, window_table, media_mapping, task_ids = ahead.popleft()
+            with span("pipeline.enrichment_wait"):
+                prefetcher.wait(task_ids)
+            return _make_conversation(ctx, window, depth, window_table, media_mapping)
+
+        for window, depth in windows:
+            # Back-pressure: hand out the oldest window before scheduling further ahead.
+            while ahead and (len(ahead) > prefetch_windows or prefetcher.saturated()):
+                yield next_ready()
+            window_table, media_mapping = _process_window_media(dataset, window)
+            task_ids = prefetcher.schedule(window_table, media_mapping)
+            ahead.append((window, depth, window_table, media_mapping, task_ids))
+        while ahead:
+            yield next_ready()
+
+
+def _iter_sized_windows(dataset: PreparedPipelineData) -> Iterator[tuple[Window, int]]:
+    """Yield ``(window, split depth)`` pairs, splitting windows too large for the writer."""
+    ctx = dataset.context
+    token_index = dataset.token_index
+    if token_index is not None:
+        max_window_size, size_unit = _calculate_max_window_tokens(ctx.config), "tokens"
+    else:
+        max_window_size, size_unit = _calculate_max_window_size(ctx.config), "messages"
 
     # Use a queue to handle splitting
     # Each item is (window, depth)
@@ -495,16 +561,18 @@ def get_pending_conversations(dataset: PreparedPipelineData) -> Iterator[Convers
 
         window, depth = queue.popleft()
 
-        # Heuristic splitting check
-        if window.size > max_window_size and depth < max_depth:
-            # Too big, split immediately based on heuristic
+        # Size check: real token counts when available, message count otherwise
+        window_size = token_index.tokens_in(window) if token_index is not None else window.size
+        if window_size > max_window_size and depth < max_depth:
+            # Too big, split before spending a writer call on it
             logger.info(
-                "Window %d too large (%d > %d), splitting...",
+                "Window %d too large (%d > %d %s), splitting...",
                 window.window_index,
-                window.size,
+                window_size,
                 max_window_size,
+                size_unit,
             )
-            num_splits = max(2, math.ceil(window.size / max_window_size))
+            num_splits = max(2, math.ceil(window_size / max_window_size))
             split_windows = split_window_into_n_parts(window, num_splits)
             # Add back to front of queue
             queue.extendleft(reversed([(w, depth + 1) for w in split_windows]))
@@ -513,45 +581,51 @@ def get_pending_conversations(dataset: PreparedPipelineData) -> Iterator[Convers
         if window.size < min_window_size and depth > 0:
             logger.warning("Window too small after split (%d messages), attempting anyway", window.size)
 
-        # ETL Step 1: Media Processing
-        output_sink = ctx.output_sink
-        if output_sink is None:
-            # Should not happen if dataset is prepared correctly
-            msg = "Output sink not initialized"
-            raise ValueError(msg)
-
-        url_context = ctx.url_context or UrlContext()
-        window_table_processed, media_mapping = process_media_for_window(
-            window_table=window.table,
-            adapter=ctx.adapter,
-            url_convention=output_sink.url_convention,
-            url_context=url_context,
-            zip_path=ctx.input_path,
-        )
-
-        # Persist media if enrichment disabled (otherwise enrichment handles it/updates it)
-        if media_mapping and not dataset.enable_enrichment:
-            for media_doc in media_mapping.values():
-                try:
-                    output_sink.persist(media_doc)
-                except Exception as e:
-                    logger.exception("Failed to write media file: %s", e)
-
-        # ETL Step 2: Enrichment
-        if dataset.enable_enrichment:
-            enriched_table = perform_enrichment(ctx, window_table_processed, media_mapping)
-        else:
-            enriched_table = window_table_processed
-
-        # Prepare metadata
-        adapter_info = _extract_adapter_info(ctx)
-
-        yield Conversation(
-            window=window,
-            messages_table=enriched_table,
-            media_mapping=media_mapping,
-            context=ctx,
-            adapter_info=adapter_info,
-            depth=depth,
-        )
+        yield window, depth
         processed_count += 1
+
+
+def _process_window_media(dataset: PreparedPipelineData, window: Window) -> tuple[ir.Table, MediaMapping]:
+    """ETL Step 1: rewrite media references and collect the window's media."""
+    ctx = dataset.context
+    output_sink = ctx.output_sink
+    if output_sink is None:
+        # Should not happen if dataset is prepared correctly
+        msg = "Output sink not initialized"
+        raise ValueError(msg)
+
+    url_context = ctx.url_context or UrlContext()
+    window_table_processed, media_mapping = process_media_for_window(
+        window_table=window.table,
+        adapter=ctx.adapter,
+        url_convention=output_sink.url_convention,
+        url_context=url_context,
+        zip_path=ctx.input_path,
+    )
+
+    # Persist media if enrichment disabled (otherwise enrichment handles it/updates it)
+    if media_mapping and not dataset.enable_enrichment:
+        for media_doc in media_mapping.values():
+            try:
+                output_sink.persist(media_doc)
+            except Exception as e:
+                logger.exception("Failed to write media file: %s", e)
+
+    return window_table_processed, media_mapping
+
+
+def _make_conversation(
+    ctx: PipelineContext,
+    window: Window,
+    depth: int,
+    messages_table: ir.Table,
+    media_mapping: MediaMapping,
+) -> Conversation:
+    return Conversation(
+        window=window,
+        messages_table=messages_table,
+        media_mapping=media_mapping,
+        context=ctx,
+        adapter_info=_extract_adapter_info(ctx),
+        depth=depth,
+    )
@@ -6,18 +6,28 @@ This module handles:
 - Site path resolution and initialization
 - API key validation
 - Global rate limiter initialization
+
+Several pipelines may run in one process at the same time (one per source,
+see ``egregora write --parallel-sources``). Provisioning is therefore
+serialized, and the Ibis default backend is resolved per thread so each run
+executes unbound expressions on its own connection.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import sqlite3
+import threading
 from collections.abc import Iterator
 from contextlib import contextmanager, suppress
+from contextvars import ContextVar
+from hashlib import sha256
 from pathlib import Path
 from typing import Any, cast
 from urllib.parse import urlparse
 
+import diskcache
 import ibis
 from google import genai
 from google.genai import types
@@ -30,9 +40,11 @@ from egregora.data_primitives.document import UrlContext
 from egregora.database import initialize_database
 from egregora.database.duckdb_manager import DuckDBStorageManager
 from egregora.database.task_store import TaskStore
+from egregora.database.url_index import UrlCandidateIndex
 from egregora.database.utils import resolve_db_uri
 from egregora.llm.api_keys import get_google_api_keys, validate_gemini_api_key
-from egregora.llm.rate_limit import init_rate_limiter
+from egregora.llm.providers.genai_clients import genai_client_session
+from egregora.llm.rate_limit import init_adaptive_rate_limits, init_rate_limiter
 from egregora.llm.usage import UsageTracker
 from egregora.orchestration.cache import PipelineCache
 from egregora.orchestration.context import PipelineConfig, PipelineContext, PipelineRunParams, PipelineState
@@ -54,6 +66,19 @@ except ImportError:
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Successful key validations are remembered for this long (seconds).
+# Override with EGREGORA_API_KEY_VALIDATION_TTL; 0 always re-validates.
+API_KEY_VALIDATION_TTL = 24 * 60 * 60
+
+# Database creation/migration and table bootstrapping take catalog locks that
+# conflict when two runs do them at once, so they happen one run at a time.
+_provision_lock = threading.Lock()
+
+# Backend of the pipeline running in the current context (thread), used for
+# expressions that are not bound to a backend (e.g. ``ibis.memtable``).
+_pipeline_backend: ContextVar[Any] = ContextVar("egregora_pipeline_backend", default=None)
+_active_pipelines = 0
+
 
 def _load_dotenv_if_available(output_dir: Path) -> None:
     if dotenv:
@@ -72,9 +97,13 @@ def ensure_site_initialized(output_dir: Path) -> None:
         scaffolder.scaffold_site(output_dir, site_name=output_dir.name)
 
 
-def validate_api_key(output_dir: Path) -> None:
+def validate_api_key(output_dir: Path, *, cache_dir: Path | None = None) -> None:
     """Validate that API key is set and valid.
 
+    With ``cache_dir``, a successful validation is remembered there (by key
+    fingerprint, never the key itself) for :data:`API_KEY_VALIDATION_TTL`
+    seconds, so back-to-back runs skip the network round trip.
+
     Raises:
         ApiKeyNotFoundError: If no API key is found.
         ApiKeyInvalidError: If no valid API key is found among candidates.
@@ -102,25 +131,69 @@ def validate_api_key(output_dir: Path) -> None:
             os.environ["GOOGLE_API_KEY"] = api_keys[0]
         return
 
-    console.print("[cyan]Validating Gemini API key...[/cyan]")
-    validation_errors: list[str] = []
-    for key in api_keys:
-        try:
-            validate_gemini_api_key(key)
-            if not os.environ.get("GOOGLE_API_KEY"):
-                os.environ["GOOGLE_API_KEY"] = key
-            console.print("[green]✓ API key validated successfully[/green]")
-            return
-        except ValueError as e:
-            validation_errors.append(str(e))
-        except ImportError as e:
-            msg = f"Import error validating key: {e}"
-            raise ApiKeyInvalidError(msg, validation_errors=[str(e)]) from e
+    ttl = _api_key_validation_ttl()
+    with _api_key_validation_cache(cache_dir if ttl > 0 else None) as cache:
+        for key in api_keys:
+            if cache is not None and cache.get(_key_fingerprint(key)):
+                if not os.environ.get("GOOGLE_API_KEY"):
+                    os.environ["GOOGLE_API_KEY"] = key
+                console.print("[green]✓ API key validated (cached)[/green]")
+                return
+
+        console.print("[cyan]Validating Gemini API key...[/cyan]")
+        validation_errors: list[str] = []
+        for key in api_keys:
+            try:
+                validate_gemini_api_key(key)
+                if not os.environ.get("GOOGLE_API_KEY"):
+                    os.environ["GOOGLE_API_KEY"] = key
+                if cache is not None:
+                    cache.set(_key_fingerprint(key), value=True, expire=ttl)
+                console.print("[green]✓ API key validated successfully[/green]")
+                return
+            except ValueError as e:
+                validation_errors.append(str(e))
+            except ImportError as e:
+                msg = f"Import error validating key: {e}"
+                raise ApiKeyInvalidError(msg, validation_errors=[str(e)]) from e
 
     msg = "No valid API key found"
     raise ApiKeyInvalidError(msg, validation_errors=validation_errors)
 
 
+def _api_key_validation_ttl() -> float:
+    raw = os.getenv("EGREGORA_API_KEY_VALIDATION_TTL", "").strip()
+    if not raw:
+        return API_KEY_VALIDATION_TTL
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        logger.warning("Ignoring invalid EGREGORA_API_KEY_VALIDATION_TTL=%r", raw)
+        return API_KEY_VALIDATION_TTL
+
+
+def _key_fingerprint(api_key: str) -> str:
+    return sha256(api_key.encode()).hexdigest()
+
+
+@contextmanager
+def _api_key_validation_cache(cache_dir: Path | None) -> Iterator[diskcache.Cache | None]:
+    """Open the key-validation cache; a broken cache just means no caching."""
+    if cache_dir is None:
+        yield None
+        return
+    try:
+        cache = diskcache.Cache(str(cache_dir / "api_keys"))
+    except (OSError, sqlite3.Error) as e:
+        logger.debug("API key validation cache unavailable: %s", e)
+        yield None
+        return
+    try:
+        yield cache
+    finally:
+        cache.close()
+
+
 def _resolve_pipeline_site_paths(output_dir: Path, config: EgregoraConfig) -> MkDocsPaths:
     """Resolve site paths for the configured output format."""
     output_dir = output_dir.expanduser().resolve()
@@ -230,11 +303,21 @@ def _get_safety_settings() -> list[types.SafetySetting]:
 
 
 def _init_global_rate_limiter(quota_config: Any) -> None:
-    """Initialize the global rate limiter."""
+    """Initialize the global rate limiter and the per-model/key adaptive limiters."""
+    adaptive = getattr(quota_config, "adaptive_rate_limit", False)
+    # Adaptive limiters start at per_second_limit and move with provider feedback;
+    # the global limiter then only caps concurrency and the overall ceiling.
+    ceiling = quota_config.max_per_second_limit if adaptive else quota_config.per_second_limit
     init_rate_limiter(
-        requests_per_second=quota_config.per_second_limit,
+        requests_per_second=ceiling,
         max_concurrency=quota_config.concurrency,
     )
+    init_adaptive_rate_limits(
+        initial_rps=quota_config.per_second_limit,
+        max_rps=ceiling,
+        tokens_per_minute=getattr(quota_config, "tokens_per_minute", None),
+        adaptive=adaptive,
+    )
 
 
 def _create_pipeline_context(run_params: PipelineRunParams) -> tuple[PipelineContext, Any]:
@@ -263,7 +346,7 @@ def _create_pipeline_context(run_params: PipelineRunParams) -> tuple[PipelineCon
     annotations_store = AnnotationStore(storage)
 
     # Initialize TaskStore for async operations
-    task_store = TaskStore(storage)
+    task_store = TaskStore(storage, source_key=run_params.source_key)
 
     _init_global_rate_limiter(run_params.config.quota)
 
@@ -302,6 +385,7 @@ def _create_pipeline_context(run_params: PipelineRunParams) -> tuple[PipelineCon
 
     # Inject TaskStore into state/context
     state.task_store = task_store
+    state.url_index = UrlCandidateIndex(storage, source_key=run_params.source_key)
 
     # Inject ErrorBoundary
     state.error_boundary = DefaultErrorBoundary()
@@ -352,15 +436,15 @@ def create_output_adapter(
 @contextmanager
 def pipeline_environment(run_params: PipelineRunParams) -> Iterator[PipelineContext]:
     """Context manager that provisions and tears down pipeline resources."""
-    options = getattr(ibis, "options", None)
-    old_backend = getattr(options, "default_backend", None) if options else None
-    ctx, pipeline_backend = _create_pipeline_context(run_params)
-
-    if options is not None:
-        options.default_backend = pipeline_backend
+    with _provision_lock:
+        ctx, pipeline_backend = _create_pipeline_context(run_params)
+    backend_token = _push_default_backend(pipeline_backend)
 
     try:
-        yield ctx
+        # Enrichment, banners and batch jobs share pooled Gemini clients; the
+        # pool closes them when the last running pipeline finishes.
+        with genai_client_session():
+            yield ctx
     finally:
         # Explicitly close the GenAI client to prevent "Event loop is closed" errors
         # caused by unclosed async resources in httpcore/anyio during shutdown
@@ -371,14 +455,69 @@ def pipeline_environment(run_params: PipelineRunParams) -> Iterator[PipelineCont
                     # Best effort cleanup, ignore errors
                     client_close()
 
+        # Input adapters may keep the export open (WhatsApp's ZIP handle) for media delivery
+        if ctx.state.adapter is not None:
+            with suppress(Exception):
+                ctx.state.adapter.close()
+
         try:
             ctx.cache.close()
         finally:
-            if options is not None:
-                options.default_backend = old_backend
+            _pop_default_backend(backend_token)
 
             backend_close = getattr(pipeline_backend, "close", None)
             if callable(backend_close):
                 backend_close()
             elif hasattr(pipeline_backend, "con") and hasattr(pipeline_backend.con, "close"):
                 pipeline_backend.con.close()
+
+
+class _ContextDefaultBackend:
+    """Stand-in for ``ibis.options.default_backend`` while pipelines run.
+
+    Ibis has a single, process-wide default backend. Pipelines for several
+    sources can run side by side in threads, each with its own DuckDB
+    connection, so the default is resolved per context instead: a thread
+    running a pipeline gets that pipeline's backend, anything else gets the
+    default that was configured before.
+    """
+
+    def __init__(self, fallback: Any) -> None:
+        self.fallback = fallback
+
+    def _resolve(self) -> Any:
+        backend = _pipeline_backend.get()
+        if backend is not None:
+            return backend
+        if self.fallback is None:
+            self.fallback = ibis.duckdb.connect(":memory:")
+        return self.fallback
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._resolve(), name)
+
+
+def _push_default_backend(backend: Any) -> Any:
+    """Make ``backend`` the Ibis default for this context while its pipeline runs."""
+    global _active_pipelines
+    options = getattr(ibis, "options", None)
+    if options is not None:
+        with _provision_lock:
+            if not isinstance(options.default_backend, _ContextDefaultBackend):
+                options.default_backend = _ContextDefaultBackend(options.default_backend)
+            _active_pipelines += 1
+    return _pipeline_backend.set(backend)
+
+
+def _pop_default_backend(token: Any) -> None:
+    """Undo :func:`_push_default_backend`; the last pipeline restores the original default."""
+    global _active_pipelines
+    _pipeline_backend.reset(token)
+    options = getattr(ibis, "options", None)
+    if options is None:
+        return
+    with _provision_lock:
+        _active_pipelines -= 1
+        default = options.default_backend
+        if not _active_pipelines and isinstance(default, _ContextDefaultBackend):
+            options.default_backend = default.fallback
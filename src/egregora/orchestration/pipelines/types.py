@@ -39,6 +39,7 @@ class WriteCommandOptions:
     refresh: str | None
     force: bool
     debug: bool
+    batch_write: bool = False
 
 
 @dataclass(frozen=True)
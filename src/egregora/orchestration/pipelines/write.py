@@ -11,10 +11,15 @@ This module orchestrates the high-level flow for the 'write' command, coordinati
 
 from __future__ import annotations
 
+import contextlib
 import logging
+import threading
+from collections.abc import Iterable
 from datetime import datetime
 from typing import Any, cast
 
+import duckdb
+from ibis.common.exceptions import IbisError
 from rich.console import Console
 
 from egregora.agents.commands import command_to_announcement, filter_commands
@@ -22,11 +27,14 @@ from egregora.agents.commands import extract_commands as extract_commands_list
 from egregora.agents.formatting import build_conversation_xml
 from egregora.agents.profile.generator import generate_profile_posts
 from egregora.agents.types import Message, WriterResources
-from egregora.agents.writer import WindowProcessingParams, write_posts_for_window
+from egregora.agents.writer import WindowProcessingParams, submit_writer_batch, write_posts_for_window
+from egregora.agents.writer_batch import WriterBatch
 from egregora.data_primitives.document import Document
+from egregora.database.run_store import RunStore
 from egregora.database.utils import convert_ibis_table_to_list
 from egregora.input_adapters import ADAPTER_REGISTRY
 from egregora.input_adapters.exceptions import UnknownAdapterError
+from egregora.llm.rate_limit import get_adaptive_registry
 from egregora.orchestration.context import PipelineContext, PipelineRunParams
 from egregora.orchestration.error_boundary import DefaultErrorBoundary
 from egregora.orchestration.exceptions import (
@@ -46,11 +54,16 @@ from egregora.orchestration.pipelines.etl.preparation import (
 )
 from egregora.orchestration.pipelines.etl.setup import pipeline_environment
 from egregora.resources.prompts import PromptManager
+from egregora.tracing import StageTimingCollector, collecting_spans, current_span, span, traced
 from egregora.transformations.windowing import generate_window_signature
 
 logger = logging.getLogger(__name__)
 console = Console()
 
+# Site-wide pages are rebuilt from the whole database; sources running in
+# parallel must not rewrite them at the same time.
+_site_pages_lock = threading.Lock()
+
 __all__ = ["run"]
 
 
@@ -115,30 +128,56 @@ def _prepare_messages(
     return clean_messages_list, messages_dtos
 
 
-def _run_writer_agent(
-    ctx: PipelineContext,
-    conversation: Conversation,
-    messages_dtos: list[Message],
-    clean_messages_list: list[dict[str, Any]],
-) -> tuple[list[Any], list[str]]:
-    """Execute writer agent and persist posts."""
-    resources = WriterResources.from_pipeline_context(ctx)
-
-    params = WindowProcessingParams(
+def _window_params(
+    ctx: PipelineContext, conversation: Conversation, messages_dtos: list[Message]
+) -> WindowProcessingParams:
+    return WindowProcessingParams(
         table=conversation.messages_table,
         messages=messages_dtos,
         window_start=conversation.window.start_time,
         window_end=conversation.window.end_time,
-        resources=resources,
+        resources=WriterResources.from_pipeline_context(ctx),
         config=ctx.config,
         cache=ctx.cache,
         adapter_content_summary=conversation.adapter_info[0],
         adapter_generation_instructions=conversation.adapter_info[1],
         run_id=str(ctx.run_id) if ctx.run_id else None,
         smoke_test=ctx.state.smoke_test,
+        batch_responses=ctx.state.writer_batch_responses,
     )
 
-    writer_result = write_posts_for_window(params)
+
+@traced("pipeline.writer_batch")
+def _submit_writer_batch(ctx: PipelineContext, conversations: list[Conversation]) -> WriterBatch | None:
+    """Batch write mode: answer the first writer turn of all pending windows in one job."""
+    windows = []
+    for conversation in conversations:
+        messages_list = convert_ibis_table_to_list(conversation.messages_table)
+        is_processed, _ = _check_window_processed(
+            ctx, messages_list, conversation.window.start_time, conversation.window.end_time
+        )
+        if not is_processed:
+            _, messages_dtos = _prepare_messages(messages_list)
+            windows.append(_window_params(ctx, conversation, messages_dtos))
+
+    batch = submit_writer_batch(windows, ctx.task_store)
+    if batch is not None:
+        ctx.state.writer_batch_responses.update(batch.responses)
+        logger.info(
+            "[bold cyan]📦 Writer batch answered %d of %d windows[/]", len(batch.responses), len(windows)
+        )
+    return batch
+
+
+@traced("pipeline.writer")
+def _run_writer_agent(
+    ctx: PipelineContext,
+    conversation: Conversation,
+    messages_dtos: list[Message],
+    clean_messages_list: list[dict[str, Any]],
+) -> tuple[list[Any], list[str]]:
+    """Execute writer agent and persist posts."""
+    writer_result = write_posts_for_window(_window_params(ctx, conversation, messages_dtos))
     posts = writer_result.get("posts", [])
     # Writer might return profile IDs, though currently it seems generate_profile_posts is separate
     # but `writer_result` dict has "profiles" key.
@@ -163,6 +202,7 @@ def _run_writer_agent(
     return posts, initial_profiles
 
 
+@traced("pipeline.profile")
 def _run_profile_agent(
     ctx: PipelineContext,
     clean_messages_list: list[dict[str, Any]],
@@ -190,6 +230,7 @@ def _run_profile_agent(
     return profiles
 
 
+@traced("pipeline.journal")
 def _persist_journal_entry(
     ctx: PipelineContext,
     signature: str,
@@ -214,11 +255,13 @@ def _persist_journal_entry(
         logger.warning("Failed to persist JOURNAL for window %s: %s", window_label, e)
 
 
+@traced("pipeline.process_item")
 def process_item(conversation: Conversation) -> dict[str, dict[str, list[str]]]:
     """Execute the agent on an isolated conversation item."""
     ctx = conversation.context
     error_boundary = ctx.error_boundary or DefaultErrorBoundary()
     window_label = f"{conversation.window.start_time:%Y-%m-%d %H:%M} to {conversation.window.end_time:%H:%M}"
+    current_span().set_attribute("window", window_label)
 
     # Convert table to list
     messages_list = convert_ibis_table_to_list(conversation.messages_table)
@@ -258,7 +301,8 @@ def process_item(conversation: Conversation) -> dict[str, dict[str, list[str]]]:
 
     # Process background tasks
     try:
-        process_background_tasks(ctx)
+        with span("pipeline.background_tasks"):
+            process_background_tasks(ctx)
     except Exception as e:
         error_boundary.handle_enrichment_error(e, window_label)
 
@@ -280,6 +324,7 @@ def process_item(conversation: Conversation) -> dict[str, dict[str, list[str]]]:
     return {window_label: {"posts": posts, "profiles": profiles}}
 
 
+@traced("pipeline.run")
 def run(run_params: PipelineRunParams) -> dict[str, dict[str, list[str]]]:
     """Run the complete write pipeline workflow.
 
@@ -291,6 +336,7 @@ def run(run_params: PipelineRunParams) -> dict[str, dict[str, list[str]]]:
 
     """
     logger.info("[bold cyan]🚀 Starting pipeline for source:[/] %s", run_params.source_type)
+    current_span().set_attribute("source", run_params.source_type)
 
     # Create adapter with config for privacy settings
     # Instead of using singleton from registry, instantiate with config
@@ -306,38 +352,131 @@ def run(run_params: PipelineRunParams) -> dict[str, dict[str, list[str]]]:
         adapter = adapter_cls()
 
     with pipeline_environment(run_params) as ctx:
+        run_store = _start_run_record(ctx, run_params)
+        collector = StageTimingCollector()
+        results: dict[str, dict[str, list[str]]] = {}
         try:
-            dataset = prepare_pipeline_data(adapter, run_params, ctx)
-
-            results = {}
-            max_processed_timestamp: datetime | None = None
+            with collecting_spans(collector):
+                dataset = prepare_pipeline_data(adapter, run_params, ctx)
+
+                max_processed_timestamp: datetime | None = None
+
+                # Closed explicitly so background enrichment stops before the storage does.
+                with contextlib.closing(get_pending_conversations(dataset)) as pending:
+                    conversations: Iterable[Conversation] = pending
+                    writer_batch = None
+                    if ctx.config.pipeline.batch_write:
+                        conversations = list(conversations)
+                        writer_batch = _submit_writer_batch(ctx, conversations)
+
+                    # New simplified loop: Iterator (ETL) -> Process (Execution)
+                    for conversation in conversations:
+                        item_results = process_item(conversation)
+                        results.update(item_results)
+
+                        # Track max timestamp for checkpoint
+                        if (
+                            max_processed_timestamp is None
+                            or conversation.window.end_time > max_processed_timestamp
+                        ):
+                            max_processed_timestamp = conversation.window.end_time
+
+                if writer_batch is not None:
+                    writer_batch.complete()
+
+                with span("pipeline.taxonomy"):
+                    generate_taxonomy_task(dataset)
+
+                # Final pass for any lingering background tasks
+                with span("pipeline.background_tasks", final=True):
+                    process_background_tasks(dataset.context)
+
+                # Regenerate tags page with word cloud visualization
+                if hasattr(dataset.context.output_sink, "regenerate_tags_page"):
+                    try:
+                        logger.info("[bold cyan]🏷️  Regenerating tags page with word cloud...[/]")
+                        with span("site.regenerate_tags"), _site_pages_lock:
+                            dataset.context.output_sink.regenerate_tags_page()
+                    except (OSError, AttributeError, TypeError) as e:
+                        logger.warning("Failed to regenerate tags page: %s", e)
+
+            _log_rate_limit_metrics()
+            logger.info("[bold green]🎉 Pipeline completed successfully![/]")
 
-            # New simplified loop: Iterator (ETL) -> Process (Execution)
-            for conversation in get_pending_conversations(dataset):
-                item_results = process_item(conversation)
-                results.update(item_results)
+        except KeyboardInterrupt:
+            logger.warning("[yellow]⚠️  Pipeline cancelled by user (Ctrl+C)[/]")
+            _finish_run_record(run_store, ctx, collector, results, status="cancelled")
+            raise  # Re-raise to allow proper cleanup
+        except Exception as exc:
+            _finish_run_record(run_store, ctx, collector, results, status="failed", error=exc)
+            raise
 
-                # Track max timestamp for checkpoint
-                if max_processed_timestamp is None or conversation.window.end_time > max_processed_timestamp:
-                    max_processed_timestamp = conversation.window.end_time
+        _finish_run_record(run_store, ctx, collector, results, status="completed")
+        return results
 
-            generate_taxonomy_task(dataset)
 
-            # Final pass for any lingering background tasks
-            process_background_tasks(dataset.context)
+def _log_rate_limit_metrics() -> None:
+    """Log where each model/key's adaptive rate limit ended up."""
+    for metrics in get_adaptive_registry().snapshot():
+        if metrics.requests:
+            logger.info("Rate limit %s", metrics.describe())
 
-            # Regenerate tags page with word cloud visualization
-            if hasattr(dataset.context.output_sink, "regenerate_tags_page"):
-                try:
-                    logger.info("[bold cyan]🏷️  Regenerating tags page with word cloud...[/]")
-                    dataset.context.output_sink.regenerate_tags_page()
-                except (OSError, AttributeError, TypeError) as e:
-                    logger.warning("Failed to regenerate tags page: %s", e)
 
-            logger.info("[bold green]🎉 Pipeline completed successfully![/]")
+def _start_run_record(ctx: PipelineContext, run_params: PipelineRunParams) -> RunStore | None:
+    """Open the run ledger entry; ledger problems never fail the pipeline."""
+    config = run_params.config
+    try:
+        run_store = RunStore(ctx.storage)
+        run_store.start_run(
+            str(ctx.run_id),
+            source_type=run_params.source_type,
+            source_key=run_params.source_key,
+            input_path=str(run_params.input_path),
+            parameters={
+                "pipeline": config.pipeline.model_dump(mode="json"),
+                "models": config.models.model_dump(mode="json"),
+                "enrichment_enabled": config.enrichment.enabled,
+                "refresh": run_params.refresh,
+                "smoke_test": run_params.smoke_test,
+            },
+            started_at=ctx.start_time,
+        )
+    except (duckdb.Error, IbisError) as e:
+        logger.warning("Could not record run in the run ledger: %s", e)
+        return None
+    return run_store
 
-        except KeyboardInterrupt:
-            logger.warning("[yellow]⚠️  Pipeline cancelled by user (Ctrl+C)[/]")
-            raise  # Re-raise to allow proper cleanup
 
-        return results
+def _finish_run_record(
+    run_store: RunStore | None,
+    ctx: PipelineContext,
+    collector: StageTimingCollector,
+    results: dict[str, dict[str, list[str]]],
+    *,
+    status: str,
+    error: BaseException | None = None,
+) -> None:
+    if run_store is None:
+        return
+    run_id = str(ctx.run_id)
+    try:
+        run_store.record_stages(run_id, collector)
+        run_store.finish_run(
+            run_id,
+            status=status,
+            windows=len(results),
+            posts=sum(len(item.get("posts", [])) for item in results.values()),
+            profiles=sum(len(item.get("profiles", [])) for item in results.values()),
+            usage=ctx.usage_tracker,
+            task_counts=run_store.count_tasks_since(
+                ctx.start_time, source_key=ctx.task_store.source_key if ctx.task_store else None
+            ),
+            failures=sum(
+                timing.failures
+                for stage, timing in collector.stages.items()
+                if stage.startswith(("pipeline.", "worker."))
+            ),
+            error=f"{type(error).__name__}: {error}" if error is not None else None,
+        )
+    except (duckdb.Error, IbisError) as e:
+        logger.warning("Could not finalize run %s in the run ledger: %s", run_id, e)
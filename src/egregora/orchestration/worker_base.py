@@ -5,6 +5,8 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import Any, Protocol
 
+from egregora.tracing import traced
+
 
 class WorkerContext(Protocol):
     """Protocol for context required by workers."""
@@ -24,6 +26,12 @@ class BaseWorker(ABC):
             raise ValueError(msg)
         self.task_store = task_store
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # Every concrete worker's run() shows up as its own span in traces.
+        if "run" in cls.__dict__:
+            cls.run = traced(f"worker.{cls.__name__}.run")(cls.__dict__["run"])
+
     @abstractmethod
     def run(self) -> int:
         """Process pending tasks. Returns number of tasks processed."""
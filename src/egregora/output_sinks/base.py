@@ -46,6 +46,15 @@ class SiteConfiguration:
     additional_paths: dict[str, Path] | None = None
 
 
+@dataclass(frozen=True)
+class RenderedDocument:
+    """A document rendered to its final bytes, ready to be written to ``path``."""
+
+    path: Path
+    payload: bytes
+    authors: tuple[str, ...] = ()
+
+
 class BaseOutputSink(OutputSink, ABC):
     """Abstract base class for output formats focused on document IO.
 
@@ -20,10 +20,7 @@ from egregora.data_primitives.document import (
 )
 from egregora.database.repository import ContentRepository
 from egregora.output_sinks.conventions import StandardUrlConvention
-from egregora.output_sinks.exceptions import (
-    DocumentIterationError,
-    DocumentNotFoundError,
-)
+from egregora.output_sinks.exceptions import DocumentNotFoundError
 
 
 class DbOutputSink(OutputSink):
@@ -89,29 +86,8 @@ class DbOutputSink(OutputSink):
             )
 
     def documents(self) -> Iterator[Document]:
-        """Iterate all documents."""
-        # Use repository.get_all which streams from view
-        # We assume get_all returns rows that allow us to fetch/reconstruct.
-        # However, for robustness and since get_all returns generic view rows (subset of columns),
-        # we should iterate per-type via list() which returns metadata, then fetch full docs.
-        # This is slower but safer for materialization.
-
-        # Iterate through all known types in the sink
-        known_types = [
-            DocumentType.POST,
-            DocumentType.PROFILE,
-            DocumentType.JOURNAL,
-            DocumentType.MEDIA,
-            DocumentType.ANNOTATION,
-        ]
-
-        for dtype in known_types:
-            for meta in self.list(dtype):
-                try:
-                    doc = self.get(dtype, meta.identifier)
-                    yield doc
-                except DocumentNotFoundError as e:
-                    raise DocumentIterationError(doc_type=e.doc_type, identifier=e.identifier) from e
+        """Iterate all documents with a single streaming query."""
+        yield from self.repository.iter_documents()
 
     def get_format_instructions(self) -> str:
         return "Database persistence mode."
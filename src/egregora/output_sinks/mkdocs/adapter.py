@@ -33,7 +33,7 @@ from egregora.data_primitives.document import (
 from egregora.data_primitives.text import slugify
 from egregora.database.protocols import StorageProtocol
 from egregora.knowledge.profiles import generate_fallback_avatar_url
-from egregora.output_sinks.base import BaseOutputSink, SiteConfiguration
+from egregora.output_sinks.base import BaseOutputSink, RenderedDocument, SiteConfiguration
 from egregora.output_sinks.conventions import RouteConfig, StandardUrlConvention
 from egregora.output_sinks.exceptions import (
     AdapterNotInitializedError,
@@ -47,9 +47,10 @@ from egregora.output_sinks.exceptions import (
     ProfileMetadataError,
     UnsupportedDocumentTypeError,
 )
-from egregora.output_sinks.mkdocs.markdown import write_markdown_post
+from egregora.output_sinks.mkdocs.markdown import render_markdown_post, write_markdown_post
 from egregora.output_sinks.mkdocs.paths import MkDocsPaths
 from egregora.output_sinks.mkdocs.scaffolding import MkDocsSiteScaffolder, safe_yaml_load
+from egregora.security.fs import safe_path_join
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
@@ -254,34 +255,10 @@ class MkDocsAdapter(BaseOutputSink):
 
         if document.type == DocumentType.POST:
             metadata = document.metadata
-            # Add related posts based on shared tags
-            current_tags = set(metadata.get("tags", []))
-            current_slug = metadata.get("slug")
-            if current_tags and current_slug:
-                all_posts = list(self.documents())
-                related_posts_list = []
-                for post in all_posts:
-                    if post.type != DocumentType.POST:
-                        continue
-                    post_slug = post.metadata.get("slug")
-                    if post_slug == current_slug:
-                        continue
-                    post_tags = set(post.metadata.get("tags", []))
-                    shared_tags = current_tags & post_tags
-                    if shared_tags:
-                        related_posts_list.append(
-                            {
-                                "title": post.metadata.get("title"),
-                                "url": self.url_convention.canonical_url(post, self._ctx),
-                                "reading_time": post.metadata.get("reading_time", 5),
-                            }
-                        )
-                if related_posts_list:
-                    metadata["related_posts"] = related_posts_list
-            content = document.content
-            if isinstance(content, bytes):
-                content = content.decode("utf-8")
-            write_markdown_post(content, metadata, self.posts_dir)
+            related_posts_list = self._related_posts(metadata)
+            if related_posts_list:
+                metadata["related_posts"] = related_posts_list
+            write_markdown_post(self._content_text(document), metadata, self.posts_dir)
         else:
             # Dispatch to specific writer if available, else generic
             writer = self._writers.get(document.type, self._write_generic_doc)
@@ -290,6 +267,99 @@ class MkDocsAdapter(BaseOutputSink):
         self._index[doc_id] = path
         logger.debug("Served document %s at %s", doc_id, path)
 
+    def render(
+        self, document: Document, *, posts: builtins.list[Document] | None = None
+    ) -> RenderedDocument | None:
+        """Render a document to its target path and file bytes without writing it.
+
+        This is the side-effect free half of :meth:`persist`, used by the site
+        materializer to render documents off the main thread. Posts render to
+        their canonical ``YYYY-MM-DD-slug.md`` path (no collision suffix), so
+        re-rendering an existing post targets the same file.
+
+        Args:
+            document: Document to render
+            posts: Pre-fetched posts used for related-post and author-post
+                listings (defaults to reading :meth:`documents` per call)
+
+        Returns:
+            The rendered file, or None when the document cannot be rendered to
+            bytes (media moved from a staging path or deleted for privacy) and
+            must go through :meth:`persist` instead.
+
+        """
+        if document.type == DocumentType.POST:
+            metadata = dict(document.metadata)
+            related_posts_list = self._related_posts(metadata, posts)
+            if related_posts_list:
+                metadata["related_posts"] = related_posts_list
+            filename, text = render_markdown_post(self._content_text(document), metadata)
+            return RenderedDocument(
+                path=safe_path_join(self.posts_dir, filename),
+                payload=text.encode("utf-8"),
+                authors=tuple(metadata.get("authors") or ()),
+            )
+
+        if document.type == DocumentType.MEDIA and (
+            document.metadata.get("pii_deleted") or document.metadata.get("source_path")
+        ):
+            return None
+
+        url = self._url_convention.canonical_url(document, self._ctx)
+        path = self._url_to_path(url, document)
+        if path.exists() and document.type == DocumentType.ENRICHMENT_URL:
+            existing_doc_id = self._get_document_id_at_path(path)
+            if existing_doc_id and existing_doc_id != document.document_id:
+                path = self._resolve_collision(path, document.document_id)
+
+        match document.type:
+            case DocumentType.PROFILE:
+                payload = self._render_profile_doc(document, posts).encode("utf-8")
+            case DocumentType.JOURNAL:
+                payload = self._render_journal_doc(document).encode("utf-8")
+            case DocumentType.ANNOTATION:
+                payload = self._render_annotation_doc(document).encode("utf-8")
+            case (
+                DocumentType.ENRICHMENT_URL
+                | DocumentType.ENRICHMENT_MEDIA
+                | DocumentType.ENRICHMENT_IMAGE
+                | DocumentType.ENRICHMENT_VIDEO
+                | DocumentType.ENRICHMENT_AUDIO
+            ):
+                payload = self._render_enrichment_doc(document).encode("utf-8")
+            case _:
+                content = document.content
+                payload = content if isinstance(content, bytes) else content.encode("utf-8")
+        return RenderedDocument(path=path, payload=payload)
+
+    def _related_posts(
+        self, metadata: dict[str, Any], posts: builtins.list[Document] | None = None
+    ) -> builtins.list[dict[str, Any]]:
+        """List posts sharing at least one tag with the post described by ``metadata``."""
+        current_tags = set(metadata.get("tags", []))
+        current_slug = metadata.get("slug")
+        if not current_tags or not current_slug:
+            return []
+        all_posts = posts if posts is not None else list(self.documents())
+        related_posts_list = []
+        for post in all_posts:
+            if post.type != DocumentType.POST:
+                continue
+            post_slug = post.metadata.get("slug")
+            if post_slug == current_slug:
+                continue
+            post_tags = set(post.metadata.get("tags", []))
+            shared_tags = current_tags & post_tags
+            if shared_tags:
+                related_posts_list.append(
+                    {
+                        "title": post.metadata.get("title"),
+                        "url": self.url_convention.canonical_url(post, self._ctx),
+                        "reading_time": post.metadata.get("reading_time", 5),
+                    }
+                )
+        return related_posts_list
+
     def _resolve_document_path(self, doc_type: DocumentType, identifier: str) -> Path:
         """Resolve filesystem path for a document based on its type.
 
@@ -1059,7 +1129,24 @@ Use consistent, meaningful tags across posts to build a useful taxonomy.
         metadata["categories"] = categories
         return metadata
 
+    @staticmethod
+    def _content_text(document: Document) -> str:
+        content = document.content
+        if isinstance(content, bytes):
+            content = content.decode("utf-8")
+        return content
+
+    @staticmethod
+    def _write_text(path: Path, text: str) -> None:
+        try:
+            path.write_text(text, encoding="utf-8")
+        except OSError as e:
+            raise FileWriteError(str(path), e) from e
+
     def _write_journal_doc(self, document: Document, path: Path) -> None:
+        self._write_text(path, self._render_journal_doc(document))
+
+    def _render_journal_doc(self, document: Document) -> str:
         metadata = dict(document.metadata or {})
         metadata["type"] = "journal"
         metadata["publish"] = True
@@ -1069,16 +1156,12 @@ Use consistent, meaningful tags across posts to build a useful taxonomy.
         metadata = self._clean_metadata(metadata)
 
         yaml_front = yaml.dump(metadata, default_flow_style=False, allow_unicode=True, sort_keys=False)
-        content = document.content
-        if isinstance(content, bytes):
-            content = content.decode("utf-8")
-        full_content = f"---\n{yaml_front}---\n\n{content}"
-        try:
-            path.write_text(full_content, encoding="utf-8")
-        except OSError as e:
-            raise FileWriteError(str(path), e) from e
+        return f"---\n{yaml_front}---\n\n{self._content_text(document)}"
 
     def _write_annotation_doc(self, document: Document, path: Path) -> None:
+        self._write_text(path, self._render_annotation_doc(document))
+
+    def _render_annotation_doc(self, document: Document) -> str:
         metadata = self._ensure_hidden(dict(document.metadata or {}))
 
         # Add type for categorization
@@ -1089,16 +1172,12 @@ Use consistent, meaningful tags across posts to build a useful taxonomy.
         metadata = self._clean_metadata(metadata)
 
         yaml_front = yaml.dump(metadata, default_flow_style=False, allow_unicode=True, sort_keys=False)
-        content = document.content
-        if isinstance(content, bytes):
-            content = content.decode("utf-8")
-        full_content = f"---\n{yaml_front}---\n\n{content}"
-        try:
-            path.write_text(full_content, encoding="utf-8")
-        except OSError as e:
-            raise FileWriteError(str(path), e) from e
+        return f"---\n{yaml_front}---\n\n{self._content_text(document)}"
 
     def _write_profile_doc(self, document: Document, path: Path) -> None:
+        self._write_text(path, self._render_profile_doc(document))
+
+    def _render_profile_doc(self, document: Document, posts: builtins.list[Document] | None = None) -> str:
         # Ensure UUID is in metadata
         author_uuid = document.metadata.get("uuid", document.metadata.get("author_uuid"))
         if not author_uuid:
@@ -1117,7 +1196,7 @@ Use consistent, meaningful tags across posts to build a useful taxonomy.
         # Add Authors category using helper (handles malformed data)
         metadata = self._ensure_category(metadata, "Authors")
 
-        all_posts = list(self.documents())
+        all_posts = posts if posts is not None else list(self.documents())
         author_posts_docs = [post for post in all_posts if author_uuid in post.metadata.get("authors", [])]
         metadata["posts"] = [
             {
@@ -1133,16 +1212,12 @@ Use consistent, meaningful tags across posts to build a useful taxonomy.
 
         # Avatar is in frontmatter only - not prepended to content
         # This allows the template/theme to handle avatar rendering
-        content = document.content
-        if isinstance(content, bytes):
-            content = content.decode("utf-8")
-        full_content = f"---\n{yaml_front}---\n\n{content}"
-        try:
-            path.write_text(full_content, encoding="utf-8")
-        except OSError as e:
-            raise FileWriteError(str(path), e) from e
+        return f"---\n{yaml_front}---\n\n{self._content_text(document)}"
 
     def _write_enrichment_doc(self, document: Document, path: Path) -> None:
+        self._write_text(path, self._render_enrichment_doc(document))
+
+    def _render_enrichment_doc(self, document: Document) -> str:
         metadata = self._ensure_hidden(document.metadata.copy())
         metadata.setdefault("slug", document.slug)
         if document.parent_id:
@@ -1155,14 +1230,7 @@ Use consistent, meaningful tags across posts to build a useful taxonomy.
         metadata = self._clean_metadata(metadata)
 
         yaml_front = yaml.dump(metadata, default_flow_style=False, allow_unicode=True, sort_keys=False)
-        content = document.content
-        if isinstance(content, bytes):
-            content = content.decode("utf-8")
-        full_content = f"---\n{yaml_front}---\n\n{content}"
-        try:
-            path.write_text(full_content, encoding="utf-8")
-        except OSError as e:
-            raise FileWriteError(str(path), e) from e
+        return f"---\n{yaml_front}---\n\n{self._content_text(document)}"
 
     def _write_media_doc(self, document: Document, path: Path) -> None:
         if document.metadata.get("pii_deleted"):
@@ -85,10 +85,15 @@ def _validate_post_metadata(metadata: dict[str, Any]) -> None:
         raise MissingMetadataError(missing_keys)
 
 
+def _render_post(content: str, front_matter: dict[str, Any]) -> str:
+    """Construct the full post content (YAML front matter + body)."""
+    yaml_front = yaml.dump(front_matter, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    return f"---\n{yaml_front}---\n\n{content}"
+
+
 def _write_post_file(filepath: Path, content: str, front_matter: dict[str, Any]) -> None:
     """Construct the full post content and write it to a file."""
-    yaml_front = yaml.dump(front_matter, default_flow_style=False, allow_unicode=True, sort_keys=False)
-    full_post = f"---\n{yaml_front}---\n\n{content}"
+    full_post = _render_post(content, front_matter)
     try:
         filepath.write_text(full_post, encoding="utf-8")
     except OSError as e:
@@ -117,3 +122,21 @@ def write_markdown_post(content: str, metadata: dict[str, Any], output_dir: Path
     _write_post_file(filepath, content, front_matter)
 
     return str(filepath)
+
+
+def render_markdown_post(content: str, metadata: dict[str, Any]) -> tuple[str, str]:
+    """Render a post to its canonical filename and file text without writing it.
+
+    Unlike :func:`write_markdown_post`, no collision suffix is appended: the
+    filename is always ``YYYY-MM-DD-<slug>.md``, so re-rendering the same post
+    targets the same file.
+
+    Returns:
+        A ``(filename, text)`` tuple.
+
+    """
+    _validate_post_metadata(metadata)
+    date_prefix = extract_clean_date(metadata["date"])
+    slug = slugify(metadata["slug"])
+    front_matter = _prepare_frontmatter(metadata, slug)
+    return f"{date_prefix}-{slug}.md", _render_post(content, front_matter)
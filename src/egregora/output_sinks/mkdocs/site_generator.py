@@ -31,6 +31,19 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _author_ids(metadata: dict[str, Any]) -> list[str]:
+    """UUIDs listed under ``authors``.
+
+    Posts list bare UUIDs; profile posts list ``{uuid, name}`` entries.
+    """
+    ids = []
+    for author in metadata.get("authors") or []:
+        author_id = author.get("uuid") if isinstance(author, dict) else author
+        if author_id:
+            ids.append(str(author_id))
+    return ids
+
+
 class SiteGenerator:
     """Handles the generation of static site pages for MkDocs."""
 
@@ -165,7 +178,7 @@ class SiteGenerator:
                     post_stats = {"metadata": doc.metadata, "word_count": word_count}
 
                     # Index by author (deduplicate to avoid double counting)
-                    for author_uuid in set(doc.metadata.get("authors", [])):
+                    for author_uuid in set(_author_ids(doc.metadata)):
                         author_posts_map[author_uuid].append(post_stats)
 
                 except Exception as e:
@@ -288,7 +301,7 @@ class SiteGenerator:
 
                 # Get authors with avatars
                 authors = []
-                for author_uuid in metadata.get("authors", []):
+                for author_uuid in _author_ids(metadata):
                     author_dir = self.profiles_dir / author_uuid
                     if author_dir.exists():
                         candidates = [p for p in author_dir.glob("*.md") if p.name != "index.md"]
@@ -420,7 +433,7 @@ class SiteGenerator:
 
                     # Get authors with avatars
                     authors = []
-                    for author_uuid in metadata.get("authors", []):
+                    for author_uuid in _author_ids(metadata):
                         author_dir = self.profiles_dir / author_uuid
                         if author_dir.exists():
                             candidates = [p for p in author_dir.glob("*.md") if p.name != "index.md"]
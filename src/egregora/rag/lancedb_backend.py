@@ -19,6 +19,7 @@ from egregora.config import EMBEDDING_DIM
 from egregora.rag.backend import VectorStore
 from egregora.rag.ingestion import chunks_from_documents
 from egregora.rag.models import RAGHit, RAGQueryRequest, RAGQueryResponse
+from egregora.tracing import current_span, traced
 
 if TYPE_CHECKING:
     from egregora.data_primitives.document import Document
@@ -66,6 +67,40 @@ class RagChunkModel(LanceModel):
     text: str
     vector: Vector(EMBEDDING_DIM)
     metadata_json: str  # JSON-serialized metadata for flexibility
+    # Scalar copies of filterable metadata so filters run inside LanceDB
+    document_type: str | None = None
+    media_type: str | None = None
+
+
+# Columns promoted out of metadata_json; each gets a bitmap index (low cardinality).
+SCALAR_FILTER_COLUMNS: dict[str, str] = {"document_type": "type", "media_type": "media_type"}
+
+
+def _scalar_values(metadata: dict[str, Any]) -> dict[str, str | None]:
+    """Extract the scalar filter columns from chunk metadata."""
+    values: dict[str, str | None] = {}
+    for column, key in SCALAR_FILTER_COLUMNS.items():
+        value = metadata.get(key)
+        values[column] = str(value) if value else None
+    return values
+
+
+def _sql_list(values: Sequence[str]) -> str:
+    return ", ".join("'" + value.replace("'", "''") + "'" for value in values)
+
+
+def build_where_clause(request: RAGQueryRequest) -> str | None:
+    """Translate the structured filters of ``request`` into a LanceDB WHERE clause."""
+    clauses: list[str] = []
+    if request.document_types:
+        clauses.append(f"document_type IN ({_sql_list(request.document_types)})")
+    if request.media_types:
+        clauses.append(f"media_type IN ({_sql_list(request.media_types)})")
+    elif request.media_only:
+        clauses.append("media_type IS NOT NULL")
+    if request.filters:
+        clauses.append(f"({request.filters})")
+    return " AND ".join(clauses) or None
 
 
 class LanceDBRAGBackend(VectorStore):
@@ -141,6 +176,49 @@ class LanceDBRAGBackend(VectorStore):
                 msg = f"Failed to create or open table {table_name}: {open_err}"
                 raise RuntimeError(msg) from open_err
 
+        self._indexed_columns: set[str] = set()
+        self._migrate_scalar_columns()
+        self._ensure_scalar_indexes()
+
+    def _migrate_scalar_columns(self) -> None:
+        """Add and backfill scalar filter columns on tables created before they existed."""
+        missing = [name for name in SCALAR_FILTER_COLUMNS if name not in self._table.schema.names]
+        if not missing:
+            return
+
+        logger.info("Adding scalar filter columns %s to LanceDB table %s", missing, self._table_name)
+        self._table.add_columns(dict.fromkeys(missing, "CAST(NULL AS STRING)"))
+        existing = self._table.search().select(["chunk_id", "metadata_json"]).limit(None).to_arrow()
+        if existing.num_rows == 0:
+            return
+
+        updates: list[dict[str, Any]] = []
+        for row in existing.to_pylist():
+            try:
+                meta = json.loads(row["metadata_json"]) if row["metadata_json"] else {}
+            except json.JSONDecodeError:
+                meta = {}
+            updates.append({"chunk_id": row["chunk_id"], **_scalar_values(meta)})
+        self._table.merge_insert("chunk_id").when_matched_update_all().execute(updates)
+
+    def _ensure_scalar_indexes(self) -> None:
+        """Create bitmap indexes on the scalar filter columns once the table has rows."""
+        pending = [name for name in SCALAR_FILTER_COLUMNS if name not in self._indexed_columns]
+        if not pending:
+            return
+        existing = {column for index in self._table.list_indices() for column in index.columns}
+        self._indexed_columns.update(existing)
+        pending = [name for name in pending if name not in existing]
+        if not pending or self._table.count_rows() == 0:
+            return
+        for name in pending:
+            try:
+                self._table.create_scalar_index(name, index_type="BITMAP")
+                self._indexed_columns.add(name)
+            except Exception as e:  # Filters still work (unindexed) if this fails
+                logger.warning("Failed to create scalar index on %s: %s", name, e)
+
+    @traced("lancedb.add")
     def add(self, documents: Sequence["Document"]) -> int:
         """Add documents to the store.
 
@@ -168,6 +246,7 @@ class LanceDBRAGBackend(VectorStore):
             return 0
 
         logger.info("Indexing %d chunks from %d documents", len(chunks), len(documents))
+        current_span().set_attribute("rag.chunks", len(chunks))
 
         # Extract texts for embedding
         texts = [c.text for c in chunks]
@@ -193,6 +272,7 @@ class LanceDBRAGBackend(VectorStore):
                     text=chunk.text,
                     vector=np.asarray(emb, dtype=np.float32),
                     metadata_json=_json_serialize_metadata(chunk.metadata),
+                    **_scalar_values(chunk.metadata),
                 )
             )
 
@@ -202,17 +282,21 @@ class LanceDBRAGBackend(VectorStore):
                 "chunk_id"
             ).when_matched_update_all().when_not_matched_insert_all().execute(rows)
             logger.info("Successfully indexed %d chunks (atomic upsert)", len(rows))
-            return len(documents)
         except Exception as e:
             msg = f"Failed to upsert chunks to LanceDB: {e}"
             raise RuntimeError(msg) from e
 
+        self._ensure_scalar_indexes()
+        return len(documents)
+
+    @traced("lancedb.query")
     def query(self, request: RAGQueryRequest) -> RAGQueryResponse:
         """Execute vector search in the knowledge base.
 
         Implementation:
             1. Embed the query text
-            2. Run vector search in LanceDB
+            2. Run vector search in LanceDB, pre-filtered by the request's
+               structured filters (document/media type) and raw SQL filter
             3. Convert results to RAGHit objects
 
         Args:
@@ -241,10 +325,12 @@ class LanceDBRAGBackend(VectorStore):
         try:
             q = self._table.search(query_vec).metric("cosine").limit(top_k)
 
-            # Apply filters if provided
-            # LanceDB supports SQL-like WHERE clauses for pre-filtering
-            if request.filters:
-                q = q.where(request.filters)
+            # Pre-filter (before ranking) so top_k counts only matching chunks
+            where = build_where_clause(request)
+            current_span().set_attribute("rag.top_k", top_k)
+            if where:
+                current_span().set_attribute("rag.where", where)
+                q = q.where(where, prefilter=True)
 
             # Execute and get results as Arrow table (zero-copy)
             arrow_table = q.to_arrow()
@@ -282,6 +368,7 @@ class LanceDBRAGBackend(VectorStore):
         logger.info("Found %d hits for query (top_k=%d)", len(hits), top_k)
         return RAGQueryResponse(hits=hits)
 
+    @traced("lancedb.delete")
     def delete(self, document_ids: list[str]) -> int:
         """Delete documents from the store.
 
@@ -357,4 +444,4 @@ class LanceDBRAGBackend(VectorStore):
         return final_ids, np.array(final_vecs)
 
 
-__all__ = ["EmbedFn", "LanceDBRAGBackend"]
+__all__ = ["EmbedFn", "LanceDBRAGBackend", "build_where_clause"]
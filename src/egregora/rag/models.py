@@ -40,6 +40,12 @@ class RAGQueryRequest(BaseModel):
         text: Query text to search for
         top_k: Number of top results to retrieve (default: 5)
         filters: Optional SQL WHERE clause for filtering (e.g., "category = 'programming'")
+        document_types: Only return chunks of these document types (e.g. ``["post"]``)
+        media_types: Only return chunks describing media of these types (e.g. ``["image"]``)
+        media_only: Only return chunks that describe a media file (any media type)
+
+    The structured filters are applied by the backend before ranking, so
+    ``top_k`` hits are returned even when matching documents are rare.
 
     Examples:
         >>> # Basic query
@@ -60,11 +66,21 @@ class RAGQueryRequest(BaseModel):
         >>> request.filters
         "metadata_json LIKE '%postgres%'"
 
+        >>> # Media-only query
+        >>> request = RAGQueryRequest(text="beach photos", media_types=["image"])
+        >>> request.media_types
+        ['image']
+
     """
 
     text: str = Field(..., description="Query text")
     top_k: int = Field(default=5, ge=1, le=100, description="Number of results to retrieve")
     filters: str | None = Field(default=None, description="Optional SQL WHERE clause for filtering")
+    document_types: list[str] | None = Field(
+        default=None, description="Restrict hits to these document types"
+    )
+    media_types: list[str] | None = Field(default=None, description="Restrict hits to these media types")
+    media_only: bool = Field(default=False, description="Restrict hits to media descriptions")
 
 
 class RAGQueryResponse(BaseModel):
@@ -1,4 +1,10 @@
-"""DNS security utilities to prevent rebinding attacks."""
+"""DNS security utilities to prevent rebinding attacks.
+
+Inside :func:`safe_dns_validation` lookups go through a process-wide
+resolution cache, so link-heavy chats resolve each host once per TTL instead
+of once per request. Cached addresses are checked against the blocked ranges
+of the current context on every use, never only when they were stored.
+"""
 
 from __future__ import annotations
 
@@ -7,7 +13,8 @@ import ipaddress
 import logging
 import socket
 import threading
-from collections.abc import Iterator
+import time
+from collections.abc import Callable, Iterator
 from typing import TYPE_CHECKING
 from urllib.parse import urlparse
 
@@ -48,6 +55,157 @@ def _set_blocked_ranges(ranges: tuple[ipaddress.IPv4Network | ipaddress.IPv6Netw
 _original_getaddrinfo = socket.getaddrinfo
 
 
+# Seconds a resolution is reused. getaddrinfo does not expose record TTLs, so
+# this caps them; short enough to follow DNS changes within a run.
+DEFAULT_DNS_CACHE_TTL = 60.0
+DNS_CACHE_MAX_ENTRIES = 1024
+
+IPAddress = ipaddress.IPv4Address | ipaddress.IPv6Address
+
+
+class DNSCache:
+    """Thread-safe hostname -> addresses cache with a per-entry TTL.
+
+    Concurrent misses for the same host share one lookup. Async HTTP clients
+    resolve through ``socket.getaddrinfo`` in worker threads, so the same
+    locking covers them.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_DNS_CACHE_TTL,
+        max_entries: int = DNS_CACHE_MAX_ENTRIES,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: dict[str, tuple[float, frozenset[IPAddress]]] = {}
+        self._lock = threading.Lock()
+        self._host_locks: dict[str, threading.Lock] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, hostname: str, resolver: Callable[[str], frozenset[IPAddress]]) -> frozenset[IPAddress]:
+        """Return the cached addresses of ``hostname``, calling ``resolver`` on a miss.
+
+        Failed and empty lookups are not cached.
+        """
+        cached = self._get(hostname)
+        if cached is not None:
+            return cached
+        with self._lock:
+            host_lock = self._host_locks.setdefault(hostname, threading.Lock())
+        with host_lock:
+            # Another thread may have resolved it while we waited.
+            cached = self._get(hostname)
+            if cached is not None:
+                return cached
+            ips = resolver(hostname)
+            with self._lock:
+                self.misses += 1
+                self._host_locks.pop(hostname, None)
+                if ips and self.ttl > 0:
+                    self._store(hostname, ips)
+            return ips
+
+    def peek(self, hostname: str) -> frozenset[IPAddress] | None:
+        """Return the unexpired addresses of ``hostname`` without resolving."""
+        return self._get(hostname)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def _get(self, hostname: str) -> frozenset[IPAddress] | None:
+        with self._lock:
+            entry = self._entries.get(hostname)
+            if entry is None:
+                return None
+            expires_at, ips = entry
+            if expires_at <= self._clock():
+                del self._entries[hostname]
+                return None
+            self.hits += 1
+            return ips
+
+    def _store(self, hostname: str, ips: frozenset[IPAddress]) -> None:
+        now = self._clock()
+        if len(self._entries) >= self.max_entries:
+            for host in [host for host, (expires_at, _) in self._entries.items() if expires_at <= now]:
+                del self._entries[host]
+            while len(self._entries) >= self.max_entries:
+                # Dicts keep insertion order: drop the oldest entry.
+                del self._entries[next(iter(self._entries))]
+        self._entries[hostname] = (now + self.ttl, ips)
+
+
+_dns_cache = DNSCache()
+
+
+def get_dns_cache() -> DNSCache:
+    """Return the process-wide resolution cache."""
+    return _dns_cache
+
+
+def clear_dns_cache() -> None:
+    """Forget every cached resolution."""
+    _dns_cache.clear()
+
+
+def _lookup_ips(hostname: str) -> frozenset[IPAddress]:
+    """Resolve ``hostname`` with the real resolver (raises ``socket.gaierror``)."""
+    ips: set[IPAddress] = set()
+    for info in _original_getaddrinfo(hostname, None):
+        try:
+            ips.add(ipaddress.ip_address(info[4][0]))
+        except ValueError:
+            continue
+    return frozenset(ips)
+
+
+def _port_number(port: str | int | None) -> int:
+    if port is None:
+        return 0
+    if isinstance(port, int):
+        return port
+    return int(port) if port.isdigit() else socket.getservbyname(port)
+
+
+def _addrinfo_for_ips(
+    ips: AbstractSet[IPAddress],
+    port: str | int | None,
+    family: int,
+    type: int,  # noqa: A002 - matching socket.getaddrinfo signature
+    proto: int,
+) -> list[tuple[int, int, int, str, tuple]]:
+    """Build getaddrinfo results for known addresses, filtered by ``family``."""
+    port_number = _port_number(port)
+    results = []
+    for ip in ips:
+        # Filter by family
+        res_family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
+        if family != 0 and family != res_family:
+            continue
+
+        ip_str = str(ip)
+        sockaddr: tuple
+        if res_family == socket.AF_INET:
+            sockaddr = (ip_str, port_number)
+        else:
+            # IPv6 sockaddr: (address, port, flow info, scope id)
+            sockaddr = (ip_str, port_number, 0, 0)
+
+        # Defaults if not specified
+        res_type = type if type != 0 else socket.SOCK_STREAM
+        res_proto = proto if proto != 0 else socket.IPPROTO_TCP
+
+        results.append((res_family, res_type, res_proto, "", sockaddr))
+    return results
+
+
 def _pinned_getaddrinfo(
     host: str | bytes | None,
     port: str | int | None,
@@ -71,54 +229,64 @@ def _pinned_getaddrinfo(
         # 1. Check Pinned Hosts
         pinned_hosts = _get_pinned_hosts()
         if hostname in pinned_hosts:
-            ips = pinned_hosts[hostname]
-            results = []
-            for ip in ips:
-                # Filter by family
-                res_family = socket.AF_INET6 if ip.version == 6 else socket.AF_INET
-                if family != 0 and family != res_family:
-                    continue
-
-                ip_str = str(ip)
-                sockaddr: tuple
-                if res_family == socket.AF_INET:
-                    sockaddr = (ip_str, port)
-                else:
-                    # IPv6 sockaddr: (address, port, flow info, scope id)
-                    sockaddr = (ip_str, port, 0, 0)
-
-                # Defaults if not specified
-                res_type = type if type != 0 else socket.SOCK_STREAM
-                res_proto = proto if proto != 0 else socket.IPPROTO_TCP
-
-                results.append((res_family, res_type, res_proto, "", sockaddr))
-
             # If we pinned the host but no IPs matched the requested family, return empty list
             # to prevent falling back to DNS (which might return unsafe IPs)
-            return results
-
-    # 2. Fallback to original resolution
-    results = _original_getaddrinfo(host, port, family, type, proto, flags)
+            return _addrinfo_for_ips(pinned_hosts[hostname], port, family, type, proto)
 
-    # 3. Validate against Blocked Ranges (if active context)
     blocked_ranges = _get_blocked_ranges()
     if blocked_ranges and hostname:
-        for res in results:
-            # res structure: (family, type, proto, canonname, sockaddr)
-            # sockaddr for AF_INET is (ip, port)
-            # sockaddr for AF_INET6 is (ip, port, flowinfo, scopeid)
-            sockaddr = res[4]
-            ip_str = sockaddr[0]
-            try:
-                ip_addr = ipaddress.ip_address(ip_str)
-            except ValueError:
-                # Should not happen with IPs from getaddrinfo, but safe to ignore invalid IPs here
-                continue
-
+        # 2. Inside a validation context: resolve through the cache and
+        #    validate every address, cached or not.
+        ips = _dns_cache.resolve(hostname, _lookup_ips)
+        for ip_addr in ips:
             # We use the hostname as the 'url' context for logging/error
             check_ip_is_public(ip_addr, f"dns://{hostname}", blocked_ranges)
+        return _addrinfo_for_ips(ips, port, family, type, proto)
 
-    return results
+    if hostname:
+        # 3. Hosts validated recently keep resolving to the validated
+        #    addresses, so connections made from other threads (e.g. the
+        #    resolver threads of async clients) cannot be rebound either.
+        cached_ips = _dns_cache.peek(hostname)
+        if cached_ips:
+            return _addrinfo_for_ips(cached_ips, port, family, type, proto)
+
+    # 4. Anything else resolves as usual
+    return _original_getaddrinfo(host, port, family, type, proto, flags)
+
+
+def resolve_public_ips(
+    url: str,
+    *,
+    blocked_ranges: tuple[ipaddress.IPv4Network | ipaddress.IPv6Network, ...] = DEFAULT_BLOCKED_IP_RANGES,
+) -> frozenset[IPAddress]:
+    """Resolve the host of ``url`` through the cache and check every address.
+
+    Use this where :func:`safe_dns_validation` cannot pin addresses for the
+    thread that connects, such as async clients: until the cache entry
+    expires, lookups of the host in any thread return the validated addresses.
+
+    Raises:
+        SSRFValidationError: If the URL has no hostname, cannot be resolved
+            or resolves to a blocked address.
+
+    """
+    _ensure_patched()
+    hostname = urlparse(url).hostname
+    if not hostname:
+        msg = "URL must have a hostname"
+        raise SSRFValidationError(msg)
+    try:
+        ips = _dns_cache.resolve(hostname, _lookup_ips)
+    except socket.gaierror as exc:
+        msg = f"Could not resolve hostname '{hostname}': {exc}"
+        raise SSRFValidationError(msg) from exc
+    if not ips:
+        msg = f"Could not resolve hostname '{hostname}': no addresses returned"
+        raise SSRFValidationError(msg)
+    for ip_addr in ips:
+        check_ip_is_public(ip_addr, url, blocked_ranges)
+    return ips
 
 
 # Global patch state
@@ -177,26 +345,27 @@ def safe_dns_validation(
         msg = "URL must have a hostname"
         raise SSRFValidationError(msg)
 
-    # 1. Resolve and Validate
-    # Use internal helper to resolve IPs once
-    resolved_ips = resolve_host_ips(hostname)
-
-    # Validate all resolved IPs
-    for ip_addr in resolved_ips:
-        check_ip_is_public(ip_addr, url, blocked_ranges)
-
-    # 2. Pin IPs for this thread
     pinned_map = _get_pinned_hosts()
     previous_pinned_entry = pinned_map.get(hostname)
-    pinned_map[hostname] = resolved_ips
 
-    # 3. Set Blocked Ranges for this thread
+    # 1. Set Blocked Ranges for this thread (also routes lookups through the cache)
     previous_blocked_ranges = _get_blocked_ranges()
     _set_blocked_ranges(blocked_ranges)
 
-    logger.debug("Pinned DNS for %s: %s", hostname, resolved_ips)
-
     try:
+        # 2. Resolve and Validate
+        # Use internal helper to resolve IPs once
+        resolved_ips = resolve_host_ips(hostname)
+
+        # Validate all resolved IPs
+        for ip_addr in resolved_ips:
+            check_ip_is_public(ip_addr, url, blocked_ranges)
+
+        # 3. Pin IPs for this thread
+        pinned_map[hostname] = resolved_ips
+
+        logger.debug("Pinned DNS for %s: %s", hostname, resolved_ips)
+
         yield
     finally:
         # Restore pinned hosts
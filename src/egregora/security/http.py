@@ -0,0 +1,295 @@
+"""Pooled HTTP clients shared across the process.
+
+Avatar downloads, enrichment fetches and HTTP input adapters reuse these
+clients instead of opening one per request, so keep-alive connections (and
+HTTP/2 multiplexing, when ``h2`` is installed) skip the TCP and TLS handshakes
+after the first request to a host.
+
+Every client built here limits concurrent requests per host; a slot is held
+until the response is closed and waiting for one is bounded by the pool
+timeout, like httpx's own connection pool. Clients built with
+``ssrf_guard=True`` check every hop, redirects included, at the transport:
+
+- the sync client runs each hop inside :func:`safe_dns_validation`, pinning
+  the validated addresses for the connecting thread;
+- the async client validates each hop's host with :func:`resolve_public_ips`,
+  whose cached addresses are what the resolver threads then connect to.
+
+Async clients are bound to the event loop that uses them, so
+:func:`get_async_http_client` keeps one per running loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import importlib.util
+import logging
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from egregora.security.dns import resolve_public_ips, safe_dns_validation
+
+if TYPE_CHECKING:
+    import ssl
+    from collections.abc import AsyncIterator, Callable, Iterator
+
+logger = logging.getLogger(__name__)
+
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+DEFAULT_TIMEOUT = 30.0
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_MAX_CONNECTIONS_PER_HOST = 8
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_MAX_REDIRECTS = 10
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    """Response body that frees its host slot when the response is closed."""
+
+    def __init__(self, stream: httpx.SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release, release = None, self._release
+                release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    """Async counterpart of :class:`_ReleasingStream`."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release, release = None, self._release
+                release()
+
+
+def _pool_timeout(request: httpx.Request) -> float | None:
+    return request.extensions.get("timeout", {}).get("pool")
+
+
+def _host_busy(request: httpx.Request) -> httpx.PoolTimeout:
+    msg = f"Timed out waiting for a free connection slot to {request.url.host}"
+    return httpx.PoolTimeout(msg, request=request)
+
+
+class GuardedTransport(httpx.BaseTransport):
+    """Wraps a transport with per-host request slots and an optional SSRF check."""
+
+    def __init__(
+        self,
+        transport: httpx.BaseTransport,
+        *,
+        ssrf_guard: bool = False,
+        max_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    ) -> None:
+        self._transport = transport
+        self._ssrf_guard = ssrf_guard
+        self._max_per_host = max_per_host
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        with self._lock:
+            slot = self._slots.setdefault(
+                request.url.netloc.decode("ascii"), threading.BoundedSemaphore(self._max_per_host)
+            )
+        if not slot.acquire(timeout=_pool_timeout(request)):
+            raise _host_busy(request)
+        try:
+            if self._ssrf_guard:
+                with safe_dns_validation(str(request.url)):
+                    response = self._transport.handle_request(request)
+            else:
+                response = self._transport.handle_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            # Body already in memory: nothing left to hold the slot for.
+            slot.release()
+        else:
+            response.stream = _ReleasingStream(response.stream, slot.release)  # type: ignore[arg-type]
+        return response
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class AsyncGuardedTransport(httpx.AsyncBaseTransport):
+    """Async counterpart of :class:`GuardedTransport`."""
+
+    def __init__(
+        self,
+        transport: httpx.AsyncBaseTransport,
+        *,
+        ssrf_guard: bool = False,
+        max_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    ) -> None:
+        self._transport = transport
+        self._ssrf_guard = ssrf_guard
+        self._max_per_host = max_per_host
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        slot = self._slots.setdefault(
+            request.url.netloc.decode("ascii"), asyncio.Semaphore(self._max_per_host)
+        )
+        try:
+            await asyncio.wait_for(slot.acquire(), _pool_timeout(request))
+        except TimeoutError:
+            raise _host_busy(request) from None
+        try:
+            if self._ssrf_guard:
+                await asyncio.to_thread(resolve_public_ips, str(request.url))
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            slot.release()
+            raise
+        if isinstance(response.stream, httpx.ByteStream):
+            slot.release()
+        else:
+            response.stream = _AsyncReleasingStream(response.stream, slot.release)  # type: ignore[arg-type]
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def _limits(max_connections: int) -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(DEFAULT_MAX_KEEPALIVE_CONNECTIONS, max_connections),
+        keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+    )
+
+
+def create_http_client(
+    *,
+    ssrf_guard: bool = False,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    verify: ssl.SSLContext | bool = True,
+    **client_options: Any,
+) -> httpx.Client:
+    """Build a pooled sync client; the caller owns (and closes) it."""
+    transport = httpx.HTTPTransport(verify=verify, http2=HTTP2_AVAILABLE, limits=_limits(max_connections))
+    client_options.setdefault("follow_redirects", True)
+    return httpx.Client(
+        transport=GuardedTransport(transport, ssrf_guard=ssrf_guard, max_per_host=max_per_host),
+        timeout=timeout,
+        max_redirects=DEFAULT_MAX_REDIRECTS,
+        **client_options,
+    )
+
+
+def create_async_http_client(
+    *,
+    ssrf_guard: bool = False,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    max_per_host: int = DEFAULT_MAX_CONNECTIONS_PER_HOST,
+    verify: ssl.SSLContext | bool = True,
+    **client_options: Any,
+) -> httpx.AsyncClient:
+    """Build a pooled async client; the caller owns (and closes) it."""
+    transport = httpx.AsyncHTTPTransport(
+        verify=verify, http2=HTTP2_AVAILABLE, limits=_limits(max_connections)
+    )
+    client_options.setdefault("follow_redirects", True)
+    return httpx.AsyncClient(
+        transport=AsyncGuardedTransport(transport, ssrf_guard=ssrf_guard, max_per_host=max_per_host),
+        timeout=timeout,
+        max_redirects=DEFAULT_MAX_REDIRECTS,
+        **client_options,
+    )
+
+
+_clients: dict[bool, httpx.Client] = {}
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[bool, httpx.AsyncClient]] = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+
+
+def get_http_client(*, ssrf_guard: bool = False) -> httpx.Client:
+    """Return the shared sync client (one with and one without the SSRF guard)."""
+    with _clients_lock:
+        client = _clients.get(ssrf_guard)
+        if client is None or client.is_closed:
+            client = _clients[ssrf_guard] = create_http_client(ssrf_guard=ssrf_guard)
+        return client
+
+
+def get_async_http_client(*, ssrf_guard: bool = False) -> httpx.AsyncClient:
+    """Return the shared async client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = _async_clients.setdefault(loop, {})
+        client = clients.get(ssrf_guard)
+        if client is None or client.is_closed:
+            client = clients[ssrf_guard] = create_async_http_client(ssrf_guard=ssrf_guard)
+        return client
+
+
+async def close_async_http_clients() -> None:
+    """Close the shared async clients of the running event loop.
+
+    Await this before closing a loop that used :func:`get_async_http_client`;
+    otherwise its keep-alive connections stay open until garbage collection.
+    """
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        clients = list(_async_clients.pop(loop, {}).values())
+    for client in clients:
+        await client.aclose()
+
+
+def close_http_clients() -> None:
+    """Close the shared sync clients (see :func:`close_async_http_clients` for async ones)."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
+
+
+atexit.register(close_http_clients)
+
+
+__all__ = [
+    "HTTP2_AVAILABLE",
+    "AsyncGuardedTransport",
+    "GuardedTransport",
+    "close_async_http_clients",
+    "close_http_clients",
+    "create_async_http_client",
+    "create_http_client",
+    "get_async_http_client",
+    "get_http_client",
+]
@@ -1,13 +1,30 @@
-"""Security helpers for validating WhatsApp ZIP exports."""
+"""Security helpers for validating WhatsApp ZIP exports.
+
+Validation results are cached per archive (keyed by resolved path, size and
+mtime), so the several components that open the same export during a run
+only pay for the central-directory scan once. :class:`ZipArchive` goes a
+step further and keeps a single validated handle open with a
+``basename -> ZipInfo`` index for constant-time media lookups.
+"""
 
 from __future__ import annotations
 
+import mmap
+import os
+import shutil
+import struct
+import threading
+import zipfile
+import zlib
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Annotated
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Annotated, Self
 
 if TYPE_CHECKING:
-    import zipfile
+    from collections.abc import Iterator
+
 __all__ = [
+    "ZipArchive",
     "ZipValidationError",
     "ZipValidationSettings",
     "configure_default_limits",
@@ -87,6 +104,25 @@ class _ZipConfig:
     defaults: ZipValidationSettings = ZipValidationSettings()
 
 
+class _ValidatedArchives:
+    """Signatures of archives that already passed validation in this process."""
+
+    signatures: set[tuple[str, int, int, ZipValidationSettings]] = set()  # noqa: RUF012
+    lock = threading.Lock()
+
+
+def _archive_signature(zf: zipfile.ZipFile) -> tuple[str, int, int] | None:
+    """Identify the on-disk archive behind ``zf`` (None for in-memory archives)."""
+    filename = getattr(zf, "filename", None)
+    if not isinstance(filename, str | os.PathLike):
+        return None
+    try:
+        stat = Path(filename).stat()
+    except OSError:
+        return None
+    return (str(Path(filename).resolve()), stat.st_size, stat.st_mtime_ns)
+
+
 def configure_default_limits(
     limits: Annotated[ZipValidationSettings, "The new default validation limits"],
 ) -> None:
@@ -133,10 +169,27 @@ def validate_zip_contents(
     - Total uncompressed size limit
     - Compression ratio (zip bomb detection)
     - Path traversal prevention
+
+    Archives opened from a file are only inspected once per process as long
+    as their size and mtime are unchanged.
     """
     limits = limits or _ZipConfig.defaults
+    signature = _archive_signature(zf)
+    cache_key = (*signature, limits) if signature else None
+    if cache_key is not None:
+        with _ValidatedArchives.lock:
+            if cache_key in _ValidatedArchives.signatures:
+                return
+
+    _validate_members(zf.infolist(), limits)
+
+    if cache_key is not None:
+        with _ValidatedArchives.lock:
+            _ValidatedArchives.signatures.add(cache_key)
+
+
+def _validate_members(members: list[zipfile.ZipInfo], limits: ZipValidationSettings) -> None:
     total_size = 0
-    members = zf.infolist()
     if len(members) > limits.max_member_count:
         raise ZipMemberCountError(len(members), limits.max_member_count)
 
@@ -182,3 +235,152 @@ def _ensure_safe_path(member_name: str) -> None:
     normalized_path = member_name.replace("\\", "/")
     if "/../" in f"/{normalized_path}/":
         raise ZipPathTraversalError(member_name)
+
+
+# Local file header layout (APPNOTE 4.3.7); only the name/extra lengths are needed
+# to locate a member's data.
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+
+class ZipArchive:
+    """A validated, long-lived handle on a ZIP archive with a basename index.
+
+    The archive is opened and validated once; members are looked up by their
+    case-insensitive basename (how WhatsApp messages reference attachments)
+    in O(1). Stored (uncompressed) members, which covers most media in
+    WhatsApp exports, are served straight from a read-only ``mmap`` of the
+    archive instead of going through ``ZipExtFile``.
+
+    Example:
+        >>> with ZipArchive(Path("export.zip")) as archive:
+        ...     info = archive.find("IMG-001.jpg")
+        ...     archive.extract_to(info, Path("/tmp/IMG-001.jpg"))
+
+    """
+
+    def __init__(
+        self,
+        path: Annotated[Path, "Path to the ZIP archive"],
+        *,
+        limits: Annotated[ZipValidationSettings | None, "Optional validation limits to use"] = None,
+    ) -> None:
+        self.path = Path(path)
+        self.limits = limits or _ZipConfig.defaults
+        self._zf = zipfile.ZipFile(self.path, "r")
+        try:
+            validate_zip_contents(self._zf, limits=self.limits)
+        except BaseException:
+            self._zf.close()
+            raise
+        self.signature = _archive_signature(self._zf)
+        self._index: dict[str, zipfile.ZipInfo] = {}
+        for info in self._zf.infolist():
+            if not info.is_dir():
+                # First occurrence wins, matching a front-to-back scan of the archive.
+                self._index.setdefault(Path(info.filename).name.lower(), info)
+        self._mmap: mmap.mmap | None = None
+        self._mmap_lock = threading.Lock()
+
+    # -- lifecycle -------------------------------------------------------
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the mmap and the underlying file handle."""
+        with self._mmap_lock:
+            if self._mmap is not None:
+                self._mmap.close()
+                self._mmap = None
+        self._zf.close()
+
+    def is_current(self) -> bool:
+        """Whether the file on disk is still the one this handle was opened on."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return False
+        return self.signature is not None and self.signature[1:] == (stat.st_size, stat.st_mtime_ns)
+
+    # -- lookup ----------------------------------------------------------
+    @property
+    def zip_file(self) -> zipfile.ZipFile:
+        """The underlying :class:`zipfile.ZipFile` (already validated)."""
+        return self._zf
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and name.lower() in self._index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[zipfile.ZipInfo]:
+        return iter(self._index.values())
+
+    def find(self, name: str) -> zipfile.ZipInfo | None:
+        """Return the member whose basename matches ``name`` (case-insensitive)."""
+        return self._index.get(Path(name).name.lower())
+
+    # -- extraction ------------------------------------------------------
+    def read(self, info: zipfile.ZipInfo) -> bytes:
+        """Return the full contents of ``info``."""
+        ensure_safe_member_size(self._zf, info.filename, limits=self.limits)
+        view = self._stored_view(info)
+        if view is not None:
+            with view:
+                return view.tobytes()
+        return self._zf.read(info)
+
+    def copy_to(self, info: zipfile.ZipInfo, dest: IO[bytes]) -> None:
+        """Stream the contents of ``info`` into an open binary file object."""
+        ensure_safe_member_size(self._zf, info.filename, limits=self.limits)
+        view = self._stored_view(info)
+        if view is not None:
+            with view:
+                dest.write(view)
+            return
+        with self._zf.open(info) as source:
+            shutil.copyfileobj(source, dest, _COPY_CHUNK_SIZE)
+
+    def extract_to(self, info: zipfile.ZipInfo, target: Path) -> Path:
+        """Write the contents of ``info`` to ``target`` without buffering it in memory."""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with target.open("wb") as dest:
+            self.copy_to(info, dest)
+        return target
+
+    def _stored_view(self, info: zipfile.ZipInfo) -> memoryview | None:
+        """Zero-copy view of a stored, unencrypted member, or None if it must be decoded."""
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1 or info.file_size == 0:
+            return None
+        archive = self._archive_map()
+        header_end = info.header_offset + _LOCAL_HEADER.size
+        if header_end > len(archive):
+            msg = f"Truncated local header for {info.filename!r}"
+            raise zipfile.BadZipFile(msg)
+        header = _LOCAL_HEADER.unpack_from(archive, info.header_offset)
+        if header[0] != _LOCAL_HEADER_SIGNATURE:
+            msg = f"Bad local header signature for {info.filename!r}"
+            raise zipfile.BadZipFile(msg)
+        start = header_end + header[10] + header[11]
+        end = start + info.file_size
+        if end > len(archive):
+            msg = f"Truncated data for {info.filename!r}"
+            raise zipfile.BadZipFile(msg)
+        view = memoryview(archive)[start:end]
+        if zlib.crc32(view) != info.CRC:
+            view.release()
+            msg = f"Bad CRC-32 for file {info.filename!r}"
+            raise zipfile.BadZipFile(msg)
+        return view
+
+    def _archive_map(self) -> mmap.mmap:
+        with self._mmap_lock:
+            if self._mmap is None:
+                with self.path.open("rb") as handle:
+                    self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            return self._mmap
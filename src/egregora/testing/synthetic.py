@@ -0,0 +1,121 @@
+"""Synthetic WhatsApp exports for benchmarks and load tests.
+
+Produces a ZIP laid out like a real "Export chat" archive (a
+``Conversa do WhatsApp com <group>.txt`` transcript plus attached media),
+with configurable size and content mix. Output is deterministic for a given
+:class:`SyntheticChatSpec`, so benchmark runs are comparable.
+
+Example Usage:
+    spec = SyntheticChatSpec(messages=10_000, participants=12, media_ratio=0.02)
+    zip_path = generate_whatsapp_export(tmp_path / "chat.zip", spec)
+"""
+
+from __future__ import annotations
+
+import io
+import random
+import zipfile
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+__all__ = ["SyntheticChatSpec", "generate_whatsapp_export"]
+
+# Bidirectional mark WhatsApp puts in front of attachment names.
+_LRM = "\u200e"
+
+_FIRST_NAMES = (
+    "Ana", "Bruno", "Carla", "Diego", "Elisa", "Fábio", "Gabriela", "Heitor",
+    "Isabela", "João", "Karina", "Lucas", "Marina", "Nuno", "Olívia", "Paulo",
+)  # fmt: skip
+_WORDS = (
+    "hoje", "amanhã", "reunião", "projeto", "ideia", "café", "viagem", "livro",
+    "música", "filme", "trabalho", "festa", "almoço", "praia", "chuva", "treino",
+    "código", "teste", "notícia", "foto", "vídeo", "plano", "semana", "domingo",
+)  # fmt: skip
+_DOMAINS = ("example.com", "example.org", "news.example.net", "blog.example.io")
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticChatSpec:
+    """Shape of a generated chat export."""
+
+    messages: int = 1_000
+    participants: int = 8
+    media_ratio: float = 0.02  # Fraction of messages that attach an image
+    url_ratio: float = 0.05  # Fraction of messages that contain a link
+    start: datetime = datetime(2024, 1, 1, 8, 0)  # Exports carry local, naive times
+    days: int = 90
+    group_name: str = "Benchmark"
+    seed: int = 42
+
+    def __post_init__(self) -> None:
+        if self.messages < 1 or self.participants < 1 or self.days < 1:
+            msg = "messages, participants and days must be positive"
+            raise ValueError(msg)
+        if not (0.0 <= self.media_ratio <= 1.0 and 0.0 <= self.url_ratio <= 1.0):
+            msg = "media_ratio and url_ratio must be between 0 and 1"
+            raise ValueError(msg)
+
+
+def generate_whatsapp_export(path: Path, spec: SyntheticChatSpec | None = None) -> Path:
+    """Write a synthetic WhatsApp export ZIP to ``path`` and return it.
+
+    The transcript is streamed into the archive, so million-message exports
+    do not need to fit in memory.
+    """
+    spec = spec or SyntheticChatSpec()
+    rng = random.Random(spec.seed)  # noqa: S311 - deterministic fixture data, not crypto
+    authors = _participant_names(spec.participants)
+    image = _placeholder_jpeg()
+    step = timedelta(days=spec.days) / spec.messages
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        media_names: list[str] = []
+        transcript = f"Conversa do WhatsApp com {spec.group_name}.txt"
+        with archive.open(transcript, "w") as raw, io.TextIOWrapper(raw, encoding="utf-8") as out:
+            out.write(f"{spec.start:%d/%m/%Y %H:%M} - Você criou este grupo\n")
+            for index in range(spec.messages):
+                timestamp = spec.start + step * index
+                author = authors[rng.randrange(len(authors))]
+                roll = rng.random()
+                if roll < spec.media_ratio:
+                    name = f"IMG-{timestamp:%Y%m%d}-WA{len(media_names):04d}.jpg"
+                    media_names.append(name)
+                    body = f"{_LRM}{name} (arquivo anexado)"
+                elif roll < spec.media_ratio + spec.url_ratio:
+                    domain = _DOMAINS[rng.randrange(len(_DOMAINS))]
+                    body = f"{_sentence(rng)} https://{domain}/artigo/{index}"
+                else:
+                    body = _sentence(rng)
+                out.write(f"{timestamp:%d/%m/%Y %H:%M} - {author}: {body}\n")
+        for name in media_names:
+            # Already-compressed payloads: store them like the real export does.
+            archive.writestr(name, image, compress_type=zipfile.ZIP_STORED)
+    return path
+
+
+def _participant_names(count: int) -> list[str]:
+    names = []
+    for index in range(count):
+        first = _FIRST_NAMES[index % len(_FIRST_NAMES)]
+        suffix = index // len(_FIRST_NAMES)
+        names.append(f"{first} {suffix}" if suffix else first)
+    return names
+
+
+def _sentence(rng: random.Random) -> str:
+    words = [_WORDS[rng.randrange(len(_WORDS))] for _ in range(rng.randint(3, 18))]
+    return " ".join(words).capitalize()
+
+
+def _placeholder_jpeg() -> bytes:
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), (200, 120, 40)).save(buffer, "JPEG", quality=60)
+    return buffer.getvalue()
@@ -0,0 +1,388 @@
+"""Lightweight span tracing for pipeline runs.
+
+Spans follow the OpenTelemetry data model (trace/span ids, parent links,
+nanosecond start/end timestamps, attributes, status) but need no
+dependencies: a run is traced by installing a :class:`Tracer` with one of
+the local exporters below, and everything instrumented with :func:`span` or
+:func:`traced` is recorded. When no tracer is installed (the default),
+instrumentation is a cheap no-op.
+
+Exporters:
+    - :class:`JsonlSpanExporter`: one OTLP-style JSON object per span and per
+      line, streamed as spans finish.
+    - :class:`ChromeTraceExporter`: a ``{"traceEvents": [...]}`` file that
+      opens in ``chrome://tracing`` / Perfetto, written when tracing stops.
+    - :class:`StageTimingCollector`: in-memory per-stage aggregates, used to
+      feed the run ledger (see :mod:`egregora.database.run_store`).
+
+Example Usage:
+    with tracing_session(Path("trace.json")):
+        with span("pipeline.window", window="2024-01-01"):
+            ...
+
+Parent/child relationships are tracked with a ``ContextVar``, so nesting is
+correct across ``await`` points. Spans opened in worker threads start a new
+root within the same trace. Collectors registered with
+:func:`collecting_spans` are context-local too, so pipelines running side by
+side in different threads each only see their own spans.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import inspect
+import json
+import os
+import secrets
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, ParamSpec, Protocol, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
+
+__all__ = [
+    "ChromeTraceExporter",
+    "JsonlSpanExporter",
+    "Span",
+    "SpanExporter",
+    "StageTimingCollector",
+    "Tracer",
+    "collecting_spans",
+    "current_span",
+    "current_tracer",
+    "span",
+    "traced",
+    "tracing_session",
+]
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+_current_span: ContextVar[Span | None] = ContextVar("egregora_current_span", default=None)
+_collectors: ContextVar[tuple[SpanExporter, ...]] = ContextVar("egregora_span_collectors", default=())
+
+
+@dataclass(slots=True)
+class Span:
+    """A timed operation within a trace."""
+
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None = None
+    start_ns: int = 0
+    end_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "OK"
+    error: str | None = None
+    thread_id: int = 0
+    parent: Span | None = field(default=None, repr=False, compare=False)
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or time.time_ns()) - self.start_ns
+
+    def window(self) -> str | None:
+        """Return the ``window`` attribute of this span or its nearest ancestor."""
+        node: Span | None = self
+        while node is not None:
+            if "window" in node.attributes:
+                return str(node.attributes["window"])
+            node = node.parent
+        return None
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def to_otel_dict(self) -> dict[str, Any]:
+        """Serialize using OTLP/JSON field names."""
+        payload: dict[str, Any] = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "startTimeUnixNano": self.start_ns,
+            "endTimeUnixNano": self.end_ns,
+            "attributes": {key: _json_safe(value) for key, value in self.attributes.items()},
+            "status": {"code": self.status},
+        }
+        if self.parent_id:
+            payload["parentSpanId"] = self.parent_id
+        if self.error:
+            payload["status"]["message"] = self.error
+        return payload
+
+
+class _NoopSpan:
+    """Stand-in yielded by :func:`span` when tracing is disabled."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class SpanExporter(Protocol):
+    """Receives finished spans."""
+
+    def export(self, span: Span) -> None: ...
+
+    def shutdown(self) -> None: ...
+
+
+class JsonlSpanExporter:
+    """Append each finished span to a JSON Lines file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._handle = self.path.open("w", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        line = json.dumps(span.to_otel_dict())
+        with self._lock:
+            self._handle.write(line + "\n")
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._handle.close()
+
+
+class ChromeTraceExporter:
+    """Collect spans and write them as Chrome trace "complete" events on shutdown."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._events: list[dict[str, Any]] = []
+
+    def export(self, span: Span) -> None:
+        event = {
+            "name": span.name,
+            "cat": span.name.split(".", 1)[0],
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": span.duration_ns / 1000,
+            "pid": os.getpid(),
+            "tid": span.thread_id,
+            "args": {
+                **{key: _json_safe(value) for key, value in span.attributes.items()},
+                "span_id": span.span_id,
+                "parent_id": span.parent_id,
+                "status": span.status,
+                **({"error": span.error} if span.error else {}),
+            },
+        }
+        with self._lock:
+            self._events.append(event)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            events = sorted(self._events, key=lambda event: event["ts"])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}), encoding="utf-8")
+
+
+@dataclass(slots=True)
+class StageTiming:
+    """Aggregated timings for one span name (optionally within one window)."""
+
+    calls: int = 0
+    duration_ns: int = 0
+    failures: int = 0
+
+
+class StageTimingCollector:
+    """Aggregate finished spans by name, and by window for per-window spans.
+
+    A span carrying a ``window`` attribute marks a window; it and every span
+    nested below it are also counted under that window.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.stages: dict[str, StageTiming] = {}
+        self.windows: dict[tuple[str, str], StageTiming] = {}
+
+    def export(self, span: Span) -> None:
+        window = span.window()
+        with self._lock:
+            self._add(self.stages, span.name, span)
+            if window is not None:
+                self._add(self.windows, (window, span.name), span)
+
+    def shutdown(self) -> None:
+        pass
+
+    @staticmethod
+    def _add(target: dict[Any, StageTiming], key: Any, span: Span) -> None:
+        timing = target.setdefault(key, StageTiming())
+        timing.calls += 1
+        timing.duration_ns += span.duration_ns
+        if span.status == "ERROR":
+            timing.failures += 1
+
+
+class Tracer:
+    """Creates spans and hands finished ones to the configured exporters."""
+
+    def __init__(self, exporters: list[SpanExporter]) -> None:
+        self.exporters = exporters
+        self.trace_id = secrets.token_hex(16)
+
+    @contextlib.contextmanager
+    def start_span(self, name: str, attributes: dict[str, Any]) -> Iterator[Span]:
+        parent = _current_span.get()
+        current = Span(
+            name=name,
+            trace_id=self.trace_id,
+            span_id=secrets.token_hex(8),
+            parent_id=parent.span_id if parent is not None else None,
+            start_ns=time.time_ns(),
+            attributes=attributes,
+            thread_id=threading.get_ident(),
+            parent=parent,
+        )
+        token = _current_span.set(current)
+        try:
+            yield current
+        except BaseException as exc:
+            current.status = "ERROR"
+            current.error = f"{type(exc).__name__}: {exc}"
+            raise
+        finally:
+            current.end_ns = time.time_ns()
+            try:
+                _current_span.reset(token)
+            except ValueError:  # closed from another context (e.g. an async generator)
+                _current_span.set(parent)
+            for exporter in (*self.exporters, *_collectors.get()):
+                exporter.export(current)
+
+    def shutdown(self) -> None:
+        for exporter in self.exporters:
+            exporter.shutdown()
+
+
+class _TracingState:
+    tracer: Tracer | None = None
+    # Tracer installed only to serve collectors, and how many collectors use it.
+    collector_tracer: Tracer | None = None
+    collector_users: int = 0
+    lock = threading.Lock()
+
+
+def current_tracer() -> Tracer | None:
+    """Return the installed tracer, or None when tracing is disabled."""
+    return _TracingState.tracer
+
+
+def current_span() -> Span | _NoopSpan:
+    """Return the innermost open span (a no-op stand-in when there is none)."""
+    if _TracingState.tracer is None:
+        return _NOOP_SPAN
+    return _current_span.get() or _NOOP_SPAN
+
+
+@contextlib.contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Span | _NoopSpan]:
+    """Record the enclosed block as a span named ``name``."""
+    tracer = _TracingState.tracer
+    if tracer is None:
+        yield _NOOP_SPAN
+        return
+    with tracer.start_span(name, attributes) as current:
+        yield current
+
+
+def traced(name: str | None = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """Decorate a sync or async function so each call is recorded as a span."""
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                with span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def exporter_for(path: Path) -> SpanExporter:
+    """Pick an exporter from the output file extension (``.jsonl`` or Chrome JSON)."""
+    if path.suffix == ".jsonl":
+        return JsonlSpanExporter(path)
+    return ChromeTraceExporter(path)
+
+
+@contextlib.contextmanager
+def tracing_session(path: Path | None) -> Iterator[Tracer | None]:
+    """Install a tracer writing to ``path`` for the duration of the block.
+
+    ``None`` disables tracing, which lets callers wrap unconditionally.
+    """
+    if path is None:
+        yield None
+        return
+    tracer = Tracer([exporter_for(path)])
+    previous, _TracingState.tracer = _TracingState.tracer, tracer
+    try:
+        with span("egregora.run"):
+            yield tracer
+    finally:
+        _TracingState.tracer = previous
+        tracer.shutdown()
+
+
+@contextlib.contextmanager
+def collecting_spans(exporter: SpanExporter) -> Iterator[SpanExporter]:
+    """Feed spans finished inside the block (in this context) to ``exporter``.
+
+    Uses the installed tracer when there is one (e.g. ``--trace``), otherwise
+    installs a tracer that lives as long as some collector needs it.
+    """
+    token = _collectors.set((*_collectors.get(), exporter))
+    with _TracingState.lock:
+        if _TracingState.tracer is None:
+            _TracingState.tracer = _TracingState.collector_tracer = Tracer([])
+        if _TracingState.tracer is _TracingState.collector_tracer:
+            _TracingState.collector_users += 1
+            owned = _TracingState.collector_tracer
+        else:
+            owned = None
+    try:
+        yield exporter
+    finally:
+        _collectors.reset(token)
+        if owned is not None:
+            with _TracingState.lock:
+                _TracingState.collector_users -= 1
+                if not _TracingState.collector_users and _TracingState.tracer is owned:
+                    _TracingState.tracer = _TracingState.collector_tracer = None
+        exporter.shutdown()
+
+
+def _json_safe(value: Any) -> Any:
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+    return str(value)
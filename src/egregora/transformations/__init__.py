@@ -14,6 +14,7 @@ What's Exported:
   - `Window`: Window data structure with metadata
   - `load_checkpoint`, `save_checkpoint`: Resume logic via sentinel files
   - `split_window_into_n_parts`: Parallel processing utilities
+  - `WindowTokenIndex`: Per-message token counts for sizing windows by tokens
 
 **Media Processing** (media.py):
   - `process_media_for_window`: Extract and standardize media references
@@ -57,6 +58,7 @@ from egregora.ops.media import (
 from egregora.transformations.windowing import (
     Window,
     WindowConfig,
+    WindowTokenIndex,
     create_windows,
     generate_window_signature,
     split_window_into_n_parts,
@@ -65,6 +67,7 @@ from egregora.transformations.windowing import (
 __all__ = [
     "Window",
     "WindowConfig",
+    "WindowTokenIndex",
     "create_windows",
     "extract_media_references",
     "generate_window_signature",
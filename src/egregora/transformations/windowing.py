@@ -37,12 +37,15 @@ from ibis.expr.types import Table
 
 from egregora.agents.formatting import build_conversation_xml
 from egregora.config.settings import EgregoraConfig
+from egregora.llm.token_utils import EstimateTokenizer, TokenCounter
 from egregora.transformations.exceptions import InvalidSplitError, InvalidStepUnitError
 
 logger = logging.getLogger(__name__)
 
 # Constants
 HOURS_PER_DAY = 24  # Hours in a day for time unit conversion
+# Tokens of the <m id=".." author=".." ts=".."> wrapper each message gets in the writer prompt
+MESSAGE_OVERHEAD_TOKENS = 32
 
 
 # ============================================================================
@@ -523,6 +526,56 @@ def _window_by_bytes(
         current_start_idx = next_start_idx
 
 
+class WindowTokenIndex:
+    """Token counts of every message in a table, for sizing windows by tokens.
+
+    Counts are computed once per message (and memoized per text by the
+    :class:`~egregora.llm.token_utils.TokenCounter`), stored in timestamp order
+    alongside the messages' timestamps, and summed with prefix sums, so the
+    token size of any window or split part is an O(log N) lookup. With the
+    character estimate the counts are computed in the query itself and message
+    text is never fetched.
+    """
+
+    def __init__(self, timestamps: list[datetime], token_counts: list[int]) -> None:
+        self.timestamps = timestamps
+        self._prefix = [0, *accumulate(token_counts)]
+
+    @classmethod
+    def build(cls, table: Table, counter: TokenCounter) -> "WindowTokenIndex":
+        """Count the tokens of every message in ``table`` (one query)."""
+        if isinstance(counter.tokenizer, EstimateTokenizer):
+            tokens = (table.text.length() // 4).fill_null(0) + MESSAGE_OVERHEAD_TOKENS
+            rows = table.select("ts", tokens=tokens).order_by("ts").execute()
+            return cls(rows["ts"].tolist(), rows["tokens"].astype(int).tolist())
+        rows = table.select("ts", "text").order_by("ts").execute()
+        token_counts = [
+            counter.count(text) + MESSAGE_OVERHEAD_TOKENS
+            if isinstance(text, str)
+            else MESSAGE_OVERHEAD_TOKENS
+            for text in rows["text"].tolist()
+        ]
+        return cls(rows["ts"].tolist(), token_counts)
+
+    @property
+    def total_tokens(self) -> int:
+        return self._prefix[-1]
+
+    def tokens_between(self, start_time: datetime, end_time: datetime) -> int:
+        """Return the tokens of messages with ``start_time <= ts <= end_time``."""
+        start_idx = bisect_left(self.timestamps, start_time)
+        end_idx = bisect_right(self.timestamps, end_time)
+        return self._prefix[max(end_idx, start_idx)] - self._prefix[start_idx]
+
+    def tokens_in(self, window: Window) -> int:
+        """Return the prompt tokens of ``window``'s messages.
+
+        Boundary messages are included even when the window's end is exclusive,
+        which errs towards splitting slightly early rather than too late.
+        """
+        return self.tokens_between(window.start_time, window.end_time)
+
+
 def split_window_into_n_parts(window: Window, n: int) -> list[Window]:
     """Split a window into N equal parts by time.
 
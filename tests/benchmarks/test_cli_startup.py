@@ -0,0 +1,85 @@
+"""Cold-start budget for the CLI.
+
+The CLI is run from cron and shell scripts many times a day, so `egregora --help`
+(and `--help` on subcommands) must not import the pipeline. Each case runs in a
+fresh interpreter under ``python -X importtime`` and checks both *what* got
+imported and how long importing ``egregora.cli`` took.
+
+Override the budget with ``EGREGORA_CLI_IMPORT_BUDGET_MS`` on slow machines.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_MS = float(os.environ.get("EGREGORA_CLI_IMPORT_BUDGET_MS", "1000"))
+RUNS = 3
+
+# Top-level packages that only commands doing real work may load.
+HEAVY_MODULES = {
+    "duckdb",
+    "google",
+    "ibis",
+    "lancedb",
+    "pandas",
+    "pydantic_ai",
+    "pydantic_settings",
+}
+HEAVY_EGREGORA_PACKAGES = {
+    "egregora.agents",
+    "egregora.config",
+    "egregora.database",
+    "egregora.orchestration",
+    "egregora.output_sinks",
+    "egregora.rag",
+}
+
+_IMPORT_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def _run_with_importtime(args: list[str]) -> tuple[dict[str, int], set[str]]:
+    """Run the CLI in a fresh interpreter; return cumulative import times (us) and module names."""
+    code = f"from egregora.cli import app; app({args!r})"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=False,
+        env={**os.environ, "PYTHONDONTWRITEBYTECODE": "1"},
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    cumulative: dict[str, int] = {}
+    modules: set[str] = set()
+    for line in result.stderr.splitlines():
+        match = _IMPORT_LINE.match(line)
+        if match:
+            name = match.group(4)
+            modules.add(name)
+            cumulative[name] = max(cumulative.get(name, 0), int(match.group(2)))
+    return cumulative, modules
+
+
+@pytest.mark.parametrize("args", [["--help"], ["write", "--help"], ["show", "--help"], ["read", "--help"]])
+def test_cli_help_does_not_import_pipeline(args):
+    _, modules = _run_with_importtime(args)
+
+    heavy = sorted(
+        name
+        for name in modules
+        if name.split(".")[0] in HEAVY_MODULES
+        or any(name == pkg or name.startswith(f"{pkg}.") for pkg in HEAVY_EGREGORA_PACKAGES)
+    )
+    assert not heavy, f"`egregora {' '.join(args)}` imported heavy modules: {heavy[:20]}"
+
+
+def test_cli_import_time_within_budget():
+    best_ms = min(_run_with_importtime(["--help"])[0]["egregora.cli"] for _ in range(RUNS)) / 1000
+    assert best_ms <= IMPORT_BUDGET_MS, (
+        f"Importing egregora.cli took {best_ms:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
+    )
@@ -0,0 +1,153 @@
+"""End-to-end throughput benchmark for the write pipeline on synthetic exports.
+
+Runs ``run_cli_flow`` against a generated WhatsApp export. Every stage runs
+for real; only the models behind them are deterministic stand-ins: the
+writer and taxonomy agents use pydantic-ai ``TestModel``, the profile agent
+is the suite's stub, and RAG indexes into LanceDB with hashed embeddings.
+The numbers therefore cover parsing, windowing, writer tool handling,
+profiles, RAG indexing and retrieval, persistence and site generation, but
+no network time. Per-stage timings come from the run ledger.
+
+Only the 10k-message scale runs by default. Larger scales are opt-in:
+
+    EGREGORA_E2E_BENCH_SCALES=10000,100000,1000000 pytest tests/benchmarks/test_e2e_pipeline_benchmark.py -s
+
+Set ``EGREGORA_E2E_BENCH_REPORT=<dir>`` to keep a JSON report per scale.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+import ibis
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.models.test import TestModel
+
+from egregora.agents.taxonomy import GlobalTaxonomyResult
+from egregora.cli.write import run_cli_flow
+from egregora.config import EMBEDDING_DIM, load_egregora_config
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.run_store import RunStore
+from egregora.database.utils import resolve_db_uri
+from egregora.testing.synthetic import SyntheticChatSpec, generate_whatsapp_export
+from tests.utils.pydantic_test_models import MockEmbeddingModel
+
+pytestmark = pytest.mark.benchmark
+
+DEFAULT_SCALES = "10000"
+WINDOW_SIZE = 500
+# Late windows may not be this much slower than early ones: per-window work
+# must not grow with the amount of data already persisted.
+MAX_LATE_WINDOW_SLOWDOWN = 3.0
+
+
+def _enabled_scales() -> set[int]:
+    raw = os.environ.get("EGREGORA_E2E_BENCH_SCALES", DEFAULT_SCALES)
+    return {int(value) for value in raw.split(",") if value.strip()}
+
+
+@pytest.fixture
+def offline_pipeline(monkeypatch, tmp_path, writer_test_agent):
+    monkeypatch.setenv("GOOGLE_API_KEY", "benchmark-key")
+    monkeypatch.setenv("EGREGORA_SKIP_API_KEY_VALIDATION", "1")
+    # The vector store resolves its default path against the working directory.
+    monkeypatch.chdir(tmp_path)
+    embeddings = MockEmbeddingModel(dimensionality=EMBEDDING_DIM)
+    monkeypatch.setattr(
+        "egregora.rag.embed_fn",
+        lambda texts, _task_type=None: [embeddings.embed(text) for text in texts],
+    )
+    monkeypatch.setattr(
+        "egregora.ops.taxonomy.create_global_taxonomy_agent",
+        lambda _model: Agent(
+            TestModel(custom_output_args={"mappings": []}), output_type=GlobalTaxonomyResult
+        ),
+    )
+    return writer_test_agent
+
+
+def _read_ledger(site_root: Path) -> dict[str, Any]:
+    config = load_egregora_config(site_root)
+    backend = ibis.connect(resolve_db_uri(config.database.pipeline_db, site_root))
+    try:
+        store = RunStore(DuckDBStorageManager.from_ibis_backend(backend))
+        run = store.list_runs(limit=1)[0]
+        return {
+            "run": run,
+            "stages": store.get_stages(run.run_id),
+            "windows": store.get_stages(run.run_id, per_window=True),
+        }
+    finally:
+        backend.disconnect()
+
+
+def _report(messages: int, generate_s: float, total_s: float, ledger: dict[str, Any]) -> dict[str, Any]:
+    stages = {
+        metric.stage: {
+            "calls": metric.calls,
+            "seconds": round(metric.duration_ms / 1000, 3),
+            "messages_per_second": round(messages / (metric.duration_ms / 1000), 1)
+            if metric.duration_ms
+            else None,
+        }
+        for metric in ledger["stages"]
+        if metric.stage.startswith(("pipeline.", "worker.", "site."))
+    }
+    return {
+        "messages": messages,
+        "generate_seconds": round(generate_s, 3),
+        "total_seconds": round(total_s, 3),
+        "messages_per_second": round(messages / total_s, 1),
+        "windows": ledger["run"].windows,
+        "stages": stages,
+    }
+
+
+@pytest.mark.parametrize(
+    "messages",
+    [
+        pytest.param(10_000, id="10k"),
+        pytest.param(100_000, id="100k", marks=pytest.mark.slow),
+        pytest.param(1_000_000, id="1M", marks=pytest.mark.slow),
+    ],
+)
+def test_write_pipeline_throughput(messages, offline_pipeline, tmp_path, capsys):
+    if messages not in _enabled_scales():
+        pytest.skip(f"scale {messages} not enabled (set EGREGORA_E2E_BENCH_SCALES)")
+
+    spec = SyntheticChatSpec(messages=messages, participants=24, media_ratio=0.01, url_ratio=0.05, days=365)
+    started = time.perf_counter()
+    zip_path = generate_whatsapp_export(tmp_path / "export.zip", spec)
+    generate_s = time.perf_counter() - started
+
+    site_root = tmp_path / "site"
+    started = time.perf_counter()
+    run_cli_flow(zip_path, output=site_root, step_size=WINDOW_SIZE, enable_enrichment=False)
+    total_s = time.perf_counter() - started
+
+    ledger = _read_ledger(site_root)
+    report = _report(messages, generate_s, total_s, ledger)
+    if report_dir := os.environ.get("EGREGORA_E2E_BENCH_REPORT"):
+        Path(report_dir).mkdir(parents=True, exist_ok=True)
+        (Path(report_dir) / f"write_pipeline_{messages}.json").write_text(json.dumps(report, indent=2))
+    with capsys.disabled():
+        print(f"\n[e2e benchmark] {json.dumps(report)}")  # noqa: T201
+
+    assert ledger["run"].status == "completed"
+    assert ledger["run"].windows == pytest.approx(messages / WINDOW_SIZE, abs=1)
+    assert ledger["run"].posts == ledger["run"].windows
+
+    # Super-linear guard: compare the first and last quarter of windows.
+    window_ms = [m.duration_ms for m in ledger["windows"] if m.stage == "pipeline.process_item"]
+    quarter = max(1, len(window_ms) // 4)
+    early = statistics.median(window_ms[:quarter])
+    late = statistics.median(window_ms[-quarter:])
+    assert late <= early * MAX_LATE_WINDOW_SLOWDOWN, (
+        f"late windows take {late:.1f}ms vs {early:.1f}ms early; per-window cost grows with corpus size"
+    )
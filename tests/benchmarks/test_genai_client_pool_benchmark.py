@@ -0,0 +1,82 @@
+"""Benchmark: pooled Gemini client vs a new client per call, against a local fake endpoint.
+
+Building a ``genai.Client`` sets up its own HTTP transport, and a fresh
+transport reconnects; the client from ``get_genai_client`` is built once and
+keeps its connection alive across calls.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from google import genai
+
+from egregora.llm.providers.genai_clients import get_genai_client
+
+CALLS_PER_ROUND = 20
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self) -> None:
+        type(self).connections += 1
+        super().setup()
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps(
+            {"candidates": [{"content": {"role": "model", "parts": [{"text": "ok"}]}}]}
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def fake_gemini():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def _call(client: genai.Client) -> None:
+    assert client.models.generate_content(model="gemini-test", contents="hi").text == "ok"
+
+
+def test_benchmark_new_client_per_call(benchmark, fake_gemini):
+    def run():
+        for _ in range(CALLS_PER_ROUND):
+            client = genai.Client(api_key="bench-key", http_options={"base_url": fake_gemini})
+            _call(client)
+            client.close()
+
+    benchmark(run)
+
+
+def test_benchmark_pooled_client(benchmark, fake_gemini):
+    def run():
+        for _ in range(CALLS_PER_ROUND):
+            _call(get_genai_client("bench-key", base_url=fake_gemini))
+
+    benchmark(run)
+
+
+def test_pooled_client_reuses_one_connection(fake_gemini):
+    before = _Handler.connections
+    for _ in range(CALLS_PER_ROUND):
+        _call(get_genai_client("bench-key", base_url=fake_gemini))
+    assert _Handler.connections - before == 1
@@ -0,0 +1,124 @@
+"""Benchmark: pooled HTTP client vs a new client per request, against a local TLS server.
+
+A fresh client pays a TCP connect and a TLS handshake for every request; the
+pooled client from ``egregora.security.http`` pays them once per connection.
+"""
+
+from __future__ import annotations
+
+import ipaddress
+import ssl
+import threading
+from datetime import UTC, datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING
+
+import httpx
+import pytest
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from egregora.security.http import create_http_client
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+REQUESTS_PER_ROUND = 20
+
+
+def _self_signed_cert(directory: Path) -> tuple[Path, Path]:
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.now(UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(minutes=1))
+        .not_valid_after(now + timedelta(hours=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False
+        )
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "cert.pem"
+    key_path = directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+    )
+    return cert_path, key_path
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    disable_nagle_algorithm = True  # headers and body go out in separate writes
+    connections = 0
+
+    def setup(self) -> None:
+        type(self).connections += 1
+        super().setup()
+
+    def do_GET(self) -> None:
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def tls_server(tmp_path_factory):
+    cert_path, key_path = _self_signed_cert(tmp_path_factory.mktemp("tls"))
+    server_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    server_context.load_cert_chain(cert_path, key_path)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.socket = server_context.wrap_socket(server.socket, server_side=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client_context = ssl.create_default_context(cafile=str(cert_path))
+    yield f"https://127.0.0.1:{server.server_address[1]}/", client_context
+    server.shutdown()
+    server.server_close()
+
+
+def test_benchmark_new_client_per_request(benchmark, tls_server):
+    url, verify = tls_server
+
+    def run():
+        for _ in range(REQUESTS_PER_ROUND):
+            with httpx.Client(verify=verify) as client:
+                client.get(url).raise_for_status()
+
+    benchmark(run)
+
+
+def test_benchmark_pooled_client(benchmark, tls_server):
+    url, verify = tls_server
+    client = create_http_client(verify=verify)
+
+    def run():
+        for _ in range(REQUESTS_PER_ROUND):
+            client.get(url).raise_for_status()
+
+    benchmark(run)
+    client.close()
+
+
+def test_pooled_client_reuses_one_connection(tls_server):
+    url, verify = tls_server
+    before = _Handler.connections
+    with create_http_client(verify=verify) as client:
+        for _ in range(REQUESTS_PER_ROUND):
+            client.get(url).raise_for_status()
+    assert _Handler.connections - before == 1
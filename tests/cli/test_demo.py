@@ -16,7 +16,7 @@ def test_demo_command_offline_mode(mock_run_offline_demo):
         mock_run_offline_demo.assert_called_once()
 
 
-@patch("egregora.cli.main.run_cli_flow")
+@patch("egregora.cli.write.run_cli_flow")
 def test_demo_command_online_mode(mock_run_cli_flow):
     """Test that the demo command runs in online mode when an API key is set."""
     with patch.dict("os.environ", {"GOOGLE_API_KEY": "test_key"}, clear=True):
@@ -313,6 +313,26 @@ def reset_rag_backend():
     rag.reset_backend()
 
 
+@pytest.fixture(autouse=True)
+def reset_dns_cache():
+    """Keep DNS resolutions mocked by one test from answering the next."""
+    from egregora.security.dns import clear_dns_cache
+
+    clear_dns_cache()
+    yield
+    clear_dns_cache()
+
+
+@pytest.fixture(autouse=True)
+def reset_genai_clients():
+    """Keep Gemini clients built under one test's patches from serving the next."""
+    from egregora.llm.providers.genai_clients import close_genai_clients
+
+    close_genai_clients()
+    yield
+    close_genai_clients()
+
+
 @pytest.fixture
 def writer_test_agent(monkeypatch):
     """Install deterministic writer agent built on ``pydantic-ai`` TestModel."""
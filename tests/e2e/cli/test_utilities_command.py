@@ -78,7 +78,7 @@ class TestDoctorCommand:
     def test_doctor_exit_code_on_success(self):
         """Test doctor exits with 0 when all checks pass (mocked)."""
         # This test mocks the diagnostics to all return OK
-        with patch("egregora.cli.main.run_diagnostics") as mock_diagnostics:
+        with patch("egregora.cli.diagnostics.run_diagnostics") as mock_diagnostics:
             mock_diagnostics.return_value = [
                 DiagnosticResult(check="Python Version", status=HealthStatus.OK, message="Python 3.12.0"),
                 DiagnosticResult(
@@ -91,7 +91,7 @@ class TestDoctorCommand:
 
     def test_doctor_exit_code_on_error(self):
         """Test doctor exits with 1 when errors are found (mocked)."""
-        with patch("egregora.cli.main.run_diagnostics") as mock_diagnostics:
+        with patch("egregora.cli.diagnostics.run_diagnostics") as mock_diagnostics:
             mock_diagnostics.return_value = [
                 DiagnosticResult(
                     check="API Key", status=HealthStatus.ERROR, message="GOOGLE_API_KEY not set"
@@ -103,7 +103,7 @@ class TestDoctorCommand:
 
     def test_doctor_continues_on_warnings(self):
         """Test doctor exits with 0 even when warnings are found."""
-        with patch("egregora.cli.main.run_diagnostics") as mock_diagnostics:
+        with patch("egregora.cli.diagnostics.run_diagnostics") as mock_diagnostics:
             mock_diagnostics.return_value = [
                 DiagnosticResult(
                     check="Some Warning", status=HealthStatus.WARNING, message="Generic warning message"
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import json
 from pathlib import Path
 
 from egregora.input_adapters.iperon_tjro import IperonTJROAdapter
+from tests.helpers.http_stub import StubHTTPServer
 
 
 class _FakeTable:
@@ -54,3 +56,101 @@ def test_adapter_parses_mock_payload(tmp_path: Path, monkeypatch):
     assert second["ts"] is not None
 
     assert "TJRO" in adapter.content_summary
+
+
+def _item(item_id: int) -> dict:
+    return {
+        "id": item_id,
+        "data_disponibilizacao": "2025-11-20",
+        "siglaTribunal": "TJRO",
+        "texto": f"Comunicação {item_id}",
+    }
+
+
+def _capture_rows(monkeypatch) -> dict[str, object]:
+    captured: dict[str, object] = {}
+
+    def fake_memtable(data, schema=None, columns=None):
+        captured["rows"] = data
+        return _FakeTable(data, schema)
+
+    monkeypatch.setattr("egregora.input_adapters.iperon_tjro.ibis.memtable", fake_memtable)
+    return captured
+
+
+def test_query_pagination_is_cached_and_resumes_from_cursor(tmp_path: Path, monkeypatch):
+    captured = _capture_rows(monkeypatch)
+
+    with StubHTTPServer() as server:
+        server.add_json("/api?pagina=1", {"items": [_item(1), _item(2)]})
+        server.add_json("/api?pagina=2", {"items": [_item(3)]})
+        server.add_json("/api", {"items": []})
+
+        config_path = tmp_path / "query.json"
+        config_path.write_text(
+            json.dumps({"query": {"nomeParte": "IPERON"}, "base_url": server.url("/api"), "concurrency": 2}),
+            encoding="utf-8",
+        )
+        adapter = IperonTJROAdapter()
+
+        adapter.parse(config_path)
+        assert [row["event_id"] for row in captured["rows"]] == ["1", "2", "3"]
+        assert 304 not in server.statuses()
+
+        # Second ingest: known pages are revalidated (304) and a new page is discovered
+        server.requests.clear()
+        server.add_json("/api?pagina=3", {"items": [_item(4)]})
+        adapter.parse(config_path)
+
+        assert [row["event_id"] for row in captured["rows"]] == ["1", "2", "3", "4"]
+        pages = {r.query["pagina"][0]: r for r in server.requests}
+        assert pages["1"].status == 304
+        assert pages["2"].status == 304
+        assert pages["1"].headers.get("If-None-Match")
+        assert pages["3"].status == 200
+
+    cursor_files = list((tmp_path / ".egregora" / ".cache" / "http" / "iperon-tjro").glob("cursor-*"))
+    assert len(cursor_files) == 1
+    assert json.loads(cursor_files[0].read_text())["last_page"] == 3
+
+
+def test_url_list_fetched_concurrently_and_failures_isolated(tmp_path: Path, monkeypatch):
+    captured = _capture_rows(monkeypatch)
+
+    with StubHTTPServer() as server:
+        server.add_json("/a", {"items": [_item(1)]})
+        server.add_json("/b", {"items": [_item(2)]})
+
+        config_path = tmp_path / "urls.txt"
+        config_path.write_text(
+            "\n".join([server.url("/a"), server.url("/missing"), server.url("/b")]), encoding="utf-8"
+        )
+
+        IperonTJROAdapter().parse(config_path)
+
+    assert sorted(row["event_id"] for row in captured["rows"]) == ["1", "2"]
+
+
+def test_zero_max_pages_means_no_limit(tmp_path: Path, monkeypatch):
+    captured = _capture_rows(monkeypatch)
+
+    with StubHTTPServer() as server:
+        server.add_json("/api?pagina=1", {"items": [_item(1)]})
+        server.add_json("/api?pagina=2", {"items": [_item(2)]})
+        server.add_json("/api", {"items": []})
+
+        config_path = tmp_path / "query.json"
+        config_path.write_text(
+            json.dumps(
+                {
+                    "query": {"nomeParte": "IPERON"},
+                    "base_url": server.url("/api"),
+                    "max_pages": 0,
+                    "cache": False,
+                }
+            ),
+            encoding="utf-8",
+        )
+        IperonTJROAdapter().parse(config_path)
+
+    assert [row["event_id"] for row in captured["rows"]] == ["1", "2"]
@@ -0,0 +1,131 @@
+"""Local stub HTTP server for network-facing tests.
+
+Runs a ``ThreadingHTTPServer`` on ``127.0.0.1`` with an ephemeral port and
+serves canned responses registered per path. Responses carry a strong ETag
+derived from the body, and conditional requests (``If-None-Match``) are
+answered with ``304 Not Modified`` so caching layers can be exercised
+without touching the internet.
+
+Example Usage:
+    with StubHTTPServer() as server:
+        server.add_json("/items", {"items": [1, 2]})
+        httpx.get(server.url("/items"))
+        assert server.requests[-1].status == 200
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Self
+from urllib.parse import parse_qs, urlsplit
+
+
+@dataclass
+class StubResponse:
+    body: bytes
+    status: int = 200
+    headers: dict[str, str] = field(default_factory=dict)
+    etag: bool = True
+
+
+@dataclass
+class RecordedRequest:
+    path: str
+    query: dict[str, list[str]]
+    headers: dict[str, str]
+    status: int
+
+
+class StubHTTPServer:
+    """Threaded HTTP server returning canned responses keyed by path (and optional query)."""
+
+    def __init__(self) -> None:
+        self._routes: dict[str, StubResponse] = {}
+        self._lock = threading.Lock()
+        self.requests: list[RecordedRequest] = []
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    # -- lifecycle -------------------------------------------------------
+    def __enter__(self) -> Self:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join(timeout=5)
+
+    @property
+    def port(self) -> int:
+        return self._server.server_address[1]
+
+    def url(self, path: str = "/") -> str:
+        return f"http://127.0.0.1:{self.port}{path}"
+
+    # -- routes ----------------------------------------------------------
+    def add(self, route: str, response: StubResponse) -> None:
+        """Register a response for ``route`` (``/path`` or ``/path?key=value``)."""
+        with self._lock:
+            self._routes[route] = response
+
+    def add_json(self, route: str, payload: Any, **kwargs: Any) -> None:
+        headers = {"Content-Type": "application/json", **kwargs.pop("headers", {})}
+        self.add(route, StubResponse(json.dumps(payload).encode("utf-8"), headers=headers, **kwargs))
+
+    def statuses(self, path: str | None = None) -> list[int]:
+        with self._lock:
+            return [r.status for r in self.requests if path is None or r.path == path]
+
+    def _resolve(self, path: str, query: dict[str, list[str]]) -> StubResponse | None:
+        with self._lock:
+            for key in sorted(query):
+                candidate = f"{path}?{key}={query[key][0]}"
+                if candidate in self._routes:
+                    return self._routes[candidate]
+            return self._routes.get(path)
+
+    def _record(self, request: RecordedRequest) -> None:
+        with self._lock:
+            self.requests.append(request)
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                parts = urlsplit(self.path)
+                query = parse_qs(parts.query)
+                response = server._resolve(parts.path, query)
+                if response is None:
+                    status, body, headers = 404, b"not found", {}
+                else:
+                    status, body, headers = response.status, response.body, dict(response.headers)
+                    if response.etag:
+                        headers["ETag"] = f'"{hashlib.sha256(response.body).hexdigest()[:16]}"'
+                        if self.headers.get("If-None-Match") == headers["ETag"]:
+                            status, body = 304, b""
+                # Record before replying so callers see the request as soon as they get the response.
+                server._record(RecordedRequest(parts.path, query, dict(self.headers), status))
+                self._send(status, body, headers)
+
+            def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                if status != 304:
+                    self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                if body and status != 304:
+                    self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        return _Handler
@@ -0,0 +1,125 @@
+"""Tests for the DNS resolution cache inside the SSRF pinning layer."""
+
+import ipaddress
+import socket
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from egregora.security.dns import DNSCache, get_dns_cache, safe_dns_validation
+from egregora.security.ssrf import SSRFValidationError
+
+PUBLIC_IP = "93.184.216.34"
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _addrinfo(ip: str, port=None):
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, port or 0))]
+
+
+def test_validations_of_the_same_host_resolve_once():
+    calls = []
+
+    def fake_getaddrinfo(host, port, *_args):
+        calls.append(host)
+        return _addrinfo(PUBLIC_IP, port)
+
+    with patch("egregora.security.dns._original_getaddrinfo", side_effect=fake_getaddrinfo):
+        for _ in range(5):
+            with safe_dns_validation("https://example.com/page"):
+                # Redirect targets resolved inside the context use the cache too.
+                addr = socket.getaddrinfo("cdn.example.com", 443, type=socket.SOCK_STREAM)
+                assert addr[0][4] == (PUBLIC_IP, 443)
+
+    assert calls == ["example.com", "cdn.example.com"]
+    assert get_dns_cache().hits == 8
+
+
+def test_cached_addresses_are_checked_against_current_blocked_ranges():
+    # Non-empty, so lookups go through the cache, but 10.0.0.0/8 is allowed.
+    permissive = (ipaddress.ip_network("192.0.2.0/24"),)
+    with patch(
+        "egregora.security.dns._original_getaddrinfo", return_value=_addrinfo("10.1.2.3")
+    ) as getaddrinfo:
+        with safe_dns_validation("http://intranet.test", blocked_ranges=permissive):
+            pass
+        assert get_dns_cache().peek("intranet.test") == {ipaddress.ip_address("10.1.2.3")}
+
+        # A context that blocks private ranges must still reject the cached address.
+        with pytest.raises(SSRFValidationError, match="blocked IP"):
+            with safe_dns_validation("http://intranet.test"):
+                pass
+
+    assert getaddrinfo.call_count == 1
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = DNSCache(ttl=60, clock=clock)
+    answers = iter(
+        [frozenset({ipaddress.ip_address("1.1.1.1")}), frozenset({ipaddress.ip_address("1.0.0.1")})]
+    )
+
+    def resolver(_host):
+        return next(answers)
+
+    assert cache.resolve("a.test", resolver) == {ipaddress.ip_address("1.1.1.1")}
+    clock.now = 59
+    assert cache.resolve("a.test", resolver) == {ipaddress.ip_address("1.1.1.1")}
+    clock.now = 61
+    assert cache.resolve("a.test", resolver) == {ipaddress.ip_address("1.0.0.1")}
+
+
+def test_failed_lookups_are_not_cached():
+    cache = DNSCache()
+    calls = 0
+
+    def resolver(_host):
+        nonlocal calls
+        calls += 1
+        msg = "temporary failure"
+        raise socket.gaierror(msg)
+
+    for _ in range(2):
+        with pytest.raises(socket.gaierror):
+            cache.resolve("down.test", resolver)
+    assert calls == 2
+
+
+def test_concurrent_misses_share_one_lookup():
+    cache = DNSCache()
+    release = threading.Event()
+    calls = 0
+
+    def resolver(_host):
+        nonlocal calls
+        calls += 1
+        release.wait(timeout=5)
+        return frozenset({ipaddress.ip_address(PUBLIC_IP)})
+
+    threads = [threading.Thread(target=cache.resolve, args=("busy.test", resolver)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert calls == 1
+
+
+def test_cache_evicts_oldest_entry_when_full():
+    cache = DNSCache(max_entries=2)
+    for host in ("a.test", "b.test", "c.test"):
+        cache.resolve(host, lambda _host: frozenset({ipaddress.ip_address(PUBLIC_IP)}))
+
+    misses = cache.misses
+    cache.resolve("a.test", lambda _host: frozenset({ipaddress.ip_address(PUBLIC_IP)}))
+    assert cache.misses == misses + 1
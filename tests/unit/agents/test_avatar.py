@@ -67,11 +67,11 @@ class AvatarProcessingTest(unittest.TestCase):
         mock_download_avatar.assert_called_once()
         mock_update_profile.assert_called_once()
 
-    @patch("egregora.agents.avatar._create_secure_client")
+    @patch("egregora.agents.avatar.get_http_client")
     @patch("egregora.agents.avatar._process_set_avatar_command")
     @patch("egregora.agents.avatar.extract_commands")
     def test_process_avatar_commands_reuses_client(self, mock_extract, mock_process_set, mock_create_client):
-        """Verify client is created once and reused."""
+        """Verify the shared guarded client is fetched once and reused."""
         mock_extract.return_value = [
             {
                 "command": {"command": "set", "target": "avatar", "value": "url1"},
@@ -86,7 +86,7 @@ class AvatarProcessingTest(unittest.TestCase):
         ]
 
         mock_client = MagicMock()
-        mock_create_client.return_value.__enter__.return_value = mock_client
+        mock_create_client.return_value = mock_client
 
         context = AvatarContext(
             docs_dir=Path("/docs"),
@@ -98,8 +98,8 @@ class AvatarProcessingTest(unittest.TestCase):
 
         process_avatar_commands(MagicMock(), context)
 
-        # Verify client creation
-        mock_create_client.assert_called_once()
+        # Verify client lookup
+        mock_create_client.assert_called_once_with(ssrf_guard=True)
 
         # Verify it was passed to _process_set_avatar_command
         self.assertEqual(mock_process_set.call_count, 2)
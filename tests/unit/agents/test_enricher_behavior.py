@@ -8,6 +8,8 @@ import pytest
 from egregora.agents.enricher import EnrichmentOutput, EnrichmentWorker, schedule_enrichment
 from egregora.config.settings import EnrichmentSettings
 from egregora.data_primitives.document import Document, DocumentType
+from egregora.llm.usage import UsageTracker
+from egregora.orchestration.cache import PipelineCache, make_enrichment_cache_key
 from egregora.orchestration.context import PipelineContext
 from egregora.orchestration.exceptions import CacheKeyNotFoundError
 
@@ -81,7 +83,9 @@ def test_schedule_enrichment_respects_max_enrichments():
         schedule_enrichment(mock_messages, {}, settings, mock_context)
 
     # Verify that get_url_enrichment_candidates was called with limit=2
-    mock_repo.get_url_enrichment_candidates.assert_called_with(mock_messages, 2)
+    mock_repo.get_url_enrichment_candidates.assert_called_with(
+        mock_messages, 2, url_index=mock_context.url_index
+    )
 
 
 def test_schedule_enrichment_skips_existing_in_db():
@@ -119,6 +123,42 @@ def test_schedule_enrichment_skips_existing_in_db():
     assert batch[0][1]["url"] == "http://example.com/new"
 
 
+def test_schedule_enrichment_skips_cached_urls_with_one_bulk_probe(tmp_path):
+    """URLs already in the enrichment cache are skipped without loading their payloads."""
+    mock_messages = MagicMock()
+    mock_messages.count().execute.return_value = 10
+    mock_existing_result = MagicMock()
+    mock_existing_result.__getitem__.return_value.tolist.return_value = []
+    mock_messages.filter.return_value.select.return_value.execute.return_value = mock_existing_result
+
+    mock_repo = MagicMock()
+    mock_repo.get_url_enrichment_candidates.return_value = [
+        ("http://example.com/new", {"ts": datetime.now(), "source": "s"}),
+        ("http://example.com/cached", {"ts": datetime.now(), "source": "s"}),
+    ]
+
+    cache = PipelineCache(tmp_path)
+    cache.enrichment.store(
+        make_enrichment_cache_key(kind="url", identifier="http://example.com/cached"), {"markdown": "x"}
+    )
+    mock_context = MagicMock()
+    mock_context.cache = MagicMock(wraps=cache.enrichment)
+    mock_context.usage_tracker = UsageTracker()
+
+    settings = EnrichmentSettings(enable_url=True, max_enrichments=10, enable_media=False)
+    try:
+        with patch("egregora.agents.enricher.MessageRepository", return_value=mock_repo):
+            schedule_enrichment(mock_messages, {}, settings, mock_context)
+    finally:
+        cache.close()
+
+    batch = mock_context.task_store.enqueue_batch.call_args[0][0]
+    assert [payload["url"] for _, payload in batch] == ["http://example.com/new"]
+    mock_context.cache.contains_many.assert_called_once()
+    mock_context.cache.load.assert_not_called()
+    assert mock_context.usage_tracker.cache_stats() == {"enrichment": {"hits": 1, "misses": 1}}
+
+
 # ---------------------------------------------------------------------------
 # Execution Tests (EnrichmentWorker.run)
 # ---------------------------------------------------------------------------
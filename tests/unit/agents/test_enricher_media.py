@@ -1,5 +1,7 @@
 """Tests for the media enrichment functionality of the EnrichmentWorker."""
 
+import base64
+import io
 import json
 import os
 import tempfile
@@ -9,8 +11,11 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 from google.api_core import exceptions as google_exceptions
+from PIL import Image
 
 from egregora.agents.enricher import EnrichmentWorker
+from egregora.ops.media import detect_media_type
+from egregora.ops.media_batching import MediaBatchLimits
 
 
 class MockPipelineContext:
@@ -35,7 +40,7 @@ class MockPipelineContext:
 
 
 def create_media_tasks(count: int) -> list[dict]:
-    """Creates a list of mock media enrichment tasks."""
+    """Creates media enrichment tasks shaped like the ones the scheduler enqueues."""
     return [
         {
             "task_id": f"media-task-{i}",
@@ -44,7 +49,8 @@ def create_media_tasks(count: int) -> list[dict]:
                 {
                     "type": "media",
                     "filename": f"image-{i}.jpg",
-                    "media_type": "image/jpeg",
+                    # The scheduler stores the media category, not a MIME type.
+                    "media_type": detect_media_type(f"image-{i}.jpg"),
                     "original_filename": f"image-{i}.jpg",
                 }
             ),
@@ -127,3 +133,108 @@ def test_media_enrichment_propagates_unexpected_errors(mock_context_and_worker,
             worker._execute_media_batch(requests, task_map)
 
         mock_single_call.assert_called_once()
+
+
+def test_media_requests_send_downscaled_images(tmp_path, monkeypatch):
+    """Photos are reduced before they are inlined in the vision request."""
+    photo = io.BytesIO()
+    Image.effect_noise((3000, 2000), 64).convert("RGB").save(photo, format="JPEG", quality=92)
+    zip_path = tmp_path / "chat.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("image-0.jpg", photo.getvalue())
+
+    context = MockPipelineContext(site_root_path=str(tmp_path), input_path=zip_path)
+    context.config.enrichment.large_file_threshold_mb = 20
+    context.config.enrichment.image_max_edge = 768
+    context.config.enrichment.image_format = "webp"
+    context.config.enrichment.image_quality = 80
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    with EnrichmentWorker(context) as worker:
+        requests, _task_map = worker._prepare_media_requests(create_media_tasks(1))
+
+    inline = requests[0]["contents"][0]["parts"][1]["inlineData"]
+    assert inline["mimeType"] == "image/webp"
+    sent = base64.b64decode(inline["data"])
+    assert len(sent) * 10 < len(photo.getvalue())
+    with Image.open(io.BytesIO(sent)) as image:
+        assert image.size == (768, 512)
+
+
+def test_uploaded_originals_keep_their_mime_type(tmp_path, monkeypatch):
+    """When even the derivative is too large, the original is uploaded under its own type."""
+    photo = io.BytesIO()
+    Image.effect_noise((64, 64), 64).convert("RGB").save(photo, format="JPEG")
+    zip_path = tmp_path / "chat.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("image-0.jpg", photo.getvalue())
+
+    context = MockPipelineContext(site_root_path=str(tmp_path), input_path=zip_path)
+    context.config.enrichment.large_file_threshold_mb = 0
+    context.config.enrichment.image_max_edge = 32
+    context.config.enrichment.image_format = "webp"
+    context.config.enrichment.image_quality = 80
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    registry = MagicMock()
+    registry.get_or_upload.return_value.uri = "files/abc"
+    with (
+        EnrichmentWorker(context) as worker,
+        patch.object(worker, "_file_upload_registry", return_value=registry),
+    ):
+        requests, _task_map = worker._prepare_media_requests(create_media_tasks(1))
+
+    assert requests[0]["contents"][0]["parts"][1]["fileData"] == {
+        "mimeType": "image/jpeg",
+        "fileUri": "files/abc",
+    }
+    assert registry.get_or_upload.call_args.args[1] == "image/jpeg"
+
+
+def test_media_batches_are_packed_and_oversized_requests_sent_alone(mock_context_and_worker, monkeypatch):
+    """Requests are packed by estimated size; one too large for any batch is sent individually."""
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    _context, worker = mock_context_and_worker
+    parts = {
+        "image-0.jpg": "a" * 100,
+        "image-1.jpg": "b" * 60_000,
+        "image-2.jpg": "c" * 100,
+    }
+
+    def prepare(_self, media, mime_type):
+        return {"inlineData": {"mimeType": mime_type, "data": parts[media.name]}}
+
+    monkeypatch.setattr(
+        "egregora.agents.enricher.SINGLE_CALL_LIMITS",
+        MediaBatchLimits(max_request_bytes=50_000, max_tokens=None, max_items=None),
+    )
+    with (
+        patch("egregora.agents.enricher.EnrichmentWorker._prepare_media_content", prepare),
+        patch.object(worker, "_execute_media_batch", return_value=[]) as batch,
+        patch.object(worker, "_execute_media_individual", return_value=[]) as individual,
+        patch.object(worker, "_persist_media_results", return_value=0),
+    ):
+        worker._process_media_batch(create_media_tasks(3))
+
+    (batch_requests, _task_map), _ = batch.call_args
+    assert [request["tag"] for request in batch_requests] == ["media-task-0", "media-task-2"]
+    assert [request["tag"] for request in individual.call_args.args[0]] == ["media-task-1"]
+
+
+def test_ordinary_photos_are_packed_into_one_call(tmp_path, monkeypatch):
+    """Photos prepared from scheduler-shaped tasks are sized as images, not as raw bytes."""
+    zip_path = tmp_path / "chat.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        for i in range(10):
+            photo = io.BytesIO()
+            Image.effect_noise((1200, 900), 64).convert("RGB").save(photo, format="JPEG", quality=95)
+            zf.writestr(f"image-{i}.jpg", photo.getvalue())
+
+    context = MockPipelineContext(site_root_path=str(tmp_path), input_path=zip_path)
+    context.config.enrichment.large_file_threshold_mb = 20
+    context.config.enrichment.image_max_edge = 0  # send the originals
+    monkeypatch.setenv("GOOGLE_API_KEY", "test-key")
+    with EnrichmentWorker(context) as worker:
+        requests, task_map = worker._prepare_media_requests(create_media_tasks(10))
+        plan = worker._plan_media_batches(requests, task_map)
+
+    assert plan.oversized == []
+    assert [len(batch) for batch in plan.batches] == [10]
@@ -21,9 +21,8 @@ from egregora.agents.exceptions import (
 @pytest.mark.asyncio
 async def test_fetch_url_with_jina_raises_exception():
     """Test that Jina fetch failures raise JinaFetchError."""
-    with patch("httpx.AsyncClient") as mock_client_cls:
-        mock_client = mock_client_cls.return_value.__aenter__.return_value
-        mock_client.get.side_effect = httpx.RequestError("Network error")
+    with patch("egregora.ops.url_fetch.get_async_http_client") as get_client:
+        get_client.return_value.get.side_effect = httpx.RequestError("Network error")
 
         ctx = MagicMock()
         with pytest.raises(JinaFetchError, match="Jina fetch failed"):
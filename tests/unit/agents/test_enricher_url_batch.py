@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from egregora.agents.enricher import URL_BATCH_TASK, EnrichmentWorker
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.init import initialize_database
+from egregora.database.task_store import TaskStore
+from egregora.llm.exceptions import BatchJobTimeoutError
+from egregora.llm.providers.google_batch import BatchResult
+
+
+@pytest.fixture
+def task_store(tmp_path: Path):
+    with DuckDBStorageManager(db_path=tmp_path / "pipeline.duckdb") as manager:
+        initialize_database(manager.ibis_conn)
+        yield TaskStore(manager)
+
+
+@pytest.fixture
+def worker(config_factory, task_store):
+    ctx = MagicMock()
+    ctx.config = config_factory(enrichment__strategy="individual", enrichment__url_batch_threshold=2)
+    ctx.task_store = task_store
+    ctx.site_root = None
+    ctx.input_path = None
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"}):
+        yield EnrichmentWorker(ctx=ctx)
+
+
+@pytest.fixture
+def batch_model():
+    with patch("egregora.agents.enricher.GoogleBatchModel") as model_cls:
+        model = model_cls.return_value
+        model.model_name = "models/gemini-2.5-flash"
+        yield model
+
+
+def _enqueue_urls(task_store: TaskStore, *urls: str) -> list[str]:
+    return task_store.enqueue_batch([("enrich_url", {"url": url, "message_metadata": {}}) for url in urls])
+
+
+def _payload(task: dict) -> dict:
+    payload = task["payload"]
+    return json.loads(payload) if isinstance(payload, str) else payload
+
+
+def _response(url: str, slug: str) -> dict:
+    text = json.dumps({url: {"slug": slug, "title": slug, "summary": "About it.", "tags": ["x"]}})
+    return {"candidates": [{"content": {"parts": [{"text": f"```json\n{text}\n```"}]}}]}
+
+
+def _persisted(worker: EnrichmentWorker):
+    def persist(results):
+        for task, output, error in results:
+            if error:
+                worker.task_store.mark_failed(task["task_id"], error)
+            else:
+                worker.persisted[task["_parsed_payload"]["url"]] = output
+                worker.task_store.mark_completed(task["task_id"])
+        return len(results)
+
+    worker.persisted = {}
+    return patch.object(worker, "_persist_url_results", side_effect=persist)
+
+
+def test_large_url_backlog_goes_through_one_recorded_batch_job(worker, task_store, batch_model):
+    first, second = _enqueue_urls(task_store, "https://a.example", "https://b.example")
+    batch_model.submit_batch.return_value = "batches/urls"
+    batch_model.collect_batch.return_value = [
+        BatchResult(tag=first, response=_response("https://a.example", "page-a"), error=None),
+        BatchResult(tag=second, response=_response("https://b.example", "page-b"), error=None),
+    ]
+
+    with _persisted(worker):
+        assert worker.run() == 2
+
+    (submitted,) = batch_model.submit_batch.call_args.args
+    assert [request["tag"] for request in submitted] == [first, second]
+    assert submitted[0]["config"] == {"tools": [{"url_context": {}}]}
+    assert worker.persisted["https://b.example"].slug == "page-b"
+    assert task_store.fetch_pending() == []
+
+
+def test_url_batch_job_is_resumed_instead_of_resubmitted(worker, task_store, batch_model):
+    first, second = _enqueue_urls(task_store, "https://a.example", "https://b.example")
+    task_store.enqueue(URL_BATCH_TASK, {"job_name": "batches/old", "model": "m", "tags": [first, second]})
+    batch_model.collect_batch.return_value = [
+        BatchResult(tag=first, response=_response("https://a.example", "page-a"), error=None),
+        BatchResult(tag=second, response=_response("https://b.example", "page-b"), error=None),
+    ]
+
+    with _persisted(worker):
+        assert worker.run() == 2
+
+    batch_model.collect_batch.assert_called_once_with("batches/old", [{"tag": first}, {"tag": second}])
+    batch_model.submit_batch.assert_not_called()
+    assert task_store.fetch_pending(task_type=URL_BATCH_TASK) == []
+
+
+def test_running_url_batch_job_leaves_tasks_pending_for_the_next_run(worker, task_store, batch_model):
+    task_ids = _enqueue_urls(task_store, "https://a.example", "https://b.example")
+    batch_model.submit_batch.return_value = "batches/slow"
+    batch_model.collect_batch.side_effect = BatchJobTimeoutError(
+        "Batch job polling timed out", job_name="batches/slow"
+    )
+
+    with _persisted(worker), patch.object(worker, "_execute_url_individual") as live:
+        assert worker.run() == 0
+        # The same worker does not wait for the job again.
+        assert worker.run() == 0
+
+    live.assert_not_called()
+    batch_model.collect_batch.assert_called_once()
+    assert task_store.pending_among(task_ids) == set(task_ids)
+    (job,) = task_store.fetch_pending(task_type=URL_BATCH_TASK)
+    assert _payload(job)["tags"] == task_ids
+
+
+def test_unanswered_urls_fall_back_to_live_calls(worker, task_store, batch_model):
+    first, second = _enqueue_urls(task_store, "https://a.example", "https://b.example")
+    batch_model.submit_batch.return_value = "batches/urls"
+    batch_model.collect_batch.return_value = [
+        BatchResult(tag=first, response=_response("https://a.example", "page-a"), error=None),
+        BatchResult(tag=second, response=None, error={"message": "boom"}),
+    ]
+
+    with (
+        _persisted(worker),
+        patch.object(worker, "_execute_url_individual", return_value=[]) as live,
+    ):
+        worker.run()
+
+    (live_tasks, _concurrency) = live.call_args.args
+    assert [td["url"] for td in live_tasks] == ["https://b.example"]
+
+
+def test_small_url_backlog_stays_live(worker, task_store, batch_model):
+    _enqueue_urls(task_store, "https://a.example")
+
+    with _persisted(worker), patch.object(worker, "_execute_url_enrichments", return_value=[]) as live:
+        worker.run()
+
+    live.assert_called_once()
+    batch_model.submit_batch.assert_not_called()
+
+
+def test_url_batch_jobs_are_opt_in(config_factory, task_store, batch_model):
+    ctx = MagicMock()
+    ctx.config = config_factory(enrichment__strategy="individual")
+    ctx.task_store = task_store
+    ctx.site_root = None
+    ctx.input_path = None
+    with patch.dict(os.environ, {"GOOGLE_API_KEY": "test-key"}):
+        worker = EnrichmentWorker(ctx=ctx)
+    _enqueue_urls(task_store, *(f"https://{i}.example" for i in range(600)))
+
+    with _persisted(worker), patch.object(worker, "_execute_url_enrichments", return_value=[]) as live:
+        worker.run()
+
+    live.assert_called()
+    batch_model.submit_batch.assert_not_called()
@@ -95,3 +95,30 @@ def test_media_batch_http_error_fallback(mock_context):
 
         # Assert that the fallback method was called
         mock_fallback.assert_called_once()
+
+
+def test_url_threads_reuse_their_loop_and_close_its_http_clients(mock_context):
+    """Each URL thread keeps one event loop (and pooled client) until the batch ends."""
+    from egregora.security.http import get_async_http_client
+
+    worker = EnrichmentWorker(ctx=mock_context)
+    seen: list[tuple[object, object]] = []
+
+    async def grab_client():
+        return get_async_http_client()
+
+    def fake_enrich(task_data):
+        loop = worker._url_loop()
+        seen.append((loop, loop.run_until_complete(grab_client())))
+        return task_data["task"], None, None
+
+    tasks = [{"task": {"task_id": str(i)}} for i in range(3)]
+    with patch.object(worker, "_enrich_single_url", side_effect=fake_enrich):
+        worker._execute_url_individual(tasks, max_concurrent=1)
+
+    loops = {loop for loop, _ in seen}
+    clients = {client for _, client in seen}
+    assert len(loops) == len(clients) == 1
+    assert all(loop.is_closed() for loop in loops)
+    assert all(client.is_closed for client in clients)
+    assert worker._url_loops == []
@@ -0,0 +1,179 @@
+"""Tests for batch write mode (writer requests answered by one batch job)."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+import pytest
+from pydantic_ai import Agent
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.google import GoogleModel
+from pydantic_ai.providers.google import GoogleProvider
+
+from egregora.agents.writer import submit_writer_batch
+from egregora.agents.writer_batch import (
+    WRITER_BATCH_TASK,
+    PrefetchedResponseModel,
+    RequestCaptureModel,
+    WriterBatch,
+    batch_write_supported,
+    capture_first_request,
+)
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.init import initialize_database
+from egregora.database.task_store import TaskStore
+from egregora.llm.exceptions import BatchJobTimeoutError
+from egregora.llm.providers.google_batch import BatchResult
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def google_model() -> GoogleModel:
+    return GoogleModel("gemini-2.5-flash", provider=GoogleProvider(api_key="test-key"))
+
+
+@pytest.fixture
+def task_store(tmp_path: Path):
+    with DuckDBStorageManager(db_path=tmp_path / "pipeline.duckdb") as manager:
+        initialize_database(manager.ibis_conn)
+        yield TaskStore(manager)
+
+
+def _agent(model, calls: list[str]) -> Agent[None, str]:
+    agent = Agent(model, system_prompt="You write posts.")
+
+    @agent.tool_plain
+    def write_post_tool(title: str) -> str:
+        calls.append(title)
+        return "saved"
+
+    return agent
+
+
+def _payload(task: dict) -> dict:
+    payload = task["payload"]
+    return json.loads(payload) if isinstance(payload, str) else payload
+
+
+def _function_call_response(title: str) -> dict:
+    return {
+        "candidates": [
+            {
+                "content": {
+                    "role": "model",
+                    "parts": [{"function_call": {"name": "write_post_tool", "args": {"title": title}}}],
+                },
+                "finish_reason": "STOP",
+            }
+        ],
+        "usage_metadata": {"prompt_token_count": 120, "candidates_token_count": 8},
+    }
+
+
+def test_installed_pydantic_ai_supports_batch_write():
+    # Batch write renders and parses through private GoogleModel methods; a
+    # pydantic-ai upgrade that drops them must fail here, not in a run.
+    assert batch_write_supported()
+
+
+def test_submit_writer_batch_writes_live_when_google_model_internals_are_missing(config_factory, monkeypatch):
+    monkeypatch.delattr(GoogleModel, "_process_response")
+    config = config_factory(models__writer="google-gla:gemini-2.5-flash")
+    window = MagicMock(config=config, smoke_test=False)
+
+    assert submit_writer_batch([window]) is None
+
+
+def test_capture_first_request_returns_system_prompt_tools_and_user_prompt(google_model):
+    agent = _agent(RequestCaptureModel(google_model), [])
+
+    request = capture_first_request(agent, "Write about the window.", deps=MagicMock(window_label="w1"))
+
+    config = request["config"]
+    assert "http_options" not in config
+    assert config["system_instruction"]["parts"] == [{"text": "You write posts."}]
+    declarations = config["tools"][0]["function_declarations"]
+    assert [d["name"] for d in declarations] == ["write_post_tool"]
+    assert request["contents"] == [{"role": "user", "parts": [{"text": "Write about the window."}]}]
+
+
+def test_prefetched_response_runs_tool_calls_then_goes_live(google_model, monkeypatch):
+    live_requests = []
+
+    async def live_request(messages, model_settings, model_request_parameters):
+        live_requests.append(messages)
+        return ModelResponse(parts=[TextPart(content="done")], model_name="gemini-2.5-flash")
+
+    monkeypatch.setattr(google_model, "request", live_request)
+    calls: list[str] = []
+    agent = _agent(PrefetchedResponseModel(google_model, _function_call_response("Batch post")), calls)
+
+    result = agent.run_sync("Write about the window.")
+
+    # First turn came from the batch: the tool ran without a live request.
+    assert calls == ["Batch post"]
+    # Only the turn after the tool result went to the live model.
+    assert len(live_requests) == 1
+    assert result.output == "done"
+    assert result.usage.input_tokens == 120
+
+
+def test_writer_batch_submits_and_records_the_job(task_store):
+    model = MagicMock(model_name="models/gemini-2.5-flash")
+    model.submit_batch.return_value = "batches/new"
+    model.collect_batch.return_value = [
+        BatchResult(tag="sig-a", response={"candidates": []}, error=None),
+        BatchResult(tag="sig-b", response=None, error={"message": "boom"}),
+    ]
+    batch = WriterBatch(model, task_store)
+
+    responses = batch.run({"sig-a": {"contents": []}, "sig-b": {"contents": []}})
+
+    assert responses == {"sig-a": {"candidates": []}}
+    submitted = model.submit_batch.call_args.args[0]
+    assert [request["tag"] for request in submitted] == ["sig-a", "sig-b"]
+    (task,) = task_store.fetch_pending(task_type=WRITER_BATCH_TASK)
+    assert _payload(task)["job_name"] == "batches/new"
+
+    batch.complete()
+    assert task_store.fetch_pending(task_type=WRITER_BATCH_TASK) == []
+
+
+def test_writer_batch_resumes_recorded_job_instead_of_resubmitting(task_store):
+    task_store.enqueue(WRITER_BATCH_TASK, {"job_name": "batches/old", "model": "m", "tags": ["sig-a"]})
+    model = MagicMock(model_name="m")
+    model.collect_batch.return_value = [BatchResult(tag="sig-a", response={"candidates": []}, error=None)]
+
+    responses = WriterBatch(model, task_store).run({"sig-a": {"contents": []}})
+
+    assert responses == {"sig-a": {"candidates": []}}
+    model.collect_batch.assert_called_once_with("batches/old", [{"tag": "sig-a"}])
+    model.submit_batch.assert_not_called()
+
+
+def test_writer_batch_keeps_job_recorded_when_polling_times_out(task_store):
+    model = MagicMock(model_name="m")
+    model.submit_batch.return_value = "batches/slow"
+    model.collect_batch.side_effect = BatchJobTimeoutError(
+        "Batch job polling timed out", job_name="batches/slow"
+    )
+
+    with pytest.raises(BatchJobTimeoutError):
+        WriterBatch(model, task_store).run({"sig-a": {"contents": []}})
+
+    (task,) = task_store.fetch_pending(task_type=WRITER_BATCH_TASK)
+    assert _payload(task)["tags"] == ["sig-a"]
+
+
+def test_writer_batch_supersedes_jobs_with_no_pending_window(task_store):
+    task_store.enqueue(WRITER_BATCH_TASK, {"job_name": "batches/old", "model": "m", "tags": ["x"]})
+    model = MagicMock(model_name="m")
+
+    assert WriterBatch(model, task_store).run({}) == {}
+
+    model.collect_batch.assert_not_called()
+    assert task_store.fetch_pending(task_type=WRITER_BATCH_TASK) == []
@@ -64,6 +64,7 @@ def test_validate_prompt_fits_behavior():
     config = MagicMock()
     config.pipeline.max_prompt_tokens = 100
     config.pipeline.use_full_context_window = False
+    config.pipeline.tokenizer = "estimate"
 
     # Case 1: Within limit (fallback counting: 20 chars / 4 = 5 tokens)
     prompt = "x" * 20
@@ -286,3 +286,61 @@ def test_regenerate_site_indices_skips_if_no_site_root() -> None:
     with patch("egregora.agents.writer.SiteGenerator") as mock_gen:
         writer_module._regenerate_site_indices(adapter)
         mock_gen.assert_not_called()
+
+
+@patch("egregora.agents.writer.build_context_and_signature")
+@patch("egregora.agents.writer.check_writer_cache")
+@patch("egregora.agents.writer.prepare_writer_dependencies")
+@patch("egregora.agents.writer._render_writer_prompt")
+@patch("egregora.agents.writer._execute_writer_with_error_handling")
+@patch("egregora.agents.writer._finalize_writer_results")
+def test_write_posts_for_window_uses_batch_response_for_its_signature(
+    mock_finalize: MagicMock,
+    mock_execute: MagicMock,
+    mock_render: MagicMock,
+    mock_prepare_deps: MagicMock,
+    mock_check_cache: MagicMock,
+    mock_build_context: MagicMock,
+    test_config: MagicMock,
+) -> None:
+    """In batch write mode the window's batch response is handed to the agent run."""
+    mock_check_cache.return_value = None
+    mock_build_context.return_value = (MagicMock(), "signature")
+    mock_execute.return_value = ([], [])
+    batch_response = {"candidates": []}
+
+    params = writer_module.WindowProcessingParams(
+        table=MagicMock(),
+        window_start=datetime.now(),
+        window_end=datetime.now(),
+        resources=MagicMock(),
+        config=test_config,
+        cache=MagicMock(),
+        messages=[MagicMock()],
+        batch_responses={"signature": batch_response, "other": {}},
+    )
+
+    writer_module.write_posts_for_window(params)
+
+    assert mock_execute.call_args.kwargs["prefetched_response"] is batch_response
+
+
+@patch("egregora.agents.writer.write_posts_with_pydantic_agent")
+def test_execute_writer_uses_batch_response_on_first_attempt_only(
+    mock_writer_agent: MagicMock, test_config: MagicMock, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A retry after a failed first attempt goes to the live model."""
+    monkeypatch.setattr(writer_module, "_iter_provider_keys", lambda _model: ["key-1", "key-2"])
+    mock_writer_agent.side_effect = [writer_module.UsageLimitExceeded("quota"), (["post"], [])]
+    mock_deps = MagicMock()
+    mock_deps.window_label = "test-window"
+    batch_response = {"candidates": []}
+
+    result = writer_module._execute_writer_with_error_handling(
+        prompt="test prompt", config=test_config, deps=mock_deps, prefetched_response=batch_response
+    )
+
+    assert result == (["post"], [])
+    first, second = mock_writer_agent.call_args_list
+    assert first.kwargs["prefetched_response"] is batch_response
+    assert second.kwargs["prefetched_response"] is None
@@ -21,9 +21,9 @@ def site_root(tmp_path):
 def test_read_command_success(site_root):
     """Test successful execution."""
     with (
-        patch("egregora.cli.read.load_egregora_config") as mock_load,
-        patch("egregora.cli.read.MkDocsPaths") as mock_paths,
-        patch("egregora.cli.read.run_reader_evaluation") as mock_run,
+        patch("egregora.config.load_egregora_config") as mock_load,
+        patch("egregora.output_sinks.mkdocs.MkDocsPaths") as mock_paths,
+        patch("egregora.agents.reader.reader_runner.run_reader_evaluation") as mock_run,
     ):
         # Setup config
         mock_config = MagicMock()
@@ -56,9 +56,9 @@ def test_read_command_success(site_root):
 def test_read_command_input_error(site_root):
     """Test handling of ReaderInputError."""
     with (
-        patch("egregora.cli.read.load_egregora_config"),
-        patch("egregora.cli.read.MkDocsPaths"),
-        patch("egregora.cli.read.run_reader_evaluation") as mock_run,
+        patch("egregora.config.load_egregora_config"),
+        patch("egregora.output_sinks.mkdocs.MkDocsPaths"),
+        patch("egregora.agents.reader.reader_runner.run_reader_evaluation") as mock_run,
     ):
         mock_run.side_effect = ReaderInputError("Not enough posts")
 
@@ -72,9 +72,9 @@ def test_read_command_input_error(site_root):
 def test_read_command_config_error(site_root):
     """Test handling of ReaderConfigurationError."""
     with (
-        patch("egregora.cli.read.load_egregora_config"),
-        patch("egregora.cli.read.MkDocsPaths"),
-        patch("egregora.cli.read.run_reader_evaluation") as mock_run,
+        patch("egregora.config.load_egregora_config"),
+        patch("egregora.output_sinks.mkdocs.MkDocsPaths"),
+        patch("egregora.agents.reader.reader_runner.run_reader_evaluation") as mock_run,
     ):
         mock_run.side_effect = ReaderConfigurationError("Bad config")
 
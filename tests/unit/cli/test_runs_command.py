@@ -0,0 +1,84 @@
+"""Tests for the `egregora runs` commands."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from rich.console import Console
+from typer.testing import CliRunner
+
+from egregora.cli.runs import runs_app
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.run_store import RunStore
+from egregora.llm.usage import UsageTracker
+from egregora.tracing import StageTimingCollector, collecting_spans, span
+
+runner = CliRunner()
+
+
+@pytest.fixture
+def site_root(tmp_path):
+    """Site with two recorded runs in its pipeline database."""
+    (tmp_path / ".egregora").mkdir()
+    db_path = tmp_path / ".egregora" / "pipeline.duckdb"
+    with DuckDBStorageManager(db_path=db_path) as storage:
+        store = RunStore(storage)
+        for run_id in ("aaaa1111", "bbbb2222"):
+            collector = StageTimingCollector()
+            with (
+                collecting_spans(collector),
+                span("pipeline.process_item", window="w1"),
+                span("pipeline.writer"),
+            ):
+                pass
+            store.start_run(run_id, source_type="whatsapp", source_key="family")
+            store.record_stages(run_id, collector)
+            store.finish_run(run_id, status="completed", windows=1, posts=2, usage=UsageTracker())
+
+    config = MagicMock()
+    config.database.pipeline_db = f"duckdb:///{db_path}"
+    with (
+        patch("egregora.config.load_egregora_config", return_value=config),
+        # Wide console so table cells are not truncated in the captured output
+        patch("egregora.cli.runs.console", Console(width=200)),
+    ):
+        yield tmp_path
+
+
+def test_runs_list(site_root):
+    result = runner.invoke(runs_app, ["list", str(site_root)])
+
+    assert result.exit_code == 0, result.output
+    assert "aaaa1111" in result.stdout
+    assert "bbbb2222" in result.stdout
+    assert "completed" in result.stdout
+
+
+def test_runs_show_with_windows(site_root):
+    result = runner.invoke(runs_app, ["show", str(site_root), "aaaa", "--windows"])
+
+    assert result.exit_code == 0, result.output
+    assert "aaaa1111" in result.stdout
+    assert "pipeline.writer" in result.stdout
+    assert "w1" in result.stdout
+
+
+def test_runs_compare(site_root):
+    result = runner.invoke(runs_app, ["compare", str(site_root), "aaaa", "bbbb"])
+
+    assert result.exit_code == 0, result.output
+    assert "pipeline.process_item" in result.stdout
+    assert "total run" in result.stdout
+
+
+def test_runs_show_unknown_run(site_root):
+    result = runner.invoke(runs_app, ["show", str(site_root), "zzzz"])
+
+    assert result.exit_code == 1
+    assert "No unique run" in result.stdout
+
+
+def test_runs_requires_site(tmp_path):
+    result = runner.invoke(runs_app, ["list", str(tmp_path)])
+
+    assert result.exit_code == 1
+    assert "No .egregora directory" in result.stdout
@@ -6,10 +6,12 @@ import pytest
 from ibis.common.exceptions import IbisError
 
 from egregora.data_primitives.document import Document, DocumentType
+from egregora.database.duckdb_manager import DuckDBStorageManager
 from egregora.database.exceptions import (
     DatabaseOperationError,
     DocumentNotFoundError,
 )
+from egregora.database.init import initialize_database
 from egregora.database.repository import ContentRepository
 
 
@@ -97,3 +99,64 @@ def test_save_calls_replace_rows(content_repository, mock_db_manager):
     assert row["doc_type"] == "post"
     assert row["title"] == "Test Title"
     assert kwargs.get("by_keys") == {"id": row["id"]}
+
+
+@pytest.fixture
+def real_repository():
+    """ContentRepository backed by an initialized in-memory DuckDB."""
+    with DuckDBStorageManager() as storage:
+        initialize_database(storage.ibis_conn)
+        yield ContentRepository(db=storage)
+
+
+def _post(slug: str, title: str) -> Document:
+    return Document(
+        content=f"Body of {slug}",
+        type=DocumentType.POST,
+        metadata={"title": title, "slug": slug, "status": "published", "tags": ["t"]},
+    )
+
+
+def test_save_many_upserts_in_one_batch(real_repository):
+    written = real_repository.save_many([_post("a", "A"), _post("b", "B"), _post("a", "A2")])
+
+    assert written == 2
+    rows = real_repository.db.execute_query("SELECT id, title FROM documents ORDER BY id")
+    assert rows == [("a", "A2"), ("b", "B")]
+
+    # Saving again replaces rather than duplicates
+    real_repository.save_many([_post("b", "B2")])
+    rows = real_repository.db.execute_query("SELECT id, title FROM documents ORDER BY id")
+    assert rows == [("a", "A2"), ("b", "B2")]
+
+
+def test_save_many_empty_is_noop(real_repository):
+    assert real_repository.save_many([]) == 0
+
+
+def test_save_many_wraps_constraint_errors(real_repository):
+    invalid = Document(content="x", type=DocumentType.POST, metadata={"slug": "no-title"})
+
+    with pytest.raises(DatabaseOperationError):
+        real_repository.save_many([invalid])
+
+
+def test_get_many_returns_only_requested_documents(real_repository):
+    real_repository.save_many([_post("a", "A"), _post("b", "B"), _post("c", "C")])
+
+    found = real_repository.get_many(DocumentType.POST, ["a", "c", "missing"])
+
+    assert sorted(found) == ["a", "c"]
+    assert found["c"].metadata["title"] == "C"
+    assert real_repository.get_many(DocumentType.PROFILE, ["a"]) == {}
+
+
+def test_iter_documents_and_batches_stream_all_rows(real_repository):
+    real_repository.save_many([_post(f"p{i:02d}", f"P{i}") for i in range(5)])
+
+    docs = list(real_repository.iter_documents(DocumentType.POST, batch_size=2))
+    assert [doc.document_id for doc in docs] == [f"p{i:02d}" for i in range(5)]
+
+    batches = list(real_repository.iter_batches(batch_size=2))
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert batches[0].column("id").to_pylist() == ["p00", "p01"]
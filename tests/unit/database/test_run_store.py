@@ -0,0 +1,137 @@
+"""Tests for the DuckDB-backed run ledger."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import pytest
+from pydantic_ai.usage import RunUsage
+
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.init import initialize_database
+from egregora.database.run_store import RunStore
+from egregora.database.task_store import TaskStore
+from egregora.llm.usage import UsageTracker
+from egregora.tracing import StageTimingCollector, collecting_spans, span
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def storage(tmp_path: Path):
+    with DuckDBStorageManager(db_path=tmp_path / "pipeline.duckdb") as manager:
+        initialize_database(manager.ibis_conn)
+        yield manager
+
+
+def _collect_run() -> StageTimingCollector:
+    collector = StageTimingCollector()
+    with collecting_spans(collector):
+        with span("pipeline.prepare"):
+            pass
+        for window in ("w1", "w2"):
+            with span("pipeline.process_item", window=window), span("pipeline.writer"):
+                pass
+        with pytest.raises(ValueError), span("pipeline.profile", window="w3"):
+            raise ValueError
+    return collector
+
+
+def test_run_lifecycle_is_persisted(storage) -> None:
+    store = RunStore(storage)
+    started = datetime.now(UTC) - timedelta(seconds=2)
+    store.start_run("run-1", source_type="whatsapp", parameters={"step_size": 100}, started_at=started)
+
+    running = store.get_run("run-1")
+    assert running is not None
+    assert running.status == "running"
+    assert running.parameters == {"step_size": 100}
+
+    usage = UsageTracker()
+    usage.record(RunUsage(requests=3, input_tokens=120, output_tokens=40))
+    usage.record_cache("writer", hit=True)
+    usage.record_cache("writer", hit=False)
+    store.record_stages("run-1", _collect_run())
+    store.finish_run(
+        "run-1",
+        status="completed",
+        windows=2,
+        posts=3,
+        usage=usage,
+        task_counts={"enrich_url": {"completed": 2}},
+        failures=1,
+    )
+
+    record = store.get_run("run-")
+    assert record is not None
+    assert record.status == "completed"
+    assert record.duration_ms is not None
+    assert record.duration_ms >= 2000
+    assert (record.input_tokens, record.output_tokens, record.llm_requests) == (120, 40, 3)
+    assert record.cache_hit_rate("writer") == 0.5
+    assert record.task_counts == {"enrich_url": {"completed": 2}}
+    assert record.failures == 1
+
+    stages = {metric.stage: metric for metric in store.get_stages("run-1")}
+    assert stages["pipeline.process_item"].calls == 2
+    assert stages["pipeline.writer"].calls == 2
+    assert stages["pipeline.profile"].failures == 1
+
+    per_window = {(m.window_label, m.stage) for m in store.get_stages("run-1", per_window=True)}
+    assert ("w1", "pipeline.writer") in per_window
+    assert ("w2", "pipeline.process_item") in per_window
+    assert ("w3", "pipeline.profile") in per_window
+    assert not any(window is None for window, _ in per_window)
+
+
+def test_list_and_compare_runs(storage) -> None:
+    store = RunStore(storage)
+    now = datetime.now(UTC)
+    for run_id, offset in (("old", 60), ("new", 0)):
+        store.start_run(run_id, source_type="whatsapp", started_at=now - timedelta(seconds=offset))
+    store.record_stages("old", _collect_run())
+    store.record_stages("new", _collect_run())
+
+    assert [record.run_id for record in store.list_runs()] == ["new", "old"]
+    assert [record.run_id for record in store.list_runs(limit=1)] == ["new"]
+
+    comparisons = {c.stage: c for c in store.compare_runs("old", "new")}
+    assert set(comparisons) == {
+        "pipeline.prepare",
+        "pipeline.process_item",
+        "pipeline.writer",
+        "pipeline.profile",
+    }
+    assert comparisons["pipeline.writer"].baseline_ms is not None
+    assert comparisons["pipeline.writer"].delta_ms is not None
+
+
+def test_get_run_requires_unique_prefix(storage) -> None:
+    store = RunStore(storage)
+    store.start_run("abc-1", source_type="whatsapp")
+    store.start_run("abc-2", source_type="whatsapp")
+
+    assert store.get_run("abc") is None
+    assert store.get_run("missing") is None
+    assert store.get_run("abc-2") is not None
+
+
+def test_count_tasks_since(storage) -> None:
+    before = datetime.now(UTC) - timedelta(seconds=1)
+    TaskStore(storage).enqueue_batch([("enrich_url", {"url": "a"}), ("enrich_url", {"url": "b"})])
+
+    assert RunStore(storage).count_tasks_since(before) == {"enrich_url": {"pending": 2}}
+
+
+def test_tasks_are_scoped_to_their_source(storage) -> None:
+    before = datetime.now(UTC) - timedelta(seconds=1)
+    alpha, beta = TaskStore(storage, source_key="alpha"), TaskStore(storage, source_key="beta")
+    alpha_task = alpha.enqueue("enrich_url", {"url": "a"})
+    beta.enqueue("enrich_url", {"url": "b"})
+    legacy_task = TaskStore(storage).enqueue("enrich_url", {"url": "legacy"})
+
+    assert {str(t["task_id"]) for t in alpha.fetch_pending("enrich_url")} == {alpha_task, legacy_task}
+    assert len(TaskStore(storage).fetch_pending("enrich_url")) == 3
+    assert RunStore(storage).count_tasks_since(before, source_key="beta") == {"enrich_url": {"pending": 1}}
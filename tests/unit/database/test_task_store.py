@@ -0,0 +1,63 @@
+"""Tests for the task store's schema evolution."""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import pytest
+
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.task_store import TaskStore
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+# The tasks table as database/init.py created it before the batch job task types.
+_LEGACY_TASKS_SQL = """
+CREATE TABLE tasks (
+    task_id UUID PRIMARY KEY,
+    task_type VARCHAR,
+    status VARCHAR,
+    payload JSON,
+    created_at TIMESTAMPTZ,
+    processed_at TIMESTAMPTZ,
+    error VARCHAR,
+    CONSTRAINT chk_tasks_status CHECK (status IN ('pending', 'processing', 'completed', 'failed', 'superseded')),
+    CONSTRAINT chk_tasks_task_type CHECK (
+        task_type IN ('generate_banner', 'update_profile', 'enrich_media', 'enrich_url')
+    )
+)
+"""
+
+
+@pytest.fixture
+def legacy_storage(tmp_path: Path):
+    with DuckDBStorageManager(db_path=tmp_path / "pipeline.duckdb") as manager:
+        manager.execute_sql(_LEGACY_TASKS_SQL)
+        manager.execute_sql(
+            "INSERT INTO tasks VALUES (uuid(), 'enrich_url', 'pending', ?, now(), NULL, NULL)",
+            [json.dumps({"url": "https://example.com"})],
+        )
+        yield manager
+
+
+@pytest.mark.parametrize("task_type", ["writer_batch", "enrich_url_batch"])
+def test_tasks_tables_from_before_batch_jobs_accept_them(legacy_storage, task_type) -> None:
+    store = TaskStore(legacy_storage, source_key="chat")
+
+    task_id = store.enqueue(task_type, {"job_name": "batches/1", "tags": ["a"]})
+
+    assert [str(task["task_id"]) for task in store.fetch_pending(task_type=task_type)] == [task_id]
+    # Rows queued before the migration are kept.
+    assert len(store.fetch_pending(task_type="enrich_url")) == 1
+    with pytest.raises(Exception, match="CHECK constraint"):
+        store.enqueue("not_a_task_type", {})
+
+
+def test_tasks_migration_is_idempotent(legacy_storage) -> None:
+    TaskStore(legacy_storage)
+    store = TaskStore(legacy_storage)
+
+    store.enqueue("writer_batch", {"job_name": "batches/1", "tags": []})
+    assert legacy_storage.row_count("tasks") == 2
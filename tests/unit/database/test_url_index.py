@@ -0,0 +1,143 @@
+"""Tests for the corpus-wide URL candidate index."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import ibis
+import pytest
+
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.message_repository import MessageRepository
+from egregora.database.schemas import STAGING_MESSAGES_SCHEMA
+from egregora.database.url_index import UrlCandidateIndex
+
+NOW = datetime(2024, 6, 1, 12, 0, tzinfo=UTC)
+
+
+def _message(event_id: str, minutes: int, text: str) -> dict:
+    return {
+        **dict.fromkeys(STAGING_MESSAGES_SCHEMA.names),
+        "event_id": event_id,
+        "ts": NOW + timedelta(minutes=minutes),
+        "text": text,
+    }
+
+
+@pytest.fixture
+def db_connection():
+    return ibis.duckdb.connect()
+
+
+@pytest.fixture
+def messages_table(db_connection):
+    rows = [
+        _message("1", 0, "Hello world"),
+        _message("2", 1, "Check out https://example.com/one"),
+        _message("3", -5, "Earlier message about https://example.com/two"),
+        _message("5", 3, "Someone else mentioned https://example.com/two"),
+        _message("6", 4, "And https://example.com/three is here"),
+        _message("7", 5, "Two links: https://example.com/four and http://example.com/five"),
+    ]
+    db_connection.create_table("messages", ibis.memtable(rows, schema=STAGING_MESSAGES_SCHEMA))
+    return db_connection.table("messages")
+
+
+@pytest.fixture
+def index(db_connection):
+    return UrlCandidateIndex(DuckDBStorageManager.from_ibis_backend(db_connection))
+
+
+def _rows(index: UrlCandidateIndex) -> dict[str, dict]:
+    return {row["url"]: row for row in index.table().execute().to_dict("records")}
+
+
+def test_update_keeps_earliest_occurrence(index, messages_table):
+    assert index.update(messages_table) == 5
+
+    rows = _rows(index)
+    assert len(rows) == 5
+    assert rows["https://example.com/two"]["first_event_id"] == "3"
+    assert {row["status"] for row in rows.values()} == {"pending"}
+
+
+def test_update_is_incremental(index, db_connection, messages_table):
+    index.update(messages_table)
+    index.mark(["https://example.com/three"], "enriched")
+    index.mark(["https://example.com/four"], "scheduled")
+
+    db_connection.insert(
+        "messages",
+        ibis.memtable(
+            [_message("8", -60, "https://example.com/one"), _message("9", 60, "https://example.com/six")],
+            schema=STAGING_MESSAGES_SCHEMA,
+        ),
+    )
+    index.update(messages_table)
+
+    rows = _rows(index)
+    assert len(rows) == 6
+    assert rows["https://example.com/one"]["first_event_id"] == "8"
+    assert rows["https://example.com/six"]["status"] == "pending"
+    assert rows["https://example.com/three"]["status"] == "enriched"
+    # Scheduled by an earlier run: offered again, the enrichment cache skips finished work.
+    assert rows["https://example.com/four"]["status"] == "pending"
+
+
+def test_mark_rejects_unknown_status(index):
+    with pytest.raises(ValueError, match="Invalid URL candidate status"):
+        index.mark(["https://example.com/one"], "done")
+
+
+def test_overlapping_windows_get_each_url_once(index, db_connection, messages_table):
+    index.update(messages_table)
+    repo = MessageRepository(db_connection)
+
+    first_window = messages_table.filter(messages_table.event_id.isin(["1", "2", "3", "5"]))
+    candidates = repo.get_url_enrichment_candidates(first_window, max_enrichments=10, url_index=index)
+    assert [url for url, _ in candidates] == ["https://example.com/two", "https://example.com/one"]
+    assert candidates[0][1]["event_id"] == "3"
+    index.mark([url for url, _ in candidates], "scheduled")
+
+    second_window = messages_table.filter(messages_table.event_id.isin(["2", "3", "5", "6", "7"]))
+    candidates = repo.get_url_enrichment_candidates(second_window, max_enrichments=10, url_index=index)
+    assert [url for url, _ in candidates] == [
+        "https://example.com/three",
+        "http://example.com/five",
+        "https://example.com/four",
+    ]
+
+
+def test_sources_keep_their_own_rows(db_connection, messages_table):
+    storage = DuckDBStorageManager.from_ibis_backend(db_connection)
+    first = UrlCandidateIndex(storage, source_key="chat-a")
+    second = UrlCandidateIndex(storage, source_key="chat-b")
+    first.update(messages_table)
+    first.mark(["https://example.com/one"], "scheduled")
+
+    # Indexing another source neither resets nor claims the first source's URLs.
+    second.update(messages_table)
+    second.mark(["https://example.com/two"], "enriched")
+
+    assert _rows(first)["https://example.com/one"]["status"] == "scheduled"
+    assert _rows(first)["https://example.com/two"]["status"] == "pending"
+    assert _rows(second)["https://example.com/one"]["status"] == "pending"
+
+    repo = MessageRepository(db_connection)
+    first_urls = [url for url, _ in repo.get_url_enrichment_candidates(messages_table, 10, url_index=first)]
+    second_urls = [url for url, _ in repo.get_url_enrichment_candidates(messages_table, 10, url_index=second)]
+    assert "https://example.com/one" not in first_urls
+    assert "https://example.com/one" in second_urls
+    assert "https://example.com/two" not in second_urls
+
+
+def test_url_keyed_index_is_recreated(db_connection, messages_table):
+    db_connection.raw_sql(
+        "CREATE TABLE url_candidates (url VARCHAR PRIMARY KEY, first_event_id VARCHAR, "
+        "first_ts TIMESTAMPTZ, status VARCHAR)"
+    )
+
+    index = UrlCandidateIndex(DuckDBStorageManager.from_ibis_backend(db_connection), source_key="chat-a")
+
+    assert index.update(messages_table) == 5
+    assert len(_rows(index)) == 5
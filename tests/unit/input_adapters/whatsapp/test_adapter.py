@@ -101,3 +101,25 @@ def test_deliver_media_raises_on_missing_file(adapter: WhatsAppAdapter, tmp_path
 
     assert "non_existent_file.jpg" in str(exc_info.value)
     assert str(zip_path) in str(exc_info.value)
+
+
+def test_deliver_media_reuses_archive_handle(adapter: WhatsAppAdapter, tmp_path: Path):
+    """Repeated deliveries share one validated handle until the export changes."""
+    zip_path = tmp_path / "export.zip"
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("Media/IMG-0001.jpg", b"one", compress_type=zipfile.ZIP_STORED)
+        zf.writestr("Media/IMG-0002.jpg", b"two", compress_type=zipfile.ZIP_DEFLATED)
+
+    first = adapter.deliver_media("img-0001.jpg", zip_path=zip_path)
+    handle = adapter._archive(zip_path)
+    second = adapter.deliver_media("IMG-0002.jpg", zip_path=zip_path)
+
+    assert first.content == b"one"
+    assert second.content == b"two"
+    assert adapter._archive(zip_path) is handle
+
+    with zipfile.ZipFile(zip_path, "w") as zf:
+        zf.writestr("Media/IMG-0001.jpg", b"replaced!")
+    assert adapter.deliver_media("IMG-0001.jpg", zip_path=zip_path).content == b"replaced!"
+
+    adapter.close()
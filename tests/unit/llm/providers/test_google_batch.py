@@ -5,6 +5,7 @@ from unittest.mock import MagicMock, patch
 import httpx
 import pytest
 from google import genai as genai_client
+from google.genai import types as genai_types
 from pydantic_ai.exceptions import ModelHTTPError, UsageLimitExceeded
 
 from egregora.llm.exceptions import (
@@ -184,3 +185,42 @@ class TestGoogleBatchModel:
 
             assert "Internal Server Error" in str(exc_info.value)
             assert exc_info.value.status_code == 500
+
+    def test_submit_batch_passes_config_and_returns_job_name(self, model: GoogleBatchModel):
+        """
+        GIVEN requests carrying a generate-content config (system instruction, tools)
+        WHEN submit_batch is called
+        THEN the config is sent as each inline request's config and the job name is returned
+        """
+        mock_client_instance = MagicMock()
+        mock_client_instance.batches.create.return_value.name = "batches/123"
+        config = {"system_instruction": {"parts": [{"text": "sys"}]}, "tools": []}
+        with patch.object(genai_client, "Client", return_value=mock_client_instance):
+            job_name = model.submit_batch([{"tag": "w1", "contents": [], "config": config}])
+
+        assert job_name == "batches/123"
+        src = mock_client_instance.batches.create.call_args.kwargs["src"]
+        assert src == [{"contents": [], "config": config}]
+        mock_client_instance.batches.get.assert_not_called()
+
+    def test_response_to_dict_keeps_function_calls(self, model: GoogleBatchModel):
+        """
+        GIVEN an SDK response whose only part is a function call
+        WHEN it is converted to a dict
+        THEN the function call survives the conversion
+        """
+        response = genai_types.GenerateContentResponse(
+            candidates=[
+                genai_types.Candidate(
+                    content=genai_types.Content(
+                        role="model",
+                        parts=[genai_types.Part.from_function_call(name="write_post_tool", args={"a": 1})],
+                    )
+                )
+            ]
+        )
+
+        result = model._response_to_dict(response)
+
+        part = result["candidates"][0]["content"]["parts"][0]
+        assert part["function_call"] == {"name": "write_post_tool", "args": {"a": 1}}
@@ -0,0 +1,118 @@
+"""Tests for reusing File API uploads by content hash."""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from typing import TYPE_CHECKING
+
+import diskcache
+
+from egregora.llm.providers.file_uploads import FileUploadRegistry, UploadedFile
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = START
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+class FakeUploader:
+    def __init__(self, clock: FakeClock, ttl: timedelta = timedelta(hours=48), delay: float = 0.0) -> None:
+        self.clock = clock
+        self.ttl = ttl
+        self.delay = delay
+        self.calls: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, path: Path, mime_type: str) -> UploadedFile:
+        time.sleep(self.delay)
+        with self._lock:
+            self.calls.append(path.name)
+            uri = f"https://files.test/{len(self.calls)}"
+        return UploadedFile(uri, mime_type, self.clock() + self.ttl)
+
+
+def _write(tmp_path: Path, name: str, content: bytes) -> Path:
+    path = tmp_path / name
+    path.write_bytes(content)
+    return path
+
+
+def test_same_content_is_uploaded_once(tmp_path):
+    clock = FakeClock()
+    uploader = FakeUploader(clock)
+    registry = FileUploadRegistry(uploader, clock=clock)
+
+    first = registry.get_or_upload(_write(tmp_path, "a.mp4", b"video"), "video/mp4")
+    # A forwarded copy under another name has the same contents.
+    second = registry.get_or_upload(_write(tmp_path, "b.mp4", b"video"), "video/mp4")
+    other = registry.get_or_upload(_write(tmp_path, "c.mp4", b"other video"), "video/mp4")
+
+    assert first.uri == second.uri != other.uri
+    assert uploader.calls == ["a.mp4", "c.mp4"]
+    assert (registry.uploads, registry.reused) == (2, 1)
+
+
+def test_uploads_are_replaced_before_they_expire(tmp_path):
+    clock = FakeClock()
+    uploader = FakeUploader(clock)
+    registry = FileUploadRegistry(uploader, clock=clock)
+    video = _write(tmp_path, "a.mp4", b"video")
+
+    first = registry.get_or_upload(video, "video/mp4")
+    clock.now = START + timedelta(hours=46)
+    assert registry.get_or_upload(video, "video/mp4") == first
+
+    # Within the safety margin of the 48h expiry: upload a fresh copy.
+    clock.now = START + timedelta(hours=47, minutes=30)
+    renewed = registry.get_or_upload(video, "video/mp4")
+    assert renewed.uri != first.uri
+    assert len(uploader.calls) == 2
+
+
+def test_registry_persists_across_runs_in_the_store(tmp_path):
+    clock = FakeClock()
+    video = _write(tmp_path, "a.mp4", b"video")
+    with diskcache.Cache(str(tmp_path / "media")) as store:
+        first_run = FakeUploader(clock)
+        uploaded = FileUploadRegistry(first_run, store, namespace="key1", clock=clock).get_or_upload(
+            video, "video/mp4"
+        )
+
+        second_run = FakeUploader(clock)
+        assert (
+            FileUploadRegistry(second_run, store, namespace="key1", clock=clock).get_or_upload(
+                video, "video/mp4"
+            )
+            == uploaded
+        )
+        assert second_run.calls == []
+
+        # Uploads belong to one API key's project.
+        other_key = FakeUploader(clock)
+        FileUploadRegistry(other_key, store, namespace="key2", clock=clock).get_or_upload(video, "video/mp4")
+        assert other_key.calls == ["a.mp4"]
+
+
+def test_concurrent_requests_share_one_upload(tmp_path):
+    clock = FakeClock()
+    uploader = FakeUploader(clock, delay=0.05)
+    registry = FileUploadRegistry(uploader, clock=clock)
+    video = _write(tmp_path, "a.mp4", b"video")
+
+    threads = [threading.Thread(target=registry.get_or_upload, args=(video, "video/mp4")) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert uploader.calls == ["a.mp4"]
@@ -0,0 +1,62 @@
+"""Tests for the shared Gemini client pool."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+from egregora.llm.providers.genai_clients import GenaiClientPool
+
+
+def _pool() -> tuple[GenaiClientPool, list[tuple[str | None, str | None]]]:
+    built: list[tuple[str | None, str | None]] = []
+
+    def factory(api_key, base_url):
+        built.append((api_key, base_url))
+        return MagicMock(name=f"client-{api_key}-{base_url}")
+
+    return GenaiClientPool(factory), built
+
+
+def test_one_client_per_key_and_endpoint():
+    pool, built = _pool()
+
+    first = pool.get("key-a")
+    assert pool.get("key-a") is first
+    assert pool.get("key-b") is not first
+    assert pool.get("key-a", base_url="http://localhost:8080/") is not first
+    assert built == [("key-a", None), ("key-b", None), ("key-a", "http://localhost:8080/")]
+
+
+def test_concurrent_callers_share_one_client():
+    pool, built = _pool()
+    barrier = threading.Barrier(8)
+    clients = []
+
+    def worker():
+        barrier.wait()
+        clients.append(pool.get("key"))
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(built) == 1
+    assert all(client is clients[0] for client in clients)
+
+
+def test_clients_close_when_the_last_session_ends():
+    pool, built = _pool()
+    with pool.session():
+        client = pool.get("key")
+        with pool.session():
+            assert pool.get("key") is client
+        client.close.assert_not_called()
+    client.close.assert_called_once()
+    assert len(pool) == 0
+
+    # Requested again after teardown: rebuilt, not handed out closed.
+    assert pool.get("key") is not client
+    assert len(built) == 2
@@ -1,15 +1,30 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import time
 from unittest.mock import patch
 
+import httpx
 import pytest
-
+from pydantic_ai import Agent
+from pydantic_ai.exceptions import ModelHTTPError
+from pydantic_ai.messages import ModelResponse, TextPart
+from pydantic_ai.models.function import FunctionModel
+from pydantic_ai.models.google import GoogleModel
+from pydantic_ai.providers.google import GoogleProvider
+from pydantic_ai.usage import RequestUsage
+
+from egregora.llm.providers.rate_limited import RateLimitedModel
 from egregora.llm.rate_limit import (
+    AdaptiveRateLimiter,
+    AdaptiveRateLimiterRegistry,
     AsyncGlobalRateLimiter,
+    get_adaptive_limiter,
     get_rate_limiter,
     init_rate_limiter,
+    parse_rate_limit_headers,
+    rate_limit_feedback,
 )
 
 
@@ -100,8 +115,10 @@ async def test_global_rate_limiter_cancellation_safety():
     except asyncio.CancelledError:
         pass
 
-    # Verify semaphore is released (value should be 1, so locked() should be False)
-    assert not limiter._semaphore.locked(), "Semaphore leaked (remained locked) after cancellation!"
+    # Verify semaphore is released (the single slot must be free again)
+    assert limiter._semaphore.acquire(blocking=False), (
+        "Semaphore leaked (remained locked) after cancellation!"
+    )
 
 
 def test_get_rate_limiter_singleton():
@@ -135,3 +152,241 @@ def test_init_rate_limiter():
         # Subsequent calls should return the new instance
         limiter4 = get_rate_limiter()
         assert limiter3 is limiter4
+
+
+def test_global_rate_limiter_is_shared_across_event_loops():
+    """Concurrency is enforced across threads that each run their own event loop."""
+    limiter = AsyncGlobalRateLimiter(requests_per_second=1000, max_concurrency=2)
+    active = peak = 0
+    lock = threading.Lock()
+
+    async def call():
+        nonlocal active, peak
+        async with limiter.throttle():
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            with lock:
+                active -= 1
+
+    threads = [threading.Thread(target=asyncio.run, args=(call(),)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert peak == 2
+
+
+def test_init_rate_limiter_keeps_limiter_with_same_limits():
+    """Pipelines initialized with the same quota share one limiter."""
+    with patch("egregora.llm.rate_limit._limiter", None):
+        init_rate_limiter(requests_per_second=5, max_concurrency=2)
+        limiter = get_rate_limiter()
+        init_rate_limiter(requests_per_second=5, max_concurrency=2)
+        assert get_rate_limiter() is limiter
+
+
+# --- Adaptive (AIMD) limiter ---
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class FakeProvider:
+    """Local provider that accepts ``capacity`` requests per second and 429s the rest."""
+
+    def __init__(self, clock: FakeClock, capacity: int, retry_after: float = 1.0) -> None:
+        self.clock = clock
+        self.capacity = capacity
+        self.retry_after = retry_after
+        self.accepted: list[float] = []
+        self.rejected = 0
+
+    def call(self) -> str:
+        now = self.clock()
+        recent = [t for t in self.accepted if t > now - 1.0]
+        if len(recent) >= self.capacity:
+            self.rejected += 1
+            request = httpx.Request("POST", "https://llm.invalid/generate")
+            response = httpx.Response(429, headers={"Retry-After": str(self.retry_after)}, request=request)
+            msg = "429 Too Many Requests"
+            raise httpx.HTTPStatusError(msg, request=request, response=response)
+        self.accepted.append(now)
+        self.clock.now += 0.01  # request latency
+        return "ok"
+
+
+def _drive(limiter: AdaptiveRateLimiter, provider: FakeProvider, requests: int) -> None:
+    for _ in range(requests):
+        try:
+            with limiter.request_sync():
+                provider.call()
+        except httpx.HTTPStatusError:
+            pass
+
+
+def test_adaptive_limiter_converges_on_provider_capacity():
+    """AIMD climbs from a low start and settles around the provider's real capacity."""
+    clock = FakeClock()
+    provider = FakeProvider(clock, capacity=5)
+    limiter = AdaptiveRateLimiter(
+        initial_rps=0.5, max_rps=50, increase_step=0.1, clock=clock, sleep=clock.sleep
+    )
+
+    _drive(limiter, provider, 600)
+
+    metrics = limiter.metrics()
+    assert metrics.throttled == provider.rejected > 0
+    # Under-used at first, then neither stuck low nor thrashing.
+    assert 2.5 <= limiter.rate <= 10
+    assert provider.rejected < 0.1 * len(provider.accepted)
+    assert len(provider.accepted) / clock.now > 2.5
+
+
+def test_adaptive_limiter_honours_retry_after_and_decreases_once_per_event():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(initial_rps=4, clock=clock, sleep=clock.sleep)
+    in_flight = [limiter.acquire_sync() for _ in range(3)]
+    feedback = parse_rate_limit_headers({"Retry-After": "7"}, throttled=True)
+
+    for permit in in_flight:
+        limiter.on_rate_limited(permit, feedback)
+
+    # Three 429s from one burst halve the rate once.
+    assert limiter.rate == 2
+    assert limiter.metrics().throttled == 3
+    delay, _ = limiter.reserve()
+    assert delay >= 7
+
+
+def test_adaptive_limiter_waits_for_token_budget():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(initial_rps=10, tokens_per_minute=1_000, clock=clock, sleep=clock.sleep)
+
+    with limiter.request_sync() as permit:
+        permit.tokens_used = 1_500
+
+    delay, _ = limiter.reserve()
+    # 500 tokens overdrawn at 1000 tokens/minute
+    assert delay == pytest.approx(30, abs=0.5)
+    assert limiter.metrics().token_utilization == 1.0
+
+
+def test_rate_limit_feedback_reads_gemini_retry_info_and_token_quota():
+    body = {
+        "error": {
+            "code": 429,
+            "status": "RESOURCE_EXHAUSTED",
+            "details": [
+                {
+                    "@type": "type.googleapis.com/google.rpc.QuotaFailure",
+                    "violations": [{"quotaId": "GenerateContentInputTokensPerModelPerMinute-FreeTier"}],
+                },
+                {"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "17s"},
+            ],
+        }
+    }
+
+    feedback = rate_limit_feedback(ModelHTTPError(429, "gemini-2.5-flash", body))
+
+    assert feedback is not None
+    assert feedback.retry_after == 17
+    assert feedback.token_limited
+    assert (
+        rate_limit_feedback(ModelHTTPError(500, "gemini-2.5-flash", {"error": {"status": "INTERNAL"}}))
+        is None
+    )
+
+
+def test_parse_rate_limit_headers_reads_quota_headers():
+    feedback = parse_rate_limit_headers(
+        {
+            "x-ratelimit-limit-requests": "60",
+            "x-ratelimit-remaining-requests": "0",
+            "x-ratelimit-limit-tokens": "9000",
+        }
+    )
+
+    assert feedback.limit_requests == 60
+    assert feedback.remaining_requests == 0
+    assert feedback.limit_tokens == 9000
+    assert feedback.retry_after is None
+
+
+def test_registry_keeps_one_limiter_per_provider_model_and_key():
+    registry = AdaptiveRateLimiterRegistry(initial_rps=3)
+
+    first = registry.get("google", "google:gemini-2.5-flash", "secret-key")
+
+    assert registry.get("google", "gemini-2.5-flash", "secret-key") is first
+    assert registry.get("google", "gemini-2.5-flash", "other-key") is not first
+    assert first.rate == 3
+    assert "secret" not in first.key_id
+
+
+def test_registry_shares_limiters_between_configured_and_pydantic_ai_model_names():
+    registry = AdaptiveRateLimiterRegistry()
+    google_model = GoogleModel("gemini-2.5-flash", provider=GoogleProvider(api_key="k"))
+
+    from_agent = registry.get(google_model.system, google_model.model_name, "k")
+
+    assert registry.get("google", "google-gla:gemini-2.5-flash", "k") is from_agent
+    assert registry.get("google", "models/gemini-2.5-flash", "k") is from_agent
+    assert (from_agent.provider, from_agent.model) == ("google", "gemini-2.5-flash")
+    # OpenRouter names carry a ":free" suffix that is not a provider prefix.
+    assert registry.get("openrouter", "vendor/model:free").model == "vendor/model:free"
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_model_charges_response_usage():
+    def reply(messages, info):
+        return ModelResponse(parts=[TextPart("hi")], usage=RequestUsage(input_tokens=40, output_tokens=2))
+
+    model = RateLimitedModel(FunctionModel(reply, model_name="fake-usage"), api_key="k")
+
+    result = await Agent(model).run("hello")
+
+    assert result.output == "hi"
+    metrics = get_adaptive_limiter("function", "fake-usage", "k").metrics()
+    assert metrics.requests == 1
+    assert metrics.tokens_last_minute == 42
+
+
+@pytest.mark.asyncio
+async def test_throttled_key_does_not_hold_global_slots():
+    """A key paused after a 429 waits without blocking requests on other keys."""
+
+    def reply(messages, info):
+        return ModelResponse(parts=[TextPart("hi")])
+
+    throttled = RateLimitedModel(FunctionModel(reply, model_name="fake-throttle"), api_key="paused")
+    healthy = RateLimitedModel(FunctionModel(reply, model_name="fake-throttle"), api_key="healthy")
+    permit = await throttled.adaptive_limiter.acquire()
+    body = {
+        "error": {"details": [{"@type": "type.googleapis.com/google.rpc.RetryInfo", "retryDelay": "30s"}]}
+    }
+    throttled.adaptive_limiter.on_rate_limited(
+        permit, rate_limit_feedback(ModelHTTPError(429, "fake-throttle", body))
+    )
+
+    with patch(
+        "egregora.llm.providers.rate_limited.get_rate_limiter",
+        return_value=AsyncGlobalRateLimiter(requests_per_second=1000, max_concurrency=1),
+    ):
+        waiting = asyncio.create_task(Agent(throttled).run("hello"))
+        await asyncio.sleep(0.05)
+        result = await asyncio.wait_for(Agent(healthy).run("hello"), timeout=2)
+        assert not waiting.done()
+        waiting.cancel()
+
+    assert result.output == "hi"
@@ -1,6 +1,17 @@
 from __future__ import annotations
 
-from egregora.llm.token_utils import estimate_tokens
+import hashlib
+
+import pytest
+
+from egregora.llm.token_utils import (
+    EstimateTokenizer,
+    TokenCounter,
+    estimate_tokens,
+    get_token_counter,
+    load_tokenizer,
+    tiktoken_encoding_cached,
+)
 
 
 def test_estimate_tokens():
@@ -35,3 +46,53 @@ def test_estimate_tokens_non_multiple_length():
 def test_estimate_tokens_multiple_length():
     """Verify a string with length as a multiple of 4 is handled."""
     assert estimate_tokens("abcd") == 1
+
+
+class _CountingTokenizer:
+    name = "words"
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def count(self, text: str) -> int:
+        self.calls += 1
+        return len(text.split())
+
+
+def test_token_counter_tokenizes_each_text_once():
+    tokenizer = _CountingTokenizer()
+    counter = TokenCounter(tokenizer)
+
+    assert [counter.count(text) for text in ["a b", "c", "a b", "a b"]] == [2, 1, 2, 2]
+
+    assert tokenizer.calls == 2
+    assert counter.cache_stats() == {"hits": 2, "misses": 2}
+
+
+def test_load_tokenizer_rejects_unknown_backend():
+    assert isinstance(load_tokenizer("estimate"), EstimateTokenizer)
+    with pytest.raises(ValueError, match="Unknown tokenizer"):
+        load_tokenizer("bogus")
+
+
+def test_get_token_counter_falls_back_to_estimate_when_backend_cannot_load(tmp_path):
+    counter = get_token_counter(f"sentencepiece:{tmp_path / 'missing.model'}")
+
+    assert counter.name == "estimate"
+    assert counter.count("abcdefgh") == 2
+
+
+def test_auto_tokenizer_estimates_without_a_cached_encoding(tmp_path, monkeypatch):
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+
+    assert not tiktoken_encoding_cached()
+    assert isinstance(load_tokenizer("auto"), EstimateTokenizer)
+
+
+def test_tiktoken_encoding_cached_finds_tiktokens_cache_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("TIKTOKEN_CACHE_DIR", str(tmp_path))
+    url = "https://openaipublic.blob.core.windows.net/encodings/o200k_base.tiktoken"
+    (tmp_path / hashlib.sha1(url.encode(), usedforsecurity=False).hexdigest()).write_bytes(b"")
+
+    assert tiktoken_encoding_cached("o200k_base")
+    assert not tiktoken_encoding_cached("cl100k_base")
@@ -57,3 +57,17 @@ def test_usage_tracker_history_truncation():
     assert tracker.history[0].input_tokens == 10
     # The last element should be the last one recorded
     assert tracker.history[-1].input_tokens == max_history + 9
+
+
+def test_usage_tracker_cache_stats():
+    """Cache lookups are counted per tier."""
+    tracker = UsageTracker()
+    tracker.record_cache("writer", hit=True)
+    tracker.record_cache("writer", hit=True)
+    tracker.record_cache("writer", hit=False)
+    tracker.record_cache("enrichment", hit=False)
+
+    assert tracker.cache_stats() == {
+        "enrichment": {"hits": 0, "misses": 1},
+        "writer": {"hits": 2, "misses": 1},
+    }
@@ -0,0 +1,101 @@
+"""Tests for downscaling and re-encoding images before enrichment."""
+
+from __future__ import annotations
+
+import io
+
+import diskcache
+import pytest
+from PIL import Image
+
+from egregora.ops.image_preprocessing import ImagePreprocessOptions, ImagePreprocessor, downscale_image
+
+ORIENTATION_TAG = 0x0112
+ROTATE_90_CW = 6
+
+
+def _photo(width: int = 4000, height: int = 3000, *, exif_orientation: int | None = None) -> bytes:
+    """A noisy JPEG, so its size behaves like a real photo's."""
+    image = Image.effect_noise((width, height), 64).convert("RGB")
+    exif = Image.Exif()
+    exif[0x010F] = "PhoneMaker"  # Make
+    if exif_orientation is not None:
+        exif[ORIENTATION_TAG] = exif_orientation
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=92, exif=exif)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="module")
+def photo() -> bytes:
+    return _photo()
+
+
+def test_downscale_shrinks_to_max_edge_and_drops_exif(photo):
+    prepared = downscale_image(photo, ImagePreprocessOptions(max_edge=1024, format="webp", quality=80))
+
+    assert prepared is not None
+    assert (prepared.width, prepared.height) == (1024, 768)
+    assert prepared.mime_type == "image/webp"
+    assert len(prepared.data) * 10 < len(photo)
+    with Image.open(io.BytesIO(prepared.data)) as result:
+        assert result.format == "WEBP"
+        assert not result.getexif()
+
+
+def test_downscale_applies_exif_orientation_before_stripping_it():
+    rotated = _photo(800, 400, exif_orientation=ROTATE_90_CW)
+
+    prepared = downscale_image(rotated, ImagePreprocessOptions(max_edge=200, format="jpeg"))
+
+    assert prepared is not None
+    assert (prepared.width, prepared.height) == (100, 200)
+    with Image.open(io.BytesIO(prepared.data)) as result:
+        assert result.format == "JPEG"
+        assert ORIENTATION_TAG not in result.getexif()
+
+
+def test_downscale_flattens_transparency_for_jpeg():
+    image = Image.new("RGBA", (2000, 2000), (255, 0, 0, 0))
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", compress_level=0)
+
+    prepared = downscale_image(buffer.getvalue(), ImagePreprocessOptions(max_edge=500, format="jpeg"))
+
+    assert prepared is not None
+    with Image.open(io.BytesIO(prepared.data)) as result:
+        assert result.mode == "RGB"
+        assert result.getpixel((0, 0)) == (255, 255, 255)
+
+
+def test_downscale_keeps_originals_that_are_already_small():
+    small = Image.new("RGB", (32, 32), "blue")
+    buffer = io.BytesIO()
+    small.save(buffer, format="WEBP", quality=50)
+
+    assert downscale_image(buffer.getvalue(), ImagePreprocessOptions()) is None
+    assert downscale_image(b"not an image", ImagePreprocessOptions()) is None
+
+
+def test_preprocessor_caches_derivatives_by_content_hash(photo, tmp_path, monkeypatch):
+    with diskcache.Cache(str(tmp_path / "media")) as cache:
+        preprocessor = ImagePreprocessor(ImagePreprocessOptions(max_edge=512), cache=cache)
+        data, mime_type = preprocessor.prepare(photo, "image/jpeg")
+        assert mime_type == "image/webp"
+
+        def fail(*_args):
+            raise AssertionError
+
+        # A second preprocessor sharing the cache never decodes the photo again.
+        monkeypatch.setattr("egregora.ops.image_preprocessing.downscale_image", fail)
+        assert ImagePreprocessor(ImagePreprocessOptions(max_edge=512), cache=cache).prepare(
+            photo, "image/jpeg"
+        ) == (data, mime_type)
+
+
+def test_preprocessor_passes_through_other_media_and_disabled_resizing(photo):
+    assert ImagePreprocessor().prepare(b"GIF89a...", "image/gif") == (b"GIF89a...", "image/gif")
+    assert ImagePreprocessor(ImagePreprocessOptions(max_edge=0)).prepare(photo, "image/jpeg") == (
+        photo,
+        "image/jpeg",
+    )
@@ -0,0 +1,98 @@
+"""Tests for estimating and packing media enrichment requests."""
+
+from __future__ import annotations
+
+import base64
+import io
+
+import pytest
+from PIL import Image
+
+from egregora.ops.media_batching import (
+    MediaBatchLimits,
+    MediaRequestSize,
+    estimate_media_tokens,
+    estimate_request_size,
+    pack_media_requests,
+)
+
+
+def _inline_image(width: int, height: int) -> dict:
+    buffer = io.BytesIO()
+    Image.new("RGB", (width, height), "red").save(buffer, format="WEBP")
+    return {"inlineData": {"mimeType": "image/webp", "data": base64.b64encode(buffer.getvalue()).decode()}}
+
+
+@pytest.mark.parametrize(
+    ("mime_type", "size", "dimensions", "expected"),
+    [
+        ("image/webp", 10_000, (320, 320), 258),
+        ("image/webp", 10_000, (1024, 768), 2 * 258),
+        ("image/jpeg", 10_000, None, 4 * 258),
+        ("video/mp4", 1_250_000, None, 10 * 263),
+        ("audio/ogg", 20_000, None, 10 * 32),
+        ("application/pdf", 120_000, None, 3 * 258),
+        ("image", 1_200_000, None, 4 * 258),
+    ],
+)
+def test_estimate_media_tokens(mime_type, size, dimensions, expected):
+    width, height = dimensions or (None, None)
+    assert estimate_media_tokens(mime_type, size, width=width, height=height) == expected
+
+
+def test_estimate_request_size_reads_inline_image_dimensions():
+    request = {"tag": "a", "contents": [{"parts": [{"text": "x" * 400}, _inline_image(1024, 768)]}]}
+
+    size = estimate_request_size(request)
+
+    assert size.tokens == 100 + 2 * 258
+    assert size.request_bytes > len(request["contents"][0]["parts"][1]["inlineData"]["data"])
+
+
+def test_file_references_count_tokens_but_few_bytes():
+    part = {"fileData": {"mimeType": "video/mp4", "fileUri": "https://files.test/v"}}
+
+    size = estimate_request_size({"contents": [{"parts": [part]}]}, file_size=12_500_000)
+
+    assert size.tokens == 100 * 263
+    assert size.request_bytes < 200
+
+
+def _requests(*sizes: tuple[int, int]) -> tuple[list[dict], dict[str, MediaRequestSize]]:
+    requests = [{"tag": f"t{i}"} for i in range(len(sizes))]
+    return requests, {f"t{i}": MediaRequestSize(*size) for i, size in enumerate(sizes)}
+
+
+def _tags(batches: list[list[dict]]) -> list[list[str]]:
+    return [[request["tag"] for request in batch] for batch in batches]
+
+
+def test_packing_fills_batches_up_to_the_byte_budget():
+    limits = MediaBatchLimits(max_request_bytes=100, max_tokens=None, max_items=None)
+    # Sizes 60, 50, 40, 30, 20: first-fit decreasing fills two batches of 100.
+    requests, sizes = _requests((60, 0), (50, 0), (40, 0), (30, 0), (20, 0))
+
+    plan = pack_media_requests(requests, sizes, limits)
+
+    assert _tags(plan.batches) == [["t0", "t2"], ["t1", "t3", "t4"]]
+    assert plan.oversized == []
+
+
+def test_packing_respects_token_and_item_limits():
+    requests, sizes = _requests(*[(1, 300)] * 5)
+
+    by_tokens = pack_media_requests(requests, sizes, MediaBatchLimits(max_tokens=600, max_items=None))
+    by_items = pack_media_requests(requests, sizes, MediaBatchLimits(max_tokens=None, max_items=4))
+
+    assert [len(batch) for batch in by_tokens.batches] == [2, 2, 1]
+    assert [len(batch) for batch in by_items.batches] == [4, 1]
+
+
+def test_oversized_requests_are_set_aside():
+    limits = MediaBatchLimits(max_request_bytes=100, max_tokens=1000, max_items=None)
+    requests, sizes = _requests((10, 10), (500, 10), (10, 5000), (10, 10))
+
+    plan = pack_media_requests(requests, sizes, limits)
+
+    assert _tags(plan.batches) == [["t0", "t3"]]
+    assert [request["tag"] for request in plan.oversized] == ["t1", "t2"]
@@ -0,0 +1,49 @@
+"""Tests for staging ZIP media in memory or spooled files."""
+
+from __future__ import annotations
+
+import hashlib
+import zipfile
+
+import pytest
+
+from egregora.ops.media_staging import build_media_index, stage_zip_member
+
+
+@pytest.fixture
+def archive(tmp_path):
+    path = tmp_path / "chat.zip"
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("WhatsApp Chat/IMG-0001.JPG", b"small photo")
+        zf.writestr("WhatsApp Chat/VID-0001.mp4", b"v" * 4096)
+        zf.writestr("WhatsApp Chat/", b"")
+    with zipfile.ZipFile(path) as zf:
+        yield zf
+
+
+def test_index_maps_lowercased_basenames_to_members(archive):
+    assert build_media_index(archive) == {
+        "img-0001.jpg": "WhatsApp Chat/IMG-0001.JPG",
+        "vid-0001.mp4": "WhatsApp Chat/VID-0001.mp4",
+    }
+
+
+def test_small_members_are_staged_in_memory(archive):
+    media = stage_zip_member(archive, "WhatsApp Chat/IMG-0001.JPG", spool_threshold=1024)
+
+    assert media.in_memory
+    assert media.name == "IMG-0001.JPG"
+    assert media.read_bytes() == b"small photo"
+    assert (media.size, media.sha256) == (11, hashlib.sha256(b"small photo").hexdigest())
+
+
+def test_large_members_are_spooled_and_can_be_written_out(archive, tmp_path):
+    media = stage_zip_member(archive, "WhatsApp Chat/VID-0001.mp4", spool_threshold=1024)
+
+    assert not media.in_memory
+    assert media.size == 4096
+    assert media.open().read(3) == b"vvv"
+    # Reads always start from the beginning.
+    assert media.read_bytes() == b"v" * 4096
+    assert media.write_to(tmp_path / "video.mp4").read_bytes() == b"v" * 4096
+    media.close()
@@ -0,0 +1,136 @@
+"""Tests for fetching URL content through the asset cache, against a local HTTP stub."""
+
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import ClassVar
+from unittest.mock import MagicMock
+
+import httpx
+import ibis
+import pytest
+
+from egregora.agents.enricher import fetch_url_with_jina
+from egregora.database.asset_cache import AssetCache
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.ops.url_fetch import CachedUrlFetcher
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """Serves ``page`` with an ETag and answers matching conditional requests with 304."""
+
+    page = b"# Page v1"
+    etag = '"v1"'
+    requests: ClassVar[list[dict[str, str]]] = []
+
+    def do_GET(self) -> None:
+        type(self).requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/markdown")
+        self.send_header("Content-Length", str(len(self.page)))
+        self.send_header("ETag", self.etag)
+        self.end_headers()
+        self.wfile.write(self.page)
+
+    def log_message(self, *_args) -> None:
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    _Handler.page, _Handler.etag, _Handler.requests = b"# Page v1", '"v1"', []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/page"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def cache():
+    storage = DuckDBStorageManager.from_ibis_backend(ibis.duckdb.connect())
+    yield AssetCache(storage)
+    storage.close()
+
+
+@pytest.mark.asyncio
+async def test_fresh_entries_are_served_without_a_request(stub_url, cache):
+    async with httpx.AsyncClient() as client:
+        fetcher = CachedUrlFetcher(cache, client=client)
+
+        first = await fetcher.get(stub_url)
+        # A second fetcher over the same table, like a retried agent run.
+        second = await CachedUrlFetcher(cache, client=client).get(stub_url)
+
+        assert first.text == second.text == "# Page v1"
+        assert second.content_type == "text/markdown"
+        assert len(_Handler.requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_revalidated_with_their_etag(stub_url, cache):
+    async with httpx.AsyncClient() as client:
+        fetcher = CachedUrlFetcher(cache, ttl=timedelta(0), client=client)
+        await fetcher.get(stub_url)
+
+        revalidated = await fetcher.get(stub_url)
+
+        assert revalidated.text == "# Page v1"
+        assert _Handler.requests[-1]["If-None-Match"] == '"v1"'
+        assert (fetcher.fetched, fetcher.revalidated) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_changed_pages_replace_the_cached_entry(stub_url, cache):
+    async with httpx.AsyncClient() as client:
+        fetcher = CachedUrlFetcher(cache, ttl=timedelta(0), client=client)
+        await fetcher.get(stub_url)
+        _Handler.page, _Handler.etag = b"# Page v2", '"v2"'
+
+        changed = await fetcher.get(stub_url)
+
+        assert changed.text == "# Page v2"
+        assert cache.load(stub_url).etag == '"v2"'
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_when_the_server_is_unreachable(stub_url, cache):
+    async with httpx.AsyncClient() as client:
+        await CachedUrlFetcher(cache, ttl=timedelta(0), client=client).get(stub_url)
+        unreachable = httpx.AsyncClient(transport=httpx.MockTransport(_refuse))
+
+        async with unreachable:
+            fetched = await CachedUrlFetcher(cache, client=unreachable).get(stub_url)
+            assert fetched.text == "# Page v1"
+            with pytest.raises(httpx.ConnectError):
+                await CachedUrlFetcher(cache, client=unreachable).get(f"{stub_url}/other")
+
+
+def _refuse(request: httpx.Request) -> httpx.Response:
+    msg = "connection refused"
+    raise httpx.ConnectError(msg, request=request)
+
+
+@pytest.mark.asyncio
+async def test_jina_tool_fetches_through_the_shared_fetcher(cache):
+    seen: list[str] = []
+
+    def jina(request: httpx.Request) -> httpx.Response:
+        seen.append(str(request.url))
+        return httpx.Response(200, text="# Reader view", headers={"Content-Type": "text/markdown"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(jina)) as client:
+        ctx = MagicMock(deps=CachedUrlFetcher(cache, client=client))
+        first = await fetch_url_with_jina(ctx, "https://example.com/post")
+        second = await fetch_url_with_jina(ctx, "https://example.com/post")
+
+    assert first == second == "# Reader view"
+    assert seen == ["https://r.jina.ai/https://example.com/post"]
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import threading
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import ClassVar, Self
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from egregora.database.duckdb_manager import DuckDBStorageManager
+from egregora.database.init import initialize_database
+from egregora.database.task_store import TaskStore
+from egregora.orchestration.context import PipelineContext, PipelineState
+from egregora.orchestration.pipelines.etl.enrichment_prefetch import EnrichmentPrefetcher
+from egregora.orchestration.pipelines.etl.preparation import PreparedPipelineData, get_pending_conversations
+from egregora.transformations import Window
+
+PREFETCH = "egregora.orchestration.pipelines.etl.enrichment_prefetch"
+
+
+class _FakeWorker:
+    """Completes every pending task, recording the thread and storage it ran on."""
+
+    runs: ClassVar[list[tuple[str, object]]] = []
+
+    def __init__(self, ctx: PipelineContext) -> None:
+        self.ctx = ctx
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        return None
+
+    def run(self) -> int:
+        tasks = self.ctx.task_store.fetch_pending()
+        for task in tasks:
+            self.ctx.task_store.mark_completed(task["task_id"])
+            self.runs.append((threading.current_thread().name, self.ctx.storage))
+        return len(tasks)
+
+
+@pytest.fixture
+def ctx(tmp_path: Path):
+    with DuckDBStorageManager(db_path=tmp_path / "pipeline.duckdb") as storage:
+        initialize_database(storage.ibis_conn)
+        state = PipelineState(
+            run_id=uuid.uuid4(),
+            start_time=datetime.now(UTC),
+            source_type="test",
+            input_path=tmp_path / "chat.zip",
+            client=None,
+            storage=storage,
+            cache=MagicMock(),
+            task_store=TaskStore(storage),
+            output_sink=MagicMock(url_convention="simple"),
+        )
+        config_obj = MagicMock()
+        config_obj.config.enrichment.prefetch_windows = 2
+        config_obj.config.pipeline.max_windows = None
+        config_obj.url_context = None
+        _FakeWorker.runs = []
+        yield PipelineContext(config_obj, state)
+
+
+def _enqueue_one(ctx: PipelineContext, scheduled: list[list[str]]):
+    def schedule(*_args, **_kwargs) -> list[str]:
+        task_ids = ctx.task_store.enqueue_batch(
+            [("enrich_url", {"url": f"https://example.com/{len(scheduled)}"})]
+        )
+        scheduled.append(task_ids)
+        return task_ids
+
+    return schedule
+
+
+def test_pending_among_reports_only_pending_tasks(ctx):
+    first, second = ctx.task_store.enqueue_batch([("enrich_url", {"url": "a"}), ("enrich_url", {"url": "b"})])
+    ctx.task_store.mark_completed(first)
+
+    assert ctx.task_store.pending_among([first, second, str(uuid.uuid4())]) == {second}
+    assert ctx.task_store.pending_among([]) == set()
+
+
+def test_prefetcher_drains_on_its_own_connection(ctx):
+    with (
+        patch(f"{PREFETCH}.EnrichmentWorker", _FakeWorker),
+        patch(f"{PREFETCH}.schedule_enrichment", side_effect=_enqueue_one(ctx, [])),
+        EnrichmentPrefetcher(ctx, poll_interval=0.01) as prefetcher,
+    ):
+        assert ctx.state.enrichment_prefetcher is prefetcher
+        task_ids = prefetcher.schedule(MagicMock(), {})
+        prefetcher.wait(task_ids)
+
+        assert ctx.task_store.pending_among(task_ids) == set()
+
+    assert ctx.state.enrichment_prefetcher is None
+    assert [thread for thread, _ in _FakeWorker.runs] == ["enrichment-prefetch"]
+    assert all(storage is not ctx.storage for _, storage in _FakeWorker.runs)
+
+
+def test_wait_drains_inline_when_the_worker_has_stopped(ctx):
+    with (
+        patch(f"{PREFETCH}.EnrichmentWorker", _FakeWorker),
+        patch(f"{PREFETCH}.schedule_enrichment", side_effect=_enqueue_one(ctx, [])),
+    ):
+        prefetcher = EnrichmentPrefetcher(ctx, poll_interval=0.01)
+        task_ids = prefetcher.schedule(MagicMock(), {})
+        prefetcher.wait(task_ids)
+
+    assert ctx.task_store.pending_among(task_ids) == set()
+    assert [thread for thread, _ in _FakeWorker.runs] == [threading.current_thread().name]
+
+
+def test_saturated_once_enough_tasks_are_queued(ctx):
+    with (
+        patch(f"{PREFETCH}.schedule_enrichment", side_effect=_enqueue_one(ctx, [])),
+        patch.object(EnrichmentPrefetcher, "start"),
+    ):
+        prefetcher = EnrichmentPrefetcher(ctx, max_queued_tasks=2)
+        prefetcher.schedule(MagicMock(), {})
+        assert not prefetcher.saturated()
+        second = prefetcher.schedule(MagicMock(), {})
+        assert prefetcher.saturated()
+
+        ctx.task_store.mark_completed(second[0])
+        assert not prefetcher.saturated()
+
+
+@patch("egregora.orchestration.pipelines.etl.preparation.process_media_for_window")
+def test_get_pending_conversations_enriches_windows_ahead(mock_process_media, ctx):
+    """Windows are scheduled ahead of the writer and yielded once their own tasks are done."""
+    windows = []
+    for index in range(5):
+        window = MagicMock(spec=Window)
+        window.size = 10
+        window.window_index = index
+        window.table = MagicMock(name=f"table-{index}")
+        windows.append(window)
+    mock_process_media.side_effect = lambda window_table, **_: (window_table, {})
+
+    dataset = MagicMock(spec=PreparedPipelineData)
+    dataset.context = ctx
+    dataset.windows_iterator = iter(windows)
+    dataset.enable_enrichment = True
+    dataset.token_index = None
+
+    scheduled: list[list[str]] = []
+    with (
+        patch(f"{PREFETCH}.EnrichmentWorker", _FakeWorker),
+        patch(f"{PREFETCH}.schedule_enrichment", side_effect=_enqueue_one(ctx, scheduled)),
+        patch(
+            "egregora.orchestration.pipelines.etl.preparation._calculate_max_window_size", return_value=100
+        ),
+    ):
+        conversations = get_pending_conversations(dataset)
+        first = next(conversations)
+        # The current window plus ``prefetch_windows`` more were scheduled before the first yield.
+        assert len(scheduled) == 3
+        assert first.window is windows[0]
+        assert ctx.task_store.pending_among(scheduled[0]) == set()
+        rest = list(conversations)
+
+    assert [conversation.window for conversation in [first, *rest]] == windows
+    assert len(scheduled) == 5
+    assert ctx.task_store.fetch_pending() == []
+    assert ctx.state.enrichment_prefetcher is None
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import ibis
 import pytest
 
 from egregora.config.exceptions import InvalidDateFormatError, InvalidTimezoneError
+from egregora.llm.token_utils import EstimateTokenizer, TokenCounter
 from egregora.orchestration.context import PipelineContext
 from egregora.orchestration.pipelines.etl.preparation import (
     PreparedPipelineData,
@@ -16,7 +17,7 @@ from egregora.orchestration.pipelines.etl.preparation import (
     validate_dates,
     validate_timezone_arg,
 )
-from egregora.transformations import Window
+from egregora.transformations import Window, WindowTokenIndex
 
 # --- Date Validation Tests ---
 
@@ -202,6 +203,7 @@ def test_get_pending_conversations_splitting(
         [large_window, small_window]
     )  # Order: Large first to test re-queueing logic
     dataset.enable_enrichment = False
+    dataset.token_index = None
 
     # Mock media processing
     mock_process_media.return_value = (MagicMock(), {})  # table, media_mapping
@@ -227,3 +229,38 @@ def test_get_pending_conversations_splitting(
     assert conversations[0].depth == 1
     assert conversations[1].depth == 1
     assert conversations[2].depth == 0
+
+
+@patch("egregora.orchestration.pipelines.etl.preparation.process_media_for_window")
+@patch("egregora.orchestration.pipelines.etl.preparation._calculate_max_window_tokens")
+def test_get_pending_conversations_splits_by_token_count(mock_calc_tokens, mock_process_media):
+    """Windows are split by their real token count, not their message count."""
+    mock_calc_tokens.return_value = 100
+    start = datetime(2024, 1, 1, 10, 0)
+    # Four short messages and one long one in a single five-message window
+    table = ibis.memtable(
+        {
+            "ts": [start + timedelta(minutes=i) for i in range(5)],
+            "text": ["hi", "ok", "yes", "no", "long " * 200],
+        }
+    )
+    token_index = WindowTokenIndex.build(table, TokenCounter(EstimateTokenizer()))
+    window = Window(
+        window_index=0, start_time=start, end_time=start + timedelta(minutes=4), table=table, size=5
+    )
+
+    ctx = MagicMock(spec=PipelineContext)
+    ctx.config.pipeline.max_windows = None
+    ctx.url_context = None
+    ctx.output_sink.url_convention = "simple"
+    dataset = MagicMock(spec=PreparedPipelineData)
+    dataset.context = ctx
+    dataset.windows_iterator = iter([window])
+    dataset.enable_enrichment = False
+    dataset.token_index = token_index
+    mock_process_media.side_effect = lambda window_table, **_: (window_table, {})
+
+    conversations = list(get_pending_conversations(dataset))
+
+    assert len(conversations) > 1
+    assert sum(conversation.window.size for conversation in conversations) == 5
@@ -8,6 +8,7 @@ from egregora.orchestration.pipelines.etl.setup import (
     _create_database_backend,
     _validate_and_connect,
     ensure_site_initialized,
+    pipeline_environment,
 )
 
 
@@ -74,3 +75,17 @@ def test_ensure_site_initialized_creates(mock_scaffolder, tmp_path):
 
     assert output_dir.exists()
     mock_scaffolder.return_value.scaffold_site.assert_called_once_with(output_dir, site_name="new_site")
+
+
+@patch("egregora.orchestration.pipelines.etl.setup._create_pipeline_context")
+def test_pipeline_environment_closes_the_input_adapter(mock_create_context):
+    """Adapters holding the export open (WhatsApp's ZIP handle) are closed on teardown."""
+    ctx = MagicMock()
+    mock_create_context.return_value = (ctx, MagicMock())
+
+    with pytest.raises(RuntimeError), pipeline_environment(MagicMock()):
+        msg = "writer failed"
+        raise RuntimeError(msg)
+
+    ctx.state.adapter.close.assert_called_once_with()
+    ctx.cache.close.assert_called_once_with()
@@ -1,6 +1,8 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from egregora.config.settings import SiteSettings, SourceSettings
 from egregora.constants import SourceType
 
@@ -127,3 +129,38 @@ def test_run_cli_flow_scaffolds_if_no_config(
     # Verify that scaffolding was called because the config was missing
     mock_scaffold_site.assert_called_once_with(output_dir, site_name=output_dir.name)
     assert mock_run.called
+
+
+@patch("egregora.cli.write.run")
+@patch("egregora.cli.write.load_egregora_config")
+@patch("egregora.cli.write.validate_api_key")
+@patch("egregora.orchestration.pipelines.etl.setup.MkDocsSiteScaffolder.scaffold_site")
+def test_run_cli_flow_parallel_sources_isolates_failures(
+    mock_scaffold_site, mock_validate_key, mock_load_config, mock_run, config_factory
+):
+    """A failing source does not stop the others; the flow exits non-zero afterwards."""
+    from egregora.cli.write import run_cli_flow
+
+    config = config_factory()
+    config.site = SiteSettings(
+        default_source="alpha",
+        sources={
+            "alpha": SourceSettings(adapter="whatsapp"),
+            "beta": SourceSettings(adapter="self"),
+            "gamma": SourceSettings(adapter="whatsapp"),
+        },
+    )
+    mock_load_config.return_value = config
+
+    def fake_run(run_params):
+        if run_params.source_key == "beta":
+            msg = "boom"
+            raise RuntimeError(msg)
+        return {"w1": {"posts": ["p"], "profiles": []}}
+
+    mock_run.side_effect = fake_run
+
+    with pytest.raises(SystemExit):
+        run_cli_flow(input_file=Path("test.zip"), output=Path("site"), all_sources=True, parallel_sources=3)
+
+    assert sorted(call[0][0].source_key for call in mock_run.call_args_list) == ["alpha", "beta", "gamma"]
@@ -1,14 +1,19 @@
 from unittest.mock import MagicMock
 
+import diskcache
 import pytest
 
 from egregora.orchestration.cache import (
     CacheBackend,
+    CacheTier,
     EnrichmentCache,
+    PipelineCache,
+    contains_many,
     make_enrichment_cache_key,
 )
 from egregora.orchestration.exceptions import (
     CacheDeserializationError,
+    CacheKeyNotFoundError,
     CachePayloadTypeError,
 )
 
@@ -89,3 +94,82 @@ def test_enrichment_cache_load_payload_type_error(mock_backend):
 
     mock_backend.get.assert_called_once_with("test_key")
     mock_backend.delete.assert_called_once_with("test_key")
+
+
+def test_pipeline_cache_contains_many(tmp_path):
+    """Bulk membership matches per-key lookups across tiers, chunks and expiry."""
+    cache = PipelineCache(tmp_path)
+    try:
+        keys = [
+            make_enrichment_cache_key(kind="url", identifier=f"http://example.com/{i}") for i in range(1200)
+        ]
+        for key in keys[::3]:
+            cache.enrichment.store(key, {"markdown": "cached"})
+        cache.writer.set("post-1", {"title": "t"})
+        cache.writer.set("post-2", {"title": "t"}, expire=-1)
+
+        assert cache.contains_many(keys) == set(keys[::3])
+        assert cache.contains_many(["post-1", "post-2", "post-3"], tier=CacheTier.WRITER) == {"post-1"}
+        assert cache.contains_many([]) == set()
+    finally:
+        cache.close()
+
+
+def test_contains_many_bulk_query_matches_installed_diskcache(tmp_path):
+    """Pins the ``Cache._sql`` bulk query to the installed diskcache's membership test."""
+    cache = diskcache.Cache(str(tmp_path))
+    try:
+        assert callable(getattr(cache, "_sql", None))
+        keys = [f"key-{i}" for i in range(50)]
+        for key in keys[::2]:
+            cache.set(key, {"v": key})
+        cache.set("key-1", "gone", expire=-1)
+
+        assert contains_many(cache, keys) == {key for key in keys if key in cache}
+    finally:
+        cache.close()
+
+
+class _CacheWithoutBulkQuery:
+    """Only the public membership API, as a diskcache release without ``_sql`` would offer."""
+
+    def __init__(self, cache: diskcache.Cache) -> None:
+        self._cache = cache
+
+    def transact(self):
+        return self._cache.transact()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._cache
+
+
+def test_contains_many_without_bulk_query_checks_each_key(tmp_path):
+    cache = diskcache.Cache(str(tmp_path))
+    try:
+        cache.set("hit", 1)
+        assert contains_many(_CacheWithoutBulkQuery(cache), ["hit", "miss"]) == {"hit"}
+    finally:
+        cache.close()
+
+
+def test_enrichment_cache_store_rejects_non_dict_payloads(mock_backend):
+    cache = EnrichmentCache(backend=mock_backend)
+
+    with pytest.raises(CachePayloadTypeError):
+        cache.store("test_key", "not a dict")
+
+    mock_backend.set.assert_not_called()
+
+
+def test_enrichment_cache_contains_many_falls_back_to_lookups(mock_backend):
+    """Backends without a bulk query are probed key by key."""
+
+    def get(key):
+        if key != "hit":
+            raise CacheKeyNotFoundError(key)
+        return {"markdown": "cached"}
+
+    mock_backend.get.side_effect = get
+    cache = EnrichmentCache(backend=mock_backend)
+
+    assert cache.contains_many(["hit", "miss"]) == {"hit"}
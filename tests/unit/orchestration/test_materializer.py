@@ -1,31 +1,96 @@
 from unittest.mock import MagicMock
 
-from egregora.data_primitives.document import DocumentType
-from egregora.orchestration.materializer import materialize_site
-from egregora.output_sinks.exceptions import DocumentNotFoundError
-
-
-def test_materialize_site_handles_document_not_found_error():
-    """
-    Given a source sink that raises DocumentNotFoundError
-    When materialize_site is called
-    Then it should handle the error and continue.
-    """
-    # Arrange
-    source_sink = MagicMock()
-    destination_sink = MagicMock()
-
-    meta = MagicMock()
-    meta.doc_type = DocumentType.POST
-    meta.identifier = "test-post"
-
-    source_sink.list.return_value = [meta]
-    source_sink.get.side_effect = DocumentNotFoundError("post", "test-post")
-
-    # Act
-    materialize_site(source_sink, destination_sink)
-
-    # Assert
-    assert source_sink.list.call_count == 5
-    assert source_sink.get.call_count == 5
-    destination_sink.persist.assert_not_called()
+import pytest
+
+from egregora.data_primitives.document import Document, DocumentType
+from egregora.orchestration.materializer import materialize_site, write_if_changed
+from egregora.output_sinks.mkdocs.adapter import MkDocsAdapter
+
+
+@pytest.fixture
+def destination(tmp_path):
+    site_root = tmp_path / "site"
+    (site_root / "docs").mkdir(parents=True)
+    adapter = MkDocsAdapter()
+    adapter.initialize(site_root)
+    return adapter
+
+
+def _source(documents):
+    source = MagicMock()
+    source.documents.side_effect = lambda: iter(documents)
+    return source
+
+
+def _documents():
+    posts = [
+        Document(
+            content=f"Post {i}",
+            type=DocumentType.POST,
+            metadata={"slug": f"post-{i}", "date": "2024-01-01", "title": f"Post {i}", "authors": ["a1"]},
+        )
+        for i in range(20)
+    ]
+    profile = Document(
+        content="Profile",
+        type=DocumentType.PROFILE,
+        metadata={"slug": "bio", "subject": "a1", "uuid": "a1"},
+    )
+    journal = Document(content="Journal", type=DocumentType.JOURNAL, metadata={"slug": "entry-1"})
+    return [*posts, profile, journal]
+
+
+def test_materialize_site_writes_every_document(destination):
+    """All documents are rendered to their canonical paths."""
+    stats = materialize_site(_source(_documents()), destination, max_workers=4)
+
+    posts_dir = destination.posts_dir
+    assert stats.written == 22
+    assert (posts_dir / "2024-01-01-post-0.md").read_text().endswith("Post 0")
+    assert (posts_dir / "2024-01-01-post-19.md").exists()
+    assert "type: profile" in (destination.profiles_dir / "a1" / "bio.md").read_text()
+    assert (posts_dir / "journal-entry-1.md").exists()
+    # Authors referenced by posts are registered once at the end
+    assert "a1" in (destination.docs_dir / ".authors.yml").read_text()
+    # No temp files are left behind
+    assert not list(destination.docs_dir.rglob("*.tmp"))
+
+
+def test_materialize_site_skips_unchanged_files(destination):
+    """Re-materializing identical content rewrites nothing and creates no duplicates."""
+    documents = _documents()
+    materialize_site(_source(documents), destination)
+    post_path = destination.posts_dir / "2024-01-01-post-3.md"
+    mtime = post_path.stat().st_mtime_ns
+
+    stats = materialize_site(_source(documents), destination)
+
+    assert stats.written == 0
+    assert stats.unchanged == 22
+    assert post_path.stat().st_mtime_ns == mtime
+    assert not (destination.posts_dir / "2024-01-01-post-3-2.md").exists()
+
+
+def test_materialize_site_falls_back_to_persist_for_unrenderable_media(destination):
+    """Media flagged for PII deletion goes through persist (which skips it)."""
+    media = Document(
+        content=b"\x89PNG",
+        type=DocumentType.MEDIA,
+        metadata={"filename": "secret.png", "pii_deleted": True},
+    )
+
+    stats = materialize_site(_source([media]), destination)
+
+    assert stats.persisted == 1
+    assert stats.written == 0
+
+
+def test_write_if_changed_is_atomic_and_idempotent(tmp_path):
+    target = tmp_path / "nested" / "file.md"
+
+    assert write_if_changed(target, b"one") is True
+    assert write_if_changed(target, b"one") is False
+    assert write_if_changed(target, b"two") is True
+    assert target.read_bytes() == b"two"
+    assert target.stat().st_mode & 0o777 == 0o644
+    assert sorted(p.name for p in target.parent.iterdir()) == ["file.md"]
@@ -66,3 +66,26 @@ def test_create_context(mock_run_params):
         assert context.config is not None
         assert context.state is not None
         assert context.state.run_id == "test-run"
+
+
+def test_validate_api_key_caches_successful_validation(tmp_path, monkeypatch):
+    """A validated key is not re-checked over the network within the TTL."""
+    from egregora.orchestration.pipelines.etl.setup import validate_api_key
+
+    monkeypatch.setenv("GOOGLE_API_KEY", "key-1")
+    monkeypatch.delenv("GOOGLE_API_KEYS", raising=False)
+    monkeypatch.delenv("EGREGORA_SKIP_API_KEY_VALIDATION", raising=False)
+    monkeypatch.delenv("EGREGORA_API_KEY_VALIDATION_TTL", raising=False)
+
+    with patch("egregora.orchestration.pipelines.etl.setup.validate_gemini_api_key") as mock_validate:
+        validate_api_key(tmp_path, cache_dir=tmp_path / "cache")
+        validate_api_key(tmp_path, cache_dir=tmp_path / "cache")
+        assert mock_validate.call_count == 1
+
+        monkeypatch.setenv("EGREGORA_API_KEY_VALIDATION_TTL", "0")
+        validate_api_key(tmp_path, cache_dir=tmp_path / "cache")
+        assert mock_validate.call_count == 2
+
+    assert "key-1" not in "".join(
+        p.read_bytes().decode(errors="ignore") for p in (tmp_path / "cache").rglob("*") if p.is_file()
+    )
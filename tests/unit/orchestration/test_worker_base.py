@@ -1,11 +1,13 @@
 """Unit tests for BaseWorker logic."""
 
+import json
 from unittest.mock import MagicMock
 
 import pytest
 
 from egregora.orchestration.context import PipelineContext
 from egregora.orchestration.worker_base import BaseWorker
+from egregora.tracing import tracing_session
 
 
 @pytest.fixture
@@ -59,3 +61,14 @@ def test_run_implementation(mock_pipeline_context):
     worker = ConcreteWorker(mock_pipeline_context)
     result = worker.run()
     assert result == 42
+
+
+def test_run_is_recorded_as_span(mock_pipeline_context, tmp_path):
+    """Each concrete worker's run() becomes a named span when tracing is on."""
+    trace_path = tmp_path / "trace.jsonl"
+
+    with tracing_session(trace_path):
+        assert ConcreteWorker(mock_pipeline_context).run() == 42
+
+    names = [json.loads(line)["name"] for line in trace_path.read_text().splitlines()]
+    assert names == ["worker.ConcreteWorker.run", "egregora.run"]
@@ -153,6 +153,27 @@ Content for Bad Date
     assert bad_date_post["url"] == "posts/post-bad-date/"
 
 
+def test_get_recent_posts_accepts_author_entries_with_names(site_generator: SiteGenerator):
+    """Profile posts list authors as ``{uuid, name}`` entries rather than bare UUIDs."""
+    create_mock_profile(site_generator, "uuid-1")
+    profile_post = """---
+slug: profile-update
+title: Profile Update
+date: 2025-01-10
+authors:
+- uuid: uuid-1
+  name: Egregora
+banner: banner.jpg
+---
+Profile content
+"""
+    (site_generator.posts_dir / "profile-update.md").write_text(profile_post, encoding="utf-8")
+
+    (post,) = site_generator.get_recent_posts(limit=10)
+
+    assert [author["uuid"] for author in post["authors"]] == ["uuid-1"]
+
+
 @patch("egregora.database.duckdb_manager.DuckDBStorageManager")
 @patch("egregora.database.elo_store.EloStore")
 def test_get_top_posts_by_elo_behavior(mock_elo_store_cls, mock_db_cls, site_generator: SiteGenerator):
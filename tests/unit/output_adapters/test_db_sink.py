@@ -4,12 +4,9 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from egregora.data_primitives.document import DocumentMetadata, DocumentType
+from egregora.data_primitives.document import Document, DocumentType
 from egregora.output_sinks.db_sink import DbOutputSink
-from egregora.output_sinks.exceptions import (
-    DocumentIterationError,
-    DocumentNotFoundError,
-)
+from egregora.output_sinks.exceptions import DocumentNotFoundError
 
 
 @pytest.fixture
@@ -35,27 +32,22 @@ def test_get_raises_not_found_error(mock_repository: MagicMock):
         sink.get(doc_type, identifier)
 
 
-def test_documents_raises_iteration_error_on_missing_document():
-    """Test that DbOutputSink.documents() raises DocumentIterationError."""
+def test_documents_streams_from_repository_in_one_query():
+    """DbOutputSink.documents() should stream instead of list() + get() per document."""
     # Arrange
     mock_repo = MagicMock()
+    docs = [
+        Document(content="a", type=DocumentType.POST, metadata={"slug": "a"}),
+        Document(content="b", type=DocumentType.PROFILE, metadata={"uuid": "b"}),
+    ]
+    mock_repo.iter_documents.return_value = iter(docs)
     sink = DbOutputSink(repository=mock_repo)
 
-    doc_type = DocumentType.POST
-    identifier = "test-post-1"
-    metadata = DocumentMetadata(
-        identifier=identifier,
-        doc_type=doc_type,
-        metadata={"id": identifier, "type": "post"},
-    )
-
-    sink.list = MagicMock(return_value=[metadata])
-    sink.get = MagicMock(side_effect=DocumentNotFoundError(doc_type.value, identifier))
-
-    # Act & Assert
-    with pytest.raises(DocumentIterationError) as exc_info:
-        # Consume the iterator to trigger the exception
-        list(sink.documents())
+    # Act
+    result = list(sink.documents())
 
-    assert exc_info.value.doc_type == doc_type.value
-    assert exc_info.value.identifier == identifier
+    # Assert
+    assert result == docs
+    mock_repo.iter_documents.assert_called_once_with()
+    mock_repo.get.assert_not_called()
+    mock_repo.list.assert_not_called()
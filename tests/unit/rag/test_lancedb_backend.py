@@ -9,7 +9,7 @@ import numpy as np
 import pytest
 
 from egregora.data_primitives.document import Document, DocumentType
-from egregora.rag.lancedb_backend import LanceDBRAGBackend
+from egregora.rag.lancedb_backend import LanceDBRAGBackend, build_where_clause
 from egregora.rag.models import RAGQueryRequest
 
 
@@ -145,3 +145,14 @@ def test_lancedb_backend_index_binary_content(temp_db_dir: Path, mock_embed_fn):
 
     # Should not raise, but should skip the binary document
     backend.add(docs)
+
+
+def test_build_where_clause_combines_structured_and_raw_filters():
+    assert build_where_clause(RAGQueryRequest(text="q")) is None
+    assert build_where_clause(RAGQueryRequest(text="q", media_only=True)) == "media_type IS NOT NULL"
+    assert (
+        build_where_clause(
+            RAGQueryRequest(text="q", document_types=["post"], media_types=["it's"], filters="x = 1")
+        )
+        == "document_type IN ('post') AND media_type IN ('it''s') AND (x = 1)"
+    )
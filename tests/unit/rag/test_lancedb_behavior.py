@@ -91,3 +91,81 @@ def test_persistence(db_path):
     assert backend2.count() > 0
     response = backend2.query(RAGQueryRequest(text="Persistent", top_k=1))
     assert len(response.hits) > 0
+
+
+def test_media_only_query_returns_top_k_media(db_path):
+    """Media filters run inside LanceDB, so posts never crowd out media hits."""
+    backend = LanceDBRAGBackend(
+        db_path,
+        "media",
+        mock_embed_fn,
+        indexable_types={DocumentType.POST, DocumentType.ENRICHMENT_IMAGE, DocumentType.ENRICHMENT_VIDEO},
+    )
+    posts = [Document(content=f"Post {i}", type=DocumentType.POST) for i in range(10)]
+    media = [
+        Document(
+            content="Photo of a beach",
+            type=DocumentType.ENRICHMENT_IMAGE,
+            metadata={"media_type": "image", "original_filename": "IMG-1.jpg"},
+        ),
+        Document(
+            content="Clip of a party",
+            type=DocumentType.ENRICHMENT_VIDEO,
+            metadata={"media_type": "video", "original_filename": "VID-1.mp4"},
+        ),
+    ]
+    backend.add([*posts, *media])
+
+    hits = backend.query(RAGQueryRequest(text="beach", top_k=2, media_only=True)).hits
+    assert sorted(h.metadata["media_type"] for h in hits) == ["image", "video"]
+
+    hits = backend.query(RAGQueryRequest(text="beach", top_k=5, media_types=["video"])).hits
+    assert [h.metadata["original_filename"] for h in hits] == ["VID-1.mp4"]
+
+    hits = backend.query(RAGQueryRequest(text="post", top_k=20, document_types=["post"])).hits
+    assert len(hits) == 10
+
+    indexed = {column for index in backend._table.list_indices() for column in index.columns}
+    assert {"document_type", "media_type"} <= indexed
+
+
+def test_legacy_table_is_backfilled_with_scalar_columns(db_path):
+    """Tables created before the scalar filter columns are migrated on open."""
+    import lancedb
+    import numpy as np
+    from lancedb.pydantic import LanceModel, Vector
+
+    from egregora.config import EMBEDDING_DIM
+
+    class LegacyChunk(LanceModel):
+        chunk_id: str
+        document_id: str
+        text: str
+        vector: Vector(EMBEDDING_DIM)
+        metadata_json: str
+
+    db_path.mkdir(parents=True)
+    table = lancedb.connect(str(db_path)).create_table("legacy", schema=LegacyChunk)
+    table.add(
+        [
+            LegacyChunk(
+                chunk_id="m:0",
+                document_id="m",
+                text="A photo",
+                vector=np.full(EMBEDDING_DIM, 0.1, dtype=np.float32),
+                metadata_json='{"type": "enrichment_image", "media_type": "image"}',
+            ),
+            LegacyChunk(
+                chunk_id="p:0",
+                document_id="p",
+                text="A post",
+                vector=np.full(EMBEDDING_DIM, 0.1, dtype=np.float32),
+                metadata_json='{"type": "post"}',
+            ),
+        ]
+    )
+
+    backend = LanceDBRAGBackend(db_path, "legacy", mock_embed_fn)
+
+    hits = backend.query(RAGQueryRequest(text="photo", top_k=5, media_only=True)).hits
+    assert [h.document_id for h in hits] == ["m"]
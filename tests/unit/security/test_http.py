@@ -0,0 +1,134 @@
+"""Unit tests for the pooled, SSRF-guarded HTTP clients."""
+
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from egregora.security.http import (
+    AsyncGuardedTransport,
+    GuardedTransport,
+    close_async_http_clients,
+    close_http_clients,
+    get_async_http_client,
+    get_http_client,
+)
+from egregora.security.ssrf import SSRFValidationError
+
+PUBLIC_IP = "93.184.216.34"
+
+
+def _fake_getaddrinfo(host, port, *_args):
+    ip = "127.0.0.1" if host == "internal.test" else PUBLIC_IP
+    return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", (ip, port or 0))]
+
+
+def _redirecting_handler(request: httpx.Request) -> httpx.Response:
+    if request.url.host == "public.test":
+        return httpx.Response(302, headers={"Location": "http://internal.test/secret"})
+    return httpx.Response(200, text="secret")
+
+
+def test_guarded_client_blocks_redirect_to_private_address():
+    transport = GuardedTransport(httpx.MockTransport(_redirecting_handler), ssrf_guard=True)
+    with (
+        patch("egregora.security.dns._original_getaddrinfo", side_effect=_fake_getaddrinfo),
+        httpx.Client(transport=transport, follow_redirects=True) as client,
+    ):
+        with pytest.raises(SSRFValidationError, match="blocked IP"):
+            client.get("http://public.test/avatar.png")
+
+        # The host slot of the failed hop was given back.
+        assert client.get("http://other.test/").status_code == 200
+
+
+def test_async_guarded_client_blocks_redirect_to_private_address():
+    async def run() -> None:
+        transport = AsyncGuardedTransport(httpx.MockTransport(_redirecting_handler), ssrf_guard=True)
+        async with httpx.AsyncClient(transport=transport, follow_redirects=True) as client:
+            with pytest.raises(SSRFValidationError, match="blocked IP"):
+                await client.get("http://public.test/page")
+
+    with patch("egregora.security.dns._original_getaddrinfo", side_effect=_fake_getaddrinfo):
+        asyncio.run(run())
+
+
+def test_requests_per_host_are_limited():
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def handler(_request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        release.wait(timeout=0.05)
+        with lock:
+            in_flight -= 1
+        return httpx.Response(200, text="ok")
+
+    transport = GuardedTransport(httpx.MockTransport(handler), max_per_host=2)
+    with httpx.Client(transport=transport) as client:
+        threads = [threading.Thread(target=client.get, args=("http://busy.test/",)) for _ in range(6)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert peak <= 2
+
+
+class _ChunkStream(httpx.SyncByteStream):
+    def __iter__(self):
+        yield b"chunk"
+
+
+def test_streamed_response_holds_its_host_slot_until_closed():
+    transport = GuardedTransport(
+        httpx.MockTransport(lambda _request: httpx.Response(200, stream=_ChunkStream())), max_per_host=1
+    )
+    with httpx.Client(transport=transport, timeout=httpx.Timeout(5, pool=0.05)) as client:
+        with client.stream("GET", "http://slow.test/a"):
+            with pytest.raises(httpx.PoolTimeout):
+                client.get("http://slow.test/b")
+            # Other hosts have their own slots.
+            assert client.get("http://fast.test/").status_code == 200
+        assert client.get("http://slow.test/b").status_code == 200
+
+
+def test_shared_clients_are_reused_and_recreated_after_close():
+    client = get_http_client(ssrf_guard=True)
+    assert get_http_client(ssrf_guard=True) is client
+    assert get_http_client() is not client
+
+    close_http_clients()
+    assert client.is_closed
+    assert get_http_client(ssrf_guard=True) is not client
+    close_http_clients()
+
+
+def test_async_clients_are_shared_per_event_loop():
+    async def grab() -> httpx.AsyncClient:
+        first = get_async_http_client()
+        assert get_async_http_client() is first
+        return first
+
+    assert asyncio.run(grab()) is not asyncio.run(grab())
+
+
+def test_async_clients_of_a_loop_are_closed_and_recreated():
+    async def run() -> None:
+        client = get_async_http_client()
+        await close_async_http_clients()
+        assert client.is_closed
+        assert get_async_http_client() is not client
+        await close_async_http_clients()
+
+    asyncio.run(run())
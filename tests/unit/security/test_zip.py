@@ -1,9 +1,11 @@
+import io
 import zipfile
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from egregora.security.zip import (
+    ZipArchive,
     ZipCompressionBombError,
     ZipMemberCountError,
     ZipMemberSizeError,
@@ -180,3 +182,72 @@ class TestZipSecurity:
             self.create_mock_info("odd.txt", file_size=100, compress_size=0)
         ]
         validate_zip_contents(mock_zip_file, limits=default_limits)
+
+
+def _write_archive(path, members):
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, payload, compression in members:
+            zf.writestr(name, payload, compress_type=compression)
+    return path
+
+
+class TestZipArchive:
+    @pytest.fixture
+    def archive_path(self, tmp_path):
+        return _write_archive(
+            tmp_path / "export.zip",
+            [
+                ("WhatsApp Chat with Team.txt", "hello", zipfile.ZIP_DEFLATED),
+                ("media/IMG-0001.jpg", b"\xff\xd8stored-bytes", zipfile.ZIP_STORED),
+                ("media/AUD-0001.opus", bytes(range(256)) * 4, zipfile.ZIP_DEFLATED),
+            ],
+        )
+
+    def test_find_is_case_insensitive_by_basename(self, archive_path):
+        with ZipArchive(archive_path) as archive:
+            assert archive.find("img-0001.JPG").filename == "media/IMG-0001.jpg"
+            assert "AUD-0001.opus" in archive
+            assert archive.find("missing.png") is None
+            assert len(archive) == 3
+
+    def test_read_stored_and_deflated_members(self, archive_path):
+        with ZipArchive(archive_path) as archive:
+            assert archive.read(archive.find("IMG-0001.jpg")) == b"\xff\xd8stored-bytes"
+            assert archive.read(archive.find("AUD-0001.opus")) == bytes(range(256)) * 4
+
+    def test_extract_to_streams_into_target(self, archive_path, tmp_path):
+        with ZipArchive(archive_path) as archive:
+            target = archive.extract_to(archive.find("IMG-0001.jpg"), tmp_path / "out" / "img.jpg")
+            buffer = io.BytesIO()
+            archive.copy_to(archive.find("AUD-0001.opus"), buffer)
+
+        assert target.read_bytes() == b"\xff\xd8stored-bytes"
+        assert buffer.getvalue() == bytes(range(256)) * 4
+
+    def test_stored_member_with_bad_crc_is_rejected(self, archive_path):
+        with ZipArchive(archive_path) as archive:
+            info = archive.find("IMG-0001.jpg")
+            info.CRC ^= 0xFFFF
+            with pytest.raises(zipfile.BadZipFile):
+                archive.read(info)
+
+    def test_validation_is_cached_until_archive_changes(self, archive_path):
+        limits = ZipValidationSettings(max_member_count=10)
+        with patch("egregora.security.zip._validate_members") as validate:
+            ZipArchive(archive_path, limits=limits).close()
+            ZipArchive(archive_path, limits=limits).close()
+            assert validate.call_count == 1
+
+            _write_archive(archive_path, [("other.txt", "changed", zipfile.ZIP_DEFLATED)])
+            archive = ZipArchive(archive_path, limits=limits)
+            archive.close()
+            assert validate.call_count == 2
+
+    def test_invalid_archive_is_not_cached(self, tmp_path):
+        path = _write_archive(
+            tmp_path / "big.zip", [(f"f{i}.txt", "x", zipfile.ZIP_STORED) for i in range(3)]
+        )
+        limits = ZipValidationSettings(max_member_count=2)
+        for _ in range(2):
+            with pytest.raises(ZipMemberCountError):
+                ZipArchive(path, limits=limits)
@@ -0,0 +1,118 @@
+"""Tests for the zero-dependency span tracer."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+from egregora.tracing import (
+    StageTimingCollector,
+    collecting_spans,
+    current_span,
+    current_tracer,
+    span,
+    traced,
+    tracing_session,
+)
+
+
+def _jsonl_spans(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_spans_are_noops_without_a_tracer():
+    assert current_tracer() is None
+    with span("anything", key="value") as current:
+        current.set_attribute("other", 1)
+    current_span().set_attribute("ignored", value=True)
+
+
+def test_nested_spans_link_to_their_parent(tmp_path):
+    path = tmp_path / "trace.jsonl"
+
+    with tracing_session(path):
+        with span("outer", window="w1"):
+            with span("inner") as inner:
+                inner.set_attribute("rows", 3)
+
+    spans = {record["name"]: record for record in _jsonl_spans(path)}
+    assert set(spans) == {"egregora.run", "outer", "inner"}
+    assert spans["inner"]["parentSpanId"] == spans["outer"]["spanId"]
+    assert spans["outer"]["parentSpanId"] == spans["egregora.run"]["spanId"]
+    assert "parentSpanId" not in spans["egregora.run"]
+    assert len({record["traceId"] for record in spans.values()}) == 1
+    assert spans["inner"]["attributes"] == {"rows": 3}
+    assert spans["outer"]["attributes"] == {"window": "w1"}
+    assert spans["inner"]["endTimeUnixNano"] >= spans["inner"]["startTimeUnixNano"]
+    assert current_tracer() is None
+
+
+def test_exceptions_mark_the_span_as_failed(tmp_path):
+    path = tmp_path / "trace.jsonl"
+
+    with pytest.raises(RuntimeError), tracing_session(path), span("failing"):
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    failing = next(record for record in _jsonl_spans(path) if record["name"] == "failing")
+    assert failing["status"] == {"code": "ERROR", "message": "RuntimeError: boom"}
+
+
+def test_traced_covers_sync_and_async_functions(tmp_path):
+    path = tmp_path / "trace.jsonl"
+
+    @traced("sync.step")
+    def sync_step():
+        return current_span().name
+
+    @traced()
+    async def async_step():
+        await asyncio.sleep(0)
+        return current_span().name
+
+    with tracing_session(path):
+        assert sync_step() == "sync.step"
+        assert asyncio.run(async_step()).endswith("async_step")
+
+    names = [record["name"] for record in _jsonl_spans(path)]
+    assert names[0] == "sync.step"
+    assert names[1].endswith("async_step")
+
+
+def test_chrome_trace_output(tmp_path):
+    path = tmp_path / "trace.json"
+
+    with tracing_session(path), span("pipeline.writer", window="w1"):
+        pass
+
+    payload = json.loads(path.read_text())
+    events = {event["name"]: event for event in payload["traceEvents"]}
+    assert events["pipeline.writer"]["ph"] == "X"
+    assert events["pipeline.writer"]["cat"] == "pipeline"
+    assert events["pipeline.writer"]["args"]["window"] == "w1"
+    assert events["pipeline.writer"]["args"]["parent_id"] == events["egregora.run"]["args"]["span_id"]
+    assert events["egregora.run"]["dur"] >= events["pipeline.writer"]["dur"]
+
+
+def test_collectors_only_see_spans_from_their_own_thread():
+    barrier = threading.Barrier(2)
+    collectors = {}
+
+    def run_source(name):
+        collector = StageTimingCollector()
+        with collecting_spans(collector):
+            barrier.wait()
+            with span(f"pipeline.{name}"):
+                barrier.wait()
+        collectors[name] = collector
+
+    threads = [threading.Thread(target=run_source, args=(name,)) for name in ("alpha", "beta")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert set(collectors["alpha"].stages) == {"pipeline.alpha"}
+    assert set(collectors["beta"].stages) == {"pipeline.beta"}
+    assert current_tracer() is None
@@ -3,8 +3,15 @@ from datetime import datetime, timedelta
 import ibis
 import pytest
 
+from egregora.llm.token_utils import EstimateTokenizer, TokenCounter, estimate_tokens
 from egregora.transformations.exceptions import InvalidSplitError, InvalidStepUnitError
-from egregora.transformations.windowing import WindowConfig, create_windows, split_window_into_n_parts
+from egregora.transformations.windowing import (
+    MESSAGE_OVERHEAD_TOKENS,
+    WindowConfig,
+    WindowTokenIndex,
+    create_windows,
+    split_window_into_n_parts,
+)
 
 
 @pytest.fixture
@@ -252,3 +259,39 @@ def test_invalid_split(messages_table):
 
     with pytest.raises(InvalidSplitError):
         split_window_into_n_parts(window, 1)
+
+
+def test_window_token_index_sums_message_tokens_per_window(messages_table):
+    """Token counts of overlapping windows and split parts come from one index."""
+    index = WindowTokenIndex.build(messages_table, TokenCounter(EstimateTokenizer()))
+    per_message = len("message_0") // 4 + MESSAGE_OVERHEAD_TOKENS
+
+    assert index.total_tokens == 10 * per_message
+    config = WindowConfig(step_size=3, step_unit="messages", overlap_ratio=0.34)
+    windows = list(create_windows(messages_table, config=config))
+    assert [index.tokens_in(window) for window in windows] == [4 * per_message] * 3 + [per_message]
+
+    parts = split_window_into_n_parts(windows[0], 2)
+    assert sum(index.tokens_in(part) for part in parts) >= index.tokens_in(windows[0])
+
+
+class _PythonEstimate:
+    name = "python-estimate"
+
+    def count(self, text: str) -> int:
+        return estimate_tokens(text)
+
+
+def test_window_token_index_estimates_in_the_query_like_the_tokenizer():
+    """The in-query estimate counts characters exactly as the Python estimate does."""
+    table = ibis.memtable(
+        {
+            "ts": [datetime(2023, 1, 1, 12, i) for i in range(4)],
+            "text": ["olá, mundo 🌍 👨‍👩‍👧", None, "", "x" * 4001],
+        }
+    )
+
+    in_query = WindowTokenIndex.build(table, TokenCounter(EstimateTokenizer()))
+    in_python = WindowTokenIndex.build(table, TokenCounter(_PythonEstimate()))
+
+    assert in_query._prefix == in_python._prefix